@@ -0,0 +1,242 @@
+"""Content-addressed on-disk cache for backtest results."""
+
+import hashlib
+import json
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from athena.core.config import settings
+from athena.core.logging import get_logger
+from athena.core.types import BacktestResult
+
+logger = get_logger(__name__)
+
+# Bump when BacktestResult or engine semantics change to invalidate old entries
+CACHE_VERSION = 2
+
+_PRIMITIVE_TYPES = (int, float, str, bool, type(None))
+
+
+def fingerprint_data(data: pd.DataFrame) -> str:
+    """Compute a fast content hash of an OHLCV frame.
+
+    Hashes the raw bytes of the index and every column, so identical data fetched
+    from different sources (cache, Yahoo, dashboard) maps to the same fingerprint.
+
+    Args:
+        data: OHLCV DataFrame
+
+    Returns:
+        Hex digest identifying the data
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(str(tuple(data.shape)).encode())
+
+    index = data.index
+    if isinstance(index, pd.DatetimeIndex):
+        h.update(str(index.tz).encode())
+        h.update(np.ascontiguousarray(index.asi8))
+    else:
+        h.update(pd.util.hash_pandas_object(index, index=False).to_numpy())
+
+    for column in data.columns:
+        values = data[column].to_numpy()
+        h.update(str(column).encode())
+        h.update(str(values.dtype).encode())
+        if values.dtype.kind in "biufcmM":
+            h.update(np.ascontiguousarray(values))
+        else:
+            h.update(pd.util.hash_pandas_object(data[column], index=False).to_numpy())
+
+    return h.hexdigest()
+
+
+def _strategy_state(strategy: Any) -> Dict[str, Any]:
+    """Collect the parameters that determine a strategy's signals."""
+    state = {k: v for k, v in vars(strategy).items() if isinstance(v, _PRIMITIVE_TYPES)}
+    state["params"] = strategy.get_parameters()
+    state["timeframes"] = list(getattr(strategy, "timeframes", []))
+    return state
+
+
+class BacktestCache:
+    """Disk cache of BacktestResult objects keyed on data, strategy and engine settings."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_size_mb: Optional[float] = None,
+        enabled: Optional[bool] = None,
+    ):
+        """Initialize cache.
+
+        Args:
+            cache_dir: Directory for cached results. Uses settings default if None.
+            max_size_mb: Size budget; least recently used entries are evicted beyond it
+            enabled: Enable caching. Uses settings default if None.
+        """
+        self.cache_dir = Path(cache_dir or settings.backtest_cache_dir)
+        self.max_size_bytes = int(
+            (max_size_mb if max_size_mb is not None else settings.backtest_cache_max_mb)
+            * 1024
+            * 1024
+        )
+        self.enabled = settings.backtest_cache_enabled if enabled is None else enabled
+        self.hits = 0
+        self.misses = 0
+
+        if self.enabled:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def make_key(
+        self,
+        strategy: Any,
+        data: pd.DataFrame,
+        symbol: str,
+        initial_capital: float,
+        commission: float,
+        slippage: float,
+    ) -> str:
+        """Build the cache key for a backtest.
+
+        Args:
+            strategy: Strategy instance
+            data: OHLCV data
+            symbol: Symbol being traded
+            initial_capital: Engine starting capital
+            commission: Engine commission rate
+            slippage: Engine slippage rate
+
+        Returns:
+            Hex cache key
+        """
+        strategy_class = type(strategy)
+        payload = {
+            "version": CACHE_VERSION,
+            "data": fingerprint_data(data),
+            "strategy": f"{strategy_class.__module__}.{strategy_class.__qualname__}",
+            "state": _strategy_state(strategy),
+            "symbol": symbol,
+            "engine": {
+                "initial_capital": float(initial_capital),
+                "commission": float(commission),
+                "slippage": float(slippage),
+            },
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+        return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        """Get the file path for a cache key."""
+        return self.cache_dir / f"{key}.pkl"
+
+    def get(self, key: str) -> Optional[BacktestResult]:
+        """Load a cached result.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached BacktestResult or None on miss
+        """
+        if not self.enabled:
+            return None
+
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                result = pickle.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception as e:
+            logger.warning("Failed to load cached backtest", path=str(path), error=str(e))
+            path.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+
+        # Touch the entry so eviction is least-recently-used
+        os.utime(path)
+        self.hits += 1
+        return result
+
+    def put(self, key: str, result: BacktestResult) -> None:
+        """Store a result and evict old entries beyond the size budget.
+
+        Args:
+            key: Cache key
+            result: Result to store
+        """
+        if not self.enabled:
+            return
+
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning("Failed to cache backtest", path=str(path), error=str(e))
+            tmp_path.unlink(missing_ok=True)
+            return
+
+        self._evict()
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until the cache fits its budget."""
+        entries = []
+        total = 0
+        for path in self.cache_dir.glob("*.pkl"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        if total <= self.max_size_bytes:
+            return
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_size_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            logger.debug("Evicted cached backtest", path=str(path))
+
+    def clear(self) -> int:
+        """Remove all cached results.
+
+        Returns:
+            Number of entries removed
+        """
+        files = list(self.cache_dir.glob("*.pkl")) if self.cache_dir.exists() else []
+        for path in files:
+            path.unlink(missing_ok=True)
+        logger.info(f"Cleared {len(files)} cached backtests")
+        return len(files)
+
+    def get_info(self) -> Dict[str, Any]:
+        """Get information about cached results.
+
+        Returns:
+            Dictionary with cache statistics
+        """
+        files = list(self.cache_dir.glob("*.pkl")) if self.cache_dir.exists() else []
+        total_size = sum(f.stat().st_size for f in files) / (1024 * 1024)  # MB
+
+        return {
+            "cache_dir": str(self.cache_dir),
+            "num_entries": len(files),
+            "total_size_mb": round(total_size, 2),
+            "max_size_mb": round(self.max_size_bytes / (1024 * 1024), 2),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
@@ -1,15 +1,21 @@
 """Backtesting engine using vectorbt."""
 
+import logging
+from contextlib import nullcontext
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import numpy as np
 import pandas as pd
 import vectorbt as vbt
 
+from athena.backtest.cache import BacktestCache
 from athena.core.config import settings
 from athena.core.logging import get_logger
+from athena.core.profiling import get_profiler, profiled, span
 from athena.core.types import BacktestResult, Trade
+from athena.data.bars import MultiTimeframeBars
+from athena.ops.prometheus_exporter import record_metric
 from athena.strategies.base import BaseStrategy
 
 logger = get_logger(__name__)
@@ -19,7 +25,11 @@ class BacktestEngine:
     """Vectorized backtesting engine."""
 
     def __init__(
-        self, initial_capital: float = None, commission: float = None, slippage: float = 0.001
+        self,
+        initial_capital: float = None,
+        commission: float = None,
+        slippage: float = 0.001,
+        cache: Optional[BacktestCache] = None,
     ):
         """Initialize backtest engine.
 
@@ -27,11 +37,16 @@ class BacktestEngine:
             initial_capital: Starting capital
             commission: Commission rate (e.g., 0.001 for 0.1%)
             slippage: Slippage rate
+            cache: Optional result cache; identical backtests are served from it
         """
         self.initial_capital = initial_capital or settings.default_initial_capital
         self.commission = commission or settings.default_commission
         self.slippage = slippage
+        self.cache = cache
+        # Seconds per stage of the most recent backtest
+        self.timings: Dict[str, float] = {}
 
+    @profiled("backtest.run")
     def run(
         self, strategy: BaseStrategy, data: pd.DataFrame, symbol: str = "ASSET"
     ) -> BacktestResult:
@@ -45,44 +60,90 @@ class BacktestEngine:
         Returns:
             BacktestResult with metrics and equity curve
         """
+        cache_key = None
+        # Seconds per stage, filled in by the spans below whether or not profiling is on
+        timings: Dict[str, float] = {}
+        if self.cache is not None and self.cache.enabled:
+            with span("backtest.cache", timings, "cache"):
+                cache_key = self.cache.make_key(
+                    strategy, data, symbol, self.initial_capital, self.commission, self.slippage
+                )
+                cached = self.cache.get(cache_key)
+            record_metric("cache", cache="backtest", hit=cached is not None)
+            if cached is not None:
+                logger.info("Backtest cache hit for %s on %s", strategy.name, symbol, key=cache_key)
+                self.timings = timings
+                return cached
+
         logger.info(
-            f"Running backtest for {strategy.name} on {symbol}",
+            "Running backtest for %s on %s",
+            strategy.name,
+            symbol,
             initial_capital=self.initial_capital,
             commission=self.commission,
         )
 
-        # Generate signals
-        signals = strategy.generate_signals(data)
-
-        # Prepare data for vectorbt
-        close_prices = data["close"]
-
-        # Convert signals to entries and exits
-        entries = signals == 1
-        exits = signals == -1
+        # Expose higher-timeframe views; get_bars only shows bars already closed at each row
+        with span("backtest.signals", timings, "signals"):
+            if strategy.timeframes:
+                strategy.attach_bars(MultiTimeframeBars(data))
+
+            # Generate signals (the per-strategy span name is only built while profiling)
+            profiler = get_profiler()
+            signals_span = (
+                profiler.span(f"{type(strategy).__name__}.generate_signals")
+                if profiler is not None
+                else nullcontext()
+            )
+            with signals_span:
+                signals = strategy.generate_signals(data)
 
         # Run vectorized backtest with vectorbt
-        portfolio = vbt.Portfolio.from_signals(
-            close=close_prices,
-            entries=entries,
-            exits=exits,
-            init_cash=self.initial_capital,
-            fees=self.commission,
-            slippage=self.slippage,
-            freq="D",  # Daily frequency
-        )
+        with span("backtest.simulation", timings, "simulation"):
+            # Prepare data for vectorbt
+            close_prices = data["close"]
+
+            # Convert signals to entries and exits
+            entries = signals == 1
+            exits = signals == -1
+
+            portfolio = vbt.Portfolio.from_signals(
+                close=close_prices,
+                entries=entries,
+                exits=exits,
+                init_cash=self.initial_capital,
+                fees=self.commission,
+                slippage=self.slippage,
+                freq="D",  # Daily frequency
+            )
 
         # Extract metrics
-        result = self._calculate_metrics(portfolio, signals, data, symbol)
-
-        logger.info(
-            "Backtest completed",
-            total_return=f"{result.total_return:.2%}",
-            sharpe_ratio=f"{result.sharpe_ratio:.2f}",
-            max_drawdown=f"{result.max_drawdown:.2%}",
-            total_trades=result.total_trades,
+        with span("backtest.metrics", timings, "metrics"):
+            result = self._calculate_metrics(portfolio, signals, data, symbol)
+
+        self.timings = timings
+        record_metric(
+            "backtest",
+            strategy=strategy.name,
+            symbol=symbol,
+            duration=sum(timings.values()),
+            bars=len(data),
+            stages=timings,
         )
 
+        # Optimizers run this per trial; skip formatting when INFO is filtered out
+        if logger.is_enabled_for(logging.INFO):
+            logger.info(
+                "Backtest completed",
+                total_return=f"{result.total_return:.2%}",
+                sharpe_ratio=f"{result.sharpe_ratio:.2f}",
+                max_drawdown=f"{result.max_drawdown:.2%}",
+                total_trades=result.total_trades,
+            )
+
+        if cache_key is not None:
+            self.cache.put(cache_key, result)
+
         return result
 
     def _calculate_metrics(
@@ -0,0 +1,257 @@
+"""Vectorized Monte Carlo simulation of price and equity paths.
+
+Paths are generated as matrices of log returns, one chunk of paths at a time,
+from a seeded ``numpy.random.Generator``:
+
+- ``gbm``: geometric Brownian motion with annual drift and volatility
+- ``bootstrap``: daily returns resampled from history with replacement
+- ``block_bootstrap``: circular blocks of consecutive historical returns, which
+  keeps volatility clustering and short-range autocorrelation
+
+``simulate`` streams chunks into per-step histograms of cumulative log return,
+so percentile bands for any number of paths need memory proportional to
+``days x bins`` rather than ``paths x days``. Terminal values and maximum
+drawdowns are kept for every path (one float each).
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+METHODS = ("gbm", "bootstrap", "block_bootstrap")
+DEFAULT_PERCENTILES = (5, 25, 50, 75, 95)
+
+
+@dataclass
+class MonteCarloResult:
+    """Summary of a Monte Carlo run."""
+
+    method: str
+    n_paths: int
+    days: int
+    initial_value: float
+    percentiles: pd.DataFrame  # Index: step 0..days, columns: percentile levels
+    final_values: np.ndarray
+    max_drawdowns: np.ndarray
+    metadata: Dict = field(default_factory=dict)
+
+    def summary(self) -> Dict[str, float]:
+        """Distribution statistics of the simulated outcomes.
+
+        Returns:
+            Mean and median terminal value, probability of loss, 95% VaR and
+            CVaR of the terminal return, and median/95th percentile max drawdown
+        """
+        returns = self.final_values / self.initial_value - 1
+        var_95 = float(np.percentile(returns, 5))
+        return {
+            "mean_final_value": float(self.final_values.mean()),
+            "median_final_value": float(np.median(self.final_values)),
+            "prob_loss": float((returns < 0).mean()),
+            "var_95": var_95,
+            "cvar_95": float(returns[returns <= var_95].mean()),
+            "median_max_drawdown": float(np.median(self.max_drawdowns)),
+            "p95_max_drawdown": float(np.percentile(self.max_drawdowns, 95)),
+        }
+
+
+class MonteCarloSimulator:
+    """Monte Carlo path simulator."""
+
+    def __init__(
+        self,
+        method: str = "gbm",
+        returns: Optional[Sequence[float]] = None,
+        drift: float = 0.05,
+        volatility: float = 0.2,
+        block_size: int = 20,
+        periods_per_year: int = 252,
+        seed: Optional[int] = None,
+        chunk_size: int = 20_000,
+    ):
+        """Initialize simulator.
+
+        Args:
+            method: One of ``gbm``, ``bootstrap`` or ``block_bootstrap``
+            returns: Historical simple returns per period (required for bootstraps)
+            drift: Annual drift for GBM
+            volatility: Annual volatility for GBM
+            block_size: Consecutive periods per block for ``block_bootstrap``
+            periods_per_year: Periods per year, to scale GBM parameters
+            seed: Random seed; each run starts a fresh generator from it
+            chunk_size: Paths generated per chunk, bounding peak memory
+
+        Raises:
+            ValueError: If the method is unknown or its inputs are missing
+        """
+        if method not in METHODS:
+            raise ValueError(f"Unknown method '{method}'. Choose from {METHODS}")
+
+        self.method = method
+        self.drift = drift
+        self.volatility = volatility
+        self.block_size = block_size
+        self.periods_per_year = periods_per_year
+        self.seed = seed
+        self.chunk_size = chunk_size
+
+        self.log_returns: Optional[np.ndarray] = None
+        if method != "gbm":
+            if returns is None:
+                raise ValueError(f"Method '{method}' needs historical returns")
+            history = np.asarray(returns, dtype=np.float64)
+            history = history[np.isfinite(history)]
+            if len(history) < 2 or (method == "block_bootstrap" and len(history) < block_size):
+                raise ValueError(
+                    f"Need at least {max(2, block_size)} finite returns for '{method}'"
+                )
+            self.log_returns = np.log1p(history).astype(np.float32)
+
+    def _log_returns(self, rng: np.random.Generator, n_paths: int, days: int) -> np.ndarray:
+        """Per-period log returns for one chunk, shape (n_paths, days)."""
+        if self.method == "gbm":
+            dt = 1 / self.periods_per_year
+            shocks = rng.standard_normal((n_paths, days), dtype=np.float32)
+            shocks *= np.float32(self.volatility * np.sqrt(dt))
+            shocks += np.float32((self.drift - 0.5 * self.volatility**2) * dt)
+            return shocks
+
+        history = self.log_returns
+        if self.method == "bootstrap":
+            return history[rng.integers(0, len(history), (n_paths, days))]
+
+        # Circular block bootstrap: random block starts, wrapping around the history
+        n_blocks = -(-days // self.block_size)
+        starts = rng.integers(0, len(history), (n_paths, n_blocks, 1))
+        indices = (starts + np.arange(self.block_size)) % len(history)
+        return history[indices.reshape(n_paths, -1)[:, :days]]
+
+    def iter_log_paths(self, days: int, n_paths: int) -> Iterator[np.ndarray]:
+        """Cumulative log returns, one chunk of paths at a time.
+
+        Args:
+            days: Periods to simulate
+            n_paths: Total number of paths
+
+        Yields:
+            float32 arrays of shape (chunk, days); step 0 (zero) is not included
+        """
+        rng = np.random.default_rng(self.seed)
+        for start in range(0, n_paths, self.chunk_size):
+            chunk = self._log_returns(rng, min(self.chunk_size, n_paths - start), days)
+            yield np.cumsum(chunk, axis=1, out=chunk)
+
+    def paths(self, initial_value: float, days: int, n_paths: int) -> np.ndarray:
+        """Materialize all paths; for small runs and plotting sample paths.
+
+        Args:
+            initial_value: Starting price or equity
+            days: Periods to simulate
+            n_paths: Number of paths
+
+        Returns:
+            Array of shape (n_paths, days + 1) starting at ``initial_value``
+        """
+        values = np.empty((n_paths, days + 1))
+        values[:, 0] = initial_value
+        row = 0
+        for log_paths in self.iter_log_paths(days, n_paths):
+            values[row:row + len(log_paths), 1:] = initial_value * np.exp(log_paths)
+            row += len(log_paths)
+        return values
+
+    def simulate(
+        self,
+        initial_value: float,
+        days: int,
+        n_paths: int,
+        percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+        bins: int = 2048,
+    ) -> MonteCarloResult:
+        """Simulate paths and summarize them without keeping every path.
+
+        A single chunk gets exact percentiles. Larger runs accumulate per-step
+        histograms whose range is set from the first chunk (widened by its
+        spread on each side); percentiles are interpolated within a bin, and
+        values beyond the range count in the edge bins, so only the most
+        extreme percentiles of very large runs can be clipped.
+
+        Args:
+            initial_value: Starting price or equity
+            days: Periods to simulate
+            n_paths: Number of paths
+            percentiles: Percentile levels for the bands (0-100)
+            bins: Histogram bins per step for chunked runs
+
+        Returns:
+            Percentile bands per step, terminal values and max drawdowns
+        """
+        levels = np.asarray(percentiles, dtype=np.float64)
+        final_log = np.empty(n_paths)
+        max_drawdowns = np.empty(n_paths)
+        step_offsets = np.arange(days) * bins
+
+        bands: Optional[np.ndarray] = None
+        counts = low = scale = None
+        row = 0
+        for log_paths in self.iter_log_paths(days, n_paths):
+            size = len(log_paths)
+            final_log[row:row + size] = log_paths[:, -1]
+            # Drawdown from the running peak, including the starting value
+            drawdown = np.maximum.accumulate(log_paths, axis=1)
+            np.maximum(drawdown, 0, out=drawdown)
+            np.subtract(log_paths, drawdown, out=drawdown)
+            max_drawdowns[row:row + size] = -np.expm1(drawdown.min(axis=1))
+            row += size
+
+            if size == n_paths:
+                bands = np.percentile(log_paths, levels, axis=0).T
+                break
+
+            if counts is None:
+                lo, hi = log_paths.min(axis=0), log_paths.max(axis=0)
+                spread = np.maximum(hi - lo, 1e-9)
+                low = (lo - spread).astype(np.float32)
+                scale = (bins / (3 * spread)).astype(np.float32)
+                counts = np.zeros(days * bins, dtype=np.int64)
+
+            index = ((log_paths - low) * scale).astype(np.int32)
+            np.clip(index, 0, bins - 1, out=index)
+            index += step_offsets
+            counts += np.bincount(index.ravel(), minlength=days * bins)
+
+        if bands is None:
+            bands = self._histogram_percentiles(
+                counts.reshape(days, bins), low, scale, n_paths, levels
+            )
+
+        values = initial_value * np.exp(np.vstack([np.zeros(len(levels)), bands]))
+        return MonteCarloResult(
+            method=self.method,
+            n_paths=n_paths,
+            days=days,
+            initial_value=initial_value,
+            percentiles=pd.DataFrame(values, columns=list(percentiles)),
+            final_values=initial_value * np.exp(final_log),
+            max_drawdowns=max_drawdowns,
+            metadata={"seed": self.seed, "chunk_size": self.chunk_size},
+        )
+
+    @staticmethod
+    def _histogram_percentiles(
+        counts: np.ndarray, low: np.ndarray, scale: np.ndarray, total: int, levels: np.ndarray
+    ) -> np.ndarray:
+        """Interpolate percentiles from per-step histograms, shape (days, levels)."""
+        cumulative = counts.cumsum(axis=1)
+        bands = np.empty((len(counts), len(levels)))
+        for j, level in enumerate(levels):
+            target = level / 100 * total
+            bin_index = (cumulative < target).sum(axis=1).clip(max=counts.shape[1] - 1)
+            steps = np.arange(len(counts))
+            before = np.where(bin_index > 0, cumulative[steps, bin_index - 1], 0)
+            in_bin = np.maximum(counts[steps, bin_index], 1)
+            fraction = np.clip((target - before) / in_bin, 0, 1)
+            bands[:, j] = low + (bin_index + fraction) / scale
+        return bands
@@ -0,0 +1,330 @@
+"""Monte Carlo robustness analysis of backtest results.
+
+A single backtest is one draw of luck. These tests resample a
+``BacktestResult`` many times to show how much its drawdown, Sharpe ratio and
+terminal wealth depend on the particular sequence that happened:
+
+- ``trade_shuffle``: the same trade P&Ls in random order. Terminal wealth is
+  unchanged; the drawdown distribution shows how lucky the ordering was.
+- ``daily_bootstrap``: daily returns resampled with replacement, optionally in
+  circular blocks to keep volatility clustering.
+- ``skip_trades``: every trade is independently missed with some probability,
+  as with fills that do not happen or signals that arrive late.
+
+Resamples are generated as NumPy matrices, one chunk of rows at a time, so
+memory stays bounded for any number of resamples. Chunks draw from
+independent streams spawned from one seed, so results are reproducible and do
+not depend on ``n_jobs``; with ``n_jobs`` > 1 chunks run in worker processes.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from athena.core.logging import get_logger
+from athena.core.types import BacktestResult
+
+logger = get_logger(__name__)
+
+TESTS = ("trade_shuffle", "daily_bootstrap", "skip_trades")
+DEFAULT_PERCENTILES = (5, 25, 50, 75, 95)
+
+# Matrix elements per chunk (float32), about 32 MB
+CHUNK_ELEMENTS = 8_000_000
+
+ChunkOutput = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+@dataclass
+class RobustnessResult:
+    """Distributions from one robustness test."""
+
+    test: str
+    n_resamples: int
+    initial_capital: float
+    terminal_wealth: np.ndarray
+    max_drawdowns: np.ndarray
+    sharpe_ratios: np.ndarray
+    baseline: Dict[str, float]
+    metadata: Dict = field(default_factory=dict)
+
+    def summary(self, percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> Dict[str, float]:
+        """Percentiles of each distribution, plus tail probabilities.
+
+        Args:
+            percentiles: Percentile levels (0-100)
+
+        Returns:
+            Flat dictionary such as ``max_drawdown_p95`` and ``prob_loss``
+        """
+        summary: Dict[str, float] = {}
+        for name, values in (
+            ("terminal_wealth", self.terminal_wealth),
+            ("max_drawdown", self.max_drawdowns),
+            ("sharpe_ratio", self.sharpe_ratios),
+        ):
+            for level, value in zip(percentiles, np.percentile(values, percentiles)):
+                summary[f"{name}_p{level:g}"] = float(value)
+
+        summary["prob_loss"] = float((self.terminal_wealth < self.initial_capital).mean())
+        summary["prob_worse_drawdown"] = float(
+            (self.max_drawdowns > self.baseline["max_drawdown"]).mean()
+        )
+        return summary
+
+
+def _max_drawdowns(equity: np.ndarray, initial_capital: float) -> np.ndarray:
+    """Maximum drawdown per row of an equity matrix, peaks including the start.
+
+    ``equity`` is overwritten.
+    """
+    peaks = np.maximum.accumulate(equity, axis=1)
+    np.maximum(peaks, np.float32(initial_capital), out=peaks)
+    np.divide(equity, peaks, out=peaks)
+    # Equity at or below zero is a total loss
+    return np.clip(1 - peaks.min(axis=1), 0, 1).astype(np.float64)
+
+
+def _trade_outcomes(
+    matrix: np.ndarray, total: np.ndarray, sum_squares: np.ndarray, sample: Dict
+) -> ChunkOutput:
+    """Wealth, drawdown and Sharpe for each row of a (rows, trades) P&L matrix.
+
+    ``matrix`` is overwritten with the equity paths.
+    """
+    count = matrix.shape[1]
+    # Sharpe of per-trade P&L, annualized by the number of trades per year
+    mean = total / count
+    std = np.sqrt(np.maximum(sum_squares / count - mean**2, 0))
+    sharpe = np.divide(mean, std, out=np.zeros_like(mean), where=std > 0)
+    if sample["years"] > 0:
+        sharpe *= np.sqrt(count / sample["years"])
+
+    initial_capital = sample["initial_capital"]
+    equity = np.cumsum(matrix, axis=1, out=matrix)
+    equity += np.float32(initial_capital)
+    return initial_capital + total, _max_drawdowns(equity, initial_capital), sharpe
+
+
+def _trade_shuffle(
+    rng: np.random.Generator, size: int, sample: Dict, options: Dict
+) -> ChunkOutput:
+    """Trade P&Ls in random order."""
+    pnl = sample["pnl"]
+    # Stable radix sort of random 16-bit keys; breaking key ties by one random
+    # order makes the sort keys exchangeable, so every row is a uniform
+    # permutation. Several times faster than row-wise Fisher-Yates.
+    keys = rng.integers(0, np.iinfo(np.uint16).max, (size, len(pnl)), np.uint16, True)
+    matrix = pnl[rng.permutation(len(pnl))][np.argsort(keys, axis=1, kind="stable")]
+    # Order does not change the sum or spread of the P&Ls
+    total = np.full(size, pnl.sum(dtype=np.float64))
+    sum_squares = np.full(size, np.square(pnl, dtype=np.float64).sum())
+    return _trade_outcomes(matrix, total, sum_squares, sample)
+
+
+def _skip_trades(
+    rng: np.random.Generator, size: int, sample: Dict, options: Dict
+) -> ChunkOutput:
+    """Trade P&Ls with each trade missed with ``skip_probability``."""
+    pnl = sample["pnl"]
+    kept = rng.random((size, len(pnl)), dtype=np.float32) >= options["skip_probability"]
+    matrix = kept.astype(np.float32)
+    total = (matrix @ pnl).astype(np.float64)
+    sum_squares = (matrix @ np.square(pnl)).astype(np.float64)
+    matrix *= pnl
+    return _trade_outcomes(matrix, total, sum_squares, sample)
+
+
+def _daily_bootstrap(
+    rng: np.random.Generator, size: int, sample: Dict, options: Dict
+) -> ChunkOutput:
+    """Daily log returns resampled iid or in circular blocks."""
+    history = sample["log_returns"]
+    days, block_size = len(history), options["block_size"]
+    if block_size > 1:
+        n_blocks = -(-days // block_size)
+        starts = rng.integers(0, days, (size, n_blocks, 1))
+        indices = ((starts + np.arange(block_size)) % days).reshape(size, -1)[:, :days]
+    else:
+        indices = rng.integers(0, days, (size, days))
+    log_returns = history[indices]
+
+    simple = sample["returns"][indices]
+    excess = options["risk_free_rate"] / options["periods_per_year"]
+    mean = simple.sum(axis=1, dtype=np.float64) / days - excess
+    sum_squares = np.einsum("ij,ij->i", simple, simple, dtype=np.float64)
+    std = np.sqrt(np.maximum(sum_squares - days * (mean + excess) ** 2, 0) / (days - 1))
+    sharpe = np.divide(mean, std, out=np.zeros_like(mean), where=std > 0)
+    sharpe *= np.sqrt(options["periods_per_year"])
+
+    initial_capital = sample["initial_capital"]
+    equity = np.cumsum(log_returns, axis=1, out=log_returns)
+    terminal = initial_capital * np.exp(equity[:, -1].astype(np.float64))
+    np.exp(equity, out=equity)
+    equity *= np.float32(initial_capital)
+    return terminal, _max_drawdowns(equity, initial_capital), sharpe
+
+
+RESAMPLERS: Dict[str, Callable[..., ChunkOutput]] = {
+    "trade_shuffle": _trade_shuffle,
+    "daily_bootstrap": _daily_bootstrap,
+    "skip_trades": _skip_trades,
+}
+
+
+def _run_chunk(
+    test: str, seed: np.random.SeedSequence, size: int, sample: Dict, options: Dict
+) -> ChunkOutput:
+    """Run one chunk of resamples (module level so worker processes can import it)."""
+    return RESAMPLERS[test](np.random.default_rng(seed), size, sample, options)
+
+
+class RobustnessAnalyzer:
+    """Monte Carlo robustness tests for a backtest result."""
+
+    def __init__(
+        self,
+        result: BacktestResult,
+        n_resamples: int = 10_000,
+        seed: Optional[int] = None,
+        n_jobs: int = 1,
+        skip_probability: float = 0.1,
+        block_size: int = 1,
+        risk_free_rate: float = 0.0,
+        periods_per_year: int = 252,
+    ):
+        """Initialize analyzer.
+
+        Args:
+            result: Backtest result with trades and daily returns
+            n_resamples: Resamples per test
+            seed: Random seed for reproducible results
+            n_jobs: Worker processes (1 runs in-process, -1 uses all CPUs)
+            skip_probability: Chance of missing each trade in ``skip_trades``
+            block_size: Block length for ``daily_bootstrap`` (1 for iid days)
+            risk_free_rate: Annual risk-free rate for Sharpe ratios
+            periods_per_year: Periods per year of the daily returns
+
+        Raises:
+            ValueError: If ``skip_probability`` or ``block_size`` is out of range
+        """
+        if not 0 <= skip_probability < 1:
+            raise ValueError("skip_probability must be in [0, 1)")
+        if block_size < 1:
+            raise ValueError("block_size must be at least 1")
+
+        self.result = result
+        self.n_resamples = n_resamples
+        self.seed = seed
+        self.n_jobs = n_jobs
+        self.options = {
+            "skip_probability": skip_probability,
+            "block_size": block_size,
+            "risk_free_rate": risk_free_rate,
+            "periods_per_year": periods_per_year,
+        }
+
+        daily_returns = result.daily_returns.to_numpy(dtype=np.float64)
+        daily_returns = daily_returns[np.isfinite(daily_returns)]
+        pnl = [t.pnl for t in result.trades if t.pnl is not None and np.isfinite(t.pnl)]
+        self.sample = {
+            "initial_capital": float(result.initial_capital),
+            "pnl": np.asarray(pnl, dtype=np.float32),
+            "returns": daily_returns.astype(np.float32),
+            "log_returns": np.log1p(daily_returns).astype(np.float32),
+            "years": len(daily_returns) / periods_per_year,
+        }
+
+    def _length(self, test: str) -> int:
+        """Columns of the resample matrix for a test."""
+        key = "log_returns" if test == "daily_bootstrap" else "pnl"
+        return len(self.sample[key])
+
+    def _chunks(self, test: str, n_resamples: int) -> List[Tuple[np.random.SeedSequence, int]]:
+        """Split resamples into chunks, each with its own random stream."""
+        rows = max(1, CHUNK_ELEMENTS // max(self._length(test), 1))
+        sizes = [min(rows, n_resamples - start) for start in range(0, n_resamples, rows)]
+        seeds = np.random.SeedSequence(self.seed).spawn(len(sizes))
+        return list(zip(seeds, sizes))
+
+    def baseline(self) -> Dict[str, float]:
+        """Metrics of the original backtest."""
+        return {
+            "terminal_wealth": float(self.result.final_capital),
+            "max_drawdown": abs(float(self.result.max_drawdown)),
+            "sharpe_ratio": float(self.result.sharpe_ratio),
+        }
+
+    def run(self, test: str, n_resamples: Optional[int] = None) -> RobustnessResult:
+        """Run one robustness test.
+
+        Args:
+            test: One of ``trade_shuffle``, ``daily_bootstrap`` or ``skip_trades``
+            n_resamples: Resamples to draw (defaults to the analyzer's setting)
+
+        Returns:
+            Terminal wealth, max drawdown and Sharpe ratio per resample
+
+        Raises:
+            ValueError: If the test is unknown or the result lacks the data it needs
+        """
+        if test not in TESTS:
+            raise ValueError(f"Unknown test '{test}'. Choose from {TESTS}")
+        if self._length(test) < 2:
+            needed = "daily returns" if test == "daily_bootstrap" else "trades with P&L"
+            raise ValueError(f"Test '{test}' needs at least 2 {needed}")
+
+        n_resamples = n_resamples or self.n_resamples
+        chunks = self._chunks(test, n_resamples)
+        workers = self.n_jobs if self.n_jobs > 0 else os.cpu_count() or 1
+        workers = min(workers, len(chunks))
+
+        start = time.perf_counter()
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(_run_chunk, test, seed, size, self.sample, self.options)
+                    for seed, size in chunks
+                ]
+                outputs = [future.result() for future in futures]
+        else:
+            outputs = [
+                _run_chunk(test, seed, size, self.sample, self.options) for seed, size in chunks
+            ]
+        duration = time.perf_counter() - start
+
+        terminal, drawdowns, sharpe = (np.concatenate(parts) for parts in zip(*outputs))
+        logger.info(
+            "Robustness test completed",
+            test=test,
+            resamples=n_resamples,
+            workers=workers,
+            duration=f"{duration:.2f}s",
+        )
+        return RobustnessResult(
+            test=test,
+            n_resamples=n_resamples,
+            initial_capital=self.sample["initial_capital"],
+            terminal_wealth=terminal,
+            max_drawdowns=drawdowns,
+            sharpe_ratios=sharpe,
+            baseline=self.baseline(),
+            metadata={"seed": self.seed, "workers": workers, "duration": duration},
+        )
+
+    def run_all(self, n_resamples: Optional[int] = None) -> Dict[str, RobustnessResult]:
+        """Run every test the result has data for.
+
+        Args:
+            n_resamples: Resamples per test (defaults to the analyzer's setting)
+
+        Returns:
+            Dictionary mapping test name to its result
+        """
+        return {
+            test: self.run(test, n_resamples) for test in TESTS if self._length(test) >= 2
+        }
@@ -1,6 +1,7 @@
 """Walk-forward validation for robust strategy testing."""
 
 import json
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -14,6 +15,7 @@ from plotly.subplots import make_subplots
 from athena.backtest.engine import BacktestEngine
 from athena.core.logging import get_logger
 from athena.core.types import BacktestResult
+from athena.ops.prometheus_exporter import record_metric
 from athena.strategies.base import BaseStrategy
 
 logger = get_logger(__name__)
@@ -169,9 +171,11 @@ class WalkForwardValidator:
 
         # Process each window
         oos_equity_parts = []
+        start = time.perf_counter()
 
         for i, window in enumerate(windows):
             logger.info(f"Processing window {i+1}/{len(windows)}")
+            window_start = time.perf_counter()
 
             # Get train and test data
             train_data = data[(data.index >= window.train_start) & (data.index < window.train_end)]
@@ -192,6 +196,14 @@ class WalkForwardValidator:
             # Collect out-of-sample equity
             oos_equity_parts.append(window.test_result.equity_curve)
 
+            record_metric(
+                "walk_forward",
+                strategy=strategy.name,
+                duration=time.perf_counter() - window_start,
+            )
+
+        duration = time.perf_counter() - start
+
         # Combine out-of-sample equity curves
         oos_equity_curve = pd.concat(oos_equity_parts, axis=0)
         oos_equity_curve = oos_equity_curve.sort_index()
@@ -221,6 +233,7 @@ class WalkForwardValidator:
                 "step_days": self.step_days,
                 "anchored": self.anchored,
                 "num_windows": len(windows),
+                "duration_seconds": duration,
             },
         )
 
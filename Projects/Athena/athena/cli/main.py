@@ -4,26 +4,87 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+import click
 import typer
 from rich.console import Console
 from rich.table import Table
 
-from athena.backtest.engine import BacktestEngine
-from athena.backtest.metrics import format_metrics
-from athena.backtest.walk_forward import WalkForwardValidator
 from athena.core.logging import get_logger
-from athena.data.yahoo import YahooDataAdapter
-from athena.live.paper_trader import PaperTradingEngine
-from athena.optimize.optimizer import StrategyOptimizer, get_param_space
-from athena.strategies.bollinger_bands import BollingerBandsStrategy
-from athena.strategies.momentum import MomentumStrategy
-from athena.strategies.sma_crossover import SMACrossoverStrategy
+from athena.core.profiling import start_profiling, stop_profiling
 
+# Commands import their dependencies locally: those pull in vectorbt, optuna, yfinance,
+# pydantic-settings and the live stack, so cheap commands like --help start quickly
 logger = get_logger(__name__)
 console = Console()
 
 app = typer.Typer(name="athena", help="Athena Trading Platform CLI", add_completion=False)
 
+METRICS_PORT_HELP = "Serve Prometheus metrics on this port while the job runs"
+PROFILE_HELP = (
+    "Profile the run and write speedscope and folded-stack profiles "
+    "[default: the profiling_enabled setting]"
+)
+
+
+def start_metrics_server(port: Optional[int]) -> None:
+    """Start the Prometheus scrape endpoint if a port was given."""
+    if port is None:
+        return
+
+    from athena.ops.prometheus_exporter import init_prometheus
+
+    exporter = init_prometheus(port=port)
+    if exporter is not None and exporter.enabled:
+        console.print(f"[dim]📡 Metrics at http://localhost:{port}/metrics[/dim]")
+    else:
+        console.print("[yellow]Metrics disabled: install prometheus-client[/yellow]")
+
+
+def start_profiler(enabled: Optional[bool], name: str) -> None:
+    """Profile the running command if enabled, writing profiles when it exits."""
+    from athena.core.config import settings
+
+    if enabled is None:
+        enabled = settings.profiling_enabled
+    if not enabled:
+        return
+
+    try:
+        start_profiling(settings.profiling_capture)
+    except ValueError as e:
+        console.print(f"[yellow]Profiling disabled: {e}[/yellow]")
+        return
+    click.get_current_context().call_on_close(lambda: report_profile(name))
+
+
+def report_profile(name: str, top: int = 10) -> None:
+    """Stop profiling, save the profiles and print the slowest spans."""
+    profiler = stop_profiling()
+    if profiler is None:
+        return
+
+    from athena.core.config import settings
+
+    paths = profiler.save(settings.profiling_output_dir, name)
+
+    table = Table(title=f"Profile ({profiler.duration:.2f}s)")
+    table.add_column("Span", style="cyan")
+    table.add_column("Calls", justify="right")
+    table.add_column("Total ms", justify="right")
+    table.add_column("Self ms", justify="right")
+    table.add_column("Max ms", justify="right")
+    for row in profiler.summary()[:top]:
+        table.add_row(
+            row["name"],
+            str(row["count"]),
+            f"{row['total_ms']:.1f}",
+            f"{row['self_ms']:.1f}",
+            f"{row['max_ms']:.1f}",
+        )
+    console.print(table)
+    for profile_format, path in paths.items():
+        console.print(f"[dim]🔬 {profile_format}: {path}[/dim]")
+
 
 @app.command()
 def backtest(
@@ -36,9 +97,21 @@ def backtest(
     initial_capital: float = typer.Option(100000, help="Initial capital"),
     commission: float = typer.Option(0.001, help="Commission rate"),
     force_refresh: bool = typer.Option(False, help="Force data refresh from Yahoo"),
+    use_cache: bool = typer.Option(True, help="Reuse cached results for identical backtests"),
+    metrics_port: Optional[int] = typer.Option(None, help=METRICS_PORT_HELP),
+    profile: Optional[bool] = typer.Option(None, "--profile/--no-profile", help=PROFILE_HELP),
 ):
     """Run a backtest for a given symbol and strategy."""
     console.print(f"[bold blue]🚀 Starting backtest for {symbol}[/bold blue]")
+    start_metrics_server(metrics_port)
+    start_profiler(profile, f"backtest_{symbol}_{strategy}")
+    from athena.backtest.cache import BacktestCache
+    from athena.backtest.engine import BacktestEngine
+    from athena.backtest.metrics import format_metrics
+    from athena.data.yahoo import YahooDataAdapter
+    from athena.strategies.bollinger_bands import BollingerBandsStrategy
+    from athena.strategies.momentum import MomentumStrategy
+    from athena.strategies.sma_crossover import SMACrossoverStrategy
 
     try:
         # Initialize data adapter
@@ -65,7 +138,11 @@ def backtest(
         console.print(f"[yellow]📈 Running {strat.name} strategy...[/yellow]")
 
         # Initialize backtest engine
-        engine = BacktestEngine(initial_capital=initial_capital, commission=commission)
+        engine = BacktestEngine(
+            initial_capital=initial_capital,
+            commission=commission,
+            cache=BacktestCache() if use_cache else None,
+        )
 
         # Run backtest
         result = engine.run(strat, data, symbol)
@@ -73,6 +150,11 @@ def backtest(
         # Display results
         console.print("[green]✓ Backtest complete![/green]\n")
         console.print(format_metrics(result))
+        if engine.timings:
+            stages = ", ".join(
+                f"{stage} {seconds * 1000:.1f}ms" for stage, seconds in engine.timings.items()
+            )
+            console.print(f"[dim]Timings: {stages}[/dim]")
 
         # Save results to file
         output_dir = Path("backtest_results")
@@ -102,6 +184,7 @@ def ingest(
 ):
     """Download and cache historical data."""
     console.print(f"[bold blue]📥 Ingesting data for {symbol}[/bold blue]")
+    from athena.data.yahoo import YahooDataAdapter
 
     try:
         # Initialize data adapter
@@ -151,9 +234,25 @@ def optimize(
     end: str = typer.Option("2023-12-31", help="End date"),
     trials: int = typer.Option(50, help="Number of optimization trials"),
     strategy: str = typer.Option("sma", help="Strategy to optimize"),
+    storage: Optional[str] = typer.Option(
+        None, help="Optuna storage URL (defaults to OPTUNA_STORAGE, then DATABASE_URL)"
+    ),
+    study_name: Optional[str] = typer.Option(
+        None, help="Study name to resume or share across workers"
+    ),
+    metrics_port: Optional[int] = typer.Option(None, help=METRICS_PORT_HELP),
+    profile: Optional[bool] = typer.Option(None, "--profile/--no-profile", help=PROFILE_HELP),
 ):
     """Optimize strategy parameters using Bayesian optimization."""
     console.print(f"[bold blue]🔧 Optimizing {strategy} strategy for {symbol}[/bold blue]")
+    start_metrics_server(metrics_port)
+    start_profiler(profile, f"optimize_{symbol}_{strategy}")
+    from athena.core.config import settings
+    from athena.data.yahoo import YahooDataAdapter
+    from athena.optimize.optimizer import StrategyOptimizer, get_param_space
+    from athena.strategies.bollinger_bands import BollingerBandsStrategy
+    from athena.strategies.momentum import MomentumStrategy
+    from athena.strategies.sma_crossover import SMACrossoverStrategy
 
     try:
         # Initialize data adapter
@@ -179,7 +278,9 @@ def optimize(
         param_space = get_param_space(strategy.lower())
 
         # Initialize optimizer
-        optimizer = StrategyOptimizer()
+        optimizer = StrategyOptimizer(
+            storage=storage or settings.optuna_storage or settings.database_url
+        )
 
         console.print(f"[yellow]🔍 Running {trials} optimization trials...[/yellow]")
 
@@ -190,6 +291,7 @@ def optimize(
             symbol=symbol,
             param_space=param_space,
             n_trials=trials,
+            study_name=study_name,
         )
 
         # Display results
@@ -204,6 +306,12 @@ def optimize(
         console.print(f"  Max Drawdown: {results['best_max_dd']:.2%}")
         console.print(f"  Win Rate: {results['best_win_rate']:.2%}")
         console.print(f"  Total Trades: {results['best_trades']}")
+        console.print(
+            f"\n[dim]Study '{results['study_name']}': {results['n_trials']} trials, "
+            f"{results['memo_hits']} answered from memo, "
+            f"{results['trials_per_second']:.1f} trials/sec, "
+            f"{results['worker_utilization']:.0%} worker utilization[/dim]"
+        )
 
         # Save results
         output_path = optimizer.save_results(results)
@@ -223,9 +331,18 @@ def wfv(
     train: int = typer.Option(365, help="Training period in days"),
     test: int = typer.Option(90, help="Testing period in days"),
     strategy: str = typer.Option("sma", help="Strategy to validate"),
+    metrics_port: Optional[int] = typer.Option(None, help=METRICS_PORT_HELP),
+    profile: Optional[bool] = typer.Option(None, "--profile/--no-profile", help=PROFILE_HELP),
 ):
     """Run walk-forward validation."""
     console.print(f"[bold blue]🔄 Walk-forward validation for {strategy} on {symbol}[/bold blue]")
+    start_metrics_server(metrics_port)
+    start_profiler(profile, f"wfv_{symbol}_{strategy}")
+    from athena.backtest.walk_forward import WalkForwardValidator
+    from athena.data.yahoo import YahooDataAdapter
+    from athena.strategies.bollinger_bands import BollingerBandsStrategy
+    from athena.strategies.momentum import MomentumStrategy
+    from athena.strategies.sma_crossover import SMACrossoverStrategy
 
     try:
         # Initialize data adapter
@@ -289,9 +406,23 @@ def paper(
     capital: float = typer.Option(10000, help="Starting capital"),
     interval: str = typer.Option("1m", help="Trading interval"),
     testnet: bool = typer.Option(True, help="Use Binance testnet"),
+    replay: Optional[Path] = typer.Option(
+        None, help="Replay bars/ticks from a Parquet file on a virtual clock instead of live"
+    ),
+    speed: Optional[float] = typer.Option(
+        None, help="Replay speed as a multiple of real time (default: as fast as possible)"
+    ),
+    profile: Optional[bool] = typer.Option(None, "--profile/--no-profile", help=PROFILE_HELP),
 ):
     """Start paper trading."""
     console.print(f"[bold blue]📝 Starting paper trading for {symbol}[/bold blue]")
+    start_profiler(profile, f"paper_{symbol}_{strategy}")
+    from athena.live.broker import SimulatedBroker
+    from athena.live.paper_trader import PaperTradingEngine
+    from athena.live.replay import ReplayFeed
+    from athena.strategies.bollinger_bands import BollingerBandsStrategy
+    from athena.strategies.momentum import MomentumStrategy
+    from athena.strategies.sma_crossover import SMACrossoverStrategy
 
     try:
         # Initialize strategy
@@ -308,9 +439,19 @@ def paper(
             raise typer.Exit(1)
 
         # Create paper trading engine
-        trader = PaperTradingEngine.create_with_auto_broker(
-            strategy=strat, symbol=symbol, initial_capital=capital, use_testnet=testnet
-        )
+        if replay:
+            feed = ReplayFeed.from_parquet(replay, symbol, speed=speed)
+            trader = PaperTradingEngine(
+                SimulatedBroker(initial_capital=capital, clock=feed.clock),
+                strat,
+                symbol,
+                initial_capital=capital,
+                use_testnet=False,
+            )
+        else:
+            trader = PaperTradingEngine.create_with_auto_broker(
+                strategy=strat, symbol=symbol, initial_capital=capital, use_testnet=testnet
+            )
 
         # Add callbacks for logging
         def on_trade(side: str, quantity: float, price: float, timestamp):
@@ -326,11 +467,15 @@ def paper(
         console.print("[green]✓ Paper trading started[/green]")
         console.print(f"  Strategy: {strat.name}")
         console.print(f"  Capital: ${capital:,.2f}")
-        console.print(f"  Testnet: {testnet}")
-        console.print("[yellow]Press Ctrl+C to stop[/yellow]\n")
+        if replay:
+            console.print(f"  Replay: {replay} ({len(feed)} ticks)")
+            trader.run_replay(feed)
+        else:
+            console.print(f"  Testnet: {testnet}")
+            console.print("[yellow]Press Ctrl+C to stop[/yellow]\n")
 
-        # Start trading
-        trader.start(interval_seconds=60)  # 1-minute intervals
+            # Start trading
+            trader.start(interval_seconds=60)  # 1-minute intervals
 
         # Show final performance
         performance = trader.get_performance_summary()
@@ -365,10 +510,15 @@ def dashboard(
 
 @app.command()
 def cache(
-    action: str = typer.Argument(..., help="Action: info, clear, or clear-symbol"),
+    action: str = typer.Argument(
+        ..., help="Action: info, clear, clear-symbol, or clear-backtests"
+    ),
     symbol: Optional[str] = typer.Option(None, help="Symbol to clear (for clear-symbol)"),
 ):
     """Manage data cache."""
+    from athena.backtest.cache import BacktestCache
+    from athena.data.yahoo import YahooDataAdapter
+
     data_adapter = YahooDataAdapter()
 
     if action == "info":
@@ -379,6 +529,15 @@ def cache(
         console.print(f"  💾 Size: {cache_info['total_size_mb']:.2f} MB")
         console.print(f"  🏷️  Symbols: {', '.join(cache_info['symbols'])}")
 
+        backtest_info = BacktestCache().get_info()
+        console.print("[bold]Backtest Result Cache:[/bold]")
+        console.print(f"  📁 Directory: {backtest_info['cache_dir']}")
+        console.print(f"  📊 Entries: {backtest_info['num_entries']}")
+        console.print(
+            f"  💾 Size: {backtest_info['total_size_mb']:.2f} / "
+            f"{backtest_info['max_size_mb']:.0f} MB"
+        )
+
     elif action == "clear":
         data_adapter.clear_cache()
         console.print("[green]✓ Cache cleared successfully[/green]")
@@ -387,8 +546,14 @@ def cache(
         data_adapter.clear_cache(symbol=symbol)
         console.print(f"[green]✓ Cache cleared for {symbol}[/green]")
 
+    elif action == "clear-backtests":
+        removed = BacktestCache().clear()
+        console.print(f"[green]✓ Removed {removed} cached backtest results[/green]")
+
     else:
-        console.print("[red]Invalid action. Use: info, clear, or clear-symbol[/red]")
+        console.print(
+            "[red]Invalid action. Use: info, clear, clear-symbol, or clear-backtests[/red]"
+        )
         raise typer.Exit(1)
 
 
@@ -0,0 +1,145 @@
+"""Clock abstraction so live components can run on wall time or simulated time."""
+
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Optional, Union
+
+import pandas as pd
+
+TimeLike = Union[datetime, pd.Timestamp, str]
+
+
+class Clock(ABC):
+    """Source of the current time for live and simulated components."""
+
+    @abstractmethod
+    def now(self) -> datetime:
+        """Current (possibly simulated) wall-clock time."""
+
+    @abstractmethod
+    def monotonic(self) -> float:
+        """Seconds on a monotonic timeline, for measuring intervals."""
+
+    @abstractmethod
+    async def sleep(self, seconds: float) -> None:
+        """Wait for the given number of (possibly simulated) seconds.
+
+        Args:
+            seconds: Duration to wait
+        """
+
+
+class WallClock(Clock):
+    """Real time from the operating system."""
+
+    def now(self) -> datetime:
+        return datetime.now()
+
+    def monotonic(self) -> float:
+        return time.monotonic()
+
+    async def sleep(self, seconds: float) -> None:
+        await asyncio.sleep(seconds)
+
+
+class MonotonicClock(Clock):
+    """Wall time derived from the monotonic clock.
+
+    Anchored to the wall time at construction, so ``now`` never jumps backwards
+    when the system clock is adjusted (NTP steps, DST changes on naive times).
+    """
+
+    def __init__(self):
+        self._anchor_wall = datetime.now()
+        self._anchor_monotonic = time.monotonic()
+
+    def now(self) -> datetime:
+        return self._anchor_wall + timedelta(seconds=time.monotonic() - self._anchor_monotonic)
+
+    def monotonic(self) -> float:
+        return time.monotonic()
+
+    async def sleep(self, seconds: float) -> None:
+        await asyncio.sleep(seconds)
+
+
+class VirtualClock(Clock):
+    """Simulated time that only moves when advanced.
+
+    Replay feeds advance the clock to each event's timestamp. ``sleep`` advances
+    the clock by the requested duration; with a ``speed`` it also waits
+    ``seconds / speed`` of real time, otherwise it returns immediately.
+    """
+
+    def __init__(self, start: Optional[TimeLike] = None, speed: Optional[float] = None):
+        """Initialize clock.
+
+        Args:
+            start: Initial time (defaults to the current wall time)
+            speed: Real-time pacing multiple for sleep (None for as fast as possible)
+        """
+        if speed is not None and speed <= 0:
+            raise ValueError(f"Speed must be positive: {speed}")
+
+        self._now = _to_datetime(start) if start is not None else datetime.now()
+        self._start = self._now
+        self.speed = speed
+
+    def now(self) -> datetime:
+        return self._now
+
+    def monotonic(self) -> float:
+        return (self._now - self._start).total_seconds()
+
+    async def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            self.advance(seconds)
+        await asyncio.sleep(seconds / self.speed if self.speed else 0)
+
+    def reset(self, start: TimeLike) -> None:
+        """Restart the clock at a new time, e.g. the first event of a replay.
+
+        Args:
+            start: New current time
+        """
+        self._now = self._start = _to_datetime(start)
+
+    def advance(self, seconds: float) -> datetime:
+        """Move the clock forward.
+
+        Args:
+            seconds: Seconds to advance
+
+        Returns:
+            New current time
+
+        Raises:
+            ValueError: If seconds is negative
+        """
+        if seconds < 0:
+            raise ValueError(f"Cannot move clock backwards by {seconds}s")
+        self._now += timedelta(seconds=seconds)
+        return self._now
+
+    def advance_to(self, timestamp: TimeLike) -> datetime:
+        """Move the clock to a timestamp; earlier timestamps leave it unchanged.
+
+        Args:
+            timestamp: Target time
+
+        Returns:
+            New current time
+        """
+        target = _to_datetime(timestamp)
+        if target > self._now:
+            self._now = target
+        return self._now
+
+
+def _to_datetime(value: TimeLike) -> datetime:
+    """Convert a timestamp-like value to a naive or aware datetime."""
+    if isinstance(value, datetime) and not isinstance(value, pd.Timestamp):
+        return value
+    return pd.Timestamp(value).to_pydatetime()
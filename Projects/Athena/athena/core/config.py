@@ -19,10 +19,19 @@ class Settings(BaseSettings):
         default="development", description="Environment (development/staging/production)"
     )
     log_level: str = Field(default="INFO", description="Logging level")
+    log_async: bool = Field(
+        default=True, description="Render log records on a background thread"
+    )
 
     # Data settings
     data_dir: Path = Field(default=Path("./data_cache"), description="Directory for data cache")
     cache_enabled: bool = Field(default=True, description="Enable data caching")
+    market_data_workers: int = Field(
+        default=8, description="Concurrent fetches in the shared market data service"
+    )
+    market_data_ttl: float = Field(
+        default=300.0, description="Seconds the market data service keeps fetched data in memory"
+    )
 
     # Yahoo Finance settings
     yf_max_retries: int = Field(default=3, description="Max retries for Yahoo Finance API")
@@ -33,6 +42,25 @@ class Settings(BaseSettings):
         default=100000, description="Default initial capital for backtests"
     )
     default_commission: float = Field(default=0.001, description="Default commission rate")
+    backtest_cache_enabled: bool = Field(default=True, description="Enable backtest result cache")
+    backtest_cache_dir: Path = Field(
+        default=Path("./data_cache/backtests"), description="Directory for cached backtest results"
+    )
+    backtest_cache_max_mb: float = Field(
+        default=512, description="Size budget for cached backtest results (MB)"
+    )
+
+    # Profiling
+    profiling_enabled: bool = Field(
+        default=False, description="Profile CLI runs and write span profiles"
+    )
+    profiling_capture: Optional[str] = Field(
+        default=None,
+        description="Function-level profiler to run alongside spans (cprofile/pyinstrument)",
+    )
+    profiling_output_dir: Path = Field(
+        default=Path("./profiles"), description="Directory for profile output"
+    )
 
     # Risk management
     max_position_size: float = Field(
@@ -44,6 +72,15 @@ class Settings(BaseSettings):
     dashboard_host: str = Field(default="0.0.0.0", description="Dashboard host")
     dashboard_port: int = Field(default=8050, description="Dashboard port")
     dashboard_debug: bool = Field(default=False, description="Dashboard debug mode")
+    dashboard_job_workers: int = Field(
+        default=2, description="Processes running dashboard backtests and optimizations"
+    )
+    dashboard_result_cache_size: int = Field(
+        default=32, description="Backtest results the dashboard keeps in memory for its charts"
+    )
+    dashboard_max_points: int = Field(
+        default=2000, description="Points per chart series after downsampling (about chart width)"
+    )
 
     # Paper trading (Binance testnet)
     binance_testnet_api_key: Optional[str] = Field(
@@ -58,6 +95,10 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = Field(default="sqlite:///./athena.db", description="Database URL")
+    optuna_storage: Optional[str] = Field(
+        default=None,
+        description="Optuna study storage URL (in-memory if unset; CLI uses database_url)",
+    )
 
     @field_validator("env")
     @classmethod
@@ -0,0 +1,189 @@
+"""Fixed-memory log-bucketed histogram for latency percentiles."""
+
+import math
+from typing import Dict, Iterable, List, Optional
+
+DEFAULT_PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+
+class LogHistogram:
+    """HDR-style histogram with constant-time record and bounded relative error.
+
+    Values are counted in logarithmically sized buckets, so memory is fixed by the
+    tracked range and precision rather than the number of samples, and any
+    percentile is accurate to within ``precision`` of the true value. Count, sum,
+    min and max are tracked exactly.
+
+    Recording takes no lock and allocates nothing; brokers record from a single
+    event loop, so increments never race.
+    """
+
+    def __init__(self, lowest: float = 0.001, highest: float = 3_600_000.0,
+                 precision: float = 0.01):
+        """Initialize histogram.
+
+        Args:
+            lowest: Smallest distinguishable value; smaller values share the first bucket
+            highest: Largest tracked value; larger values share the last bucket
+            precision: Maximum relative error of reported percentiles
+
+        Raises:
+            ValueError: If the range or precision is invalid
+        """
+        if not 0 < lowest < highest:
+            raise ValueError(f"Invalid histogram range: {lowest} to {highest}")
+        if not 0 < precision < 1:
+            raise ValueError(f"Precision must be between 0 and 1: {precision}")
+
+        self.lowest = lowest
+        self.highest = highest
+        self.precision = precision
+
+        # Reporting a bucket's geometric midpoint keeps error within precision
+        self._growth = (1 + precision) ** 2
+        self._inv_log_growth = 1 / math.log(self._growth)
+        self._size = int(math.ceil(math.log(highest / lowest) * self._inv_log_growth)) + 1
+        self._counts: List[int] = [0] * self._size
+
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        """Record one value.
+
+        Args:
+            value: Sample, in the same unit as the histogram range
+        """
+        if value > self.lowest:
+            index = int(math.log(value / self.lowest) * self._inv_log_growth) + 1
+            if index >= self._size:
+                index = self._size - 1
+        else:
+            index = 0
+        self._counts[index] += 1
+
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def mean(self) -> float:
+        """Exact mean of recorded values (0 if empty)."""
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percentile: float) -> float:
+        """Get the value at a percentile.
+
+        Args:
+            percentile: Percentile between 0 and 100
+
+        Returns:
+            Approximate value (0 if empty)
+        """
+        return self.percentiles((percentile,))[percentile]
+
+    def percentiles(self, percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> Dict[float, float]:
+        """Get values at several percentiles in one pass over the buckets.
+
+        Args:
+            percentiles: Percentiles between 0 and 100
+
+        Returns:
+            Approximate value by percentile (0 if empty)
+
+        Raises:
+            ValueError: If a percentile is outside 0-100
+        """
+        targets = sorted(percentiles)
+        if targets and not 0 <= targets[0] <= targets[-1] <= 100:
+            raise ValueError(f"Percentiles must be between 0 and 100: {targets}")
+        if not self.count or not targets:
+            return {p: 0.0 for p in targets}
+
+        result = {}
+        ranks = iter((p, max(1, math.ceil(p / 100 * self.count))) for p in targets)
+        target, rank = next(ranks)
+        seen = 0
+        for index, bucket_count in enumerate(self._counts):
+            if not bucket_count:
+                continue
+            seen += bucket_count
+            while seen >= rank:
+                result[target] = self.max if rank == self.count else self._value_at(index)
+                target, rank = next(ranks, (None, None))
+                if target is None:
+                    return result
+        return result
+
+    def _value_at(self, index: int) -> float:
+        """Representative value of a bucket, clamped to the observed range."""
+        # Edge buckets are unbounded on one side, so report the exact extreme
+        if index == 0:
+            return self.min
+        if index == self._size - 1:
+            return self.max
+        value = self.lowest * self._growth ** (index - 0.5)
+        return min(max(value, self.min), self.max)
+
+    def merge(self, other: "LogHistogram") -> None:
+        """Add another histogram's samples to this one.
+
+        Args:
+            other: Histogram with the same range and precision
+
+        Raises:
+            ValueError: If the bucket layouts differ
+        """
+        if (other.lowest, other.highest, other.precision) != (
+            self.lowest, self.highest, self.precision
+        ):
+            raise ValueError("Cannot merge histograms with different bucket layouts")
+
+        for index, bucket_count in enumerate(other._counts):
+            if bucket_count:
+                self._counts[index] += bucket_count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def reset(self) -> None:
+        """Forget all recorded values."""
+        self._counts = [0] * self._size
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def summary(self, percentiles: Optional[Iterable[float]] = None) -> Dict[str, float]:
+        """Get count, mean, extremes and percentiles.
+
+        Args:
+            percentiles: Percentiles to include (p50, p90, p99 and p999 if None)
+
+        Returns:
+            Dictionary keyed like ``count``, ``mean``, ``max``, ``p99``, ``p999``
+        """
+        values = self.percentiles(percentiles or DEFAULT_PERCENTILES)
+        summary = {
+            "count": self.count,
+            "mean": self.mean,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+        }
+        for percentile, value in values.items():
+            summary[percentile_label(percentile)] = value
+        return summary
+
+    def __len__(self) -> int:
+        return self.count
+
+
+def percentile_label(percentile: float) -> str:
+    """Format a percentile as a metric suffix, e.g. 99.9 -> ``p999``."""
+    return "p" + f"{percentile:g}".replace(".", "")
@@ -1,49 +1,110 @@
 """Logging configuration using structlog."""
 
+import atexit
 import logging
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
 
 import structlog
 from rich.console import Console
 from rich.logging import RichHandler
 
-from athena.core.config import settings
+_handler: Optional[logging.Handler] = None
+_listener: Optional[QueueListener] = None
+_setup_lock = threading.Lock()
 
 
-def setup_logging() -> None:
-    """Configure structlog with rich formatting for development."""
-    # Configure standard logging for libraries
-    logging.basicConfig(
-        level=getattr(logging, settings.log_level),
-        handlers=[
-            RichHandler(
+class RecordQueueHandler(QueueHandler):
+    """Queue handler that passes records through unformatted.
+
+    The stock handler formats each record before queueing it, which would render
+    on the logging thread. Records keep references to their arguments, so values
+    logged from hot loops must not be mutated afterwards.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def setup_logging(handler: Optional[logging.Handler] = None) -> None:
+    """Configure structlog with rich formatting for development.
+
+    Log calls below ``settings.log_level`` return before formatting their
+    message, so hot loops can pass ``%``-style arguments to ``logger.debug``
+    for free. When Athena owns the root logger, structlog only builds the event
+    dict on the calling thread; rendering and output happen on the handler,
+    behind a queue when ``settings.log_async`` is set.
+
+    Args:
+        handler: Handler that writes rendered records (RichHandler on stderr if None)
+    """
+    # Imported here: pydantic-settings is slow to load and most imports never log
+    from athena.core.config import settings
+
+    global _handler, _listener
+    shutdown_logging()
+
+    level = getattr(logging, settings.log_level)
+    renderer = (
+        structlog.dev.ConsoleRenderer()
+        if settings.env == "development"
+        else structlog.processors.JSONRenderer()
+    )
+    processors = [
+        structlog.stdlib.add_log_level,
+        structlog.stdlib.add_logger_name,
+        structlog.processors.TimeStamper(fmt="iso"),
+        structlog.processors.StackInfoRenderer(),
+        structlog.processors.format_exc_info,
+    ]
+
+    # Configure standard logging for libraries, unless someone else already has
+    root = logging.getLogger()
+    if _handler is not None:
+        root.removeHandler(_handler)
+    if root.handlers:
+        _handler = None
+        processors.append(renderer)
+    else:
+        if handler is None:
+            handler = RichHandler(
                 console=Console(stderr=True), rich_tracebacks=True, show_time=True, show_path=False
             )
-        ],
-        format="%(message)s",
-        datefmt="[%X]",
-    )
+        handler.setFormatter(
+            structlog.stdlib.ProcessorFormatter(processor=renderer, datefmt="[%X]")
+        )
+        processors.append(structlog.stdlib.ProcessorFormatter.wrap_for_formatter)
+
+        if settings.log_async:
+            records: queue.SimpleQueue = queue.SimpleQueue()
+            _listener = QueueListener(records, handler, respect_handler_level=True)
+            _listener.start()
+            handler = RecordQueueHandler(records)
+
+        _handler = handler
+        root.addHandler(handler)
+        root.setLevel(level)
 
     # Configure structlog
     structlog.configure(
-        processors=[
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.add_logger_name,
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            (
-                structlog.dev.ConsoleRenderer()
-                if settings.env == "development"
-                else structlog.processors.JSONRenderer()
-            ),
-        ],
+        processors=processors,
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         cache_logger_on_first_use=True,
     )
 
 
+def shutdown_logging() -> None:
+    """Stop the background log listener, writing any queued records."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
 def get_logger(name: str) -> structlog.BoundLogger:
     """Get a configured logger instance.
 
@@ -56,5 +117,20 @@ def get_logger(name: str) -> structlog.BoundLogger:
     return structlog.get_logger(name)
 
 
-# Initialize logging on module import
-setup_logging()
+def _configure_on_first_use(*args):
+    """Logger factory that runs ``setup_logging`` before the first logger binds.
+
+    structlog loggers are lazy proxies that call the configured factory when
+    they are first used and read the rest of the configuration afterwards, so
+    the logger returned here already picks up the settings applied above it.
+    """
+    with _setup_lock:
+        if structlog.get_config()["logger_factory"] is _configure_on_first_use:
+            setup_logging()
+    return structlog.get_config()["logger_factory"](*args)
+
+
+# Configure on first use rather than at import, so importing Athena stays cheap and
+# no listener thread starts until something logs
+structlog.configure(logger_factory=_configure_on_first_use)
+atexit.register(shutdown_logging)
@@ -0,0 +1,386 @@
+"""Opt-in profiling spans for strategies and engines.
+
+Code marks stages with ``span("name")`` or ``@profiled``. While no profiler is
+active a span is a shared no-op context manager, so instrumentation costs one
+global lookup; spans given a ``timings`` dict still time their block into it.
+While profiling, spans record per-name counters and self time per call stack,
+optionally alongside a cProfile or pyinstrument capture, and can be
+written as speedscope JSON or folded stacks for flamegraph tools.
+"""
+
+import cProfile
+import functools
+import inspect
+import json
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+try:
+    import pyinstrument
+    PYINSTRUMENT_AVAILABLE = True
+except ImportError:
+    PYINSTRUMENT_AVAILABLE = False
+
+from athena.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+CAPTURE_BACKENDS = ("cprofile", "pyinstrument")
+
+_NULL_SPAN = nullcontext()
+
+# Open spans of the current thread or task: (path, start_ns, child_ns) lists
+_stack: ContextVar[Tuple[list, ...]] = ContextVar("athena_profile_stack", default=())
+
+_active: Optional["Profiler"] = None
+
+
+class _Span:
+    """Active span that records its timing into a profiler and/or a timings dict on exit."""
+
+    __slots__ = ("_profiler", "_name", "_timings", "_key", "_frame", "_token")
+
+    def __init__(self, profiler: Optional["Profiler"], name: str,
+                 timings: Optional[Dict[str, float]] = None, key: Optional[str] = None):
+        self._profiler = profiler
+        self._name = name
+        self._timings = timings
+        self._key = key or name
+
+    def __enter__(self) -> "_Span":
+        if self._profiler is None:
+            self._frame = [None, time.perf_counter_ns(), 0]
+            return self
+
+        stack = _stack.get()
+        path = stack[-1][0] + (self._name,) if stack else (self._name,)
+        self._frame = [path, time.perf_counter_ns(), 0]
+        self._token = _stack.set(stack + (self._frame,))
+        return self
+
+    def __exit__(self, *exc) -> None:
+        elapsed = time.perf_counter_ns() - self._frame[1]
+        if self._timings is not None:
+            self._timings[self._key] = elapsed / 1e9
+        if self._profiler is None:
+            return
+
+        _stack.reset(self._token)
+        stack = _stack.get()
+        if stack:
+            stack[-1][2] += elapsed
+        self._profiler._record(self._frame[0], elapsed, self._frame[2])
+
+
+class Profiler:
+    """Collects span counters and per-stack self time.
+
+    Statistics are kept per thread and merged on read, so recording never takes
+    a lock. Memory grows with the number of distinct span stacks, not calls.
+    """
+
+    def __init__(self, capture: Optional[str] = None):
+        """Initialize profiler.
+
+        Args:
+            capture: Also run a function-level profiler: ``cprofile`` or
+                ``pyinstrument`` (None for spans only)
+
+        Raises:
+            ValueError: If the capture backend is unknown or not installed
+        """
+        if capture is not None and capture not in CAPTURE_BACKENDS:
+            raise ValueError(f"Unknown capture backend {capture!r}; use one of {CAPTURE_BACKENDS}")
+        if capture == "pyinstrument" and not PYINSTRUMENT_AVAILABLE:
+            raise ValueError("pyinstrument capture requires: pip install pyinstrument")
+
+        self.capture = capture
+        self.started_at: Optional[float] = None
+        self.duration = 0.0
+
+        self._local = threading.local()
+        self._thread_stats: List[Tuple[Dict[str, list], Dict[Tuple[str, ...], int]]] = []
+        self._lock = threading.Lock()
+        self._capture: Any = None
+
+    def span(self, name: str) -> _Span:
+        """Create a span recording into this profiler."""
+        return _Span(self, name)
+
+    def _record(self, path: Tuple[str, ...], elapsed_ns: int, child_ns: int) -> None:
+        """Add one finished span to the calling thread's statistics."""
+        try:
+            stats, stacks = self._local.stats
+        except AttributeError:
+            stats, stacks = self._local.stats = ({}, {})
+            with self._lock:
+                self._thread_stats.append((stats, stacks))
+
+        # Child tasks running concurrently can outlast their parent's own time
+        self_ns = max(0, elapsed_ns - child_ns)
+        name = path[-1]
+        entry = stats.get(name)
+        if entry is None:
+            stats[name] = [1, elapsed_ns, self_ns, elapsed_ns]
+        else:
+            entry[0] += 1
+            entry[1] += elapsed_ns
+            entry[2] += self_ns
+            if elapsed_ns > entry[3]:
+                entry[3] = elapsed_ns
+        stacks[path] = stacks.get(path, 0) + self_ns
+
+    def start(self) -> None:
+        """Start the capture backend, if any."""
+        self.started_at = time.perf_counter()
+        if self.capture == "cprofile":
+            self._capture = cProfile.Profile()
+            self._capture.enable()
+        elif self.capture == "pyinstrument":
+            self._capture = pyinstrument.Profiler()
+            self._capture.start()
+
+    def stop(self) -> None:
+        """Stop the capture backend, if any."""
+        if self.started_at is not None:
+            self.duration = time.perf_counter() - self.started_at
+        if self.capture == "cprofile" and self._capture is not None:
+            self._capture.disable()
+        elif self.capture == "pyinstrument" and self._capture is not None:
+            self._capture.stop()
+
+    def _merged(self) -> Tuple[Dict[str, list], Dict[Tuple[str, ...], int]]:
+        """Combine statistics from every thread."""
+        stats: Dict[str, list] = {}
+        stacks: Dict[Tuple[str, ...], int] = {}
+        with self._lock:
+            thread_stats = list(self._thread_stats)
+
+        for thread_spans, thread_stacks in thread_stats:
+            for name, (count, total, self_ns, max_ns) in list(thread_spans.items()):
+                entry = stats.setdefault(name, [0, 0, 0, 0])
+                entry[0] += count
+                entry[1] += total
+                entry[2] += self_ns
+                entry[3] = max(entry[3], max_ns)
+            for path, self_ns in list(thread_stacks.items()):
+                stacks[path] = stacks.get(path, 0) + self_ns
+        return stats, stacks
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """Get per-span counters, slowest total first.
+
+        Returns:
+            Rows with name, count, total_ms, self_ms, mean_ms and max_ms
+        """
+        stats, _ = self._merged()
+        rows = [
+            {
+                "name": name,
+                "count": count,
+                "total_ms": total / 1e6,
+                "self_ms": self_ns / 1e6,
+                "mean_ms": total / count / 1e6,
+                "max_ms": max_ns / 1e6,
+            }
+            for name, (count, total, self_ns, max_ns) in stats.items()
+        ]
+        return sorted(rows, key=lambda row: row["total_ms"], reverse=True)
+
+    def folded(self) -> str:
+        """Render self time per stack in folded format for flamegraph tools.
+
+        Returns:
+            One ``outer;inner microseconds`` line per stack
+        """
+        _, stacks = self._merged()
+        return "".join(
+            f"{';'.join(path)} {self_ns // 1000}\n"
+            for path, self_ns in sorted(stacks.items())
+            if self_ns >= 1000
+        )
+
+    def speedscope(self, name: str = "athena") -> Dict[str, Any]:
+        """Render span stacks as a speedscope sampled profile.
+
+        Args:
+            name: Profile name shown in speedscope
+
+        Returns:
+            Speedscope file contents
+        """
+        _, stacks = self._merged()
+        frames: Dict[str, int] = {}
+        samples, weights = [], []
+        for path, self_ns in sorted(stacks.items()):
+            if self_ns <= 0:
+                continue
+            samples.append([frames.setdefault(frame, len(frames)) for frame in path])
+            weights.append(self_ns)
+
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "athena",
+            "shared": {"frames": [{"name": frame} for frame in frames]},
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": name,
+                    "unit": "nanoseconds",
+                    "startValue": 0,
+                    "endValue": sum(weights),
+                    "samples": samples,
+                    "weights": weights,
+                }
+            ],
+        }
+
+    def save(self, output_dir: Union[str, Path], name: str = "athena") -> Dict[str, Path]:
+        """Write span and capture profiles.
+
+        Args:
+            output_dir: Directory for output files
+            name: File name prefix
+
+        Returns:
+            Paths by format: speedscope, folded and, with a capture backend,
+            cprofile (pstats) or pyinstrument (speedscope JSON)
+        """
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        paths = {
+            "speedscope": output_dir / f"{name}.speedscope.json",
+            "folded": output_dir / f"{name}.folded",
+        }
+        paths["speedscope"].write_text(json.dumps(self.speedscope(name)))
+        paths["folded"].write_text(self.folded())
+
+        if self.capture == "cprofile" and self._capture is not None:
+            paths["cprofile"] = output_dir / f"{name}.prof"
+            self._capture.dump_stats(paths["cprofile"])
+        elif self.capture == "pyinstrument" and self._capture is not None:
+            from pyinstrument.renderers import SpeedscopeRenderer
+
+            paths["pyinstrument"] = output_dir / f"{name}.pyinstrument.speedscope.json"
+            paths["pyinstrument"].write_text(self._capture.output(SpeedscopeRenderer()))
+
+        return paths
+
+
+def span(name: str, timings: Optional[Dict[str, float]] = None, key: Optional[str] = None):
+    """Time a block under a span name while profiling is active.
+
+    Args:
+        name: Span name, e.g. ``backtest.simulation``
+        timings: Dict that receives the block's duration in seconds, profiling or not
+        key: Key for the duration in ``timings`` (defaults to ``name``)
+
+    Returns:
+        Context manager (a shared no-op while profiling is off and no timings are kept)
+    """
+    profiler = _active
+    if profiler is None and timings is None:
+        return _NULL_SPAN
+    return _Span(profiler, name, timings, key)
+
+
+def profiled(name: Optional[str] = None) -> Callable[[Callable], Callable]:
+    """Decorate a function or coroutine function to run inside a span.
+
+    Args:
+        name: Span name (defaults to the function's qualified name)
+    """
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                profiler = _active
+                if profiler is None:
+                    return await func(*args, **kwargs)
+                with _Span(profiler, span_name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            profiler = _active
+            if profiler is None:
+                return func(*args, **kwargs)
+            with _Span(profiler, span_name):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+def get_profiler() -> Optional[Profiler]:
+    """Get the active profiler, if profiling is on."""
+    return _active
+
+
+def start_profiling(capture: Optional[str] = None) -> Profiler:
+    """Start collecting spans globally.
+
+    Args:
+        capture: Optional function-level capture backend (cprofile or pyinstrument)
+
+    Returns:
+        The active profiler
+
+    Raises:
+        RuntimeError: If profiling is already active
+    """
+    global _active
+    if _active is not None:
+        raise RuntimeError("Profiling is already active")
+
+    profiler = Profiler(capture)
+    profiler.start()
+    _active = profiler
+    return profiler
+
+
+def stop_profiling() -> Optional[Profiler]:
+    """Stop collecting spans.
+
+    Returns:
+        The profiler that was active, or None
+    """
+    global _active
+    profiler, _active = _active, None
+    if profiler is not None:
+        profiler.stop()
+    return profiler
+
+
+@contextmanager
+def profiling(
+    output_dir: Optional[Union[str, Path]] = None,
+    name: str = "athena",
+    capture: Optional[str] = None,
+) -> Iterator[Profiler]:
+    """Profile a block and optionally write the results.
+
+    Args:
+        output_dir: Directory to write profiles to (nothing written if None)
+        name: File name prefix
+        capture: Optional function-level capture backend (cprofile or pyinstrument)
+
+    Yields:
+        The active profiler
+    """
+    profiler = start_profiling(capture)
+    try:
+        yield profiler
+    finally:
+        stop_profiling()
+        if output_dir is not None:
+            paths = profiler.save(output_dir, name)
+            logger.info(f"Profile written to {paths['speedscope']}")
@@ -51,6 +51,17 @@ class Order:
     filled_price: float = 0.0
     commission: float = 0.0
     metadata: Optional[Dict] = None
+    time_in_force: Optional[str] = None
+
+
+@dataclass
+class OrderResult:
+    """Outcome of one order in a batch submission."""
+
+    order: Order
+    success: bool
+    latency_ms: float
+    error: Optional[str] = None
 
 
 @dataclass
@@ -1,11 +1,9 @@
 """Athena Trading Dashboard."""
 
 import json
-import asyncio
-import concurrent.futures
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import logging
 import os
 
@@ -15,13 +13,16 @@ import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
-from dash import Input, Output, State, callback, dash_table, dcc, html
+from dash import Input, Output, State, callback, dash_table, dcc, html, no_update
 import numpy as np
 
-from athena.backtest.engine import BacktestEngine
+from athena.backtest.cache import BacktestCache
 from athena.backtest.walk_forward import WalkForwardValidator
-from athena.data.yahoo import YahooDataAdapter
-from athena.optimize.optimizer import get_param_space, StrategyOptimizer
+from athena.core.config import settings
+from athena.dashboard.downsample import downsample, visible_range
+from athena.dashboard.jobs import JobManager, JobStatus, backtest_job, optimization_job
+from athena.dashboard.result_store import ResultStore
+from athena.optimize.optimizer import get_param_space
 from athena.strategies.bollinger_bands import BollingerBandsStrategy
 from athena.strategies.momentum import MomentumStrategy
 from athena.strategies.sma_crossover import SMACrossoverStrategy
@@ -61,6 +62,9 @@ ARTIFACTS_DIR = Path("artifacts/dashboard_media")
 CACHE_DIR.mkdir(exist_ok=True)
 ARTIFACTS_DIR.mkdir(parents=True, exist_ok=True)
 
+# Content-addressed backtest results shared by all callbacks (replaces per-click JSON dumps)
+BACKTEST_CACHE = BacktestCache(cache_dir=CACHE_DIR / "backtests")
+
 # Risk model options
 RISK_MODELS = {
     "Fixed Fraction": "fixed_fraction",
@@ -68,8 +72,30 @@ RISK_MODELS = {
     "Capped Kelly": "capped_kelly"
 }
 
-# Executor for async tasks
-executor = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+# Backtests and optimizations run in background processes; callbacks only submit and poll
+JOBS = JobManager(max_workers=settings.dashboard_job_workers)
+JOB_POLL_MS = 1000
+
+# Finished backtests stay server-side, owned by RESULTS (bounded by
+# dashboard_result_cache_size); dcc.Store only holds a handle
+RESULTS = ResultStore(max_results=settings.dashboard_result_cache_size)
+
+
+def job_key(kind: str, *params: Any) -> str:
+    """Identify a job request so identical requests share one run."""
+    return json.dumps([kind, *params], sort_keys=True, default=str)
+
+
+def release_job(active_jobs: Optional[Dict[str, str]], kind: str) -> None:
+    """Drop this session's interest in its previous job of a kind.
+
+    Called after submitting a replacement, so a superseded job stops unless
+    another session is still waiting for it (resubmitting the same request
+    just leaves its subscriber count unchanged).
+    """
+    previous = (active_jobs or {}).get(kind)
+    if previous is not None:
+        JOBS.cancel(previous)
 
 
 def create_header() -> dbc.Container:
@@ -309,6 +335,42 @@ def create_controls() -> dbc.Card:
     )
 
 
+def create_job_panel() -> dbc.Card:
+    """Create background job status panel."""
+    return dbc.Card(
+        dbc.CardBody(
+            dbc.Row(
+                [
+                    dbc.Col(
+                        [
+                            dbc.Alert(
+                                id="job-status",
+                                is_open=False,
+                                color="info",
+                                className="mb-2",
+                            ),
+                            dbc.Progress(id="job-progress", value=0, striped=True, animated=True),
+                        ],
+                        width=9,
+                    ),
+                    dbc.Col(
+                        dbc.Button(
+                            [html.I(className="fas fa-stop me-2"), "Cancel"],
+                            id="cancel-jobs-btn",
+                            color="secondary",
+                            outline=True,
+                            className="w-100",
+                        ),
+                        width=3,
+                    ),
+                ],
+                align="center",
+            )
+        ),
+        className="mb-4",
+    )
+
+
 def create_results_section() -> html.Div:
     """Create results display section."""
     return html.Div(
@@ -475,6 +537,8 @@ app.layout = dbc.Container(
         dcc.Store(id="backtest-results"),
         dcc.Store(id="optimization-results"),
         dcc.Store(id="wfv-results"),
+        dcc.Store(id="active-jobs", data={}),
+        dcc.Interval(id="job-poller", interval=JOB_POLL_MS, disabled=True),
         dcc.Interval(
             id="interval-component",
             interval=5*1000,  # Update every 5 seconds
@@ -483,6 +547,7 @@ app.layout = dbc.Container(
         ),
         create_header(),
         create_controls(),
+        create_job_panel(),
         create_results_section(),
         # Demo banner with sample data
         dbc.Alert([
@@ -561,12 +626,11 @@ def update_strategy_params(strategy_name: str) -> List[html.Div]:
 
 @callback(
     [
-        Output("backtest-results", "data"),
-        Output("alert-message", "children"),
-        Output("alert-message", "color"),
-        Output("alert-message", "is_open"),
-        Output("results-section", "style"),
-        Output("export-btn", "disabled"),
+        Output("active-jobs", "data", allow_duplicate=True),
+        Output("job-status", "children", allow_duplicate=True),
+        Output("job-status", "color", allow_duplicate=True),
+        Output("job-status", "is_open", allow_duplicate=True),
+        Output("job-poller", "disabled", allow_duplicate=True),
     ],
     Input("run-backtest-btn", "n_clicks"),
     [
@@ -578,138 +642,59 @@ def update_strategy_params(strategy_name: str) -> List[html.Div]:
         State("commission-input", "value"),
         State("risk-model-dropdown", "value"),
         State("position-size-input", "value"),
-    ]
-    + [
-        State("strategy-params", "children")
+        State("strategy-params", "children"),
+        State("active-jobs", "data"),
     ],
     prevent_initial_call=True,
 )
 def run_backtest(
-    n_clicks, symbol, strategy_name, start_date, end_date, capital, commission, risk_model, position_size, strategy_params_children
+    n_clicks, symbol, strategy_name, start_date, end_date, capital, commission, risk_model,
+    position_size, strategy_params_children, active_jobs=None
 ):
-    """Run backtest with given parameters."""
+    """Submit a backtest job with given parameters."""
     logger.info(f"Backtest callback triggered: n_clicks={n_clicks}, symbol={symbol}")
 
     if not n_clicks:
-        return None, "", "info", False, {"display": "none"}, True
-
-    try:
-        # Add immediate feedback
-        logger.info(f"Starting backtest with symbol={symbol}, strategy={strategy_name}")
-
-        # Validate inputs
-        if not all([symbol, strategy_name, start_date, end_date]):
-            logger.warning("Missing required inputs for backtest")
-            return (
-                None,
-                "Please fill in all required fields.",
-                "warning",
-                True,
-                {"display": "none"},
-                True,
-            )
+        return no_update, no_update, no_update, no_update, no_update
 
-        # Get parameter space for strategy
-        param_space = PARAM_SPACES[strategy_name]
-
-        # Extract parameters from strategy params inputs
-        params = {}
-        if strategy_params_children:
-            from dash import ctx
-            # Get current parameter values from the strategy params section
-            for param_name, param_config in param_space.items():
-                # Use default value for now - in a full implementation, you'd extract from inputs
-                params[param_name] = param_config.get("default", param_config["low"])
-
-        # Download data
-        provider = YahooDataAdapter()
-        data = provider.fetch(symbol, start_date, end_date)
-
-        if data.empty:
-            return (
-                None,
-                f"No data available for {symbol} in the specified date range.",
-                "danger",
-                True,
-                {"display": "none"},
-                True,
-            )
-
-        # Initialize strategy
-        strategy_class = STRATEGY_CLASSES[strategy_name]
-        strategy = strategy_class(**params)
+    # Validate inputs
+    if not all([symbol, strategy_name, start_date, end_date]):
+        logger.warning("Missing required inputs for backtest")
+        return no_update, "Please fill in all required fields.", "warning", True, no_update
 
-        # Run backtest
-        engine = BacktestEngine(
-            initial_capital=capital,
-            commission=commission / 10000,  # Convert bps to decimal
-        )
+    # Use parameter defaults - in a full implementation, you'd extract from inputs
+    params = {}
+    if strategy_params_children:
+        for param_name, param_config in PARAM_SPACES[strategy_name].items():
+            params[param_name] = param_config.get("default", param_config["low"])
 
-        result = engine.run(strategy, data, symbol)
-
-        # Prepare results for JSON serialization
-        results_data = {
-            "symbol": symbol,
-            "strategy": strategy_name,
-            "params": params,
-            "metrics": {
-                "initial_capital": result.initial_capital,
-                "final_capital": result.final_capital,
-                "total_return": result.total_return,
-                "annualized_return": result.annualized_return,
-                "sharpe_ratio": result.sharpe_ratio,
-                "max_drawdown": result.max_drawdown,
-                "win_rate": result.win_rate,
-                "total_trades": result.total_trades,
-                "avg_trade_return": result.avg_trade_return,
-                "volatility": result.volatility,
-            },
-            "equity_curve": result.equity_curve.to_dict("index"),
-            "trades": [
-                {
-                    "entry_date": trade.entry_date.isoformat(),
-                    "exit_date": trade.exit_date.isoformat() if trade.exit_date else None,
-                    "symbol": trade.symbol,
-                    "side": trade.side.value,
-                    "quantity": trade.quantity,
-                    "entry_price": trade.entry_price,
-                    "exit_price": trade.exit_price,
-                    "pnl": trade.pnl,
-                    "return_pct": trade.return_pct,
-                }
-                for trade in result.trades
-            ],
-            "daily_returns": (
-                result.daily_returns.to_dict("index") if hasattr(result, "daily_returns") else {}
-            ),
-        }
-
-        # Cache results
-        cache_file = (
-            CACHE_DIR
-            / f"backtest_{symbol}_{strategy_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        )
-        with open(cache_file, "w") as f:
-            json.dump(results_data, f, indent=2, default=str)
-
-        return (
-            results_data,
-            f"Backtest completed successfully! Total Return: {result.total_return:.2%}",
-            "success",
-            True,
-            {"display": "block"},
-            False,
+    try:
+        job_id = JOBS.submit(
+            "backtest",
+            backtest_job,
+            STRATEGY_CLASSES[strategy_name],
+            strategy_name,
+            params,
+            symbol,
+            start_date,
+            end_date,
+            capital,
+            commission / 10000,  # Convert bps to decimal
+            BACKTEST_CACHE,
+            key=job_key("backtest", symbol, strategy_name, params, start_date, end_date,
+                        capital, commission),
         )
-
     except Exception as e:
-        return (
-            None,
-            f"Error running backtest: {str(e)}",
-            "danger",
-            True,
-            {"display": "none"},
-            True,
-        )
+        return no_update, f"Error running backtest: {str(e)}", "danger", True, no_update
+
+    release_job(active_jobs, "backtest")
+    return (
+        {**(active_jobs or {}), "backtest": job_id},
+        f"Backtest queued for {symbol}...",
+        "info",
+        True,
+        False,
+    )
 
 
 @callback(
@@ -852,22 +837,24 @@ def update_quick_stats(results_data):
 @callback(
     Output("equity-curve-chart", "figure"),
     Input("backtest-results", "data"),
+    Input("equity-curve-chart", "relayoutData"),
 )
-def update_equity_curve(results_data):
+def update_equity_curve(results_data, relayout_data=None):
     """Update equity curve chart."""
-    if not results_data:
+    result = RESULTS.get(results_data)
+    if result is None:
         return {}
 
-    equity_data = results_data["equity_curve"]
-    dates = list(equity_data.keys())
-    values = list(equity_data.values())
+    equity = downsample(
+        result.equity_curve, settings.dashboard_max_points, visible_range(relayout_data)
+    )
 
     fig = go.Figure()
 
     fig.add_trace(
         go.Scatter(
-            x=dates,
-            y=values,
+            x=equity.index,
+            y=equity.values,
             mode="lines",
             name="Portfolio Value",
             line=dict(color="#1f77b4", width=2),
@@ -880,6 +867,7 @@ def update_equity_curve(results_data):
         yaxis_title="Portfolio Value ($)",
         hovermode="x unified",
         template="plotly_white",
+        uirevision=results_data["id"],  # Keep the zoom while points are re-fetched
     )
 
     return fig
@@ -888,26 +876,24 @@ def update_equity_curve(results_data):
 @callback(
     Output("drawdown-chart", "figure"),
     Input("backtest-results", "data"),
+    Input("drawdown-chart", "relayoutData"),
 )
-def update_drawdown_chart(results_data):
+def update_drawdown_chart(results_data, relayout_data=None):
     """Update drawdown chart."""
-    if not results_data:
+    result = RESULTS.get(results_data)
+    if result is None:
         return {}
 
-    equity_data = results_data["equity_curve"]
-    dates = list(equity_data.keys())
-    values = list(equity_data.values())
-
-    # Calculate drawdown
-    peak = pd.Series(values).expanding().max()
-    drawdown = (pd.Series(values) - peak) / peak * 100
+    drawdown = downsample(
+        result.drawdown, settings.dashboard_max_points, visible_range(relayout_data)
+    )
 
     fig = go.Figure()
 
     fig.add_trace(
         go.Scatter(
-            x=dates,
-            y=drawdown,
+            x=drawdown.index,
+            y=drawdown.values,
             mode="lines",
             name="Drawdown",
             fill="tonexty",
@@ -921,6 +907,7 @@ def update_drawdown_chart(results_data):
         yaxis_title="Drawdown (%)",
         hovermode="x unified",
         template="plotly_white",
+        uirevision=results_data["id"],
     )
 
     return fig
@@ -932,17 +919,20 @@ def update_drawdown_chart(results_data):
 )
 def update_returns_distribution(results_data):
     """Update returns distribution chart."""
-    if not results_data or not results_data.get("daily_returns"):
+    result = RESULTS.get(results_data)
+    if result is None or result.daily_returns.empty:
         return {}
 
-    daily_returns = list(results_data["daily_returns"].values())
+    # Bin on the server so only 50 bars are sent, however long the backtest
+    counts, edges = np.histogram(result.daily_returns.dropna().values, bins=50)
 
     fig = go.Figure()
 
     fig.add_trace(
-        go.Histogram(
-            x=daily_returns,
-            nbinsx=50,
+        go.Bar(
+            x=(edges[:-1] + edges[1:]) / 2,
+            y=counts,
+            width=np.diff(edges),
             name="Daily Returns",
             opacity=0.7,
         )
@@ -964,10 +954,11 @@ def update_returns_distribution(results_data):
 )
 def update_trade_table(results_data):
     """Update trade analysis table."""
-    if not results_data or not results_data["trades"]:
+    result = RESULTS.get(results_data)
+    if result is None or not result.trades:
         return "No trades executed."
 
-    trades = results_data["trades"]
+    trades = result.trades
 
     # Format trades for display
     formatted_trades = []
@@ -1012,18 +1003,19 @@ def update_trade_table(results_data):
 @callback(
     Output("rolling-sharpe-chart", "figure"),
     Input("backtest-results", "data"),
+    Input("rolling-sharpe-chart", "relayoutData"),
 )
-def update_rolling_sharpe(results_data):
+def update_rolling_sharpe(results_data, relayout_data=None):
     """Update rolling Sharpe ratio chart."""
-    if not results_data or not results_data.get("daily_returns"):
+    result = RESULTS.get(results_data)
+    if result is None or result.daily_returns.empty:
         return {}
 
-    daily_returns = pd.Series(results_data["daily_returns"])
-    daily_returns.index = pd.to_datetime(daily_returns.index)
-
-    # Calculate rolling Sharpe ratio (30-day window)
-    window = 30
-    rolling_sharpe = daily_returns.rolling(window=window).mean() / daily_returns.rolling(window=window).std() * np.sqrt(252)
+    # Rolling Sharpe ratio (30-day window), computed once per result
+    rolling_sharpe = downsample(
+        result.rolling_sharpe(window=30), settings.dashboard_max_points,
+        visible_range(relayout_data),
+    )
 
     fig = go.Figure()
 
@@ -1046,6 +1038,7 @@ def update_rolling_sharpe(results_data):
         yaxis_title="Sharpe Ratio",
         hovermode="x unified",
         template="plotly_white",
+        uirevision=results_data["id"],
     )
 
     return fig
@@ -1199,10 +1192,11 @@ def update_wfv_table(wfv_data):
 
 @callback(
     [
-        Output("optimization-results", "data"),
-        Output("alert-message", "children", allow_duplicate=True),
-        Output("alert-message", "color", allow_duplicate=True),
-        Output("alert-message", "is_open", allow_duplicate=True),
+        Output("active-jobs", "data", allow_duplicate=True),
+        Output("job-status", "children", allow_duplicate=True),
+        Output("job-status", "color", allow_duplicate=True),
+        Output("job-status", "is_open", allow_duplicate=True),
+        Output("job-poller", "disabled", allow_duplicate=True),
     ],
     Input("optimize-btn", "n_clicks"),
     [
@@ -1212,72 +1206,160 @@ def update_wfv_table(wfv_data):
         State("end-date", "date"),
         State("capital-input", "value"),
         State("commission-input", "value"),
+        State("active-jobs", "data"),
     ],
     prevent_initial_call=True,
 )
-def run_optimization(n_clicks, symbol, strategy_name, start_date, end_date, capital, commission):
-    """Run parameter optimization."""
+def run_optimization(
+    n_clicks, symbol, strategy_name, start_date, end_date, capital, commission, active_jobs=None
+):
+    """Submit a parameter optimization job."""
     if not n_clicks:
-        return None, "", "info", False
+        return no_update, no_update, no_update, no_update, no_update
 
     try:
-        provider = YahooDataAdapter()
-        data = provider.fetch(symbol, start_date, end_date)
-
-        if data.empty:
-            return None, f"No data available for {symbol}", "danger", True
-
-        strategy_class = STRATEGY_CLASSES[strategy_name]
-        optimizer = StrategyOptimizer(
-            initial_capital=capital,
-            commission=commission / 10000,
-        )
-
-        best_params, study = optimizer.optimize(
-            strategy_class=strategy_class,
-            param_space=PARAM_SPACES[strategy_name],
-            data=data,
-            symbol=symbol,
+        job_id = JOBS.submit(
+            "optimization",
+            optimization_job,
+            STRATEGY_CLASSES[strategy_name],
+            strategy_name,
+            PARAM_SPACES[strategy_name],
+            symbol,
+            start_date,
+            end_date,
+            capital,
+            commission / 10000,
             n_trials=50,
+            key=job_key("optimization", symbol, strategy_name, start_date, end_date,
+                        capital, commission),
         )
+    except Exception as e:
+        logger.error(f"Optimization error: {e}")
+        return no_update, f"Optimization failed: {str(e)}", "danger", True, no_update
+
+    release_job(active_jobs, "optimization")
+    return (
+        {**(active_jobs or {}), "optimization": job_id},
+        f"Optimization queued for {symbol}...",
+        "info",
+        True,
+        False,
+    )
 
-        trials_data = []
-        for trial in study.trials:
-            trial_data = {
-                "trial_number": trial.number,
-                "sharpe_ratio": trial.value if trial.value else 0,
-            }
-            
-            for param_name, param_value in trial.params.items():
-                trial_data[f"param_{param_name}"] = param_value
-            
-            if trial.user_attrs:
-                trial_data.update({
-                    "total_return": trial.user_attrs.get("total_return", 0),
-                    "max_drawdown": trial.user_attrs.get("max_drawdown", 0),
-                    "win_rate": trial.user_attrs.get("win_rate", 0),
-                })
-            
-            trials_data.append(trial_data)
-
-        optimization_results = {
-            "best_params": best_params,
-            "best_value": study.best_value,
-            "trials": trials_data,
-            "symbol": symbol,
-            "strategy": strategy_name,
-        }
 
-        return (
-            optimization_results,
-            f"Optimization completed! Best Sharpe: {study.best_value:.3f}",
-            "success",
-            True,
-        )
+@callback(
+    [
+        Output("backtest-results", "data"),
+        Output("optimization-results", "data"),
+        Output("results-section", "style"),
+        Output("export-btn", "disabled"),
+        Output("job-status", "children"),
+        Output("job-status", "color"),
+        Output("job-status", "is_open"),
+        Output("job-progress", "value"),
+        Output("active-jobs", "data"),
+        Output("job-poller", "disabled"),
+    ],
+    Input("job-poller", "n_intervals"),
+    State("active-jobs", "data"),
+    prevent_initial_call=True,
+)
+def poll_jobs(n_intervals, active_jobs):
+    """Check submitted jobs and publish results as they finish."""
+    active_jobs = dict(active_jobs or {})
+    results = {"backtest": no_update, "optimization": no_update}
+    section_style = export_disabled = no_update
+    lines, progress, color = [], [], "info"
+
+    for kind, job_id in list(active_jobs.items()):
+        job = JOBS.get(job_id)
+        title = kind.title()
+        if job is None:
+            # Evicted from the job cache or lost in a server restart
+            del active_jobs[kind]
+            lines.append(f"{title} job expired; please run it again.")
+            color = "warning"
+        elif job.status is JobStatus.DONE:
+            del active_jobs[kind]
+            if kind == "backtest":
+                # RESULTS owns finished backtests; the job cache keeps only metadata.
+                # Sessions sharing the job find the result there after the first poll.
+                stored = JOBS.take_result(job_id)
+                if stored is not None:
+                    RESULTS.put(job_id, stored)
+                stored = RESULTS.get(job_id)
+                if stored is None:
+                    lines.append("Backtest result expired; please run it again.")
+                    color = "warning"
+                    continue
+                results[kind] = stored.handle(job_id)
+                section_style, export_disabled = {"display": "block"}, False
+                total_return = stored.metrics["total_return"]
+                lines.append(f"Backtest completed successfully! Total Return: {total_return:.2%}")
+            else:
+                results[kind] = job.result
+                lines.append(f"Optimization completed! Best Sharpe: {job.result['best_value']:.3f}")
+            color = "success" if color == "info" else color
+        elif job.status is JobStatus.FAILED:
+            del active_jobs[kind]
+            lines.append(f"{title} failed: {job.error}")
+            color = "danger"
+        elif job.status is JobStatus.CANCELLED:
+            del active_jobs[kind]
+            lines.append(f"{title} cancelled.")
+            color = "secondary" if color == "info" else color
+        else:
+            progress.append(job.progress)
+            status = job.message or job.status.value.title()
+            lines.append(f"{title}: {status} ({job.progress:.0%}, {job.elapsed:.0f}s)")
+
+    return (
+        results["backtest"],
+        results["optimization"],
+        section_style,
+        export_disabled,
+        " | ".join(lines) if lines else no_update,
+        color,
+        bool(lines) or no_update,
+        100 * min(progress) if progress else (100 if lines else no_update),
+        active_jobs,
+        not active_jobs,
+    )
 
-    except Exception as e:
-        logger.error(f"Optimization error: {e}")
-        return None, f"Optimization failed: {str(e)}", "danger", True
+
+@callback(
+    [
+        Output("job-status", "children", allow_duplicate=True),
+        Output("job-status", "color", allow_duplicate=True),
+        Output("job-status", "is_open", allow_duplicate=True),
+        Output("active-jobs", "data", allow_duplicate=True),
+        Output("job-poller", "disabled", allow_duplicate=True),
+    ],
+    Input("cancel-jobs-btn", "n_clicks"),
+    State("active-jobs", "data"),
+    prevent_initial_call=True,
+)
+def cancel_jobs(n_clicks, active_jobs):
+    """Cancel this session's running jobs.
+
+    Jobs shared with other sessions keep running for them; this session stops
+    following every job it cancelled either way.
+    """
+    if not n_clicks or not active_jobs:
+        return "No running jobs to cancel.", "secondary", True, no_update, no_update
+
+    cancelled = [kind for kind, job_id in active_jobs.items() if JOBS.cancel(job_id)]
+    if not cancelled:
+        return "Jobs already finished.", "secondary", True, no_update, no_update
+
+    remaining = {kind: job_id for kind, job_id in active_jobs.items() if kind not in cancelled}
+    return (
+        f"Cancelled {', '.join(cancelled)}.",
+        "warning",
+        True,
+        remaining,
+        not remaining,
+    )
 
 
 # Demo data callback
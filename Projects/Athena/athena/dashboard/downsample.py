@@ -0,0 +1,238 @@
+"""Server-side downsampling of chart series.
+
+A chart cannot show more points than it has pixels, but Plotly still ships and
+renders every point it is given. Series are reduced to roughly the chart width
+before they leave the server:
+
+- Line series use MinMaxLTTB: a min-max pass keeps each bucket's extremes,
+  then Largest-Triangle-Three-Buckets picks the visually significant points
+  among them. The overall peak and trough are always kept.
+- OHLC bars are aggregated into wider candles (first open, max high, min low,
+  last close, summed volume), which keeps every extreme inside a candle.
+
+Zoomed charts pass their visible x range (see ``visible_range``) and get a full
+point budget for that range, so detail reappears as the user zooms in.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_MAX_POINTS = 2000
+
+# Min-max preselection keeps this many candidates per output point for LTTB
+MINMAX_RATIO = 4
+
+OHLC_AGGREGATES = {
+    "open": "first",
+    "high": "max",
+    "low": "min",
+    "close": "last",
+    "volume": "sum",
+}
+
+XRange = Tuple[Any, Any]
+
+
+def lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets point selection.
+
+    The first and last points are always kept. Every bucket in between keeps
+    the point forming the largest triangle with the previously kept point and
+    the average of the next bucket.
+
+    Args:
+        x: Increasing x values as floats
+        y: Y values without NaNs
+        n_out: Number of points to keep
+
+    Returns:
+        Sorted indices of the kept points
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # n_out - 2 buckets over the interior points; the last edge is the final point
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(area.argmax())
+        selected[i + 1] = a
+
+    return selected
+
+
+def minmax(y: np.ndarray, n_out: int) -> np.ndarray:
+    """Keep the minimum and maximum of each of ``n_out // 2`` equal buckets.
+
+    Args:
+        y: Values without NaNs
+        n_out: Approximate number of points to keep
+
+    Returns:
+        Sorted, unique indices including the first and last point
+    """
+    n = len(y)
+    if n_out >= n or n_out < 4:
+        return np.arange(n)
+
+    size = -(-n // (n_out // 2))
+    n_buckets = -(-n // size)
+    padded = np.full(n_buckets * size, np.nan)
+    padded[:n] = y
+    buckets = padded.reshape(n_buckets, size)
+
+    offsets = np.arange(n_buckets) * size
+    indices = np.concatenate(
+        [
+            [0, n - 1],
+            offsets + np.nanargmin(buckets, axis=1),
+            offsets + np.nanargmax(buckets, axis=1),
+        ]
+    )
+    return np.unique(indices)
+
+
+def minmax_lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """LTTB over min-max preselected points.
+
+    Much faster than plain LTTB on long series. LTTB alone can trade an
+    extreme for a point forming a larger triangle, so the overall maximum and
+    minimum are always kept: the highest peak and deepest drawdown are exact.
+
+    Args:
+        x: Increasing x values as floats
+        y: Y values without NaNs
+        n_out: Number of points to keep
+
+    Returns:
+        Sorted indices of at most ``n_out`` kept points
+    """
+    if len(y) <= n_out:
+        return np.arange(len(y))
+
+    n_lttb = max(n_out - 2, 3)
+    if len(y) <= n_lttb * MINMAX_RATIO:
+        selected = lttb(x, y, n_lttb)
+    else:
+        candidates = minmax(y, n_lttb * MINMAX_RATIO)
+        selected = candidates[lttb(x[candidates], y[candidates], n_lttb)]
+    return np.union1d(selected, [y.argmin(), y.argmax()])
+
+
+def _numeric_index(index: pd.Index) -> np.ndarray:
+    """X positions as floats (nanoseconds for datetimes)."""
+    if isinstance(index, pd.DatetimeIndex):
+        return index.asi8.astype(np.float64)
+    if pd.api.types.is_numeric_dtype(index):
+        return np.asarray(index, dtype=np.float64)
+    return np.arange(len(index), dtype=np.float64)
+
+
+def _slice_range(data: Any, x_range: Optional[XRange]) -> Any:
+    """Limit a Series or DataFrame to an x range plus one point on each side.
+
+    The extra points let lines run to the edges of the zoomed chart.
+    """
+    if x_range is None or not data.index.is_monotonic_increasing:
+        return data
+    start, end = x_range
+    if isinstance(data.index, pd.DatetimeIndex):
+        start, end = pd.Timestamp(start), pd.Timestamp(end)
+        if data.index.tz is not None:
+            start = start.tz_localize(data.index.tz) if start.tz is None else start
+            end = end.tz_localize(data.index.tz) if end.tz is None else end
+    first = max(int(data.index.searchsorted(start, side="left")) - 1, 0)
+    last = int(data.index.searchsorted(end, side="right")) + 1
+    return data.iloc[first:last]
+
+
+def downsample(
+    series: pd.Series,
+    max_points: int = DEFAULT_MAX_POINTS,
+    x_range: Optional[XRange] = None,
+) -> pd.Series:
+    """Reduce a line series to at most ``max_points`` points.
+
+    Args:
+        series: Series indexed by its x values
+        max_points: Point budget, roughly the chart width in pixels
+        x_range: Visible (start, end) x range; points outside it are dropped
+
+    Returns:
+        Subset of the series that draws the same line, without NaNs
+    """
+    series = _slice_range(series.dropna(), x_range)
+    if len(series) <= max_points:
+        return series
+
+    x = _numeric_index(series.index)
+    y = series.to_numpy(dtype=np.float64)
+    return series.iloc[minmax_lttb(x, y, max_points)]
+
+
+def downsample_ohlc(
+    data: pd.DataFrame,
+    max_points: int = DEFAULT_MAX_POINTS,
+    x_range: Optional[XRange] = None,
+) -> pd.DataFrame:
+    """Aggregate OHLCV bars into at most ``max_points`` wider bars.
+
+    Open/high/low/close/volume columns (any capitalization) are aggregated as
+    candles; other columns, such as indicators, keep their last value.
+
+    Args:
+        data: Bars indexed by time
+        max_points: Maximum number of bars to return
+        x_range: Visible (start, end) x range; bars outside it are dropped
+
+    Returns:
+        Aggregated bars indexed by the first timestamp of each group
+    """
+    data = _slice_range(data, x_range)
+    if len(data) <= max_points:
+        return data
+
+    size = -(-len(data) // max_points)
+    groups = np.arange(len(data)) // size
+    aggregates = {
+        column: OHLC_AGGREGATES.get(str(column).lower(), "last") for column in data.columns
+    }
+    bars = data.groupby(groups).agg(aggregates)
+    bars.index = data.index[::size]
+    return bars
+
+
+def visible_range(
+    relayout_data: Optional[Dict[str, Any]], axis: str = "xaxis"
+) -> Optional[XRange]:
+    """Extract the zoomed x range from a Plotly ``relayoutData`` event.
+
+    Args:
+        relayout_data: ``relayoutData`` property of a ``dcc.Graph``
+        axis: Layout axis name
+
+    Returns:
+        (start, end) of the visible range, or None when showing everything
+    """
+    if not relayout_data or relayout_data.get(f"{axis}.autorange"):
+        return None
+    if f"{axis}.range[0]" in relayout_data and f"{axis}.range[1]" in relayout_data:
+        return relayout_data[f"{axis}.range[0]"], relayout_data[f"{axis}.range[1]"]
+    if f"{axis}.range" in relayout_data:
+        start, end = relayout_data[f"{axis}.range"]
+        return start, end
+    return None
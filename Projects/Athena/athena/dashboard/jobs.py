@@ -0,0 +1,585 @@
+"""Background jobs for long-running dashboard work.
+
+Backtests and optimizations run in a local process pool instead of inside Dash
+callbacks. Callbacks submit a job, keep its ID in a ``dcc.Store`` and poll it
+from a ``dcc.Interval``. Jobs report progress and check for cancellation through
+``report_progress``; finished results are cached by key, so identical requests
+from several users share one run. A shared run counts its subscribers and is
+only cancelled when the last of them cancels.
+
+Job state lives in the web server process: run the dashboard with one process
+and several threads (e.g. ``gunicorn --workers 1 --threads 8``) so every poll
+reaches the manager that owns the job.
+"""
+
+import multiprocessing
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field, fields
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from athena.core.logging import get_logger
+from athena.dashboard.result_store import StoredResult
+
+logger = get_logger(__name__)
+
+
+class JobStatus(str, Enum):
+    """Lifecycle of a background job."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job has stopped for good."""
+        return self in (JobStatus.DONE, JobStatus.FAILED, JobStatus.CANCELLED)
+
+
+class JobCancelled(Exception):
+    """Raised inside a job when its cancellation has been requested."""
+
+
+@dataclass
+class Job:
+    """A submitted unit of background work."""
+
+    id: str
+    kind: str
+    key: Optional[str] = None
+    subscribers: int = 1
+    status: JobStatus = JobStatus.PENDING
+    progress: float = 0.0
+    message: str = ""
+    result: Any = None
+    error: Optional[str] = None
+    submitted_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds spent running so far (0 while pending)."""
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.time()) - self.started_at
+
+    def to_dict(self, include_result: bool = False) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary.
+
+        Args:
+            include_result: Include the job result (can be large)
+
+        Returns:
+            Job fields with the status as a string
+        """
+        # Shallow on purpose: results can be large and are never copied here
+        data = {
+            f.name: getattr(self, f.name)
+            for f in fields(self)
+            if include_result or f.name != "result"
+        }
+        data["status"] = self.status.value
+        data["elapsed"] = self.elapsed
+        return data
+
+
+# Worker-side state, set in each pool process by _init_worker
+_updates: Any = None
+_cancelled: Any = None
+_current_job: Optional[str] = None
+
+
+def report_progress(fraction: float, message: str = "") -> None:
+    """Report progress of the running job and honour cancellation.
+
+    Does nothing outside a job, so job functions can also be called directly.
+
+    Args:
+        fraction: Completed fraction between 0 and 1
+        message: Short status text for the UI
+
+    Raises:
+        JobCancelled: If cancellation of the current job was requested
+    """
+    job_id = _current_job
+    if job_id is None:
+        return
+    if job_id in _cancelled:
+        raise JobCancelled(job_id)
+    _updates.put((job_id, "progress", (min(max(fraction, 0.0), 1.0), message)))
+
+
+def _init_worker(updates: Any, cancelled: Any) -> None:
+    """Attach a pool process to the manager's update queue and cancellation set."""
+    global _updates, _cancelled
+    _updates = updates
+    _cancelled = cancelled
+
+
+def _run_job(
+    job_id: str, func: Callable, args: tuple, kwargs: Dict[str, Any]
+) -> Tuple[float, Any]:
+    """Run a job function in a pool process.
+
+    Returns:
+        Start time and result; the start time also travels with the result
+        because a quick job can finish before its "started" update is read
+    """
+    global _current_job
+    if job_id in _cancelled:
+        raise JobCancelled(job_id)
+
+    _current_job = job_id
+    started_at = time.time()
+    _updates.put((job_id, "started", started_at))
+    try:
+        return started_at, func(*args, **kwargs)
+    finally:
+        _current_job = None
+
+
+class JobManager:
+    """Runs jobs in a process pool and tracks their status for polling.
+
+    The pool starts on the first submission, so importing the dashboard does not
+    spawn processes. Identical requests, identified by ``key``, share the running
+    job or its cached result.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        cache_size: int = 128,
+        max_pending: int = 100,
+        mp_context: str = "spawn",
+    ):
+        """Initialize job manager.
+
+        Args:
+            max_workers: Pool processes (CPU count if None)
+            cache_size: Finished jobs kept for polling and result reuse
+            max_pending: Maximum queued or running jobs before submissions are refused
+            mp_context: Multiprocessing start method; spawn avoids forking the
+                threaded web server
+        """
+        self.max_workers = max_workers
+        self.cache_size = cache_size
+        self.max_pending = max_pending
+        self.mp_context = mp_context
+
+        self._jobs: Dict[str, Job] = {}
+        self._futures: Dict[str, Future] = {}
+        self._by_key: Dict[str, str] = {}
+        self._finished: "OrderedDict[str, None]" = OrderedDict()
+        self._lock = threading.RLock()
+
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._sync: Any = None
+        self._updates: Any = None
+        self._cancelled: Any = None
+        self._reader: Optional[threading.Thread] = None
+
+    def _start(self) -> None:
+        """Create the pool, cancellation set and progress reader."""
+        context = multiprocessing.get_context(self.mp_context)
+        if self._sync is None:
+            self._sync = context.Manager()
+            self._cancelled = self._sync.dict()
+            self._updates = context.Queue()
+            self._reader = threading.Thread(
+                target=self._read_updates, name="job-updates", daemon=True
+            )
+            self._reader.start()
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(self._updates, self._cancelled),
+        )
+
+    def submit(self, kind: str, func: Callable, *args, key: Optional[str] = None, **kwargs) -> str:
+        """Submit a job.
+
+        Args:
+            kind: Job type shown to users, e.g. ``backtest``
+            func: Picklable module-level function to run in a pool process
+            *args: Positional arguments for ``func``
+            key: Identity of the request; a running or completed job with the
+                same key is returned instead of starting another
+            **kwargs: Keyword arguments for ``func``
+
+        Returns:
+            Job ID
+
+        Raises:
+            RuntimeError: If ``max_pending`` jobs are already queued or running
+        """
+        with self._lock:
+            if key is not None and key in self._by_key:
+                job_id = self._by_key[key]
+                job = self._jobs[job_id]
+                if not job.status.finished:
+                    job.subscribers += 1
+                logger.debug(f"Reusing {kind} job {job_id} for identical request")
+                return job_id
+
+            active = sum(not job.status.finished for job in self._jobs.values())
+            if active >= self.max_pending:
+                raise RuntimeError(f"Job queue is full ({active} jobs pending)")
+
+            job = Job(id=uuid.uuid4().hex[:12], kind=kind, key=key)
+            if self._pool is None:
+                self._start()
+            try:
+                future = self._pool.submit(_run_job, job.id, func, args, kwargs)
+            except BrokenProcessPool:
+                logger.warning("Job pool broke; starting a new one")
+                self._start()
+                future = self._pool.submit(_run_job, job.id, func, args, kwargs)
+
+            self._jobs[job.id] = job
+            self._futures[job.id] = future
+            if key is not None:
+                self._by_key[key] = job.id
+
+        future.add_done_callback(lambda f, job_id=job.id: self._complete(job_id, f))
+        logger.info(f"Submitted {kind} job {job.id}")
+        return job.id
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Get a job by ID (None if unknown or evicted)."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def take_result(self, job_id: str) -> Any:
+        """Hand over a finished job's result, dropping the job's reference to it.
+
+        For callers that keep results in their own bounded store: the job cache
+        then holds only job metadata. The job is no longer reused for identical
+        requests, since it has nothing left to share.
+
+        Args:
+            job_id: Finished job
+
+        Returns:
+            The result, or None if unknown, unfinished or already taken
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.status is not JobStatus.DONE:
+                return None
+            result, job.result = job.result, None
+            if job.key is not None and self._by_key.get(job.key) == job_id:
+                del self._by_key[job.key]
+        return result
+
+    def jobs(self, active_only: bool = False) -> List[Job]:
+        """List tracked jobs, oldest first.
+
+        Args:
+            active_only: Only pending and running jobs
+        """
+        with self._lock:
+            jobs = sorted(self._jobs.values(), key=lambda job: job.submitted_at)
+        return [job for job in jobs if not (active_only and job.status.finished)]
+
+    def cancel(self, job_id: str, force: bool = False) -> bool:
+        """Cancel a job, or detach from it while other submitters still want it.
+
+        Each identical submission of an unfinished job adds a subscriber. Cancelling
+        removes one; the job itself is only cancelled when none are left. Pending
+        jobs are then dropped immediately; running jobs stop at their next
+        ``report_progress`` call.
+
+        Args:
+            job_id: Job to cancel
+            force: Cancel regardless of other subscribers
+
+        Returns:
+            True if the job was pending or running
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.status.finished:
+                return False
+
+            if job.subscribers > 1 and not force:
+                job.subscribers -= 1
+                logger.info(
+                    f"Detached from shared {job.kind} job {job_id}; "
+                    f"{job.subscribers} subscriber(s) left"
+                )
+                return True
+            job.subscribers = 0
+
+            # Cancelled jobs must not be reused for identical requests
+            if job.key is not None and self._by_key.get(job.key) == job_id:
+                del self._by_key[job.key]
+            self._cancelled[job_id] = True
+            if job.status is JobStatus.RUNNING:
+                job.message = "Cancelling"
+            future = self._futures.get(job_id)
+
+        # Outside the lock: cancelling runs the done callback synchronously
+        if future is not None:
+            future.cancel()
+        logger.info(f"Cancellation requested for {job.kind} job {job_id}")
+        return True
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Job:
+        """Block until a job finishes.
+
+        Args:
+            job_id: Job to wait for
+            timeout: Maximum seconds to wait
+
+        Returns:
+            The finished job
+
+        Raises:
+            KeyError: If the job is unknown
+            TimeoutError: If it does not finish in time
+        """
+        with self._lock:
+            job = self._jobs[job_id]
+            future = self._futures.get(job_id)
+        if future is not None:
+            try:
+                future.result(timeout)
+            except TimeoutError:
+                raise TimeoutError(f"Job {job_id} did not finish in time") from None
+            except Exception:
+                pass  # Recorded on the job by the done callback
+        # The done callback may still be recording the outcome
+        deadline = time.monotonic() + 1.0
+        while not job.status.finished and time.monotonic() < deadline:
+            time.sleep(0.01)
+        if not job.status.finished:
+            raise TimeoutError(f"Job {job_id} did not finish in time")
+        return job
+
+    def shutdown(self, wait: bool = True, cancel_pending: bool = True) -> None:
+        """Stop the pool and the progress reader.
+
+        Args:
+            wait: Wait for running jobs to finish; without waiting, the
+                cancellation set and progress reader stay up for the jobs
+                still running
+            cancel_pending: Cancel unfinished jobs; running ones stop at their
+                next ``report_progress`` call
+        """
+        if cancel_pending:
+            for job in self.jobs(active_only=True):
+                self.cancel(job.id, force=True)
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=cancel_pending)
+        if not wait:
+            return
+        if self._reader is not None:
+            self._updates.put(None)
+            self._reader.join(timeout=5)
+            self._reader = None
+        if self._sync is not None:
+            self._sync.shutdown()
+            self._sync = None
+
+    def _read_updates(self) -> None:
+        """Apply start and progress messages sent by pool processes."""
+        while True:
+            update = self._updates.get()
+            if update is None:
+                return
+            job_id, event, payload = update
+            with self._lock:
+                job = self._jobs.get(job_id)
+                if job is None or job.status.finished:
+                    continue
+                if event == "started":
+                    job.status = JobStatus.RUNNING
+                    job.started_at = payload
+                elif event == "progress":
+                    job.progress, job.message = payload
+
+    def _complete(self, job_id: str, future: Future) -> None:
+        """Record a job's outcome when its future resolves."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+
+            job.finished_at = time.time()
+            if future.cancelled():
+                job.status = JobStatus.CANCELLED
+            else:
+                error = future.exception()
+                if error is None:
+                    job.status = JobStatus.DONE
+                    job.progress = 1.0
+                    started_at, job.result = future.result()
+                    if job.started_at is None:
+                        job.started_at = started_at
+                elif isinstance(error, JobCancelled):
+                    job.status = JobStatus.CANCELLED
+                else:
+                    job.status = JobStatus.FAILED
+                    job.error = f"{type(error).__name__}: {error}"
+                    logger.error(f"{job.kind} job {job_id} failed: {job.error}")
+
+            if job.status is not JobStatus.DONE and job.key is not None:
+                if self._by_key.get(job.key) == job_id:
+                    del self._by_key[job.key]
+            if job.status is JobStatus.CANCELLED:
+                job.message = "Cancelled"
+            self._futures.pop(job_id, None)
+            if self._cancelled is not None:
+                self._cancelled.pop(job_id, None)
+
+            self._finished[job_id] = None
+            while len(self._finished) > self.cache_size:
+                evicted, _ = self._finished.popitem(last=False)
+                old = self._jobs.pop(evicted, None)
+                if old is not None and old.key is not None and self._by_key.get(old.key) == evicted:
+                    del self._by_key[old.key]
+
+
+def backtest_job(
+    strategy_class: type,
+    strategy_name: str,
+    params: Dict[str, Any],
+    symbol: str,
+    start_date: str,
+    end_date: str,
+    capital: float,
+    commission: float,
+    cache: Any = None,
+) -> StoredResult:
+    """Fetch data and run one backtest for the dashboard.
+
+    Args:
+        strategy_class: Strategy class to instantiate
+        strategy_name: Display name of the strategy
+        params: Strategy parameters
+        symbol: Symbol to backtest
+        start_date: Start date (YYYY-MM-DD)
+        end_date: End date (YYYY-MM-DD)
+        capital: Initial capital
+        commission: Commission as a decimal fraction
+        cache: Optional BacktestCache shared with other jobs
+
+    Returns:
+        Result for the dashboard's server-side result store
+
+    Raises:
+        ValueError: If no data is available for the range
+    """
+    from athena.backtest.engine import BacktestEngine
+    from athena.data.service import get_market_data
+
+    report_progress(0.1, f"Fetching {symbol}")
+    data = get_market_data().history(symbol, start_date, end_date)
+    if data.empty:
+        raise ValueError(f"No data available for {symbol} in the specified date range.")
+
+    report_progress(0.4, f"Backtesting {strategy_name}")
+    engine = BacktestEngine(initial_capital=capital, commission=commission, cache=cache)
+    result = engine.run(strategy_class(**params), data, symbol)
+
+    return StoredResult.from_backtest(result, symbol, strategy_name, params)
+
+
+def optimization_job(
+    strategy_class: type,
+    strategy_name: str,
+    param_space: Dict[str, Dict],
+    symbol: str,
+    start_date: str,
+    end_date: str,
+    capital: float,
+    commission: float,
+    n_trials: int = 50,
+) -> Dict[str, Any]:
+    """Fetch data and optimize strategy parameters for the dashboard.
+
+    Progress is reported after every trial; a cancellation request stops the
+    study after the trial in flight.
+
+    Args:
+        strategy_class: Strategy class to optimize
+        strategy_name: Display name of the strategy
+        param_space: Parameter search space
+        symbol: Symbol to optimize on
+        start_date: Start date (YYYY-MM-DD)
+        end_date: End date (YYYY-MM-DD)
+        capital: Initial capital
+        commission: Commission as a decimal fraction
+        n_trials: Number of optimization trials
+
+    Returns:
+        JSON-serializable best parameters and per-trial results
+
+    Raises:
+        ValueError: If no data is available for the range
+        JobCancelled: If the job was cancelled
+    """
+    from athena.data.service import get_market_data
+    from athena.optimize.optimizer import StrategyOptimizer
+
+    report_progress(0.0, f"Fetching {symbol}")
+    data = get_market_data().history(symbol, start_date, end_date)
+    if data.empty:
+        raise ValueError(f"No data available for {symbol}")
+
+    completed = []
+
+    def on_trial(study, trial) -> None:
+        completed.append(trial.number)
+        try:
+            report_progress(len(completed) / n_trials, f"Trial {len(completed)}/{n_trials}")
+        except JobCancelled:
+            study.stop()
+
+    optimizer = StrategyOptimizer(initial_capital=capital, commission=commission)
+    results = optimizer.optimize(
+        strategy_class=strategy_class,
+        data=data,
+        symbol=symbol,
+        param_space=param_space,
+        n_trials=n_trials,
+        callbacks=[on_trial],
+    )
+    # Raises if the study was stopped by a cancellation
+    report_progress(1.0, "Collecting trials")
+
+    trials = []
+    for trial in results["study"].trials:
+        trial_data = {"trial_number": trial.number, "sharpe_ratio": trial.value or 0}
+        for param_name, param_value in trial.params.items():
+            trial_data[f"param_{param_name}"] = param_value
+        if trial.user_attrs:
+            trial_data.update(
+                {
+                    "total_return": trial.user_attrs.get("total_return", 0),
+                    "max_drawdown": trial.user_attrs.get("max_drawdown", 0),
+                    "win_rate": trial.user_attrs.get("win_rate", 0),
+                }
+            )
+        trials.append(trial_data)
+
+    return {
+        "best_params": results["best_params"],
+        "best_value": results["best_objective"],
+        "trials": trials,
+        "symbol": symbol,
+        "strategy": strategy_name,
+    }
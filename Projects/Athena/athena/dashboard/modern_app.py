@@ -15,7 +15,9 @@ import plotly.express as px
 from plotly.subplots import make_subplots
 from dash import Input, Output, State, callback, dash_table, dcc, html, ALL, MATCH
 import numpy as np
-import yfinance as yf
+
+from athena.dashboard.downsample import DEFAULT_MAX_POINTS, downsample_ohlc
+from athena.data.service import get_market_data
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -713,8 +715,7 @@ def handle_operations(quick_clicks, backtest_clicks, optimize_clicks, ai_clicks,
         # Simulate quick analysis with real data
         try:
             # Download real data
-            ticker = yf.Ticker(symbol)
-            data = ticker.history(period="1y")
+            data = get_market_data().history(symbol, period="1y").rename(columns=str.title)
 
             if not data.empty:
                 fig = create_candlestick_chart(data, symbol)
@@ -805,8 +806,19 @@ def create_default_chart():
     return fig
 
 
-def create_candlestick_chart(data, symbol):
-    """Create a professional candlestick chart."""
+def create_candlestick_chart(data, symbol, max_points=DEFAULT_MAX_POINTS):
+    """Create a professional candlestick chart.
+
+    Moving averages are computed on the full data; bars are then merged into
+    at most ``max_points`` candles so long intraday histories stay responsive.
+    """
+    data = data.copy()
+    if len(data) >= 20:
+        data['MA20'] = data['Close'].rolling(20).mean()
+    if len(data) >= 50:
+        data['MA50'] = data['Close'].rolling(50).mean()
+    data = downsample_ohlc(data, max_points)
+
     fig = make_subplots(
         rows=2, cols=1,
         shared_xaxes=True,
@@ -827,8 +839,7 @@ def create_candlestick_chart(data, symbol):
     ), row=1, col=1)
 
     # Volume bars
-    colors = ['#00ff88' if row['Close'] >= row['Open'] else '#ff6b6b'
-              for idx, row in data.iterrows()]
+    colors = np.where(data['Close'] >= data['Open'], '#00ff88', '#ff6b6b')
 
     fig.add_trace(go.Bar(
         x=data.index,
@@ -839,20 +850,18 @@ def create_candlestick_chart(data, symbol):
     ), row=2, col=1)
 
     # Add moving averages
-    if len(data) >= 20:
-        ma20 = data['Close'].rolling(20).mean()
+    if 'MA20' in data:
         fig.add_trace(go.Scatter(
             x=data.index,
-            y=ma20,
+            y=data['MA20'],
             name='MA(20)',
             line=dict(color='#00d4ff', width=1)
         ), row=1, col=1)
 
-    if len(data) >= 50:
-        ma50 = data['Close'].rolling(50).mean()
+    if 'MA50' in data:
         fig.add_trace(go.Scatter(
             x=data.index,
-            y=ma50,
+            y=data['MA50'],
             name='MA(50)',
             line=dict(color='#ffd700', width=1)
         ), row=1, col=1)
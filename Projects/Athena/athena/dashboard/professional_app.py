@@ -20,9 +20,13 @@ import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
 from dash import Input, Output, State, callback, dcc, html, ALL, MATCH, dash_table
-import yfinance as yf
 from scipy import stats
 from scipy.optimize import minimize
+
+from athena.backtest.monte_carlo import MonteCarloSimulator
+from athena.dashboard.downsample import downsample
+from athena.data.service import get_market_data
+
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -30,6 +34,20 @@ warnings.filterwarnings('ignore')
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+def price_history(data):
+    """Date, Close and Returns columns from service data."""
+    hist = data.reset_index().rename(columns=str.title)
+    hist['Returns'] = hist['Close'].pct_change()
+    return hist[['Date', 'Close', 'Returns']]
+
+
+def normalized_performance(data):
+    """Close prices rebased to 100, downsampled for plotting."""
+    performance = data.set_index('Date')['Close']
+    return downsample(performance / performance.iloc[0] * 100)
+
+
 # Helper functions for real calculations
 def calculate_diversification_ratio(weights, cov_matrix):
     """Calculate diversification ratio."""
@@ -559,18 +577,9 @@ def optimize_portfolio_risk_parity(returns: pd.DataFrame, risk_free_rate: float
 
 def monte_carlo_simulation(price: float, days: int, iterations: int = 1000,
                           volatility: float = 0.2, drift: float = 0.05) -> pd.DataFrame:
-    """Run Monte Carlo simulation for price paths."""
-    dt = 1/252
-    price_paths = []
-
-    for _ in range(iterations):
-        prices = [price]
-        for _ in range(days):
-            shock = np.random.normal(drift * dt, volatility * np.sqrt(dt))
-            prices.append(prices[-1] * (1 + shock))
-        price_paths.append(prices)
-
-    return pd.DataFrame(price_paths).T
+    """Run Monte Carlo simulation for price paths (one column per path)."""
+    simulator = MonteCarloSimulator(method="gbm", drift=drift, volatility=volatility)
+    return pd.DataFrame(simulator.paths(price, days, iterations).T)
 
 
 def calculate_greeks(spot: float, strike: float, time: float, rate: float, volatility: float, option_type: str = 'call') -> Dict:
@@ -1139,19 +1148,13 @@ def load_portfolio_data(load_clicks, demo_clicks, symbols, period):
         portfolio_data = {}
 
         demo_symbols = ["AAPL", "MSFT", "GOOGL", "AMZN"]
-        # Load real market data for demo symbols
+        # Load real market data for demo symbols (cached, fetched concurrently)
+        histories = get_market_data().history_many(demo_symbols, period='1y')
         for symbol in demo_symbols:
-            try:
-                ticker = yf.Ticker(symbol)
-                hist = ticker.history(period='1y')
-                if not hist.empty:
-                    hist.reset_index(inplace=True)
-                    hist['Returns'] = hist['Close'].pct_change()
-                    # Use last 252 trading days
-                    hist = hist.tail(252)
-                    portfolio_data[symbol] = hist[['Date', 'Close', 'Returns']]
-            except Exception as e:
-                logger.warning(f"Could not load data for {symbol}: {e}")
+            if symbol in histories:
+                # Use last 252 trading days
+                portfolio_data[symbol] = price_history(histories[symbol]).tail(252)
+            else:
                 # Fallback to synthetic data only if real data fails
                 returns = np.sin(np.linspace(0, 4*np.pi, 252)) * 0.01 + np.random.normal(0, 0.005, 252)
                 prices = 100 * (1 + returns).cumprod()
@@ -1164,9 +1167,10 @@ def load_portfolio_data(load_clicks, demo_clicks, symbols, period):
         # Create main chart
         main_fig = go.Figure()
         for symbol, data in portfolio_data.items():
+            performance = normalized_performance(data)
             main_fig.add_trace(go.Scatter(
-                x=data['Date'],
-                y=data['Close'] / data['Close'].iloc[0] * 100,
+                x=performance.index,
+                y=performance.values,
                 mode='lines',
                 name=symbol
             ))
@@ -1217,23 +1221,19 @@ def load_portfolio_data(load_clicks, demo_clicks, symbols, period):
         # Load real data
         try:
             symbol_list = [s.strip() for s in symbols.split(',')]
-            portfolio_data = {}
-
-            for symbol in symbol_list:
-                ticker = yf.Ticker(symbol)
-                hist = ticker.history(period=period)
-                if not hist.empty:
-                    hist.reset_index(inplace=True)
-                    hist['Returns'] = hist['Close'].pct_change()
-                    portfolio_data[symbol] = hist[['Date', 'Close', 'Returns']]
+            histories = get_market_data().history_many(symbol_list, period=period)
+            portfolio_data = {
+                symbol: price_history(data) for symbol, data in histories.items()
+            }
 
             if portfolio_data:
                 # Create visualizations with real data
                 main_fig = go.Figure()
                 for symbol, data in portfolio_data.items():
+                    performance = normalized_performance(data)
                     main_fig.add_trace(go.Scatter(
-                        x=data['Date'],
-                        y=data['Close'] / data['Close'].iloc[0] * 100,
+                        x=performance.index,
+                        y=performance.values,
                         mode='lines',
                         name=symbol
                     ))
@@ -0,0 +1,199 @@
+"""Server-side storage for dashboard results.
+
+Backtest results stay in the web server process; the browser only receives a
+small handle with the result ID and headline metrics. Chart callbacks look the
+result up by ID and read just the series they plot, so multi-year intraday
+results are neither serialized to JSON nor rebuilt into DataFrames on every
+callback. Derived series (drawdown, rolling Sharpe) are computed once per
+result and shared between callbacks.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from athena.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class StoredResult:
+    """A backtest result kept for the dashboard charts."""
+
+    symbol: str
+    strategy: str
+    params: Dict[str, Any]
+    metrics: Dict[str, float]
+    equity_curve: pd.Series
+    daily_returns: pd.Series
+    trades: List[Dict[str, Any]] = field(default_factory=list)
+    _rolling: Dict[int, pd.Series] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_backtest(
+        cls, result: Any, symbol: str, strategy: str, params: Dict[str, Any]
+    ) -> "StoredResult":
+        """Build from an engine ``BacktestResult``.
+
+        Args:
+            result: Backtest result
+            symbol: Backtested symbol
+            strategy: Display name of the strategy
+            params: Strategy parameters
+
+        Returns:
+            Result holding the series the dashboard plots
+        """
+        trades = []
+        for trade in result.trades:
+            notional = trade.price * trade.quantity
+            trades.append(
+                {
+                    "entry_date": pd.Timestamp(trade.timestamp).isoformat(),
+                    "exit_date": None,
+                    "symbol": trade.symbol,
+                    "side": str(getattr(trade.side, "value", trade.side)),
+                    "quantity": trade.quantity,
+                    "entry_price": trade.price,
+                    "exit_price": None,
+                    "pnl": trade.pnl,
+                    "return_pct": trade.pnl / notional if trade.pnl and notional else None,
+                }
+            )
+
+        returns = [trade["return_pct"] for trade in trades if trade["return_pct"] is not None]
+        daily_returns = result.daily_returns
+        volatility = daily_returns.std() * np.sqrt(252) if len(daily_returns) > 1 else 0.0
+        metrics = {
+            "initial_capital": result.initial_capital,
+            "final_capital": result.final_capital,
+            "total_return": result.total_return,
+            "annualized_return": result.annual_return,
+            "sharpe_ratio": result.sharpe_ratio,
+            "max_drawdown": result.max_drawdown,
+            "win_rate": result.win_rate,
+            "total_trades": result.total_trades,
+            "avg_trade_return": float(np.mean(returns)) if returns else 0.0,
+            "volatility": volatility,
+        }
+        return cls(
+            symbol=symbol,
+            strategy=strategy,
+            params=params,
+            metrics={name: float(value) for name, value in metrics.items()},
+            equity_curve=result.equity_curve,
+            daily_returns=daily_returns,
+            trades=trades,
+        )
+
+    @cached_property
+    def drawdown(self) -> pd.Series:
+        """Drawdown from the running peak, in percent."""
+        peak = self.equity_curve.cummax()
+        return (self.equity_curve - peak) / peak * 100
+
+    def rolling_sharpe(self, window: int = 30) -> pd.Series:
+        """Annualized rolling Sharpe ratio of daily returns.
+
+        Args:
+            window: Rolling window in days
+
+        Returns:
+            Rolling Sharpe ratio indexed like the daily returns
+        """
+        if window not in self._rolling:
+            rolling = self.daily_returns.rolling(window=window)
+            self._rolling[window] = rolling.mean() / rolling.std() * np.sqrt(252)
+        return self._rolling[window]
+
+    def handle(self, result_id: str) -> Dict[str, Any]:
+        """JSON-serializable reference sent to the browser.
+
+        Args:
+            result_id: ID the result is stored under
+
+        Returns:
+            Result ID with the small fields callbacks use directly
+        """
+        return {
+            "id": result_id,
+            "symbol": self.symbol,
+            "strategy": self.strategy,
+            "params": self.params,
+            "metrics": self.metrics,
+            "n_trades": len(self.trades),
+        }
+
+
+class ResultStore:
+    """Thread-safe LRU cache of results, keyed by ID.
+
+    Results are held in memory by the process serving the dashboard, like the
+    background jobs that produce them. Evicted results make their handles
+    stale; callbacks then render the empty state and the user reruns.
+    """
+
+    def __init__(self, max_results: int = 32):
+        """Initialize result store.
+
+        Args:
+            max_results: Results kept before the least recently used is dropped
+        """
+        self.max_results = max_results
+        self._results: "OrderedDict[str, StoredResult]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, result_id: str, result: StoredResult) -> Dict[str, Any]:
+        """Store a result.
+
+        Args:
+            result_id: Key for the result, e.g. the ID of the job that produced it
+            result: Result to store
+
+        Returns:
+            Handle to send to the browser
+        """
+        with self._lock:
+            self._results[result_id] = result
+            self._results.move_to_end(result_id)
+            while len(self._results) > self.max_results:
+                evicted, _ = self._results.popitem(last=False)
+                logger.debug(f"Evicted dashboard result {evicted}")
+        return result.handle(result_id)
+
+    def get(self, handle: Any) -> Optional[StoredResult]:
+        """Look up a result by handle or ID.
+
+        Args:
+            handle: Handle returned by ``put``, or a bare result ID
+
+        Returns:
+            Stored result, or None if unknown or evicted
+        """
+        if not handle:
+            return None
+        result_id = handle.get("id") if isinstance(handle, dict) else handle
+        with self._lock:
+            result = self._results.get(result_id)
+            if result is not None:
+                self._results.move_to_end(result_id)
+        return result
+
+    def __contains__(self, result_id: str) -> bool:
+        with self._lock:
+            return result_id in self._results
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._results)
+
+    def clear(self) -> None:
+        """Drop all results."""
+        with self._lock:
+            self._results.clear()
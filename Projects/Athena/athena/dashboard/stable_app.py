@@ -13,7 +13,8 @@ import numpy as np
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from dash import Input, Output, State, callback, dcc, html, ALL
-import yfinance as yf
+
+from athena.data.service import get_market_data as get_market_data_service
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -464,8 +465,12 @@ def get_market_data(get_clicks, demo_clicks, symbol, period, current_log):
 
         try:
             # Download real data from Yahoo Finance
-            ticker = yf.Ticker(symbol)
-            df = ticker.history(period=period)
+            try:
+                df = get_market_data_service().history(symbol, period=period).rename(
+                    columns=str.title
+                )
+            except ValueError:
+                df = pd.DataFrame()
 
             if df.empty:
                 error_log = html.Div(f"[{timestamp}] ❌ No data found for {symbol}", className="activity-item")
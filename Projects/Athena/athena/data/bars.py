@@ -0,0 +1,365 @@
+"""Bar aggregation for ticks and OHLCV bars across multiple timeframes."""
+
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Deque, Dict, Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+OHLCV_COLUMNS = ["open", "high", "low", "close", "volume"]
+
+TimestampLike = Union[pd.Timestamp, np.datetime64, int, str]
+
+
+@lru_cache(maxsize=64)
+def timeframe_to_ns(timeframe: str) -> int:
+    """Convert a timeframe string to its width in nanoseconds.
+
+    Args:
+        timeframe: Fixed-width timeframe such as "30s", "1m", "1min", "15min", "1h", "1d"
+
+    Returns:
+        Timeframe width in nanoseconds
+
+    Raises:
+        ValueError: If the timeframe is not a positive fixed-width duration
+    """
+    try:
+        width = pd.to_timedelta(timeframe).value
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Unsupported timeframe: {timeframe!r}") from e
+
+    if width <= 0:
+        raise ValueError(f"Timeframe must be positive: {timeframe!r}")
+
+    return width
+
+
+def _to_ns(timestamp: TimestampLike) -> int:
+    """Convert a timestamp-like value to integer nanoseconds of local wall time."""
+    if isinstance(timestamp, (int, np.integer)):
+        return int(timestamp)
+    timestamp = pd.Timestamp(timestamp)
+    if timestamp.tz is not None:
+        timestamp = timestamp.tz_localize(None)
+    return timestamp.value
+
+
+def _bucket_labels(bucket_ns: np.ndarray, tz) -> pd.DatetimeIndex:
+    """Build a DatetimeIndex of bucket start labels."""
+    labels = pd.DatetimeIndex(bucket_ns.astype("datetime64[ns]"))
+    if tz is not None:
+        labels = labels.tz_localize(tz, ambiguous=True, nonexistent="shift_forward")
+    return labels
+
+
+def resample_ohlcv(data: pd.DataFrame, timeframe: str) -> pd.DataFrame:
+    """Aggregate ticks or bars into a coarser timeframe in a single vectorized pass.
+
+    Accepts either OHLCV bars (open/high/low/close/volume) or ticks with a ``price``
+    column and optional ``volume``. Ticks without volume count one unit each. Buckets
+    are left-closed and labelled by their start time; empty buckets are dropped,
+    matching ``DataFrame.resample(timeframe).agg(...).dropna()``.
+
+    Args:
+        data: Ticks or OHLCV bars with a DatetimeIndex
+        timeframe: Target timeframe (e.g., "1min", "1h", "1d")
+
+    Returns:
+        OHLCV DataFrame at the requested timeframe
+    """
+    width = timeframe_to_ns(timeframe)
+
+    if data.empty:
+        return pd.DataFrame(columns=OHLCV_COLUMNS, index=pd.DatetimeIndex([]), dtype=float)
+
+    index = pd.DatetimeIndex(data.index)
+    if not index.is_monotonic_increasing:
+        order = np.argsort(index.asi8, kind="stable")
+        data = data.iloc[order]
+        index = index[order]
+
+    if "price" in data.columns:
+        price = data["price"].to_numpy(dtype=float)
+        open_, high, low, close = price, price, price, price
+        if "volume" in data.columns:
+            volume = data["volume"].to_numpy(dtype=float)
+        else:
+            volume = np.ones(len(data))
+    else:
+        open_ = data["open"].to_numpy(dtype=float)
+        high = data["high"].to_numpy(dtype=float)
+        low = data["low"].to_numpy(dtype=float)
+        close = data["close"].to_numpy(dtype=float)
+        volume = data["volume"].to_numpy(dtype=float)
+
+    # Bucket on local wall time so daily bars line up with the calendar day
+    tz = index.tz
+    stamps = (index.tz_localize(None) if tz is not None else index).asi8
+    buckets = stamps - stamps % width
+
+    boundaries = np.flatnonzero(np.diff(buckets)) + 1
+    starts = np.concatenate(([0], boundaries))
+    ends = np.concatenate((boundaries - 1, [len(buckets) - 1]))
+
+    return pd.DataFrame(
+        {
+            "open": open_[starts],
+            "high": np.maximum.reduceat(high, starts),
+            "low": np.minimum.reduceat(low, starts),
+            "close": close[ends],
+            "volume": np.add.reduceat(volume, starts),
+        },
+        index=_bucket_labels(buckets[starts], tz),
+    )
+
+
+def resample_many(data: pd.DataFrame, timeframes: Iterable[str]) -> Dict[str, pd.DataFrame]:
+    """Resample one frame into several timeframes, cascading from finer results.
+
+    Each timeframe is built from the largest already-computed timeframe that divides
+    it evenly, so 1m -> 1h -> 1d costs roughly one pass over the source data.
+
+    Args:
+        data: Ticks or OHLCV bars with a DatetimeIndex
+        timeframes: Target timeframes
+
+    Returns:
+        Dictionary mapping each timeframe to its OHLCV DataFrame
+    """
+    views = MultiTimeframeBars(data)
+    return {timeframe: views.to_frame(timeframe) for timeframe in timeframes}
+
+
+class MultiTimeframeBars:
+    """Memoized multi-timeframe views over a fixed OHLCV frame (batch mode)."""
+
+    def __init__(self, data: pd.DataFrame):
+        """Initialize views.
+
+        Args:
+            data: Source ticks or OHLCV bars with a DatetimeIndex
+        """
+        self.data = data
+        self._views: Dict[int, pd.DataFrame] = {}
+
+    def to_frame(self, timeframe: str, include_partial: bool = True) -> pd.DataFrame:
+        """Get OHLCV bars for a timeframe, computing each view at most once.
+
+        The views cover the whole source range, so at any source row most bars have
+        not closed yet. With ``include_partial=False`` the bars are shifted by one:
+        the row labelled with a bar's start holds the previous bar, the latest one
+        that had closed by then. Aligning that frame onto the source rows (e.g.
+        ``reindex(..., method="ffill")``) sees only closed bars, like a live
+        ``BarAggregator`` without its open bar.
+
+        Args:
+            timeframe: Target timeframe
+            include_partial: Whether rows may hold bars that close after their label
+
+        Returns:
+            OHLCV DataFrame (a copy; the memoized view is never exposed)
+        """
+        view = self._view(timeframe)
+        if not include_partial:
+            return view.shift(1).iloc[1:]
+        return view.copy()
+
+    def _view(self, timeframe: str) -> pd.DataFrame:
+        """Memoized view for a timeframe."""
+        width = timeframe_to_ns(timeframe)
+        if width in self._views:
+            return self._views[width]
+
+        # Cascade from the coarsest computed view that divides this timeframe
+        source = self.data
+        for computed in sorted(self._views, reverse=True):
+            if computed < width and width % computed == 0:
+                source = self._views[computed]
+                break
+
+        view = resample_ohlcv(source, timeframe)
+        self._views[width] = view
+        return view
+
+
+@dataclass
+class Bar:
+    """Single OHLCV bar."""
+
+    start_ns: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+
+    @property
+    def timestamp(self) -> pd.Timestamp:
+        """Bar start time."""
+        return pd.Timestamp(self.start_ns)
+
+
+class _TimeframeState:
+    """Rolling state for a single timeframe."""
+
+    __slots__ = ("timeframe", "width", "closed", "current", "version")
+
+    def __init__(self, timeframe: str, max_bars: int):
+        self.timeframe = timeframe
+        self.width = timeframe_to_ns(timeframe)
+        self.closed: Deque[Bar] = deque(maxlen=max_bars)
+        self.current: Optional[Bar] = None
+        self.version = 0
+
+
+class BarAggregator:
+    """Incremental (streaming) OHLCV aggregator for several timeframes at once.
+
+    Every tick or low-timeframe bar updates the open bar of each timeframe in O(1).
+    Frames requested via ``to_frame`` are cached until the next update, so strategies
+    can read 1m, 1h and 1d views on every evaluation without recomputing resamples.
+    """
+
+    def __init__(self, timeframes: Iterable[str] = ("1min",), max_bars: int = 500):
+        """Initialize aggregator.
+
+        Args:
+            timeframes: Timeframes to maintain
+            max_bars: Closed bars kept per timeframe
+        """
+        self.max_bars = max_bars
+        self._states: Dict[int, _TimeframeState] = {}
+        self._tz = None
+        self._frames: Dict[int, tuple] = {}
+        self.late_updates = 0
+
+        for timeframe in timeframes:
+            self.add_timeframe(timeframe)
+
+    @property
+    def timeframes(self) -> List[str]:
+        """Maintained timeframes, finest first."""
+        return [self._states[width].timeframe for width in sorted(self._states)]
+
+    def add_timeframe(self, timeframe: str) -> None:
+        """Start maintaining an additional timeframe.
+
+        Args:
+            timeframe: Timeframe to add
+        """
+        width = timeframe_to_ns(timeframe)
+        if width not in self._states:
+            self._states[width] = _TimeframeState(timeframe, self.max_bars)
+
+    def update_tick(self, timestamp: TimestampLike, price: float, volume: float = 1.0) -> List[Bar]:
+        """Add a trade/quote tick.
+
+        Args:
+            timestamp: Tick time
+            price: Tick price
+            volume: Tick volume (defaults to one unit, i.e. tick count)
+
+        Returns:
+            Bars closed by this update, across all timeframes
+        """
+        return self.update_bar(timestamp, price, price, price, price, volume)
+
+    def update_bar(
+        self,
+        timestamp: TimestampLike,
+        open: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float = 0.0,
+    ) -> List[Bar]:
+        """Add a low-timeframe bar (its start time must fall inside the target bucket).
+
+        Args:
+            timestamp: Bar start time
+            open: Open price
+            high: High price
+            low: Low price
+            close: Close price
+            volume: Volume
+
+        Returns:
+            Bars closed by this update, across all timeframes
+        """
+        if self._tz is None and getattr(timestamp, "tzinfo", None) is not None:
+            self._tz = pd.Timestamp(timestamp).tz
+        ts = _to_ns(timestamp)
+
+        closed = []
+        for state in self._states.values():
+            bucket = ts - ts % state.width
+            current = state.current
+
+            if current is None or bucket > current.start_ns:
+                if current is not None:
+                    state.closed.append(current)
+                    closed.append(current)
+                state.current = Bar(bucket, open, high, low, close, volume)
+            elif bucket == current.start_ns:
+                if high > current.high:
+                    current.high = high
+                if low < current.low:
+                    current.low = low
+                current.close = close
+                current.volume += volume
+            else:
+                # Older than the open bar; bars already emitted are immutable
+                self.late_updates += 1
+                continue
+
+            state.version += 1
+
+        return closed
+
+    def current_bar(self, timeframe: str) -> Optional[Bar]:
+        """Get the open (partial) bar for a timeframe."""
+        return self._states[timeframe_to_ns(timeframe)].current
+
+    def to_frame(self, timeframe: str, include_partial: bool = True) -> pd.DataFrame:
+        """Get OHLCV bars for a timeframe as a DataFrame.
+
+        Args:
+            timeframe: Maintained timeframe
+            include_partial: Include the still-open bar
+
+        Returns:
+            OHLCV DataFrame indexed by bar start time (a copy; the cached frame is
+            never exposed)
+        """
+        width = timeframe_to_ns(timeframe)
+        if width not in self._states:
+            raise KeyError(f"Timeframe {timeframe!r} is not maintained by this aggregator")
+
+        state = self._states[width]
+        cache_key = (state.version, include_partial)
+        cached = self._frames.get(width)
+        if cached is not None and cached[0] == cache_key:
+            return cached[1].copy()
+
+        bars = list(state.closed)
+        if include_partial and state.current is not None:
+            bars.append(state.current)
+
+        frame = pd.DataFrame(
+            [(b.open, b.high, b.low, b.close, b.volume) for b in bars],
+            columns=OHLCV_COLUMNS,
+            index=_bucket_labels(np.array([b.start_ns for b in bars], dtype=np.int64), self._tz),
+            dtype=float,
+        )
+        self._frames[width] = (cache_key, frame)
+        return frame.copy()
+
+    def __len__(self) -> int:
+        """Number of bars (closed + open) in the finest timeframe."""
+        if not self._states:
+            return 0
+        state = self._states[min(self._states)]
+        return len(state.closed) + (state.current is not None)
@@ -0,0 +1,239 @@
+"""Shared, cached market data access for long-running apps.
+
+``MarketDataService`` sits in front of ``YahooDataAdapter`` (and its parquet
+cache) and adds what a multi-user server needs:
+
+- an in-memory cache with a time-to-live, so repeated loads skip disk and network;
+- deduplication of in-flight requests, so concurrent loads of the same symbol
+  share one fetch;
+- a thread pool, so multi-symbol loads fetch concurrently.
+
+The dashboards use the process-wide instance from ``get_market_data``.
+"""
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Dict, Iterable, Optional, Tuple
+
+import pandas as pd
+from tenacity import RetryError
+
+from athena.core.config import settings
+from athena.core.logging import get_logger
+from athena.data.yahoo import YahooDataAdapter
+
+logger = get_logger(__name__)
+
+PERIOD_UNITS = {"d": "days", "wk": "weeks", "mo": "months", "y": "years"}
+
+RequestKey = Tuple[str, str, str, str]
+
+
+def period_to_dates(period: str, today: Optional[pd.Timestamp] = None) -> Tuple[str, str]:
+    """Convert a Yahoo-style period ("5d", "6mo", "1y", "ytd", "max") to dates.
+
+    Args:
+        period: Lookback period
+        today: Reference date (defaults to today)
+
+    Returns:
+        (start, end) as YYYY-MM-DD; end is tomorrow so today's bar is included
+
+    Raises:
+        ValueError: If the period is not recognised
+    """
+    today = (today or pd.Timestamp.now()).normalize()
+    end = (today + pd.Timedelta(days=1)).strftime("%Y-%m-%d")
+
+    if period == "max":
+        return "1970-01-01", end
+    if period == "ytd":
+        return today.replace(month=1, day=1).strftime("%Y-%m-%d"), end
+    for suffix, unit in PERIOD_UNITS.items():
+        count = period[: -len(suffix)]
+        if period.endswith(suffix) and count.isdigit():
+            start = today - pd.DateOffset(**{unit: int(count)})
+            return start.strftime("%Y-%m-%d"), end
+
+    raise ValueError(f"Unknown period: {period}")
+
+
+class MarketDataService:
+    """Cached, concurrent market data with in-flight request deduplication."""
+
+    def __init__(
+        self,
+        adapter: Optional[YahooDataAdapter] = None,
+        max_workers: Optional[int] = None,
+        ttl: Optional[float] = None,
+        max_entries: int = 256,
+    ):
+        """Initialize the service.
+
+        Args:
+            adapter: Data adapter doing the actual fetches (parquet-cached Yahoo if None)
+            max_workers: Concurrent fetches. Uses settings default if None.
+            ttl: Seconds fetched data stays in memory. Uses settings default if None.
+            max_entries: Maximum requests kept in memory
+        """
+        self.adapter = adapter or YahooDataAdapter()
+        self.ttl = settings.market_data_ttl if ttl is None else ttl
+        self.max_entries = max_entries
+
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers or settings.market_data_workers,
+            thread_name_prefix="market-data",
+        )
+        self._lock = threading.Lock()
+        self._cache: Dict[RequestKey, Tuple[float, pd.DataFrame]] = {}
+        self._inflight: Dict[RequestKey, Future] = {}
+        self.stats = {"hits": 0, "fetches": 0, "joined": 0}
+
+    def _request(self, key: RequestKey) -> Future:
+        """Future for a request: cached, already in flight, or newly submitted."""
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < self.ttl:
+                self.stats["hits"] += 1
+                future: Future = Future()
+                future.set_result(cached[1])
+                return future
+
+            future = self._inflight.get(key)
+            if future is not None:
+                self.stats["joined"] += 1
+                return future
+
+            self.stats["fetches"] += 1
+            future = self._pool.submit(self._fetch, key)
+            self._inflight[key] = future
+            return future
+
+    def _fetch(self, key: RequestKey) -> pd.DataFrame:
+        """Fetch through the adapter and publish the result to the cache."""
+        symbol, start, end, interval = key
+        try:
+            try:
+                data = self.adapter.fetch(symbol, start, end, interval=interval)
+            except RetryError as e:
+                # Surface the adapter's own error (e.g. ValueError for no data)
+                raise e.last_attempt.exception() from None
+            with self._lock:
+                self._cache[key] = (time.monotonic(), data)
+                while len(self._cache) > self.max_entries:
+                    # Dicts keep insertion order: drop the oldest fetch
+                    del self._cache[next(iter(self._cache))]
+            return data
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def _key(
+        self,
+        symbol: str,
+        start: Optional[str],
+        end: Optional[str],
+        period: Optional[str],
+        interval: str,
+    ) -> RequestKey:
+        """Normalize request parameters so equivalent requests share a key."""
+        if start is None:
+            start, end = period_to_dates(period or "1y")
+        elif end is None:
+            end = period_to_dates("1d")[1]
+        start = pd.to_datetime(start).strftime("%Y-%m-%d")
+        end = pd.to_datetime(end).strftime("%Y-%m-%d")
+        return symbol.strip().upper(), start, end, interval
+
+    def history(
+        self,
+        symbol: str,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        period: Optional[str] = None,
+        interval: str = "1d",
+        timeout: Optional[float] = None,
+    ) -> pd.DataFrame:
+        """Get OHLCV history for one symbol.
+
+        Args:
+            symbol: Stock symbol
+            start: Start date (YYYY-MM-DD); if None, derived from ``period``
+            end: End date (YYYY-MM-DD); defaults to today
+            period: Yahoo-style lookback such as "1y" (used when ``start`` is None)
+            interval: Data interval
+            timeout: Maximum seconds to wait for the fetch
+
+        Returns:
+            Copy of the data with lowercase columns, safe to modify
+
+        Raises:
+            ValueError: If no data is available
+        """
+        key = self._key(symbol, start, end, period, interval)
+        return self._request(key).result(timeout).copy()
+
+    def history_many(
+        self,
+        symbols: Iterable[str],
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        period: Optional[str] = None,
+        interval: str = "1d",
+        timeout: Optional[float] = None,
+    ) -> Dict[str, pd.DataFrame]:
+        """Get history for several symbols concurrently.
+
+        Symbols that fail are logged and left out of the result.
+
+        Args:
+            symbols: Stock symbols
+            start: Start date (YYYY-MM-DD); if None, derived from ``period``
+            end: End date (YYYY-MM-DD); defaults to today
+            period: Yahoo-style lookback such as "1y" (used when ``start`` is None)
+            interval: Data interval
+            timeout: Maximum seconds to wait for all fetches
+
+        Returns:
+            Dictionary mapping each requested symbol to a copy of its data
+        """
+        futures = {
+            symbol: self._request(self._key(symbol, start, end, period, interval))
+            for symbol in dict.fromkeys(s.strip() for s in symbols if s.strip())
+        }
+        wait(futures.values(), timeout=timeout)
+
+        data = {}
+        for symbol, future in futures.items():
+            if not future.done():
+                logger.warning(f"Timed out fetching data for {symbol}")
+                continue
+            error = future.exception()
+            if error is not None:
+                logger.warning(f"Could not load data for {symbol}: {error}")
+                continue
+            data[symbol] = future.result().copy()
+        return data
+
+    def clear(self) -> None:
+        """Drop all in-memory data (the adapter's disk cache is kept)."""
+        with self._lock:
+            self._cache.clear()
+
+    def shutdown(self) -> None:
+        """Stop the fetch threads."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+_service: Optional[MarketDataService] = None
+_service_lock = threading.Lock()
+
+
+def get_market_data() -> MarketDataService:
+    """Get the process-wide market data service, creating it on first use."""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = MarketDataService()
+        return _service
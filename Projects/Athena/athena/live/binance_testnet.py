@@ -1,22 +1,33 @@
 """Binance testnet integration for paper trading."""
 
-import asyncio
-import json
 import time
-from datetime import datetime
 from typing import Callable, Dict, List, Optional
 
 import requests
-import websockets
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import AsyncRetrying, Retrying, stop_after_attempt, wait_exponential
 
+from athena.core.clock import Clock, WallClock
 from athena.core.config import settings
 from athena.core.logging import get_logger
-from athena.core.types import Order, OrderStatus, OrderType, Portfolio, Position, Trade
-from athena.live.broker import BaseBroker
+from athena.core.types import (
+    Order,
+    OrderResult,
+    OrderStatus,
+    OrderType,
+    Portfolio,
+    Position,
+    Trade,
+)
+from athena.live.broker import BaseBroker, place_orders_concurrently
+from athena.live.http import AsyncHTTPTransport
+from athena.live.streaming import MarketDataStream
 
 logger = get_logger(__name__)
 
+# Only these are resent after a failure: a POST or DELETE that timed out may already have
+# reached the exchange, so retrying it could place or cancel an order twice.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD"})
+
 
 class BinanceTestnetBroker(BaseBroker):
     """Binance testnet broker for paper trading."""
@@ -26,6 +37,7 @@ class BinanceTestnetBroker(BaseBroker):
         api_key: Optional[str] = None,
         secret_key: Optional[str] = None,
         testnet_url: str = None,
+        clock: Optional[Clock] = None,
     ):
         """Initialize Binance testnet broker.
 
@@ -33,16 +45,23 @@ class BinanceTestnetBroker(BaseBroker):
             api_key: Binance testnet API key
             secret_key: Binance testnet secret key
             testnet_url: Testnet base URL
+            clock: Time source for order and trade timestamps (wall time if None)
         """
+        self.clock = clock or WallClock()
         self.api_key = api_key or settings.binance_testnet_api_key
         self.secret_key = secret_key or settings.binance_testnet_secret_key
         self.testnet_url = testnet_url or settings.binance_testnet_url
 
         # Connection state
         self.connected = False
-        self.websocket = None
         self.price_callbacks: List[Callable] = []
 
+        # Pooled keep-alive HTTP clients: blocking for sync calls, async for the trading loop
+        headers = {"X-MBX-APIKEY": self.api_key} if self.api_key else {}
+        self.session = requests.Session()
+        self.session.headers.update(headers)
+        self.transport = AsyncHTTPTransport(self.testnet_url, headers=headers)
+
         # Cache
         self.account_info = {}
         self.orders: Dict[str, Order] = {}
@@ -51,6 +70,7 @@ class BinanceTestnetBroker(BaseBroker):
 
         # Websocket stream
         self.stream_url = "wss://stream.binance.com:9443/ws/"
+        self.price_stream: Optional[MarketDataStream] = None
 
     @property
     def has_credentials(self) -> bool:
@@ -90,22 +110,39 @@ class BinanceTestnetBroker(BaseBroker):
             True if disconnection successful
         """
         self.connected = False
+        self.session.close()
+        self.transport.close_sync()
 
-        if self.websocket:
-            try:
-                asyncio.run(self.websocket.close())
-            except Exception as e:
-                logger.warning(f"Error closing websocket: {e}")
+        if self.price_stream:
+            self.price_stream.stop()
+            self.price_stream = None
 
         logger.info("Disconnected from Binance testnet")
         return True
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
+    @staticmethod
+    def _retry_policy(method: str) -> Dict:
+        """Build the tenacity retry arguments for a request.
+
+        Args:
+            method: HTTP method
+
+        Returns:
+            Keyword arguments for ``Retrying``/``AsyncRetrying``
+        """
+        attempts = 3 if method.upper() in IDEMPOTENT_METHODS else 1
+        return {
+            "stop": stop_after_attempt(attempts),
+            "wait": wait_exponential(multiplier=1, min=4, max=10),
+        }
+
     def _make_request(
         self, method: str, endpoint: str, params: Dict = None, signed: bool = False
     ) -> Dict:
         """Make HTTP request to Binance API.
 
+        Only idempotent requests are retried; orders are sent exactly once.
+
         Args:
             method: HTTP method
             endpoint: API endpoint
@@ -115,27 +152,71 @@ class BinanceTestnetBroker(BaseBroker):
         Returns:
             Response JSON
         """
-        if not self.connected and endpoint != "/api/v3/time":
-            raise RuntimeError("Not connected to Binance testnet")
+        for attempt in Retrying(**self._retry_policy(method)):
+            with attempt:
+                request_params = self._prepare_request(endpoint, params, signed)
+
+                url = f"{self.testnet_url}{endpoint}"
+                response = self.session.request(method, url, params=request_params, timeout=10)
+                response.raise_for_status()
+
+                return response.json()
 
-        url = f"{self.testnet_url}{endpoint}"
-        headers = {}
+    async def _make_request_async(
+        self, method: str, endpoint: str, params: Dict = None, signed: bool = False
+    ) -> Dict:
+        """Make HTTP request to Binance API without blocking the event loop.
 
-        if self.api_key:
-            headers["X-MBX-APIKEY"] = self.api_key
+        Only idempotent requests are retried; orders are sent exactly once.
 
-        if params is None:
-            params = {}
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            params: Request parameters
+            signed: Whether request needs signature
+
+        Returns:
+            Response JSON
+        """
+        async for attempt in AsyncRetrying(**self._retry_policy(method)):
+            with attempt:
+                request_params = self._prepare_request(endpoint, params, signed)
+                return await self.transport.request(method, endpoint, params=request_params)
+
+    def _prepare_request(self, endpoint: str, params: Optional[Dict], signed: bool) -> Dict:
+        """Validate connection state and build request parameters.
+
+        Args:
+            endpoint: API endpoint
+            params: Request parameters
+            signed: Whether request needs signature
+
+        Returns:
+            Request parameters
+        """
+        if not self.connected and endpoint != "/api/v3/time":
+            raise RuntimeError("Not connected to Binance testnet")
+
+        params = dict(params) if params else {}
 
         if signed:
             params["timestamp"] = int(time.time() * 1000)
             # Note: In real implementation, you'd sign the request with HMAC-SHA256
             # For testnet, simplified implementation
 
-        response = requests.request(method, url, headers=headers, params=params, timeout=10)
-        response.raise_for_status()
+        return params
 
-        return response.json()
+    async def aclose(self) -> None:
+        """Close pooled async connections (call from the event loop that used them)."""
+        await self.transport.close()
+
+    def get_latency_stats(self) -> Dict[str, Dict]:
+        """Get per-endpoint latency histograms for async requests.
+
+        Returns:
+            Dictionary keyed by "METHOD /path"
+        """
+        return self.transport.get_latency_stats()
 
     def _update_account_info(self) -> None:
         """Update account information."""
@@ -157,7 +238,66 @@ class BinanceTestnetBroker(BaseBroker):
         if not self.connected:
             raise RuntimeError("Not connected to Binance testnet")
 
-        # Convert order to Binance format
+        params = self._order_params(order)
+
+        try:
+            response = self._make_request("POST", "/api/v3/order", params, signed=True)
+            return self._record_order(order, response)
+
+        except Exception as e:
+            logger.error(f"Failed to place order: {e}")
+            raise
+
+    async def place_order_async(self, order: Order) -> str:
+        """Place an order on Binance testnet over the pooled async transport.
+
+        Args:
+            order: Order to place
+
+        Returns:
+            Order ID
+        """
+        if not self.connected:
+            raise RuntimeError("Not connected to Binance testnet")
+
+        params = self._order_params(order)
+
+        try:
+            response = await self._make_request_async(
+                "POST", "/api/v3/order", params, signed=True
+            )
+            return self._record_order(order, response)
+
+        except Exception as e:
+            logger.error(f"Failed to place order: {e}")
+            raise
+
+    async def place_orders_async(
+        self, orders: List[Order], max_concurrency: int = 5
+    ) -> List[OrderResult]:
+        """Submit several orders concurrently over the pooled connections.
+
+        Binance spot has no batch order endpoint, so orders are spread across
+        up to ``max_concurrency`` keep-alive connections instead.
+
+        Args:
+            orders: Orders to place
+            max_concurrency: Maximum orders in flight
+
+        Returns:
+            Per-order results, in input order, with submission latency
+        """
+        return await place_orders_concurrently(self.place_order_async, orders, max_concurrency)
+
+    def _order_params(self, order: Order) -> Dict:
+        """Convert an order to Binance request parameters.
+
+        Args:
+            order: Order to convert
+
+        Returns:
+            Request parameters
+        """
         params = {
             "symbol": order.symbol.replace("/", ""),  # Remove slash for Binance format
             "side": order.side.value.upper(),
@@ -169,25 +309,29 @@ class BinanceTestnetBroker(BaseBroker):
             params["price"] = order.price
             params["timeInForce"] = "GTC"
 
-        try:
-            response = self._make_request("POST", "/api/v3/order", params, signed=True)
+        return params
 
-            # Update order with response
-            order.order_id = str(response.get("orderId"))
-            order.timestamp = datetime.now()
-            order.status = OrderStatus.PENDING
+    def _record_order(self, order: Order, response: Dict) -> str:
+        """Update and store an order from the exchange response.
 
-            # Store order
-            self.orders[order.order_id] = order
+        Args:
+            order: Submitted order
+            response: Exchange response
 
-            logger.info(
-                f"Placed order {order.order_id}: {order.side.value} {order.quantity} {order.symbol}"
-            )
-            return order.order_id
+        Returns:
+            Order ID
+        """
+        order.order_id = str(response.get("orderId"))
+        order.timestamp = self.clock.now()
+        order.status = OrderStatus.PENDING
 
-        except Exception as e:
-            logger.error(f"Failed to place order: {e}")
-            raise
+        # Store order
+        self.orders[order.order_id] = order
+
+        logger.info(
+            f"Placed order {order.order_id}: {order.side.value} {order.quantity} {order.symbol}"
+        )
+        return order.order_id
 
     def cancel_order(self, order_id: str) -> bool:
         """Cancel an order.
@@ -284,7 +428,7 @@ class BinanceTestnetBroker(BaseBroker):
                         avg_entry_price=current_price,  # Simplified
                         current_price=current_price,
                         unrealized_pnl=0.0,  # Simplified
-                        timestamp=datetime.now(),
+                        timestamp=self.clock.now(),
                     )
                     positions[f"{asset}/USDT"] = position
 
@@ -320,6 +464,31 @@ class BinanceTestnetBroker(BaseBroker):
             logger.error(f"Failed to get price for {symbol}: {e}")
             return 0.0
 
+    async def get_current_price_async(self, symbol: str) -> float:
+        """Get current price for symbol over the pooled async transport.
+
+        Args:
+            symbol: Symbol (e.g., "BTC/USDT")
+
+        Returns:
+            Current price
+        """
+        # Check cache first
+        if symbol in self.price_cache:
+            return self.price_cache[symbol]
+
+        try:
+            params = {"symbol": symbol.replace("/", "")}
+            response = await self._make_request_async("GET", "/api/v3/ticker/price", params)
+
+            price = float(response.get("price", 0))
+            self.price_cache[symbol] = price
+            return price
+
+        except Exception as e:
+            logger.error(f"Failed to get price for {symbol}: {e}")
+            return 0.0
+
     def get_portfolio(self) -> Portfolio:
         """Get current portfolio status.
 
@@ -344,7 +513,7 @@ class BinanceTestnetBroker(BaseBroker):
         return Portfolio(
             cash=cash,
             positions=positions,
-            timestamp=datetime.now(),
+            timestamp=self.clock.now(),
             total_value=total_value,
             unrealized_pnl=unrealized_pnl,
             realized_pnl=0.0,  # Would need trade history analysis
@@ -378,15 +547,16 @@ class BinanceTestnetBroker(BaseBroker):
         stream_names = [f"{s}@ticker" for s in binance_symbols]
         stream_url = f"{self.stream_url}{'/'.join(stream_names)}"
 
-        try:
-            async with websockets.connect(stream_url) as websocket:
-                self.websocket = websocket
-                logger.info(f"Started price stream for {symbols}")
-
-                async for message in websocket:
-                    data = json.loads(message)
-                    await self._handle_price_update(data)
+        # Latest ticker per symbol wins; stale prices are never worth queueing
+        self.price_stream = MarketDataStream(
+            stream_url,
+            parser=lambda data: [(data["s"], data)] if "s" in data and "c" in data else [],
+            on_tick=lambda symbol, data: self._handle_price_update(data),
+        )
+        logger.info(f"Started price stream for {symbols}")
 
+        try:
+            await self.price_stream.run()
         except Exception as e:
             logger.error(f"Price stream error: {e}")
 
@@ -1,16 +1,61 @@
 """Abstract broker interface and simulator implementation."""
 
+import asyncio
+import time
 import uuid
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
+from athena.core.clock import Clock, WallClock
 from athena.core.logging import get_logger
-from athena.core.types import Order, OrderStatus, Portfolio, Position, Trade
+from athena.core.types import (
+    Order,
+    OrderResult,
+    OrderSide,
+    OrderStatus,
+    OrderType,
+    Portfolio,
+    Position,
+    Trade,
+)
+from athena.live.order_book import QUANTITY_EPSILON, OrderBook
 
 logger = get_logger(__name__)
 
 
+async def place_orders_concurrently(
+    place_order: Callable[[Order], Awaitable[Any]], orders: List[Order], max_concurrency: int
+) -> List[OrderResult]:
+    """Submit orders through an async per-order call with bounded concurrency.
+
+    A failing order is reported in its result instead of aborting the batch.
+
+    Args:
+        place_order: Coroutine function placing one order (may return the placed Order)
+        orders: Orders to place
+        max_concurrency: Maximum orders in flight
+
+    Returns:
+        Per-order results, in input order, with submission latency
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def submit(order: Order) -> OrderResult:
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                placed = await place_order(order)
+                if not isinstance(placed, Order):
+                    placed = order
+                error = "rejected" if placed.status == OrderStatus.REJECTED else None
+            except Exception as e:
+                placed, error = order, str(e)
+            latency_ms = (time.perf_counter() - start) * 1000
+            return OrderResult(placed, error is None, latency_ms, error)
+
+    return list(await asyncio.gather(*(submit(order) for order in orders)))
+
+
 class BaseBroker(ABC):
     """Abstract base class for broker implementations."""
 
@@ -44,6 +89,27 @@ class BaseBroker(ABC):
         """
         pass
 
+    def place_orders(self, orders: List[Order]) -> List[OrderResult]:
+        """Place several orders, collecting a result per order instead of stopping on errors.
+
+        Args:
+            orders: Orders to place
+
+        Returns:
+            Results in the same order as the input
+        """
+        results = []
+        for order in orders:
+            start = time.perf_counter()
+            try:
+                self.place_order(order)
+                error = "rejected" if order.status == OrderStatus.REJECTED else None
+            except Exception as e:
+                error = str(e)
+            latency_ms = (time.perf_counter() - start) * 1000
+            results.append(OrderResult(order, error is None, latency_ms, error))
+        return results
+
     @abstractmethod
     def cancel_order(self, order_id: str) -> bool:
         """Cancel an order.
@@ -100,10 +166,21 @@ class BaseBroker(ABC):
 
 
 class SimulatedBroker(BaseBroker):
-    """Simulated broker for testing and fallback."""
+    """Simulated broker for testing and fallback.
+
+    Market orders fill immediately at the mock price plus slippage. Limit, stop and
+    stop-limit orders rest in a per-symbol price-time priority ``OrderBook`` and are
+    matched on every ``set_mock_price`` tick, partially when the tick's volume is
+    smaller than the resting quantity. An order that is marketable when placed
+    executes against the last tick, taking only the volume that tick has left.
+    """
 
     def __init__(
-        self, initial_capital: float = 100000, commission: float = 0.001, slippage: float = 0.0005
+        self,
+        initial_capital: float = 100000,
+        commission: float = 0.001,
+        slippage: float = 0.0005,
+        clock: Optional[Clock] = None,
     ):
         """Initialize simulated broker.
 
@@ -111,10 +188,12 @@ class SimulatedBroker(BaseBroker):
             initial_capital: Starting capital
             commission: Commission rate
             slippage: Slippage rate
+            clock: Time source for order and trade timestamps (wall time if None)
         """
         self.initial_capital = initial_capital
         self.commission = commission
         self.slippage = slippage
+        self.clock = clock or WallClock()
 
         # State
         self.connected = False
@@ -122,9 +201,16 @@ class SimulatedBroker(BaseBroker):
         self.orders: Dict[str, Order] = {}
         self.positions: Dict[str, Position] = {}
         self.trades: List[Trade] = []
+        self.books: Dict[str, OrderBook] = {}
+
+        # Running portfolio totals, updated at fill and price-update time
+        self.realized_pnl = 0.0
+        self._market_value = 0.0
+        self._unrealized_pnl = 0.0
 
-        # Mock price feed
+        # Mock price feed, and the volume each side can still take from the last tick
         self.mock_prices: Dict[str, float] = {}
+        self._tick_volume: Dict[str, Dict[OrderSide, Optional[float]]] = {}
 
     def connect(self) -> bool:
         """Connect to simulated broker."""
@@ -138,14 +224,112 @@ class SimulatedBroker(BaseBroker):
         logger.info("Disconnected from simulated broker")
         return True
 
-    def set_mock_price(self, symbol: str, price: float) -> None:
-        """Set mock price for simulation.
+    def set_mock_price(self, symbol: str, price: float, volume: Optional[float] = None) -> None:
+        """Set mock price for simulation and match resting orders against it.
 
         Args:
             symbol: Symbol
             price: Mock price
+            volume: Quantity tradable at this price per side (unlimited if None)
         """
         self.mock_prices[symbol] = price
+        self._tick_volume[symbol] = {OrderSide.BUY: volume, OrderSide.SELL: volume}
+
+        position = self.positions.get(symbol)
+        if position is not None:
+            self._unmark(position)
+            self._mark(position, price)
+
+        self._process_tick(symbol, price)
+
+    def _process_tick(self, symbol: str, price: float) -> None:
+        """Trigger stops and fill marketable limits for one price update.
+
+        Triggered stops execute first, so resting limits only get the volume they leave.
+
+        Args:
+            symbol: Symbol
+            price: Market price
+        """
+        book = self.books.get(symbol)
+        if not book:
+            return
+
+        for order in book.trigger_stops(price):
+            if order.order_type == OrderType.STOP:
+                self._fill_market(order, price)
+            else:
+                book.add_limit(order)  # Stop-limit becomes a resting limit
+
+        volume = self._tick_volume[symbol]
+        for fill in book.match(price, volume[OrderSide.BUY], volume[OrderSide.SELL]):
+            self._fill_order(fill.order, fill.price, fill.quantity)
+            self._consume_volume(symbol, fill.order.side, fill.quantity)
+
+    def _fill_market(self, order: Order, price: float) -> None:
+        """Fill a market order, or a triggered stop, in full with slippage.
+
+        The fill still takes its quantity out of the last tick's volume, so limit
+        orders matched against the same tick cannot reuse it.
+        """
+        quantity = order.quantity - order.filled_quantity
+        self._fill_order(order, self._slipped_price(order, price))
+        self._consume_volume(order.symbol, order.side, quantity)
+
+    def _consume_volume(self, symbol: str, side: OrderSide, quantity: float) -> None:
+        """Take filled quantity out of the last tick's remaining volume."""
+        volume = self._tick_volume.get(symbol)
+        if volume is not None and volume[side] is not None:
+            volume[side] = max(volume[side] - quantity, 0.0)
+
+    def _match_new_order(self, book: OrderBook, order: Order) -> None:
+        """Execute a newly placed order that is already marketable at the last tick.
+
+        Only the new order is considered, and only against the volume the last
+        tick has left, so placing an order never fills other resting orders and
+        cannot exceed the tick's liquidity. Everything else waits for the next tick.
+        """
+        price = self.mock_prices.get(order.symbol)
+        if price is None:
+            if order.order_type == OrderType.LIMIT:
+                book.add_limit(order)
+            else:
+                book.add_stop(order)
+            return
+
+        if order.order_type != OrderType.LIMIT:
+            if not OrderBook.stop_reached(order, price):
+                book.add_stop(order)
+                return
+            if order.order_type == OrderType.STOP:
+                self._fill_market(order, price)
+                return
+
+        book.add_limit(order)
+        fill = book.match_order(order, price, self._tick_volume[order.symbol][order.side])
+        if fill is not None:
+            self._fill_order(order, fill.price, fill.quantity)
+            self._consume_volume(order.symbol, order.side, fill.quantity)
+
+    def _slipped_price(self, order: Order, price: float) -> float:
+        """Apply slippage against the order's side."""
+        if order.side == OrderSide.BUY:
+            return price * (1 + self.slippage)
+        return price * (1 - self.slippage)
+
+    def get_book(self, symbol: str) -> OrderBook:
+        """Get the order book for a symbol, creating it on first use.
+
+        Args:
+            symbol: Symbol
+
+        Returns:
+            OrderBook
+        """
+        book = self.books.get(symbol)
+        if book is None:
+            book = self.books[symbol] = OrderBook(symbol)
+        return book
 
     def get_current_price(self, symbol: str) -> float:
         """Get current price for symbol.
@@ -170,65 +354,82 @@ class SimulatedBroker(BaseBroker):
         if not self.connected:
             raise RuntimeError("Broker not connected")
 
-        # Generate order ID
-        order_id = str(uuid.uuid4())[:8]
+        # Generate order ID (long enough to stay unique across large simulations)
+        order_id = uuid.uuid4().hex[:16]
         order.order_id = order_id
-        order.timestamp = datetime.now()
-
-        # Get current price
-        current_price = self.get_current_price(order.symbol)
-
-        # Apply slippage
-        if order.side.value == "buy":
-            fill_price = current_price * (1 + self.slippage)
-        else:
-            fill_price = current_price * (1 - self.slippage)
-
-        # For market orders, fill immediately
-        if order.order_type.value == "market":
-            self._fill_order(order, fill_price)
-            # Store filled order for status tracking
-            self.orders[order_id] = order
+        order.timestamp = self.clock.now()
+        self.orders[order_id] = order
+
+        missing = {
+            OrderType.LIMIT: order.price is None,
+            OrderType.STOP: order.stop_price is None,
+            OrderType.STOP_LIMIT: order.price is None or order.stop_price is None,
+        }.get(order.order_type, False)
+        if missing:
+            order.status = OrderStatus.REJECTED
+            logger.warning(f"Rejected {order.order_type.value} order {order_id}: missing price")
+            return order_id
+
+        if order.order_type == OrderType.MARKET:
+            # Fill immediately
+            self._fill_market(order, self.get_current_price(order.symbol))
         else:
-            # For limit orders, store for potential future fill
             order.status = OrderStatus.PENDING
-            self.orders[order_id] = order
+            self._match_new_order(self.get_book(order.symbol), order)
 
-        logger.info(f"Placed order {order_id}: {order.side.value} {order.quantity} {order.symbol}")
+        logger.debug(
+            "Placed order %s: %s %s %s", order_id, order.side.value, order.quantity, order.symbol
+        )
         return order_id
 
-    def _fill_order(self, order: Order, fill_price: float) -> None:
-        """Fill an order at given price.
+    def _fill_order(
+        self, order: Order, fill_price: float, quantity: Optional[float] = None
+    ) -> None:
+        """Fill an order, or part of it, at given price.
 
         Args:
             order: Order to fill
             fill_price: Fill price
+            quantity: Quantity to fill (the whole remaining quantity if None)
         """
+        remaining = order.quantity - order.filled_quantity
+        if quantity is None or quantity > remaining:
+            quantity = remaining
+
         # Calculate commission
-        trade_value = order.quantity * fill_price
+        trade_value = quantity * fill_price
         commission = trade_value * self.commission
 
-        # Update order
-        order.status = OrderStatus.FILLED
-        order.filled_quantity = order.quantity
-        order.filled_price = fill_price
-        order.commission = commission
+        # Update order; filled_price is the average over all fills
+        filled = order.filled_quantity + quantity
+        if filled > 0:
+            order.filled_price = (
+                order.filled_price * order.filled_quantity + fill_price * quantity
+            ) / filled
+        order.filled_quantity = filled
+        order.commission += commission
+        if order.quantity - filled > QUANTITY_EPSILON:
+            order.status = OrderStatus.PARTIALLY_FILLED
+        else:
+            order.status = OrderStatus.FILLED
 
         # Create trade
         trade = Trade(
             symbol=order.symbol,
             side=order.side,
-            quantity=order.quantity,
+            quantity=quantity,
             price=fill_price,
-            timestamp=datetime.now(),
+            timestamp=self.clock.now(),
             commission=commission,
             trade_id=str(uuid.uuid4())[:8],
             order_id=order.order_id,
         )
         self.trades.append(trade)
 
-        # Update positions
-        self._update_position(trade)
+        # Update positions and realized P&L
+        trade.pnl = self._update_position(trade)
+        if trade.pnl is not None:
+            self.realized_pnl += trade.pnl
 
         # Update cash
         if order.side.value == "buy":
@@ -236,48 +437,73 @@ class SimulatedBroker(BaseBroker):
         else:
             self.cash += trade_value - commission
 
-        logger.info(f"Filled order {order.order_id}: {order.quantity} @ ${fill_price:.2f}")
+        logger.debug("Filled order %s: %s @ $%.2f", order.order_id, quantity, fill_price)
 
-    def _update_position(self, trade: Trade) -> None:
+    def _update_position(self, trade: Trade) -> Optional[float]:
         """Update position based on trade.
 
         Args:
             trade: Executed trade
+
+        Returns:
+            Realized P&L (excluding commission) if the trade reduced a position,
+            otherwise None
         """
         symbol = trade.symbol
+        signed_quantity = trade.quantity if trade.side == OrderSide.BUY else -trade.quantity
+        realized = None
 
-        if symbol not in self.positions:
+        pos = self.positions.get(symbol)
+        if pos is None:
             # New position
-            self.positions[symbol] = Position(
+            pos = self.positions[symbol] = Position(
                 symbol=symbol,
-                quantity=trade.quantity if trade.side.value == "buy" else -trade.quantity,
+                quantity=signed_quantity,
                 avg_entry_price=trade.price,
                 current_price=trade.price,
                 unrealized_pnl=0.0,
                 timestamp=trade.timestamp,
             )
         else:
-            # Update existing position
-            pos = self.positions[symbol]
-
-            if trade.side.value == "buy":
-                new_quantity = pos.quantity + trade.quantity
-                if pos.quantity >= 0:  # Adding to long
-                    pos.avg_entry_price = (
-                        pos.avg_entry_price * pos.quantity + trade.price * trade.quantity
-                    ) / new_quantity
-                pos.quantity = new_quantity
-            else:  # sell
-                new_quantity = pos.quantity - trade.quantity
-                if pos.quantity <= 0:  # Adding to short
-                    pos.avg_entry_price = (
-                        pos.avg_entry_price * abs(pos.quantity) + trade.price * trade.quantity
-                    ) / abs(new_quantity)
-                pos.quantity = new_quantity
+            self._unmark(pos)
+            new_quantity = pos.quantity + signed_quantity
+
+            if pos.quantity * signed_quantity > 0:
+                # Adding to the position
+                pos.avg_entry_price = (
+                    pos.avg_entry_price * abs(pos.quantity) + trade.price * trade.quantity
+                ) / abs(new_quantity)
+            else:
+                # Reducing, closing or flipping the position
+                closed = min(abs(pos.quantity), trade.quantity)
+                direction = 1 if pos.quantity > 0 else -1
+                realized = (trade.price - pos.avg_entry_price) * closed * direction
+                pos.realized_pnl += realized
+                if new_quantity * pos.quantity < 0:
+                    pos.avg_entry_price = trade.price  # Remainder opens the opposite side
+            pos.quantity = new_quantity
 
             # Remove position if closed
             if abs(pos.quantity) < 1e-6:
                 del self.positions[symbol]
+                if not self.positions:
+                    self._market_value = self._unrealized_pnl = 0.0  # Shed float drift
+                return realized
+
+        self._mark(pos, self.get_current_price(symbol))
+        return realized
+
+    def _mark(self, position: Position, price: float) -> None:
+        """Reprice a position and fold it into the running portfolio totals."""
+        position.current_price = price
+        position.unrealized_pnl = (price - position.avg_entry_price) * position.quantity
+        self._market_value += position.market_value
+        self._unrealized_pnl += position.unrealized_pnl
+
+    def _unmark(self, position: Position) -> None:
+        """Remove a position's contribution from the running portfolio totals."""
+        self._market_value -= position.market_value
+        self._unrealized_pnl -= position.unrealized_pnl
 
     def cancel_order(self, order_id: str) -> bool:
         """Cancel a pending order.
@@ -290,8 +516,11 @@ class SimulatedBroker(BaseBroker):
         """
         if order_id in self.orders:
             order = self.orders[order_id]
-            if order.status == OrderStatus.PENDING:
+            if order.status in (OrderStatus.PENDING, OrderStatus.PARTIALLY_FILLED):
                 order.status = OrderStatus.CANCELLED
+                book = self.books.get(order.symbol)
+                if book is not None:
+                    book.cancel(order_id)
                 logger.info(f"Cancelled order {order_id}")
                 return True
 
@@ -312,50 +541,27 @@ class SimulatedBroker(BaseBroker):
     def get_positions(self) -> Dict[str, Position]:
         """Get current positions.
 
+        Positions are repriced on every ``set_mock_price`` and fill, so this is a
+        plain copy.
+
         Returns:
             Dictionary mapping symbols to positions
         """
-        # Update unrealized PnL
-        for symbol, position in self.positions.items():
-            current_price = self.get_current_price(symbol)
-            position.current_price = current_price
-
-            if position.quantity > 0:  # Long position
-                position.unrealized_pnl = (
-                    current_price - position.avg_entry_price
-                ) * position.quantity
-            else:  # Short position
-                position.unrealized_pnl = (position.avg_entry_price - current_price) * abs(
-                    position.quantity
-                )
-
         return self.positions.copy()
 
     def get_portfolio(self) -> Portfolio:
-        """Get current portfolio status.
+        """Get current portfolio status from running totals.
 
         Returns:
             Portfolio object
         """
-        positions = self.get_positions()
-
-        total_value = self.cash
-        unrealized_pnl = 0.0
-
-        for position in positions.values():
-            total_value += position.market_value
-            unrealized_pnl += position.unrealized_pnl
-
-        # Calculate realized PnL from trades
-        realized_pnl = sum(getattr(trade, "pnl", 0) or 0 for trade in self.trades)
-
         return Portfolio(
             cash=self.cash,
-            positions=positions,
-            timestamp=datetime.now(),
-            total_value=total_value,
-            unrealized_pnl=unrealized_pnl,
-            realized_pnl=realized_pnl,
+            positions=self.positions.copy(),
+            timestamp=self.clock.now(),
+            total_value=self.cash + self._market_value,
+            unrealized_pnl=self._unrealized_pnl,
+            realized_pnl=self.realized_pnl,
         )
 
     def get_trades(self, symbol: Optional[str] = None) -> List[Trade]:
@@ -2,16 +2,19 @@
 
 import asyncio
 import json
+import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Callable
 import aiohttp
 from decimal import Decimal
 
+from athena.core.clock import Clock
 from athena.core.types import Order, Position, Trade, OrderSide, OrderStatus, OrderType
 from athena.core.logging import get_logger
 from athena.live.brokers.base import (
     BaseBroker, BrokerConfig, MarketData, AccountInfo, ConnectionState
 )
+from athena.live.streaming import MarketDataStream
 
 logger = get_logger(__name__)
 
@@ -19,9 +22,9 @@ logger = get_logger(__name__)
 class AlpacaBroker(BaseBroker):
     """Alpaca broker implementation."""
 
-    def __init__(self, config: BrokerConfig):
+    def __init__(self, config: BrokerConfig, clock: Optional[Clock] = None):
         """Initialize Alpaca broker."""
-        super().__init__(config)
+        super().__init__(config, clock)
 
         # Set Alpaca-specific URLs
         if config.paper_trading:
@@ -32,11 +35,13 @@ class AlpacaBroker(BaseBroker):
             self.data_url = "https://data.alpaca.markets"
 
         self.ws_url = self.base_url.replace("https", "wss") + "/stream"
+        self.data_ws_url = config.metadata.get(
+            "data_ws_url", "wss://stream.data.alpaca.markets/v2/iex"
+        )
 
         # HTTP session
         self.session: Optional[aiohttp.ClientSession] = None
-        self.ws_connection = None
-        self._market_data_callbacks: Dict[str, List[Callable]] = {}
+        self.ws_connection: Optional[MarketDataStream] = None
 
     async def connect(self) -> bool:
         """Connect to Alpaca."""
@@ -56,7 +61,7 @@ class AlpacaBroker(BaseBroker):
             account = await self.get_account()
             if account:
                 self.state = ConnectionState.CONNECTED
-                self._start_time = datetime.now()
+                self._start_time = self.clock.now()
                 logger.info(f"Connected to Alpaca ({'paper' if self.config.paper_trading else 'live'})")
                 return True
 
@@ -87,9 +92,23 @@ class AlpacaBroker(BaseBroker):
         """Check connection status."""
         return self.state == ConnectionState.CONNECTED and self.session is not None
 
+    async def ping(self) -> bool:
+        """Round-trip Alpaca's market clock endpoint."""
+        if not await self.is_connected():
+            return False
+
+        try:
+            await self._check_rate_limit("/v2/clock")
+            async with self.session.get(f"{self.base_url}/v2/clock") as response:
+                return response.status == 200
+        except Exception as e:
+            logger.warning(f"Alpaca ping failed: {e}")
+            return False
+
     async def get_account(self) -> AccountInfo:
         """Get account information."""
         try:
+            await self._check_rate_limit("/v2/account")
             async with self.session.get(f"{self.base_url}/v2/account") as response:
                 if response.status == 200:
                     data = await response.json()
@@ -116,6 +135,7 @@ class AlpacaBroker(BaseBroker):
         positions = []
 
         try:
+            await self._check_rate_limit("/v2/positions")
             async with self.session.get(f"{self.base_url}/v2/positions") as response:
                 if response.status == 200:
                     data = await response.json()
@@ -130,6 +150,7 @@ class AlpacaBroker(BaseBroker):
     async def get_position(self, symbol: str) -> Optional[Position]:
         """Get position for specific symbol."""
         try:
+            await self._check_rate_limit("/v2/positions/{symbol}")
             async with self.session.get(f"{self.base_url}/v2/positions/{symbol}") as response:
                 if response.status == 200:
                     data = await response.json()
@@ -145,8 +166,11 @@ class AlpacaBroker(BaseBroker):
     async def place_order(self, order: Order) -> Order:
         """Place an order."""
         try:
+            # Wait for rate limit budget before starting the latency clock
+            await self._check_rate_limit("/v2/orders")
+
             # Measure latency
-            start_time = datetime.now()
+            start_time = time.perf_counter()
 
             # Prepare order data
             order_data = {
@@ -170,7 +194,7 @@ class AlpacaBroker(BaseBroker):
             ) as response:
 
                 # Record metrics
-                latency = (datetime.now() - start_time).total_seconds() * 1000
+                latency = (time.perf_counter() - start_time) * 1000
                 self.record_latency(latency)
                 self.metrics.total_orders += 1
 
@@ -204,6 +228,7 @@ class AlpacaBroker(BaseBroker):
     async def cancel_order(self, order_id: str) -> bool:
         """Cancel an order."""
         try:
+            await self._check_rate_limit("/v2/orders/{order_id}")
             async with self.session.delete(f"{self.base_url}/v2/orders/{order_id}") as response:
                 if response.status in [200, 204]:
                     logger.info(f"Order cancelled: {order_id}")
@@ -220,6 +245,7 @@ class AlpacaBroker(BaseBroker):
     async def get_order(self, order_id: str) -> Optional[Order]:
         """Get order by ID."""
         try:
+            await self._check_rate_limit("/v2/orders/{order_id}")
             async with self.session.get(f"{self.base_url}/v2/orders/{order_id}") as response:
                 if response.status == 200:
                     data = await response.json()
@@ -242,6 +268,7 @@ class AlpacaBroker(BaseBroker):
             params["status"] = self._get_alpaca_status(status)
 
         try:
+            await self._check_rate_limit("/v2/orders")
             async with self.session.get(
                 f"{self.base_url}/v2/orders",
                 params=params
@@ -260,6 +287,7 @@ class AlpacaBroker(BaseBroker):
         """Get current market data."""
         try:
             # Get latest quote
+            await self._check_rate_limit("/v2/stocks/{symbol}/quotes/latest")
             async with self.session.get(
                 f"{self.data_url}/v2/stocks/{symbol}/quotes/latest",
                 headers={
@@ -273,7 +301,9 @@ class AlpacaBroker(BaseBroker):
 
                     return MarketData(
                         symbol=symbol,
-                        timestamp=datetime.fromisoformat(quote.get("t", datetime.now().isoformat())),
+                        timestamp=datetime.fromisoformat(
+                            quote.get("t", self.clock.now().isoformat())
+                        ),
                         bid=float(quote.get("bp", 0)),
                         ask=float(quote.get("ap", 0)),
                         last=float(quote.get("p", 0)),
@@ -299,12 +329,13 @@ class AlpacaBroker(BaseBroker):
         if not self.ws_connection:
             await self._connect_websocket()
 
-        # Subscribe to symbols
+        # Subscribe to symbols; the stream sends these once connected and after reconnects
         if self.ws_connection:
-            await self.ws_connection.send_json({
-                "action": "subscribe",
-                "quotes": symbols
-            })
+            for symbol in symbols:
+                await self.ws_connection.subscribe(symbol, {
+                    "action": "subscribe",
+                    "quotes": [symbol]
+                })
 
     async def unsubscribe_market_data(self, symbols: List[str]) -> None:
         """Unsubscribe from market data."""
@@ -313,10 +344,11 @@ class AlpacaBroker(BaseBroker):
                 del self._market_data_callbacks[symbol]
 
         if self.ws_connection:
-            await self.ws_connection.send_json({
-                "action": "unsubscribe",
-                "quotes": symbols
-            })
+            for symbol in symbols:
+                await self.ws_connection.unsubscribe(symbol, {
+                    "action": "unsubscribe",
+                    "quotes": [symbol]
+                })
 
     async def get_trades(self, symbol: Optional[str] = None,
                         start_date: Optional[datetime] = None,
@@ -326,9 +358,9 @@ class AlpacaBroker(BaseBroker):
 
         # Default to last 30 days
         if not start_date:
-            start_date = datetime.now() - timedelta(days=30)
+            start_date = self.clock.now() - timedelta(days=30)
         if not end_date:
-            end_date = datetime.now()
+            end_date = self.clock.now()
 
         try:
             # Get closed orders (executed trades)
@@ -341,6 +373,7 @@ class AlpacaBroker(BaseBroker):
             if symbol:
                 params["symbols"] = symbol
 
+            await self._check_rate_limit("/v2/orders")
             async with self.session.get(
                 f"{self.base_url}/v2/orders",
                 params=params
@@ -457,9 +490,40 @@ class AlpacaBroker(BaseBroker):
     async def _connect_websocket(self) -> None:
         """Connect to Alpaca websocket for real-time data."""
         try:
-            # This would connect to Alpaca's websocket
-            # Implementation depends on specific websocket library
             logger.info("Connecting to Alpaca websocket...")
-            # self.ws_connection = await connect_to_alpaca_ws(...)
+            self.ws_connection = MarketDataStream(
+                self.data_ws_url,
+                parser=self._parse_stream_message,
+                on_tick=self._dispatch_market_data,
+                on_drop=self.record_tick_drop,
+                handshake=[{
+                    "action": "auth",
+                    "key": self.config.api_key,
+                    "secret": self.config.api_secret,
+                }],
+            )
+            await self.ws_connection.start()
         except Exception as e:
-            logger.error(f"Failed to connect to websocket: {e}")
\ No newline at end of file
+            logger.error(f"Failed to connect to websocket: {e}")
+
+    def _parse_stream_message(self, payload: Any):
+        """Extract quotes from an Alpaca market data stream message."""
+        for item in payload if isinstance(payload, list) else [payload]:
+            if item.get("T") != "q":
+                continue  # Control messages (success, subscription, error)
+
+            try:
+                timestamp = datetime.fromisoformat(item["t"])
+            except (KeyError, ValueError):
+                timestamp = self.clock.now()
+
+            yield item["S"], MarketData(
+                symbol=item["S"],
+                timestamp=timestamp,
+                bid=float(item.get("bp", 0)),
+                ask=float(item.get("ap", 0)),
+                last=(float(item.get("bp", 0)) + float(item.get("ap", 0))) / 2,
+                volume=0,
+                bid_size=float(item.get("bs", 0)),
+                ask_size=float(item.get("as", 0))
+            )
\ No newline at end of file
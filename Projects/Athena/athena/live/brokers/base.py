@@ -1,15 +1,19 @@
 """Base broker interface for unified trading operations."""
 
 import asyncio
+import hashlib
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Dict, List, Optional, Any, Callable
-import time
 
-from athena.core.types import Order, Position, Trade, OrderSide, OrderStatus
+from athena.core.clock import Clock, WallClock
+from athena.core.histogram import LogHistogram, percentile_label
+from athena.core.types import Order, OrderResult, Position, Trade, OrderSide, OrderStatus
 from athena.core.logging import get_logger
+from athena.live.broker import place_orders_concurrently
+from athena.live.rate_limit import TokenBucket, get_shared_bucket
 
 logger = get_logger(__name__)
 
@@ -33,7 +37,11 @@ class BrokerConfig:
     timeout: int = 30
     max_retries: int = 3
     retry_delay: float = 1.0
-    rate_limit: Optional[int] = None  # Requests per minute
+    rate_limit: Optional[int] = None  # Request weight per minute
+    rate_limit_burst: Optional[int] = None  # Burst size (default: 1s of budget or heaviest weight)
+    rate_limit_key: Optional[str] = None  # Brokers with the same key share one budget
+    endpoint_weights: Dict[str, float] = field(default_factory=dict)  # Overrides per endpoint
+    max_concurrent_orders: int = 5  # In-flight orders for batch submission
     enable_telemetry: bool = True
     metadata: Dict[str, Any] = field(default_factory=dict)
 
@@ -95,19 +103,28 @@ class BrokerMetrics:
 class BaseBroker(ABC):
     """Abstract base class for all broker implementations."""
 
-    def __init__(self, config: BrokerConfig):
-        """Initialize broker with configuration."""
+    # Request weight per endpoint; unlisted endpoints weigh 1
+    DEFAULT_ENDPOINT_WEIGHTS: Dict[str, float] = {}
+
+    def __init__(self, config: BrokerConfig, clock: Optional[Clock] = None):
+        """Initialize broker with configuration.
+
+        Args:
+            config: Connection and limit settings
+            clock: Time source for timestamps, heartbeats and uptime (wall time if None)
+        """
         self.config = config
+        self.clock = clock or WallClock()
         self.state = ConnectionState.DISCONNECTED
         self.metrics = BrokerMetrics()
         self._start_time = None
         self._callbacks: Dict[str, List[Callable]] = {}
-        self._rate_limiter = None
-        self._last_request_time = 0
+        self._market_data_callbacks: Dict[str, List[Callable]] = {}
+        self._endpoint_weights = {**self.DEFAULT_ENDPOINT_WEIGHTS, **config.endpoint_weights}
+        self._rate_limiter = self._create_rate_limiter()
 
         # Telemetry tracking
-        self._latency_samples: List[float] = []
-        self._max_latency_samples = 1000
+        self.latency = LogHistogram()
 
     # Connection Management
 
@@ -126,6 +143,17 @@ class BaseBroker(ABC):
         """Check if broker is connected."""
         pass
 
+    async def ping(self) -> bool:
+        """Probe the broker connection end to end.
+
+        Brokers with a cheap keepalive endpoint override this to make a real round
+        trip; the default only checks local connection state.
+
+        Returns:
+            True if the broker answered
+        """
+        return await self.is_connected()
+
     async def reconnect(self) -> bool:
         """Reconnect to broker with retry logic."""
         self.metrics.reconnect_count += 1
@@ -187,6 +215,31 @@ class BaseBroker(ABC):
         """Get orders with optional filters."""
         pass
 
+    async def place_orders(self, orders: List[Order],
+                           max_concurrency: Optional[int] = None) -> List[OrderResult]:
+        """Submit several orders concurrently.
+
+        Orders are sent through ``place_order`` with at most ``max_concurrency``
+        in flight, so a rebalance costs roughly N / max_concurrency round trips
+        instead of N. Rate limiting still applies per order.
+
+        Args:
+            orders: Orders to place
+            max_concurrency: In-flight limit (defaults to config.max_concurrent_orders)
+
+        Returns:
+            Per-order results, in input order, with submission latency
+        """
+        results = await place_orders_concurrently(
+            self.place_order, orders, max_concurrency or self.config.max_concurrent_orders
+        )
+
+        failed = sum(not result.success for result in results)
+        if failed:
+            logger.warning(f"Batch submission: {failed}/{len(orders)} orders failed")
+
+        return results
+
     async def place_market_order(self, symbol: str, side: OrderSide,
                                  quantity: float) -> Order:
         """Place a market order."""
@@ -195,7 +248,7 @@ class BaseBroker(ABC):
             side=side,
             quantity=quantity,
             order_type="market",
-            timestamp=datetime.now()
+            timestamp=self.clock.now()
         )
         return await self.place_order(order)
 
@@ -208,7 +261,7 @@ class BaseBroker(ABC):
             quantity=quantity,
             price=price,
             order_type="limit",
-            timestamp=datetime.now()
+            timestamp=self.clock.now()
         )
         return await self.place_order(order)
 
@@ -242,16 +295,19 @@ class BaseBroker(ABC):
     # Telemetry and Monitoring
 
     def record_latency(self, latency_ms: float) -> None:
-        """Record operation latency."""
-        self._latency_samples.append(latency_ms)
-
-        # Keep only recent samples
-        if len(self._latency_samples) > self._max_latency_samples:
-            self._latency_samples = self._latency_samples[-self._max_latency_samples:]
-
-        # Update metrics
-        self.metrics.average_latency_ms = sum(self._latency_samples) / len(self._latency_samples)
-        self.metrics.max_latency_ms = max(self._latency_samples)
+        """Record operation latency in constant time."""
+        self.latency.record(latency_ms)
+        self.metrics.average_latency_ms = self.latency.mean
+        self.metrics.max_latency_ms = self.latency.max
+
+    def _dispatch_market_data(self, symbol: str, data: MarketData) -> None:
+        """Deliver a streamed market data update to the symbol's subscribers."""
+        self.update_heartbeat()
+        for callback in self._market_data_callbacks.get(symbol, ()):
+            try:
+                callback(data)
+            except Exception as e:
+                logger.error(f"Market data callback error for {symbol}: {e}")
 
     def record_tick_drop(self) -> None:
         """Record a dropped tick."""
@@ -259,29 +315,52 @@ class BaseBroker(ABC):
 
     def update_heartbeat(self) -> None:
         """Update last heartbeat timestamp."""
-        self.metrics.last_heartbeat = datetime.now()
+        self.metrics.last_heartbeat = self.clock.now()
 
     def get_uptime(self) -> float:
         """Get uptime in seconds."""
         if self._start_time:
-            return (datetime.now() - self._start_time).total_seconds()
+            return (self.clock.now() - self._start_time).total_seconds()
         return 0
 
     # Rate Limiting
 
-    async def _check_rate_limit(self) -> None:
-        """Check and enforce rate limiting."""
+    def _create_rate_limiter(self) -> Optional[TokenBucket]:
+        """Get the token bucket for this broker's budget, if rate limiting is enabled."""
         if not self.config.rate_limit:
+            return None
+
+        key = self.config.rate_limit_key
+        if key is None:
+            # Same broker type and API key share a budget; don't keep the raw key around
+            key_hash = hashlib.sha256(self.config.api_key.encode()).hexdigest()[:12]
+            key = f"{self.__class__.__name__}:{key_hash}"
+
+        rate = self.config.rate_limit / 60.0
+        capacity = self.config.rate_limit_burst
+        if capacity is None:
+            # One second of budget, but never less than the heaviest request
+            capacity = max([1.0, rate, *self._endpoint_weights.values()])
+
+        return get_shared_bucket(key, rate, capacity)
+
+    async def _check_rate_limit(self, endpoint: Optional[str] = None,
+                                weight: Optional[float] = None) -> None:
+        """Wait for rate limit budget before a request.
+
+        Args:
+            endpoint: Endpoint being called, used to look up its request weight
+            weight: Explicit request weight (overrides the endpoint lookup)
+        """
+        if self._rate_limiter is None:
             return
 
-        now = time.time()
-        time_since_last = now - self._last_request_time
-        min_interval = 60.0 / self.config.rate_limit
-
-        if time_since_last < min_interval:
-            await asyncio.sleep(min_interval - time_since_last)
+        if weight is None:
+            weight = self._endpoint_weights.get(endpoint, 1)
 
-        self._last_request_time = time.time()
+        waited = await self._rate_limiter.acquire(weight)
+        if waited > 1.0:
+            logger.debug("Rate limited %s for %.2fs", endpoint or "request", waited)
 
     # Callback Management
 
@@ -317,7 +396,12 @@ class BaseBroker(ABC):
                 "dropped_ticks": self.metrics.dropped_ticks,
                 "avg_latency_ms": round(self.metrics.average_latency_ms, 2),
                 "max_latency_ms": round(self.metrics.max_latency_ms, 2),
-            }
+                **{
+                    f"{percentile_label(percentile)}_latency_ms": round(value, 2)
+                    for percentile, value in self.latency.percentiles().items()
+                },
+            },
+            "rate_limit": self._rate_limiter.get_stats() if self._rate_limiter else None,
         }
 
     def __str__(self) -> str:
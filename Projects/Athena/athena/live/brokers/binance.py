@@ -2,16 +2,19 @@
 
 import asyncio
 import json
+import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Callable
 import aiohttp
 from decimal import Decimal
 
+from athena.core.clock import Clock
 from athena.core.types import Order, Position, Trade, OrderSide, OrderStatus, OrderType
 from athena.core.logging import get_logger
 from athena.live.brokers.base import (
     BaseBroker, BrokerConfig, MarketData, AccountInfo, ConnectionState
 )
+from athena.live.streaming import MarketDataStream
 
 logger = get_logger(__name__)
 
@@ -19,9 +22,17 @@ logger = get_logger(__name__)
 class BinanceBroker(BaseBroker):
     """Binance broker implementation for crypto trading."""
 
-    def __init__(self, config: BrokerConfig):
+    # Binance REQUEST_WEIGHT costs of the endpoints requested here (spot API, single symbol)
+    DEFAULT_ENDPOINT_WEIGHTS = {
+        "/api/v3/ping": 1,
+        "/api/v3/time": 1,
+        "/api/v3/order": 1,
+        "/api/v3/ticker/bookTicker": 2,
+    }
+
+    def __init__(self, config: BrokerConfig, clock: Optional[Clock] = None):
         """Initialize Binance broker."""
-        super().__init__(config)
+        super().__init__(config, clock)
 
         # Set Binance URLs
         if config.paper_trading:
@@ -33,8 +44,7 @@ class BinanceBroker(BaseBroker):
 
         # HTTP session
         self.session: Optional[aiohttp.ClientSession] = None
-        self.ws_connection = None
-        self._market_data_callbacks: Dict[str, List[Callable]] = {}
+        self.ws_connection: Optional[MarketDataStream] = None
 
         # Binance-specific tracking
         self._order_id_counter = 1
@@ -53,10 +63,11 @@ class BinanceBroker(BaseBroker):
             self.session = aiohttp.ClientSession(headers=headers)
 
             # Test connection with server time
+            await self._check_rate_limit("/api/v3/time")
             async with self.session.get(f"{self.base_url}/api/v3/time") as response:
                 if response.status == 200:
                     self.state = ConnectionState.CONNECTED
-                    self._start_time = datetime.now()
+                    self._start_time = self.clock.now()
                     logger.info(f"Connected to Binance ({'testnet' if self.config.paper_trading else 'mainnet'})")
                     return True
                 else:
@@ -89,6 +100,19 @@ class BinanceBroker(BaseBroker):
         """Check connection status."""
         return self.state == ConnectionState.CONNECTED and self.session is not None
 
+    async def ping(self) -> bool:
+        """Round-trip Binance's ping endpoint."""
+        if not await self.is_connected():
+            return False
+
+        try:
+            await self._check_rate_limit("/api/v3/ping")
+            async with self.session.get(f"{self.base_url}/api/v3/ping") as response:
+                return response.status == 200
+        except Exception as e:
+            logger.warning(f"Binance ping failed: {e}")
+            return False
+
     async def get_account(self) -> AccountInfo:
         """Get Binance account information."""
         try:
@@ -157,8 +181,11 @@ class BinanceBroker(BaseBroker):
     async def place_order(self, order: Order) -> Order:
         """Place an order on Binance."""
         try:
+            # Wait for rate limit budget before starting the latency clock
+            await self._check_rate_limit("/api/v3/order")
+
             # Measure latency
-            start_time = datetime.now()
+            start_time = time.perf_counter()
 
             # For paper trading, simulate order placement
             if self.config.paper_trading:
@@ -176,7 +203,7 @@ class BinanceBroker(BaseBroker):
                     order.average_price = order.price or 50000.0  # Simulated BTC price
 
                 # Record metrics
-                latency = (datetime.now() - start_time).total_seconds() * 1000
+                latency = (time.perf_counter() - start_time) * 1000
                 self.record_latency(latency)
                 self.metrics.total_orders += 1
                 self.metrics.successful_orders += 1
@@ -251,6 +278,7 @@ class BinanceBroker(BaseBroker):
         """Get current Binance market data."""
         try:
             # Public endpoint - no auth required
+            await self._check_rate_limit("/api/v3/ticker/bookTicker")
             async with self.session.get(
                 f"{self.base_url}/api/v3/ticker/bookTicker",
                 params={"symbol": symbol.upper()}
@@ -259,7 +287,7 @@ class BinanceBroker(BaseBroker):
                     data = await response.json()
                     return MarketData(
                         symbol=symbol,
-                        timestamp=datetime.now(),
+                        timestamp=self.clock.now(),
                         bid=float(data["bidPrice"]),
                         ask=float(data["askPrice"]),
                         last=float(data["bidPrice"]),  # Use bid as last for simplicity
@@ -278,7 +306,9 @@ class BinanceBroker(BaseBroker):
     async def subscribe_market_data(self, symbols: List[str],
                                    callback: Callable[[MarketData], None]) -> None:
         """Subscribe to Binance real-time market data."""
+        # Stream events carry upper-case symbols
         for symbol in symbols:
+            symbol = symbol.upper()
             if symbol not in self._market_data_callbacks:
                 self._market_data_callbacks[symbol] = []
             self._market_data_callbacks[symbol].append(callback)
@@ -287,28 +317,29 @@ class BinanceBroker(BaseBroker):
         if not self.ws_connection:
             await self._connect_websocket()
 
-        # Subscribe to symbols
+        # Subscribe to symbols; the stream sends these once connected and after reconnects
         if self.ws_connection:
-            streams = [f"{symbol.lower()}@bookTicker" for symbol in symbols]
-            await self.ws_connection.send_json({
-                "method": "SUBSCRIBE",
-                "params": streams,
-                "id": 1
-            })
+            for symbol in symbols:
+                stream = f"{symbol.lower()}@bookTicker"
+                await self.ws_connection.subscribe(stream, {
+                    "method": "SUBSCRIBE",
+                    "params": [stream],
+                    "id": 1
+                })
 
     async def unsubscribe_market_data(self, symbols: List[str]) -> None:
         """Unsubscribe from Binance market data."""
         for symbol in symbols:
-            if symbol in self._market_data_callbacks:
-                del self._market_data_callbacks[symbol]
+            self._market_data_callbacks.pop(symbol.upper(), None)
 
         if self.ws_connection:
-            streams = [f"{symbol.lower()}@bookTicker" for symbol in symbols]
-            await self.ws_connection.send_json({
-                "method": "UNSUBSCRIBE",
-                "params": streams,
-                "id": 2
-            })
+            for symbol in symbols:
+                stream = f"{symbol.lower()}@bookTicker"
+                await self.ws_connection.unsubscribe(stream, {
+                    "method": "UNSUBSCRIBE",
+                    "params": [stream],
+                    "id": 2
+                })
 
     async def get_trades(self, symbol: Optional[str] = None,
                         start_date: Optional[datetime] = None,
@@ -336,12 +367,36 @@ class BinanceBroker(BaseBroker):
         """Connect to Binance websocket for real-time data."""
         try:
             logger.info("Connecting to Binance websocket...")
-            # In real implementation, would establish websocket connection
-            # and handle incoming market data messages
+            self.ws_connection = MarketDataStream(
+                self.ws_url,
+                parser=self._parse_stream_message,
+                on_tick=self._dispatch_market_data,
+                on_drop=self.record_tick_drop,
+            )
+            await self.ws_connection.start()
 
         except Exception as e:
             logger.error(f"Failed to connect to Binance websocket: {e}")
 
+    def _parse_stream_message(self, payload: Any):
+        """Extract book ticker updates from a Binance stream message."""
+        # Combined streams wrap events as {"stream": ..., "data": {...}}
+        data = payload.get("data", payload) if isinstance(payload, dict) else {}
+        if "s" not in data or "b" not in data:
+            return  # Subscription acks ({"result": null, "id": 1}) and other events
+
+        bid, ask = float(data["b"]), float(data["a"])
+        yield data["s"], MarketData(
+            symbol=data["s"],
+            timestamp=self.clock.now(),
+            bid=bid,
+            ask=ask,
+            last=bid,  # Use bid as last for simplicity, as in get_market_data
+            volume=0,
+            bid_size=float(data["B"]),
+            ask_size=float(data["A"])
+        )
+
     def _generate_signature(self, params: Dict[str, Any]) -> str:
         """Generate HMAC signature for Binance API."""
         # In real implementation, would use HMAC-SHA256
@@ -1,11 +1,12 @@
 """Interactive Brokers implementation for paper and live trading."""
 
-import asyncio
 import json
+import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Callable
 from decimal import Decimal
 
+from athena.core.clock import Clock
 from athena.core.types import Order, Position, Trade, OrderSide, OrderStatus, OrderType
 from athena.core.logging import get_logger
 from athena.live.brokers.base import (
@@ -18,9 +19,9 @@ logger = get_logger(__name__)
 class InteractiveBroker(BaseBroker):
     """Interactive Brokers implementation using IB Gateway/TWS."""
 
-    def __init__(self, config: BrokerConfig):
+    def __init__(self, config: BrokerConfig, clock: Optional[Clock] = None):
         """Initialize IB broker."""
-        super().__init__(config)
+        super().__init__(config, clock)
 
         # IB-specific configuration
         self.host = config.metadata.get("host", "127.0.0.1")
@@ -30,7 +31,6 @@ class InteractiveBroker(BaseBroker):
         # IB connection objects (would use ibapi in real implementation)
         self.ib_client = None
         self.next_order_id = 1
-        self._market_data_callbacks: Dict[str, List[Callable]] = {}
         self._contract_cache: Dict[str, Any] = {}
 
     async def connect(self) -> bool:
@@ -49,9 +49,9 @@ class InteractiveBroker(BaseBroker):
 
             # Simulate connection for paper trading
             if self.config.paper_trading:
-                await asyncio.sleep(1)  # Simulate connection time
+                await self.clock.sleep(1)  # Simulate connection time
                 self.state = ConnectionState.CONNECTED
-                self._start_time = datetime.now()
+                self._start_time = self.clock.now()
                 logger.info(f"Connected to IB {'paper' if self.config.paper_trading else 'live'} account")
                 return True
             else:
@@ -142,8 +142,11 @@ class InteractiveBroker(BaseBroker):
     async def place_order(self, order: Order) -> Order:
         """Place an order through IB."""
         try:
+            # IB paces API messages; wait before starting the latency clock
+            await self._check_rate_limit("placeOrder")
+
             # Measure latency
-            start_time = datetime.now()
+            start_time = time.perf_counter()
 
             # In real implementation, would create IB contract and order objects
             contract = self._create_contract(order.symbol)
@@ -156,7 +159,7 @@ class InteractiveBroker(BaseBroker):
                 order.status = OrderStatus.PENDING
 
                 # Simulate brief processing time
-                await asyncio.sleep(0.1)
+                await self.clock.sleep(0.1)
 
                 # For market orders, simulate immediate fill
                 if order.order_type == OrderType.MARKET:
@@ -165,7 +168,7 @@ class InteractiveBroker(BaseBroker):
                     order.average_price = order.price or 100.0  # Simulated price
 
                 # Record metrics
-                latency = (datetime.now() - start_time).total_seconds() * 1000
+                latency = (time.perf_counter() - start_time) * 1000
                 self.record_latency(latency)
                 self.metrics.total_orders += 1
                 self.metrics.successful_orders += 1
@@ -189,6 +192,8 @@ class InteractiveBroker(BaseBroker):
     async def cancel_order(self, order_id: str) -> bool:
         """Cancel an IB order."""
         try:
+            await self._check_rate_limit("cancelOrder")
+
             # In real implementation: self.ib_client.cancelOrder(int(order_id))
             if self.config.paper_trading:
                 logger.info(f"IB order cancelled: {order_id}")
@@ -237,12 +242,14 @@ class InteractiveBroker(BaseBroker):
     async def get_market_data(self, symbol: str) -> MarketData:
         """Get current IB market data."""
         try:
+            await self._check_rate_limit("reqMktData")
+
             # In real implementation, would request market data from IB
             if self.config.paper_trading:
                 # Return simulated market data
                 return MarketData(
                     symbol=symbol,
-                    timestamp=datetime.now(),
+                    timestamp=self.clock.now(),
                     bid=99.90,
                     ask=100.10,
                     last=100.00,
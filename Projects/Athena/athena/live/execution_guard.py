@@ -1,12 +1,14 @@
 """Execution guards and circuit breakers for production safety."""
 
 import asyncio
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Dict, List, Optional, Any, Callable
+from typing import Deque, Dict, List, Optional, Any, Callable
 from decimal import Decimal
 
+from athena.core.clock import Clock, WallClock
 from athena.core.types import Order, Position, Trade, OrderSide
 from athena.core.logging import get_logger
 
@@ -86,9 +88,16 @@ class ExecutionGuardConfig:
 class ExecutionGuard:
     """Comprehensive execution guard system."""
 
-    def __init__(self, config: ExecutionGuardConfig):
-        """Initialize execution guard."""
+    def __init__(self, config: ExecutionGuardConfig, clock: Optional[Clock] = None):
+        """Initialize execution guard.
+
+        Args:
+            config: Guard thresholds
+            clock: Time source for windows and halts (wall time if None). A
+                VirtualClock lets halts and rate windows expire during replay.
+        """
         self.config = config
+        self.clock = clock or WallClock()
         self.is_active = True
         self.violations: List[GuardViolation] = []
         self.halted_symbols: Dict[str, datetime] = {}
@@ -100,7 +109,9 @@ class ExecutionGuard:
         self._account_balance = 100000.0  # Will be updated from broker
         self._positions: Dict[str, Position] = {}
         self._recent_trades: List[Trade] = []
-        self._order_timestamps: List[datetime] = []
+        # Order times inside the last minute and hour, oldest first
+        self._orders_last_minute: Deque[datetime] = deque()
+        self._orders_last_hour: Deque[datetime] = deque()
         self._slippage_violations = 0
         self._last_market_prices: Dict[str, float] = {}
 
@@ -128,7 +139,7 @@ class ExecutionGuard:
         self._recent_trades.append(trade)
 
         # Keep only recent trades (24 hours)
-        cutoff = datetime.now() - timedelta(hours=24)
+        cutoff = self.clock.now() - timedelta(hours=24)
         self._recent_trades = [t for t in self._recent_trades if t.timestamp > cutoff]
 
     def update_market_price(self, symbol: str, price: float) -> None:
@@ -140,11 +151,15 @@ class ExecutionGuard:
         if not self.is_active:
             return True, None
 
+        # Read the clock once for every window in this check
+        now = self.clock.now()
+
         # Check global halt
         if self.is_global_halt:
-            if await self._check_halt_expiry():
+            if await self._check_halt_expiry(now):
                 return False, GuardViolation(
                     type=GuardViolationType.MAX_DAILY_LOSS,
+                    timestamp=now,
                     message="Global trading halt active",
                     severity="critical",
                     action=GuardAction.HALT_ALL
@@ -152,9 +167,10 @@ class ExecutionGuard:
 
         # Check symbol-specific halt
         if order.symbol in self.halted_symbols:
-            if await self._check_symbol_halt_expiry(order.symbol):
+            if await self._check_symbol_halt_expiry(order.symbol, now):
                 return False, GuardViolation(
                     type=GuardViolationType.MAX_POSITION_SIZE,
+                    timestamp=now,
                     message=f"Symbol {order.symbol} trading halted",
                     severity="high",
                     action=GuardAction.HALT_SYMBOL,
@@ -162,32 +178,36 @@ class ExecutionGuard:
                 )
 
         # Check daily loss limit
-        violation = await self._check_daily_loss_limit(order)
+        violation = await self._check_daily_loss_limit(order, now)
         if violation:
             return False, violation
 
         # Check position size limits
-        violation = await self._check_position_size_limits(order)
+        violation = await self._check_position_size_limits(order, now)
         if violation:
             return False, violation
 
         # Check consecutive losses
-        violation = await self._check_consecutive_losses()
+        violation = await self._check_consecutive_losses(now)
         if violation:
             return False, violation
 
         # Check order rate limits
-        violation = await self._check_order_rate_limits()
+        violation = await self._check_order_rate_limits(now)
         if violation:
             return False, violation
 
         return True, None
 
-    async def check_trade_slippage(self, trade: Trade, expected_price: float) -> Optional[GuardViolation]:
+    async def check_trade_slippage(
+        self, trade: Trade, expected_price: float
+    ) -> Optional[GuardViolation]:
         """Check trade for excessive slippage."""
         if not self.is_active or expected_price == 0:
             return None
 
+        now = self.clock.now()
+
         slippage_bps = abs(trade.price - expected_price) / expected_price * 10000
 
         if slippage_bps > self.config.max_slippage_bps:
@@ -195,9 +215,14 @@ class ExecutionGuard:
 
             violation = GuardViolation(
                 type=GuardViolationType.SLIPPAGE_THRESHOLD,
+                timestamp=now,
                 message=f"High slippage detected: {slippage_bps:.1f} bps",
                 severity="medium" if slippage_bps < self.config.max_slippage_bps * 2 else "high",
-                action=GuardAction.ALERT_ONLY if self._slippage_violations < self.config.slippage_violation_threshold else GuardAction.HALT_SYMBOL,
+                action=(
+                    GuardAction.ALERT_ONLY
+                    if self._slippage_violations < self.config.slippage_violation_threshold
+                    else GuardAction.HALT_SYMBOL
+                ),
                 symbol=trade.symbol,
                 value=slippage_bps,
                 threshold=self.config.max_slippage_bps
@@ -213,15 +238,20 @@ class ExecutionGuard:
 
         return None
 
-    async def check_connectivity(self, latency_ms: float, is_connected: bool) -> Optional[GuardViolation]:
+    async def check_connectivity(
+        self, latency_ms: float, is_connected: bool
+    ) -> Optional[GuardViolation]:
         """Check connectivity health."""
         if not self.is_active:
             return None
 
+        now = self.clock.now()
+
         # Check latency
         if latency_ms > self.config.max_latency_ms:
             violation = GuardViolation(
                 type=GuardViolationType.CONNECTIVITY_LOSS,
+                timestamp=now,
                 message=f"High latency detected: {latency_ms:.1f}ms",
                 severity="high",
                 action=GuardAction.ALERT_ONLY,
@@ -235,6 +265,7 @@ class ExecutionGuard:
         if not is_connected:
             violation = GuardViolation(
                 type=GuardViolationType.CONNECTIVITY_LOSS,
+                timestamp=now,
                 message="Broker disconnected",
                 severity="critical",
                 action=GuardAction.HALT_ALL
@@ -266,26 +297,35 @@ class ExecutionGuard:
 
     def get_status(self) -> Dict[str, Any]:
         """Get current guard status."""
+        now = self.clock.now()
+        self._prune_order_times(now)
         return {
             "active": self.is_active,
             "global_halt": self.is_global_halt,
             "halted_symbols": list(self.halted_symbols.keys()),
             "daily_pnl": self._daily_pnl,
             "account_balance": self._account_balance,
-            "recent_violations": len([v for v in self.violations if v.timestamp > datetime.now() - timedelta(hours=1)]),
+            "recent_violations": len(
+                [v for v in self.violations if v.timestamp > now - timedelta(hours=1)]
+            ),
             "total_violations": len(self.violations),
             "slippage_violations": self._slippage_violations,
-            "recent_orders": len([t for t in self._order_timestamps if t > datetime.now() - timedelta(minutes=1)])
+            "recent_orders": len(self._orders_last_minute)
         }
 
     # Private methods
 
-    async def _check_daily_loss_limit(self, order: Order) -> Optional[GuardViolation]:
+    async def _check_daily_loss_limit(
+        self, order: Order, now: Optional[datetime] = None
+    ) -> Optional[GuardViolation]:
         """Check daily loss limits."""
+        now = now or self.clock.now()
+
         # Check absolute dollar loss
         if self._daily_pnl < -self.config.max_daily_loss_dollars:
             violation = GuardViolation(
                 type=GuardViolationType.MAX_DAILY_LOSS,
+                timestamp=now,
                 message=f"Daily loss limit exceeded: ${abs(self._daily_pnl):,.2f}",
                 severity="critical",
                 action=GuardAction.HALT_ALL,
@@ -301,6 +341,7 @@ class ExecutionGuard:
         if loss_percent > self.config.max_daily_loss_percent:
             violation = GuardViolation(
                 type=GuardViolationType.MAX_DAILY_LOSS,
+                timestamp=now,
                 message=f"Daily loss percentage exceeded: {loss_percent:.2%}",
                 severity="critical",
                 action=GuardAction.HALT_ALL,
@@ -313,8 +354,12 @@ class ExecutionGuard:
 
         return None
 
-    async def _check_position_size_limits(self, order: Order) -> Optional[GuardViolation]:
+    async def _check_position_size_limits(
+        self, order: Order, now: Optional[datetime] = None
+    ) -> Optional[GuardViolation]:
         """Check position size limits."""
+        now = now or self.clock.now()
+
         # Calculate new position size if order fills
         current_pos = self._positions.get(order.symbol)
         current_qty = current_pos.quantity if current_pos else 0
@@ -332,6 +377,7 @@ class ExecutionGuard:
         if new_position_value > self.config.max_position_per_symbol_dollars:
             violation = GuardViolation(
                 type=GuardViolationType.MAX_POSITION_SIZE,
+                timestamp=now,
                 message=f"Position size limit exceeded for {order.symbol}: ${new_position_value:,.2f}",
                 severity="high",
                 action=GuardAction.HALT_SYMBOL,
@@ -348,6 +394,7 @@ class ExecutionGuard:
         if position_percent > self.config.max_position_per_symbol_percent:
             violation = GuardViolation(
                 type=GuardViolationType.MAX_POSITION_SIZE,
+                timestamp=now,
                 message=f"Position percentage limit exceeded for {order.symbol}: {position_percent:.2%}",
                 severity="high",
                 action=GuardAction.HALT_SYMBOL,
@@ -361,9 +408,12 @@ class ExecutionGuard:
 
         return None
 
-    async def _check_consecutive_losses(self) -> Optional[GuardViolation]:
+    async def _check_consecutive_losses(
+        self, now: Optional[datetime] = None
+    ) -> Optional[GuardViolation]:
         """Check for consecutive losing trades."""
-        cutoff = datetime.now() - timedelta(hours=self.config.consecutive_loss_lookback_hours)
+        now = now or self.clock.now()
+        cutoff = now - timedelta(hours=self.config.consecutive_loss_lookback_hours)
         recent_trades = [t for t in self._recent_trades if t.timestamp > cutoff]
 
         if len(recent_trades) < self.config.max_consecutive_losses:
@@ -385,6 +435,7 @@ class ExecutionGuard:
         if consecutive_losses >= self.config.max_consecutive_losses:
             violation = GuardViolation(
                 type=GuardViolationType.CONSECUTIVE_LOSSES,
+                timestamp=now,
                 message=f"Consecutive losses detected: {consecutive_losses}",
                 severity="high",
                 action=GuardAction.HALT_ALL,
@@ -397,22 +448,31 @@ class ExecutionGuard:
 
         return None
 
-    async def _check_order_rate_limits(self) -> Optional[GuardViolation]:
+    def _prune_order_times(self, now: datetime) -> None:
+        """Drop order times that fell out of the minute and hour windows."""
+        for window, span in (
+            (self._orders_last_minute, timedelta(minutes=1)),
+            (self._orders_last_hour, timedelta(hours=1)),
+        ):
+            cutoff = now - span
+            while window and window[0] <= cutoff:
+                window.popleft()
+
+    async def _check_order_rate_limits(
+        self, now: Optional[datetime] = None
+    ) -> Optional[GuardViolation]:
         """Check order rate limits."""
-        now = datetime.now()
-        self._order_timestamps.append(now)
-
-        # Clean old timestamps
-        minute_ago = now - timedelta(minutes=1)
-        hour_ago = now - timedelta(hours=1)
-
-        self._order_timestamps = [t for t in self._order_timestamps if t > hour_ago]
+        now = now or self.clock.now()
+        self._orders_last_minute.append(now)
+        self._orders_last_hour.append(now)
+        self._prune_order_times(now)
 
         # Check per-minute limit
-        minute_orders = len([t for t in self._order_timestamps if t > minute_ago])
+        minute_orders = len(self._orders_last_minute)
         if minute_orders > self.config.max_orders_per_minute:
             violation = GuardViolation(
                 type=GuardViolationType.ORDER_RATE_LIMIT,
+                timestamp=now,
                 message=f"Order rate limit exceeded: {minute_orders} orders/minute",
                 severity="medium",
                 action=GuardAction.ALERT_ONLY,
@@ -423,10 +483,11 @@ class ExecutionGuard:
             return violation
 
         # Check per-hour limit
-        hour_orders = len(self._order_timestamps)
+        hour_orders = len(self._orders_last_hour)
         if hour_orders > self.config.max_orders_per_hour:
             violation = GuardViolation(
                 type=GuardViolationType.ORDER_RATE_LIMIT,
+                timestamp=now,
                 message=f"Hourly order limit exceeded: {hour_orders} orders/hour",
                 severity="high",
                 action=GuardAction.HALT_ALL,
@@ -442,15 +503,15 @@ class ExecutionGuard:
     async def _global_halt(self, reason: str) -> None:
         """Implement global trading halt."""
         self.is_global_halt = True
-        self.global_halt_time = datetime.now()
+        self.global_halt_time = self.clock.now()
         logger.critical(f"GLOBAL TRADING HALT: {reason}")
 
     async def _halt_symbol(self, symbol: str, reason: str) -> None:
         """Implement symbol-specific halt."""
-        self.halted_symbols[symbol] = datetime.now()
+        self.halted_symbols[symbol] = self.clock.now()
         logger.warning(f"SYMBOL HALT ({symbol}): {reason}")
 
-    async def _check_halt_expiry(self) -> bool:
+    async def _check_halt_expiry(self, now: Optional[datetime] = None) -> bool:
         """Check if global halt should expire."""
         if not self.is_global_halt or not self.global_halt_time:
             return False
@@ -458,7 +519,7 @@ class ExecutionGuard:
         if not self.config.auto_resume_enabled:
             return True  # Manual resume required
 
-        elapsed = datetime.now() - self.global_halt_time
+        elapsed = (now or self.clock.now()) - self.global_halt_time
         if elapsed.total_seconds() > self.config.default_halt_duration_minutes * 60:
             self.is_global_halt = False
             self.global_halt_time = None
@@ -467,7 +528,7 @@ class ExecutionGuard:
 
         return True
 
-    async def _check_symbol_halt_expiry(self, symbol: str) -> bool:
+    async def _check_symbol_halt_expiry(self, symbol: str, now: Optional[datetime] = None) -> bool:
         """Check if symbol halt should expire."""
         if symbol not in self.halted_symbols:
             return False
@@ -475,7 +536,7 @@ class ExecutionGuard:
         if not self.config.auto_resume_enabled:
             return True  # Manual resume required
 
-        elapsed = datetime.now() - self.halted_symbols[symbol]
+        elapsed = (now or self.clock.now()) - self.halted_symbols[symbol]
         if elapsed.total_seconds() > self.config.default_halt_duration_minutes * 60:
             del self.halted_symbols[symbol]
             logger.info(f"Symbol halt auto-expired for {symbol}")
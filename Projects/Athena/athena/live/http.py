@@ -0,0 +1,154 @@
+"""Pooled async HTTP transport with per-endpoint latency tracking."""
+
+import asyncio
+import time
+from typing import Any, Dict, Optional
+
+import aiohttp
+
+from athena.core.histogram import LogHistogram
+
+
+class AsyncHTTPTransport:
+    """Async JSON-over-HTTP client backed by a persistent keep-alive connection pool.
+
+    A single ``aiohttp.ClientSession`` is reused for every request, so TCP and TLS
+    handshakes are paid once per pooled connection instead of once per call.
+    Concurrent requests are spread over up to ``max_connections`` sockets.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 10.0,
+        max_connections: int = 10,
+        keepalive_timeout: float = 30.0,
+    ):
+        """Initialize transport.
+
+        Args:
+            base_url: Base URL prepended to request paths
+            headers: Default headers sent with every request
+            timeout: Total request timeout in seconds
+            max_connections: Maximum pooled connections
+            keepalive_timeout: Seconds an idle connection is kept open
+        """
+        self.base_url = base_url.rstrip("/")
+        self.headers = headers or {}
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.keepalive_timeout = keepalive_timeout
+
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.latency: Dict[str, LogHistogram] = {}
+        self.connections_opened = 0
+        self.requests_sent = 0
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Create the pooled session on first use (it must bind to the running loop)."""
+        if self.session is None or self.session.closed:
+            self._loop = asyncio.get_running_loop()
+            trace_config = aiohttp.TraceConfig()
+            trace_config.on_connection_create_end.append(self._on_connection_created)
+
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.max_connections,
+                    keepalive_timeout=self.keepalive_timeout,
+                    ttl_dns_cache=300,
+                ),
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                trace_configs=[trace_config],
+            )
+        return self.session
+
+    async def _on_connection_created(self, session, context, params) -> None:
+        """Count new sockets so connection reuse is observable."""
+        self.connections_opened += 1
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """Send a request and decode the JSON response.
+
+        Args:
+            method: HTTP method
+            path: Request path relative to the base URL
+            params: Query parameters
+            headers: Extra headers for this request
+
+        Returns:
+            Decoded JSON body
+
+        Raises:
+            aiohttp.ClientResponseError: On non-2xx responses
+        """
+        session = await self._get_session()
+        start = time.perf_counter()
+        try:
+            async with session.request(
+                method, f"{self.base_url}{path}", params=params, headers=headers
+            ) as response:
+                response.raise_for_status()
+                return await response.json(content_type=None)
+        finally:
+            self.requests_sent += 1
+            self._observe(f"{method.upper()} {path}", (time.perf_counter() - start) * 1000)
+
+    def _observe(self, endpoint: str, latency_ms: float) -> None:
+        """Record a latency sample for an endpoint."""
+        histogram = self.latency.get(endpoint)
+        if histogram is None:
+            histogram = self.latency[endpoint] = LogHistogram()
+        histogram.record(latency_ms)
+
+    def get_latency_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get latency summaries keyed by "METHOD /path".
+
+        Returns:
+            Dictionary of per-endpoint count, mean, min, max and percentiles in milliseconds
+        """
+        return {endpoint: hist.summary() for endpoint, hist in self.latency.items()}
+
+    async def close(self) -> None:
+        """Close pooled connections."""
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
+    def close_sync(self) -> None:
+        """Close pooled connections from synchronous code.
+
+        The session is bound to the loop that created it, so the close is run on
+        that loop: scheduled if it is running, driven to completion if it is idle.
+        If the loop has already been closed the session is only dropped.
+        """
+        session, loop = self.session, self._loop
+        if session is None or session.closed or loop is None or loop.is_closed():
+            self.session = None
+            return
+
+        if loop.is_running():
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+            if running is loop:
+                loop.create_task(self.close())
+            else:
+                asyncio.run_coroutine_threadsafe(self.close(), loop)
+        else:
+            loop.run_until_complete(self.close())
+
+    async def __aenter__(self) -> "AsyncHTTPTransport":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
@@ -0,0 +1,225 @@
+"""Price-time priority order book for simulated limit and stop order matching."""
+
+import heapq
+import itertools
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from athena.core.types import Order, OrderSide
+
+# Remaining quantities below this are treated as fully filled
+QUANTITY_EPSILON = 1e-9
+
+
+@dataclass
+class Fill:
+    """A (possibly partial) execution of a resting order."""
+
+    order: Order
+    quantity: float
+    price: float
+
+
+class OrderBook:
+    """Resting limit orders and pending stop orders for a single symbol.
+
+    Orders come from one account and trade against the external market, so bids
+    and asks never match each other; they fill when the market price reaches them.
+    Limits are kept in heaps ordered by price then arrival, stops in heaps ordered
+    by trigger price. Cancels are lazy: cancelled orders are skipped when they
+    reach the top of a heap.
+    """
+
+    def __init__(self, symbol: str):
+        """Initialize order book.
+
+        Args:
+            symbol: Symbol traded in this book
+        """
+        self.symbol = symbol
+        self._sequence = itertools.count()
+
+        # Heap entries are (sort key, sequence, order)
+        self._bids: List[Tuple[float, int, Order]] = []  # key -price: best bid first
+        self._asks: List[Tuple[float, int, Order]] = []  # key price: best ask first
+        self._buy_stops: List[Tuple[float, int, Order]] = []  # lowest trigger first
+        self._sell_stops: List[Tuple[float, int, Order]] = []  # highest trigger first
+
+        self._live: Dict[str, Order] = {}
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    def add_limit(self, order: Order) -> None:
+        """Rest a limit order (or a triggered stop-limit) in the book.
+
+        Args:
+            order: Order with a limit price
+        """
+        entry = (-order.price if order.side == OrderSide.BUY else order.price,
+                 next(self._sequence), order)
+        heapq.heappush(self._bids if order.side == OrderSide.BUY else self._asks, entry)
+        self._live[order.order_id] = order
+
+    def add_stop(self, order: Order) -> None:
+        """Hold a stop or stop-limit order until its trigger price trades.
+
+        Args:
+            order: Order with a stop price
+        """
+        if order.side == OrderSide.BUY:
+            heapq.heappush(self._buy_stops, (order.stop_price, next(self._sequence), order))
+        else:
+            heapq.heappush(self._sell_stops, (-order.stop_price, next(self._sequence), order))
+        self._live[order.order_id] = order
+
+    def cancel(self, order_id: str) -> bool:
+        """Remove an order from the book.
+
+        Args:
+            order_id: Order ID
+
+        Returns:
+            True if the order was resting in this book
+        """
+        return self._live.pop(order_id, None) is not None
+
+    def _top(self, heap: List[Tuple[float, int, Order]]) -> Optional[Order]:
+        """Return the best live order in a heap, discarding cancelled entries."""
+        while heap:
+            order = heap[0][2]
+            if order.order_id in self._live:
+                return order
+            heapq.heappop(heap)
+        return None
+
+    @staticmethod
+    def stop_reached(order: Order, price: float) -> bool:
+        """Whether a price triggers a stop order.
+
+        Buy stops trigger at or above their stop price, sell stops at or below.
+        """
+        if order.side == OrderSide.BUY:
+            return price >= order.stop_price
+        return price <= order.stop_price
+
+    def trigger_stops(self, price: float) -> List[Order]:
+        """Release stop orders whose trigger price has been reached.
+
+        Buy stops trigger at or above their stop price, sell stops at or below.
+
+        Args:
+            price: Latest market price
+
+        Returns:
+            Triggered orders in trigger-price then time priority
+        """
+        triggered = []
+        for heap in (self._buy_stops, self._sell_stops):
+            order = self._top(heap)
+            while order is not None and self.stop_reached(order, price):
+                heapq.heappop(heap)
+                del self._live[order.order_id]
+                triggered.append(order)
+                order = self._top(heap)
+        return triggered
+
+    def match(
+        self,
+        price: float,
+        buy_volume: Optional[float] = None,
+        sell_volume: Optional[float] = None,
+    ) -> List[Fill]:
+        """Fill resting limits that the market price has reached.
+
+        Buy limits at or above the price and sell limits at or below it fill at
+        their limit price or better, best price first and oldest first within a
+        price. Each side can take at most its volume from this tick, so large
+        orders fill partially across several ticks.
+
+        Args:
+            price: Latest market price
+            buy_volume: Quantity buy limits can take at this price (unlimited if None)
+            sell_volume: Quantity sell limits can take at this price (unlimited if None)
+
+        Returns:
+            Fills in execution order
+        """
+        fills = []
+        for heap, volume, marketable, better in (
+            (self._bids, buy_volume, lambda order: order.price >= price, min),
+            (self._asks, sell_volume, lambda order: order.price <= price, max),
+        ):
+            available = float("inf") if volume is None else volume
+            order = self._top(heap)
+            while order is not None and available > QUANTITY_EPSILON and marketable(order):
+                remaining = order.quantity - order.filled_quantity
+                quantity = min(remaining, available)
+                available -= quantity
+                fills.append(Fill(order, quantity, better(order.price, price)))
+
+                if remaining - quantity > QUANTITY_EPSILON:
+                    break  # Partially filled order keeps its place at the front
+
+                heapq.heappop(heap)
+                del self._live[order.order_id]
+                order = self._top(heap)
+        return fills
+
+    def match_order(
+        self, order: Order, price: float, volume: Optional[float] = None
+    ) -> Optional[Fill]:
+        """Fill a single resting limit order against a price, ignoring the rest of the book.
+
+        Used for orders that arrive between ticks: older orders already had their
+        turn at the last tick, so the new order may only take the volume that tick
+        has left and cannot trigger fills for anything else.
+
+        Args:
+            order: Limit order resting in this book
+            price: Last market price
+            volume: Quantity still available at this price (unlimited if None)
+
+        Returns:
+            The fill, or None if the order is not marketable or no volume is left
+        """
+        if order.order_id not in self._live:
+            return None
+        if order.side == OrderSide.BUY:
+            marketable, fill_price = order.price >= price, min(order.price, price)
+        else:
+            marketable, fill_price = order.price <= price, max(order.price, price)
+        available = float("inf") if volume is None else volume
+        if not marketable or available <= QUANTITY_EPSILON:
+            return None
+
+        remaining = order.quantity - order.filled_quantity
+        quantity = min(remaining, available)
+        if remaining - quantity <= QUANTITY_EPSILON:
+            del self._live[order.order_id]  # Heap entry is discarded lazily
+        return Fill(order, quantity, fill_price)
+
+    def best_bid(self) -> Optional[float]:
+        """Highest resting buy limit price."""
+        order = self._top(self._bids)
+        return order.price if order is not None else None
+
+    def best_ask(self) -> Optional[float]:
+        """Lowest resting sell limit price."""
+        order = self._top(self._asks)
+        return order.price if order is not None else None
+
+    def depth(self) -> Dict[str, int]:
+        """Count live orders by kind.
+
+        Returns:
+            Dictionary with bids, asks and stops counts
+        """
+        def live(heap):
+            return sum(1 for _, _, order in heap if order.order_id in self._live)
+
+        return {
+            "bids": live(self._bids),
+            "asks": live(self._asks),
+            "stops": live(self._buy_stops) + live(self._sell_stops),
+        }
@@ -1,15 +1,18 @@
 """Paper trading engine with broker abstraction."""
 
 import asyncio
-from datetime import datetime
-from typing import Callable, Dict, List
+from typing import Callable, Dict, List, Optional
 
 import pandas as pd
 
+from athena.core.clock import Clock, WallClock
 from athena.core.logging import get_logger
-from athena.core.types import Order, OrderSide, OrderType
+from athena.core.profiling import profiled, span
+from athena.core.types import Order, OrderResult, OrderSide, OrderType, Portfolio
+from athena.data.bars import BarAggregator
 from athena.live.binance_testnet import BinanceTestnetBroker
 from athena.live.broker import BaseBroker, SimulatedBroker
+from athena.live.replay import ReplayFeed
 from athena.strategies.base import BaseStrategy
 
 logger = get_logger(__name__)
@@ -26,6 +29,8 @@ class PaperTradingEngine:
         initial_capital: float = 10000,
         position_size_pct: float = 0.1,
         use_testnet: bool = True,
+        base_timeframe: str = "1min",
+        clock: Optional[Clock] = None,
     ):
         """Initialize paper trading engine.
 
@@ -36,8 +41,11 @@ class PaperTradingEngine:
             initial_capital: Initial capital
             position_size_pct: Position size as percentage of capital
             use_testnet: Whether to use testnet
+            base_timeframe: Bar timeframe passed to the strategy's generate_signals
+            clock: Time source for ticks and trade timestamps (wall time if None)
         """
         self.broker = broker
+        self.clock = clock or WallClock()
         self.strategy = strategy
         self.symbol = symbol
         self.initial_capital = initial_capital
@@ -51,6 +59,11 @@ class PaperTradingEngine:
         self.price_history: List[Dict] = []
         self.performance_log: List[Dict] = []
 
+        # Streaming bars for the base timeframe plus any the strategy requests
+        self.base_timeframe = base_timeframe
+        self.bars = BarAggregator([base_timeframe, *strategy.timeframes], max_bars=200)
+        self.strategy.attach_bars(self.bars)
+
         # Callbacks
         self.on_trade_callbacks: List[Callable] = []
         self.on_signal_callbacks: List[Callable] = []
@@ -115,6 +128,49 @@ class PaperTradingEngine:
         finally:
             self.stop()
 
+    def run_replay(self, feed: ReplayFeed) -> Dict:
+        """Run the strategy over a historical replay instead of live prices.
+
+        The broker must be a SimulatedBroker. The engine and broker switch to the
+        feed's virtual clock, and each replayed tick is evaluated immediately, so
+        years of data take minutes instead of years.
+
+        Args:
+            feed: Replay feed for this engine's symbol
+
+        Returns:
+            Performance summary
+        """
+        if not isinstance(self.broker, SimulatedBroker):
+            raise TypeError("Replay requires a SimulatedBroker")
+        if feed.symbol != self.symbol:
+            raise ValueError(f"Feed symbol {feed.symbol} does not match {self.symbol}")
+
+        self.clock = self.broker.clock = feed.clock
+        if not self.broker.connect():
+            raise RuntimeError("Failed to connect to broker")
+
+        self.running = True
+        logger.info(f"Replaying {len(feed)} ticks for {self.symbol} with {self.strategy.name}")
+        try:
+            asyncio.run(self._replay_loop(feed))
+        finally:
+            self.stop()
+
+        return self.get_performance_summary()
+
+    async def _replay_loop(self, feed: ReplayFeed) -> None:
+        """Feed replayed ticks through the broker and strategy.
+
+        Args:
+            feed: Replay feed
+        """
+        async for tick in feed.stream():
+            if not self.running:
+                break
+            self.broker.set_mock_price(self.symbol, tick.price, tick.volume)
+            await self._evaluate_strategy()
+
     def stop(self) -> None:
         """Stop paper trading."""
         self.running = False
@@ -127,26 +183,34 @@ class PaperTradingEngine:
         Args:
             interval_seconds: Loop interval
         """
-        while self.running:
-            try:
-                await self._evaluate_strategy()
-                await asyncio.sleep(interval_seconds)
-            except Exception as e:
-                logger.error(f"Trading loop error: {e}")
-                await asyncio.sleep(5)  # Brief pause before retry
+        try:
+            while self.running:
+                try:
+                    await self._evaluate_strategy()
+                    await asyncio.sleep(interval_seconds)
+                except Exception as e:
+                    logger.error(f"Trading loop error: {e}")
+                    await asyncio.sleep(5)  # Brief pause before retry
+        finally:
+            # Pooled connections are bound to this loop; release them before it closes
+            if isinstance(self.broker, BinanceTestnetBroker):
+                await self.broker.aclose()
 
+    @profiled("paper.evaluate_strategy")
     async def _evaluate_strategy(self) -> None:
         """Evaluate strategy and execute trades."""
         try:
             # Get current price
             current_price = await self._get_current_price()
-            current_time = datetime.now()
+            current_time = self.clock.now()
 
             # Update price history
             self.price_history.append(
                 {"timestamp": current_time, "price": current_price, "symbol": self.symbol}
             )
 
+            self.bars.update_tick(current_time, current_price)
+
             # Keep only recent history for strategy evaluation
             if len(self.price_history) > 200:
                 self.price_history = self.price_history[-200:]
@@ -156,10 +220,12 @@ class PaperTradingEngine:
                 logger.debug("Insufficient price history for strategy evaluation")
                 return
 
-            df = self._create_ohlcv_from_prices()
+            with span("paper.build_ohlcv"):
+                df = self._create_ohlcv_from_prices()
 
             # Generate signals
-            signals = self.strategy.generate_signals(df)
+            with span(f"{type(self.strategy).__name__}.generate_signals"):
+                signals = self.strategy.generate_signals(df)
 
             if len(signals) == 0:
                 return
@@ -168,7 +234,8 @@ class PaperTradingEngine:
 
             # Check if signal changed
             if current_signal != self.last_signal and current_signal != 0:
-                await self._execute_signal(current_signal, current_price)
+                with span("paper.execute_signal"):
+                    await self._execute_signal(current_signal, current_price)
                 self.last_signal = current_signal
 
                 # Call signal callbacks
@@ -179,7 +246,8 @@ class PaperTradingEngine:
                         logger.error(f"Signal callback error: {e}")
 
             # Log performance
-            portfolio = self.broker.get_portfolio()
+            with span("paper.portfolio"):
+                portfolio = await self._get_portfolio()
             self.performance_log.append(
                 {
                     "timestamp": current_time,
@@ -200,7 +268,7 @@ class PaperTradingEngine:
             Current price
         """
         if isinstance(self.broker, BinanceTestnetBroker):
-            return self.broker.get_current_price(self.symbol)
+            return await self.broker.get_current_price_async(self.symbol)
         elif isinstance(self.broker, SimulatedBroker):
             # For simulation, use mock price or generate random walk
             if self.symbol not in self.broker.mock_prices:
@@ -219,26 +287,50 @@ class PaperTradingEngine:
         else:
             raise NotImplementedError("Unsupported broker type")
 
-    def _create_ohlcv_from_prices(self) -> pd.DataFrame:
-        """Create OHLCV DataFrame from price history.
+    async def _get_portfolio(self) -> Portfolio:
+        """Get the broker portfolio without blocking the event loop.
 
         Returns:
-            OHLCV DataFrame
+            Portfolio snapshot
         """
-        # Convert price ticks to OHLCV bars (simplified)
-        df = pd.DataFrame(self.price_history)
-        df["timestamp"] = pd.to_datetime(df["timestamp"])
-        df.set_index("timestamp", inplace=True)
+        if isinstance(self.broker, BinanceTestnetBroker):
+            # Portfolio valuation makes several blocking REST calls
+            return await asyncio.to_thread(self.broker.get_portfolio)
+        return self.broker.get_portfolio()
 
-        # Resample to 1-minute bars
-        ohlcv = df.resample("1T").agg({"price": ["first", "max", "min", "last", "count"]}).dropna()
+    async def _place_order(self, order: Order) -> str:
+        """Submit an order, using the pooled async transport when available.
 
-        ohlcv.columns = ["open", "high", "low", "close", "volume"]
+        Args:
+            order: Order to place
+
+        Returns:
+            Order ID
+        """
+        if isinstance(self.broker, BinanceTestnetBroker):
+            return await self.broker.place_order_async(order)
+        return self.broker.place_order(order)
 
-        # Forward fill missing values
-        ohlcv = ohlcv.fillna(method="ffill")
+    async def place_orders(self, orders: List[Order]) -> List[OrderResult]:
+        """Submit a group of orders (e.g. a rebalance) in as few round trips as possible.
 
-        return ohlcv
+        Args:
+            orders: Orders to place
+
+        Returns:
+            Per-order results with submission latency
+        """
+        if isinstance(self.broker, BinanceTestnetBroker):
+            return await self.broker.place_orders_async(orders)
+        return self.broker.place_orders(orders)
+
+    def _create_ohlcv_from_prices(self) -> pd.DataFrame:
+        """Create OHLCV DataFrame from streamed price ticks.
+
+        Returns:
+            OHLCV DataFrame at the base timeframe
+        """
+        return self.bars.to_frame(self.base_timeframe)
 
     async def _execute_signal(self, signal: int, current_price: float) -> None:
         """Execute trading signal.
@@ -248,7 +340,7 @@ class PaperTradingEngine:
             current_price: Current price
         """
         try:
-            portfolio = self.broker.get_portfolio()
+            portfolio = await self._get_portfolio()
 
             # Calculate position size
             position_value = portfolio.total_value * self.position_size_pct
@@ -263,7 +355,7 @@ class PaperTradingEngine:
                         order_type=OrderType.MARKET,
                     )
 
-                    self.broker.place_order(order)
+                    await self._place_order(order)
                     self.current_position = 1
 
                     logger.info(
@@ -273,7 +365,7 @@ class PaperTradingEngine:
                     # Call trade callbacks
                     for callback in self.on_trade_callbacks:
                         try:
-                            callback("BUY", quantity, current_price, datetime.now())
+                            callback("BUY", quantity, current_price, self.clock.now())
                         except Exception as e:
                             logger.error(f"Trade callback error: {e}")
 
@@ -286,7 +378,7 @@ class PaperTradingEngine:
                         order_type=OrderType.MARKET,
                     )
 
-                    self.broker.place_order(order)
+                    await self._place_order(order)
                     self.current_position = -1
 
                     logger.info(
@@ -296,7 +388,7 @@ class PaperTradingEngine:
                     # Call trade callbacks
                     for callback in self.on_trade_callbacks:
                         try:
-                            callback("SELL", quantity, current_price, datetime.now())
+                            callback("SELL", quantity, current_price, self.clock.now())
                         except Exception as e:
                             logger.error(f"Trade callback error: {e}")
 
@@ -0,0 +1,156 @@
+"""Async token-bucket rate limiting with request weights."""
+
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+
+from athena.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class TokenBucket:
+    """Token bucket that refills continuously and allows bursts up to its capacity.
+
+    Callers acquire a weight (1 for plain request-count limits, the endpoint's
+    request weight for exchanges such as Binance). Waiters are served strictly in
+    arrival order, so a heavy request cannot be starved by a stream of light ones.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """Initialize bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size in tokens. Defaults to one second of budget.
+        """
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive: {rate}")
+
+        self.rate = float(rate)
+        self.capacity = float(capacity) if capacity is not None else max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+
+        # asyncio.Lock queues waiters FIFO; recreated if the bucket moves to a new loop
+        self._lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self.total_acquired = 0.0
+        self.total_wait_seconds = 0.0
+        self.throttled_requests = 0
+
+    def _refill(self) -> None:
+        """Add tokens for the time elapsed since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+    @property
+    def available(self) -> float:
+        """Tokens currently available."""
+        self._refill()
+        return self._tokens
+
+    def try_acquire(self, weight: float = 1.0) -> bool:
+        """Take tokens without waiting.
+
+        Args:
+            weight: Tokens to take
+
+        Returns:
+            True if the tokens were taken
+        """
+        if self._lock is not None and self._lock.locked():
+            return False  # Don't jump the queue
+
+        self._refill()
+        if self._tokens >= weight:
+            self._tokens -= weight
+            self.total_acquired += weight
+            return True
+        return False
+
+    async def acquire(self, weight: float = 1.0) -> float:
+        """Wait until the requested weight is available and take it.
+
+        Args:
+            weight: Tokens to take
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            ValueError: If weight exceeds the bucket capacity
+        """
+        if weight > self.capacity:
+            raise ValueError(f"Weight {weight} exceeds bucket capacity {self.capacity}")
+
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._lock = asyncio.Lock()
+            self._loop = loop
+
+        start = time.monotonic()
+        async with self._lock:
+            self._refill()
+            while self._tokens < weight:
+                await asyncio.sleep((weight - self._tokens) / self.rate)
+                self._refill()
+
+            self._tokens -= weight
+            self.total_acquired += weight
+
+        waited = time.monotonic() - start
+        if waited > 0.001:
+            self.throttled_requests += 1
+            self.total_wait_seconds += waited
+        return waited
+
+    def get_stats(self) -> Dict[str, float]:
+        """Get limiter statistics.
+
+        Returns:
+            Dictionary with rate, capacity, available tokens and wait totals
+        """
+        return {
+            "rate_per_sec": self.rate,
+            "capacity": self.capacity,
+            "available": round(self.available, 3),
+            "total_acquired": self.total_acquired,
+            "throttled_requests": self.throttled_requests,
+            "total_wait_seconds": round(self.total_wait_seconds, 3),
+        }
+
+
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def get_shared_bucket(key: str, rate: float, capacity: Optional[float] = None) -> TokenBucket:
+    """Get the process-wide bucket for a key, creating it on first use.
+
+    Brokers that talk to the same account/API key share one budget this way.
+
+    Args:
+        key: Budget identifier (e.g., "BinanceBroker:<api key>")
+        rate: Tokens per second, used when the bucket is created
+        capacity: Burst capacity, used when the bucket is created
+
+    Returns:
+        Shared TokenBucket
+    """
+    with _buckets_lock:
+        bucket = _buckets.get(key)
+        if bucket is None:
+            bucket = _buckets[key] = TokenBucket(rate, capacity)
+        elif bucket.rate != rate or (capacity is not None and bucket.capacity != capacity):
+            logger.warning(f"Rate limiter {key} already exists; keeping its original settings")
+        return bucket
+
+
+def reset_shared_buckets() -> None:
+    """Drop all shared buckets (mainly for tests)."""
+    with _buckets_lock:
+        _buckets.clear()
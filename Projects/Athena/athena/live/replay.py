@@ -0,0 +1,158 @@
+"""Replay historical bars or ticks through the live trading path on a virtual clock."""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, Iterator, Optional, Union
+
+import pandas as pd
+
+from athena.core.clock import VirtualClock
+from athena.core.logging import get_logger
+from athena.live.broker import SimulatedBroker
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class ReplayTick:
+    """One replayed price update."""
+
+    timestamp: pd.Timestamp
+    price: float
+    volume: Optional[float] = None
+
+
+class ReplayFeed:
+    """Stream historical prices into a SimulatedBroker while driving a VirtualClock.
+
+    Accepts OHLCV bars (uses ``close``, or an open/high/low/close path per bar with
+    ``expand_bars``) or ticks (a ``price`` column). Events are emitted as fast as
+    possible, or paced at ``speed`` times real time.
+    """
+
+    def __init__(
+        self,
+        data: pd.DataFrame,
+        symbol: str,
+        clock: Optional[VirtualClock] = None,
+        speed: Optional[float] = None,
+        expand_bars: bool = False,
+    ):
+        """Initialize replay feed.
+
+        Args:
+            data: Bars or ticks indexed by timestamp
+            symbol: Symbol the prices belong to
+            clock: Virtual clock to advance (a new one if None)
+            speed: Real-time multiple to pace events at (None for as fast as possible)
+            expand_bars: Emit open, extremes and close for each bar so intrabar
+                stops and limits can trigger
+
+        Raises:
+            ValueError: If data has neither a close nor a price column
+        """
+        if "close" not in data.columns and "price" not in data.columns:
+            raise ValueError("Replay data needs a 'close' or 'price' column")
+        if speed is not None and speed <= 0:
+            raise ValueError(f"Speed must be positive: {speed}")
+
+        self.data = data.sort_index()
+        self.symbol = symbol
+        self.clock = clock or VirtualClock()
+        self.speed = speed
+        self.expand_bars = expand_bars and {"open", "high", "low"} <= set(data.columns)
+
+        self.rewind()
+
+    @classmethod
+    def from_parquet(cls, path: Union[str, Path], symbol: str, **kwargs) -> "ReplayFeed":
+        """Load a feed from a Parquet file, such as the Yahoo data cache.
+
+        Args:
+            path: Parquet file path
+            symbol: Symbol the prices belong to
+            **kwargs: Passed to ReplayFeed
+
+        Returns:
+            ReplayFeed
+        """
+        data = pd.read_parquet(path)
+        data.columns = [str(col).lower() for col in data.columns]
+        return cls(data, symbol, **kwargs)
+
+    def rewind(self) -> None:
+        """Reset the clock to the first timestamp so the feed can be replayed again."""
+        if len(self.data):
+            self.clock.reset(self.data.index[0])
+
+    def __len__(self) -> int:
+        return len(self.data) * (4 if self.expand_bars else 1)
+
+    def __iter__(self) -> Iterator[ReplayTick]:
+        """Yield ticks in time order without pacing or touching the clock."""
+        # Missing volume means unlimited liquidity for that tick
+        volumes = (
+            self.data["volume"].astype(float).fillna(-1).to_numpy()
+            if "volume" in self.data else None
+        )
+
+        def volume_at(i: int, parts: int = 1) -> Optional[float]:
+            if volumes is None or volumes[i] < 0:
+                return None
+            return float(volumes[i]) / parts
+
+        if self.expand_bars:
+            timestamps = self.data.index
+            width = pd.Series(timestamps).diff().median() if len(timestamps) > 1 else None
+            step = width / 4 if isinstance(width, pd.Timedelta) else pd.Timedelta(0)
+            columns = self.data[["open", "high", "low", "close"]].to_numpy()
+
+            for i, (open_, high, low, close) in enumerate(columns):
+                # Assume the bar visits the extreme nearer its close last
+                path = (open_, low, high, close) if close >= open_ else (open_, high, low, close)
+                volume = volume_at(i, 4)
+                for j, price in enumerate(path):
+                    yield ReplayTick(timestamps[i] + step * j, float(price), volume)
+            return
+
+        prices = self.data["price" if "price" in self.data else "close"].to_numpy()
+        for i, timestamp in enumerate(self.data.index):
+            yield ReplayTick(timestamp, float(prices[i]), volume_at(i))
+
+    async def stream(self) -> AsyncIterator[ReplayTick]:
+        """Yield ticks, advancing the clock and pacing them at the configured speed."""
+        self.rewind()
+        start_real = time.monotonic()
+        start_virtual = None
+
+        for tick in self:
+            self.clock.advance_to(tick.timestamp)
+            if start_virtual is None:
+                start_virtual = self.clock.monotonic()
+
+            if self.speed:
+                due = (self.clock.monotonic() - start_virtual) / self.speed
+                delay = due - (time.monotonic() - start_real)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            yield tick
+
+    def replay_into(self, broker: SimulatedBroker) -> int:
+        """Push every tick into a broker as fast as possible.
+
+        Args:
+            broker: Simulated broker whose mock price (and resting orders) to update
+
+        Returns:
+            Number of ticks replayed
+        """
+        self.rewind()
+        count = 0
+        for tick in self:
+            self.clock.advance_to(tick.timestamp)
+            broker.set_mock_price(self.symbol, tick.price, tick.volume)
+            count += 1
+        return count
@@ -0,0 +1,315 @@
+"""Websocket market-data ingestion with bounded buffering and backpressure."""
+
+import asyncio
+import inspect
+import json
+from collections import deque
+from enum import Enum
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import websockets
+
+from athena.core.logging import get_logger
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = get_logger(__name__)
+
+# (symbol, tick) pairs extracted from one decoded websocket message
+TickParser = Callable[[Any], Iterable[Tuple[str, Any]]]
+TickHandler = Callable[[str, Any], Union[None, Awaitable[None]]]
+
+
+def loads(message: Union[str, bytes]) -> Any:
+    """Decode a JSON message, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(message)
+    return json.loads(message)
+
+
+class OverflowPolicy(Enum):
+    """What to do with ticks that arrive faster than handlers consume them."""
+
+    COALESCE = "coalesce"  # Keep only the latest pending tick per symbol
+    DROP_OLDEST = "drop_oldest"  # FIFO buffer that discards the oldest tick when full
+    DROP_NEWEST = "drop_newest"  # FIFO buffer that rejects new ticks when full
+
+
+class MarketDataStream:
+    """Websocket reader that decouples socket I/O from tick handling.
+
+    A reader task decodes messages as fast as they arrive and puts ticks in a
+    bounded buffer; a dispatcher task drains the buffer into the tick handler.
+    A slow handler therefore never stalls the socket (and its ping/pong keepalive).
+    Ticks lost to the overflow policy are reported through ``on_drop``.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        parser: TickParser,
+        on_tick: TickHandler,
+        max_pending: int = 1000,
+        policy: OverflowPolicy = OverflowPolicy.COALESCE,
+        on_drop: Optional[Callable[[], None]] = None,
+        handshake: Optional[List[Dict[str, Any]]] = None,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+    ):
+        """Initialize stream.
+
+        Args:
+            url: Websocket URL
+            parser: Extracts (symbol, tick) pairs from a decoded message
+            on_tick: Called (sync or async) for every delivered tick
+            max_pending: Buffer bound (distinct symbols for COALESCE, ticks otherwise)
+            policy: Overflow policy
+            on_drop: Called once per dropped or superseded tick
+            handshake: Messages (e.g. auth) sent first on every (re)connect
+            reconnect_delay: Initial reconnect backoff in seconds
+            max_reconnect_delay: Maximum reconnect backoff in seconds
+        """
+        self.url = url
+        self.parser = parser
+        self.on_tick = on_tick
+        self.max_pending = max_pending
+        self.policy = policy
+        self.on_drop = on_drop
+        self.handshake = list(handshake or [])
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+
+        self._websocket = None
+        self._latest: Dict[str, Any] = {}
+        self._buffer: Deque[Tuple[str, Any]] = deque()
+        self._ready = asyncio.Event()
+        self._connected = asyncio.Event()
+        self._subscriptions: Dict[Hashable, Dict[str, Any]] = {}  # Replayed on reconnect
+        self._reader_task: Optional[asyncio.Task] = None
+        self._dispatch_task: Optional[asyncio.Task] = None
+        self._running = False
+
+        self.stats = {
+            "messages": 0,
+            "ticks": 0,
+            "delivered": 0,
+            "dropped": 0,
+            "coalesced": 0,
+            "parse_errors": 0,
+            "handler_errors": 0,
+            "reconnects": 0,
+        }
+
+    @property
+    def connected(self) -> bool:
+        """Whether the websocket is currently open."""
+        return self._connected.is_set()
+
+    @property
+    def pending(self) -> int:
+        """Ticks waiting for dispatch."""
+        return len(self._latest) if self.policy == OverflowPolicy.COALESCE else len(self._buffer)
+
+    async def start(self) -> None:
+        """Start the reader and dispatcher tasks."""
+        if self._running:
+            return
+
+        self._running = True
+        self._reader_task = asyncio.create_task(self._read_loop())
+        self._dispatch_task = asyncio.create_task(self._dispatch_loop())
+
+    async def wait_connected(self, timeout: Optional[float] = None) -> bool:
+        """Wait until the websocket is open.
+
+        Args:
+            timeout: Seconds to wait (forever if None)
+
+        Returns:
+            True if connected within the timeout
+        """
+        try:
+            await asyncio.wait_for(self._connected.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def run(self) -> None:
+        """Start streaming and block until the stream is closed."""
+        await self.start()
+        await asyncio.gather(self._reader_task, self._dispatch_task, return_exceptions=True)
+
+    async def send_json(self, message: Dict[str, Any]) -> None:
+        """Send a one-off control message if connected (not replayed after reconnects).
+
+        Args:
+            message: JSON-serializable message
+        """
+        if self._websocket is not None and self.connected:
+            await self._websocket.send(json.dumps(message))
+
+    async def subscribe(self, key: Hashable, message: Dict[str, Any]) -> None:
+        """Send a subscribe message and replay it after reconnects until unsubscribed.
+
+        Args:
+            key: Subscription identifier (e.g. stream name); replaces an earlier one
+            message: JSON-serializable subscribe message
+        """
+        self._subscriptions[key] = message
+        await self.send_json(message)
+
+    async def unsubscribe(self, key: Hashable, message: Optional[Dict[str, Any]] = None) -> None:
+        """Drop a subscription so it is no longer replayed.
+
+        Args:
+            key: Subscription identifier passed to ``subscribe``
+            message: Unsubscribe message to send, if the server needs one
+        """
+        self._subscriptions.pop(key, None)
+        if message is not None:
+            await self.send_json(message)
+
+    def stop(self) -> None:
+        """Request shutdown without waiting (usable from synchronous code)."""
+        self._running = False
+        for task in (self._reader_task, self._dispatch_task):
+            if task is not None and not task.done():
+                task.cancel()
+
+    async def close(self) -> None:
+        """Stop the tasks and close the websocket."""
+        self.stop()
+        for task in (self._reader_task, self._dispatch_task):
+            if task is not None:
+                try:
+                    await task
+                except (asyncio.CancelledError, Exception):
+                    pass
+
+        if self._websocket is not None:
+            await self._websocket.close()
+            self._websocket = None
+        self._connected.clear()
+
+    async def _read_loop(self) -> None:
+        """Read messages, reconnecting with exponential backoff."""
+        delay = self.reconnect_delay
+
+        while self._running:
+            try:
+                async with websockets.connect(self.url) as websocket:
+                    self._websocket = websocket
+                    for message in self.handshake + list(self._subscriptions.values()):
+                        await websocket.send(json.dumps(message))
+                    self._connected.set()
+                    delay = self.reconnect_delay
+                    logger.info(f"Market data stream connected: {self.url}")
+
+                    async for raw in websocket:
+                        self._ingest(raw)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Market data stream error: {e}")
+            finally:
+                self._connected.clear()
+                self._websocket = None
+
+            if not self._running:
+                break
+
+            self.stats["reconnects"] += 1
+            logger.info(f"Reconnecting market data stream in {delay:.1f}s")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    def _ingest(self, raw: Union[str, bytes]) -> None:
+        """Decode one message and buffer its ticks."""
+        self.stats["messages"] += 1
+        try:
+            ticks = list(self.parser(loads(raw)))
+        except Exception as e:
+            self.stats["parse_errors"] += 1
+            logger.debug(f"Failed to parse market data message: {e}")
+            return
+
+        for symbol, tick in ticks:
+            self.stats["ticks"] += 1
+            self._enqueue(symbol, tick)
+
+        if ticks:
+            self._ready.set()
+
+    def _enqueue(self, symbol: str, tick: Any) -> None:
+        """Buffer a tick according to the overflow policy."""
+        if self.policy == OverflowPolicy.COALESCE:
+            if symbol in self._latest:
+                self._latest[symbol] = tick
+                self.stats["coalesced"] += 1
+                self._drop()
+            elif len(self._latest) < self.max_pending:
+                self._latest[symbol] = tick
+            else:
+                self._drop()
+            return
+
+        if len(self._buffer) >= self.max_pending:
+            if self.policy == OverflowPolicy.DROP_NEWEST:
+                self._drop()
+                return
+            self._buffer.popleft()
+            self._drop()
+        self._buffer.append((symbol, tick))
+
+    def _drop(self) -> None:
+        """Account for a tick that will never be delivered."""
+        self.stats["dropped"] += 1
+        if self.on_drop is not None:
+            self.on_drop()
+
+    def _take_batch(self) -> Iterable[Tuple[str, Any]]:
+        """Remove and return everything currently buffered."""
+        if self.policy == OverflowPolicy.COALESCE:
+            batch, self._latest = self._latest, {}
+            return batch.items()
+
+        batch = list(self._buffer)
+        self._buffer.clear()
+        return batch
+
+    async def _dispatch_loop(self) -> None:
+        """Deliver buffered ticks to the handler."""
+        while self._running:
+            await self._ready.wait()
+            self._ready.clear()
+
+            for symbol, tick in self._take_batch():
+                try:
+                    result = self.on_tick(symbol, tick)
+                    if inspect.isawaitable(result):
+                        await result
+                    self.stats["delivered"] += 1
+                except Exception as e:
+                    self.stats["handler_errors"] += 1
+                    logger.error(f"Market data handler error for {symbol}: {e}")
+
+            # Let the reader run between batches
+            await asyncio.sleep(0)
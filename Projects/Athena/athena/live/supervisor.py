@@ -0,0 +1,271 @@
+"""Background connection supervision with heartbeats and broker failover."""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from athena.core.clock import Clock, WallClock
+from athena.core.logging import get_logger
+from athena.live.brokers.base import BaseBroker
+from athena.live.execution_guard import ExecutionGuard
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class BrokerHealth:
+    """Latest heartbeat outcome for one supervised broker."""
+
+    name: str
+    connected: bool = False
+    latency_ms: float = 0.0
+    last_check: Optional[datetime] = None
+    last_success: Optional[datetime] = None
+    consecutive_failures: int = 0
+    reconnects: int = 0
+    last_error: Optional[str] = None
+
+
+class ConnectionSupervisor:
+    """Keep every configured broker connected and pick the active one.
+
+    Each broker gets its own heartbeat task, so probes run concurrently and a
+    slow venue never delays the others. Failed heartbeats trigger reconnects with
+    exponential backoff inside the supervisor, off the order path. Brokers are
+    listed in priority order: the first healthy one is active, the rest are warm
+    standbys that fail over instantly. Connectivity of the active broker is fed
+    to ``ExecutionGuard.check_connectivity`` after every heartbeat.
+    """
+
+    def __init__(
+        self,
+        brokers: Dict[str, BaseBroker],
+        guard: Optional[ExecutionGuard] = None,
+        heartbeat_interval: float = 5.0,
+        heartbeat_timeout: float = 5.0,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 60.0,
+        clock: Optional[Clock] = None,
+    ):
+        """Initialize supervisor.
+
+        Args:
+            brokers: Brokers by name, in failover priority order
+            guard: Execution guard to report connectivity to
+            heartbeat_interval: Seconds between heartbeats per broker
+            heartbeat_timeout: Seconds before a heartbeat counts as failed
+            reconnect_delay: Initial reconnect backoff in seconds
+            max_reconnect_delay: Maximum reconnect backoff in seconds
+            clock: Time source for heartbeat pacing and timestamps (wall time if None)
+        """
+        if not brokers:
+            raise ValueError("At least one broker is required")
+
+        self.brokers = dict(brokers)
+        self.guard = guard
+        self.heartbeat_interval = heartbeat_interval
+        self.heartbeat_timeout = heartbeat_timeout
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.clock = clock or WallClock()
+
+        self.health: Dict[str, BrokerHealth] = {name: BrokerHealth(name) for name in brokers}
+        self.active: Optional[str] = None
+        self.failovers = 0
+
+        self._tasks: List[asyncio.Task] = []
+        self._failover_callbacks: List[Callable[[Optional[str], Optional[str]], None]] = []
+        self._outage_reported = False
+
+    def on_failover(self, callback: Callable[[Optional[str], Optional[str]], None]) -> None:
+        """Register a callback called with (previous, new) active broker names."""
+        self._failover_callbacks.append(callback)
+
+    def get_broker(self) -> BaseBroker:
+        """Get the active broker for order routing.
+
+        Returns:
+            Highest-priority healthy broker
+
+        Raises:
+            RuntimeError: If no broker is healthy
+        """
+        if self.active is None:
+            raise RuntimeError("No healthy broker available")
+        return self.brokers[self.active]
+
+    @property
+    def running(self) -> bool:
+        """Whether heartbeat tasks are running."""
+        return any(not task.done() for task in self._tasks)
+
+    async def start(self) -> None:
+        """Connect all brokers concurrently and start their heartbeat tasks."""
+        if self.running:
+            return
+
+        await self.check_all(reconnect=True)
+        self._tasks = [
+            asyncio.create_task(self._supervise(name), name=f"supervisor:{name}")
+            for name in self.brokers
+        ]
+        logger.info(f"Supervising {len(self.brokers)} brokers; active: {self.active}")
+
+    async def stop(self, disconnect: bool = False) -> None:
+        """Stop heartbeat tasks.
+
+        Args:
+            disconnect: Also disconnect every broker
+        """
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+        if disconnect:
+            await asyncio.gather(
+                *(broker.disconnect() for broker in self.brokers.values()),
+                return_exceptions=True,
+            )
+
+    async def check_all(self, reconnect: bool = False) -> Dict[str, BrokerHealth]:
+        """Heartbeat every broker once, concurrently.
+
+        Args:
+            reconnect: Try to (re)connect brokers whose heartbeat fails
+
+        Returns:
+            Health by broker name
+        """
+        await asyncio.gather(*(self._check(name, reconnect) for name in self.brokers))
+        return self.health
+
+    async def _supervise(self, name: str) -> None:
+        """Heartbeat loop for one broker."""
+        while True:
+            await self.clock.sleep(self._next_delay(name))
+            try:
+                await self._check(name, reconnect=True)
+            except Exception as e:
+                logger.error(f"Supervisor error for {name}: {e}")
+
+    def _next_delay(self, name: str) -> float:
+        """Heartbeat interval when healthy, reconnect backoff otherwise."""
+        failures = self.health[name].consecutive_failures
+        if failures == 0:
+            return self.heartbeat_interval
+        return min(self.reconnect_delay * 2 ** (failures - 1), self.max_reconnect_delay)
+
+    async def _check(self, name: str, reconnect: bool) -> None:
+        """Heartbeat one broker, reconnecting it if requested and needed."""
+        broker = self.brokers[name]
+        health = self.health[name]
+
+        connected, latency_ms, error = await self._probe(broker)
+        if not connected and reconnect:
+            health.reconnects += 1
+            connected, latency_ms, error = await self._reconnect(broker)
+
+        health.connected = connected
+        health.latency_ms = latency_ms
+        health.last_check = self.clock.now()
+        health.last_error = error
+        if connected:
+            health.consecutive_failures = 0
+            health.last_success = health.last_check
+            broker.update_heartbeat()
+            broker.record_latency(latency_ms)
+        else:
+            health.consecutive_failures += 1
+            logger.warning(f"Heartbeat failed for {name} ({health.consecutive_failures}x): {error}")
+
+        self._select_active()
+        await self._report()
+
+    async def _probe(self, broker: BaseBroker):
+        """Run one timed heartbeat.
+
+        Returns:
+            (connected, latency_ms, error)
+        """
+        start = time.perf_counter()
+        try:
+            connected = await asyncio.wait_for(broker.ping(), self.heartbeat_timeout)
+            error = None if connected else "not connected"
+        except asyncio.TimeoutError:
+            connected, error = False, f"heartbeat timed out after {self.heartbeat_timeout}s"
+        except Exception as e:
+            connected, error = False, str(e)
+        return connected, (time.perf_counter() - start) * 1000, error
+
+    async def _reconnect(self, broker: BaseBroker):
+        """Drop and re-establish a connection, then probe it.
+
+        Returns:
+            (connected, latency_ms, error)
+        """
+        broker.metrics.reconnect_count += 1
+        try:
+            await broker.disconnect()
+            if not await broker.connect():
+                return False, 0.0, "reconnect failed"
+        except Exception as e:
+            return False, 0.0, f"reconnect failed: {e}"
+        return await self._probe(broker)
+
+    def _select_active(self) -> None:
+        """Make the highest-priority healthy broker active."""
+        active = next((name for name, h in self.health.items() if h.connected), None)
+        if active == self.active:
+            return
+
+        previous, self.active = self.active, active
+        if previous is not None:
+            self.failovers += 1
+            logger.warning(f"Broker failover: {previous} -> {active}")
+
+        for callback in self._failover_callbacks:
+            try:
+                callback(previous, active)
+            except Exception as e:
+                logger.error(f"Failover callback error: {e}")
+
+    async def _report(self) -> None:
+        """Feed active-broker connectivity to the execution guard."""
+        if self.guard is None:
+            return
+
+        if self.active is None:
+            # Report an outage once instead of re-halting on every heartbeat
+            if not self._outage_reported:
+                self._outage_reported = True
+                await self.guard.check_connectivity(0.0, False)
+            return
+
+        self._outage_reported = False
+        await self.guard.check_connectivity(self.health[self.active].latency_ms, True)
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get supervisor status.
+
+        Returns:
+            Dictionary with the active broker, failover count and per-broker health
+        """
+        return {
+            "running": self.running,
+            "active": self.active,
+            "failovers": self.failovers,
+            "brokers": {
+                name: {
+                    "connected": h.connected,
+                    "latency_ms": round(h.latency_ms, 2),
+                    "last_success": h.last_success.isoformat() if h.last_success else None,
+                    "consecutive_failures": h.consecutive_failures,
+                    "reconnects": h.reconnects,
+                    "last_error": h.last_error,
+                }
+                for name, h in self.health.items()
+            },
+        }
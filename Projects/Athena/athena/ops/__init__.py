@@ -1,6 +1,7 @@
 """Operations and monitoring utilities."""
 
 from athena.ops.prometheus_exporter import (
+    DeferredRecorder,
     PrometheusExporter,
     get_exporter,
     init_prometheus,
@@ -10,6 +11,7 @@ from athena.ops.prometheus_exporter import (
 )
 
 __all__ = [
+    "DeferredRecorder",
     "PrometheusExporter",
     "get_exporter",
     "init_prometheus",
@@ -1,9 +1,9 @@
 """Prometheus metrics exporter for Athena trading system."""
 
 import time
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
-from threading import Thread
+from collections import deque
+from typing import TYPE_CHECKING, Callable, Deque, Dict, Iterator, List, Optional, Any, Tuple
+from threading import Event, Thread
 import asyncio
 
 try:
@@ -11,21 +11,135 @@ try:
         Counter, Histogram, Gauge, Info, Enum,
         start_http_server, CollectorRegistry, REGISTRY
     )
+    from prometheus_client.core import GaugeMetricFamily
     PROMETHEUS_AVAILABLE = True
 except ImportError:
     PROMETHEUS_AVAILABLE = False
 
+from athena.core.clock import Clock, WallClock
+from athena.core.histogram import DEFAULT_PERCENTILES, LogHistogram
 from athena.core.logging import get_logger
-from athena.live.brokers.base import BaseBroker, BrokerMetrics
-from athena.live.execution_guard import ExecutionGuard, GuardViolation
+
+if TYPE_CHECKING:
+    # Only needed for annotations; importing the live stack here would make
+    # backtests and optimizations load broker clients just to record metrics
+    from athena.live.brokers.base import BaseBroker
+    from athena.live.execution_guard import GuardViolation
 
 logger = get_logger(__name__)
 
 
+class DeferredRecorder:
+    """Queue metric events on the hot path and apply them from a background thread.
+
+    ``submit`` is a bounded deque append, so recording costs a fraction of a
+    microsecond regardless of how many label lookups and locks the update needs.
+    Events beyond ``max_pending`` are dropped and counted rather than growing
+    memory when the flusher falls behind.
+    """
+
+    def __init__(self, apply: Callable[[str, Dict[str, Any]], None],
+                 flush_interval: float = 0.1, max_pending: int = 100_000):
+        """Initialize recorder.
+
+        Args:
+            apply: Called with (metric_type, kwargs) for each queued event
+            flush_interval: Seconds between background flushes
+            max_pending: Maximum queued events before new ones are dropped
+        """
+        self._apply = apply
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.dropped = 0
+
+        self._pending: Deque[Tuple[str, Dict[str, Any]]] = deque()
+        self._stop = Event()
+        self._thread: Optional[Thread] = None
+
+    def submit(self, metric_type: str, kwargs: Dict[str, Any]) -> None:
+        """Queue one metric event."""
+        if len(self._pending) >= self.max_pending:
+            self.dropped += 1
+            return
+        self._pending.append((metric_type, kwargs))
+
+    def flush(self) -> int:
+        """Apply all queued events.
+
+        Returns:
+            Number of events applied
+        """
+        applied = 0
+        pending = self._pending
+        while pending:
+            # popleft is atomic, so concurrent flushes never apply an event twice
+            try:
+                metric_type, kwargs = pending.popleft()
+            except IndexError:
+                break
+            self._apply(metric_type, kwargs)
+            applied += 1
+        return applied
+
+    @property
+    def pending(self) -> int:
+        """Number of queued events."""
+        return len(self._pending)
+
+    @property
+    def running(self) -> bool:
+        """Whether the background flush thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the background flush thread."""
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = Thread(target=self._run, name="metrics-flush", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the flush thread and apply anything still queued."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+
+class LatencyQuantileCollector:
+    """Export latency histogram percentiles, computed only when scraped."""
+
+    def __init__(self, histograms: Dict[Tuple[str, str], LogHistogram]):
+        """Initialize collector.
+
+        Args:
+            histograms: Histograms in seconds by (broker, endpoint), shared with the exporter
+        """
+        self.histograms = histograms
+
+    def collect(self) -> Iterator["GaugeMetricFamily"]:
+        """Yield one gauge sample per (broker, endpoint, quantile)."""
+        family = GaugeMetricFamily(
+            'athena_api_latency_quantile_seconds',
+            'API call latency percentiles',
+            labels=['broker', 'endpoint', 'quantile'],
+        )
+        for (broker, endpoint), histogram in list(self.histograms.items()):
+            for percentile, value in histogram.percentiles(DEFAULT_PERCENTILES).items():
+                family.add_metric([broker, endpoint, f"{percentile / 100:g}"], value)
+        yield family
+
+
 class PrometheusExporter:
     """Prometheus metrics exporter for trading system telemetry."""
 
-    def __init__(self, port: int = 8090, registry: Optional[CollectorRegistry] = None):
+    def __init__(self, port: int = 8090, registry: Optional["CollectorRegistry"] = None):
         """Initialize Prometheus exporter.
 
         Args:
@@ -41,6 +155,39 @@ class PrometheusExporter:
         self.registry = registry or REGISTRY
         self.enabled = True
         self.server_started = False
+        self.deferred: Optional[DeferredRecorder] = None
+
+        # Label children by metric, so hot-path updates skip .labels() resolution
+        self._children: Dict[Any, Dict[Tuple[str, ...], Any]] = {}
+        # Last cumulative totals synced from brokers, so counters advance by the delta
+        self._synced_totals: Dict[Tuple[Any, Tuple[str, ...]], float] = {}
+        self._handlers: Dict[str, Callable[[Dict[str, Any]], None]] = {
+            "order": lambda kw: self.record_order(kw.get('broker'), kw.get('data', {})),
+            "trade": lambda kw: self.record_trade(kw.get('broker'), kw.get('data', {})),
+            "violation": lambda kw: self.record_guard_violation(kw.get('violation')),
+            "halt": lambda kw: self.record_trading_halt(
+                kw.get('halt_type'), kw.get('symbol'), kw.get('duration')
+            ),
+            "latency": lambda kw: self.record_latency(
+                kw.get('broker'), kw.get('endpoint'), kw.get('latency')
+            ),
+            "error": lambda kw: self.record_error(kw.get('component'), kw.get('error_type')),
+            "backtest": lambda kw: self.record_backtest_performance(
+                kw.get('strategy'), kw.get('symbol'), kw.get('duration'),
+                kw.get('bars', 0), kw.get('stages'),
+            ),
+            "cache": lambda kw: self.record_cache_access(kw.get('cache'), kw.get('hit')),
+            "trial": lambda kw: self.record_trial(
+                kw.get('strategy'), kw.get('outcome'), kw.get('duration')
+            ),
+            "optimization": lambda kw: self.record_optimization_performance(
+                kw.get('strategy'), kw.get('optimizer'), kw.get('duration'),
+                kw.get('trials'), kw.get('worker_utilization'),
+            ),
+            "walk_forward": lambda kw: self.record_walk_forward_window(
+                kw.get('strategy'), kw.get('duration')
+            ),
+        }
 
         # Trading metrics
         self._init_trading_metrics()
@@ -54,6 +201,9 @@ class PrometheusExporter:
         # System metrics
         self._init_system_metrics()
 
+        # Backtest and optimization throughput
+        self._init_research_metrics()
+
     def _init_trading_metrics(self):
         """Initialize trading-related metrics."""
         # Order metrics
@@ -171,6 +321,10 @@ class PrometheusExporter:
             registry=self.registry
         )
 
+        # Fixed buckets hide tail latency, so also keep percentiles per endpoint
+        self.latency_histograms: Dict[Tuple[str, str], LogHistogram] = {}
+        self.registry.register(LatencyQuantileCollector(self.latency_histograms))
+
     def _init_risk_metrics(self):
         """Initialize risk and guard metrics."""
         # Guard violations
@@ -250,6 +404,125 @@ class PrometheusExporter:
             registry=self.registry
         )
 
+    def _init_research_metrics(self):
+        """Initialize backtest, optimization and walk-forward throughput metrics."""
+        self.backtest_bars_total = Counter(
+            'athena_backtest_bars_total',
+            'Bars simulated by backtests',
+            ['strategy'],
+            registry=self.registry
+        )
+
+        self.backtest_bars_per_second = Gauge(
+            'athena_backtest_bars_per_second',
+            'Simulation throughput of the latest backtest',
+            ['strategy'],
+            registry=self.registry
+        )
+
+        self.backtest_stage_seconds = Histogram(
+            'athena_backtest_stage_seconds',
+            'Backtest time by stage',
+            ['stage'],
+            buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, float('inf')),
+            registry=self.registry
+        )
+
+        self.cache_requests_total = Counter(
+            'athena_cache_requests_total',
+            'Cache lookups by result',
+            ['cache', 'result'],  # result is hit or miss
+            registry=self.registry
+        )
+
+        self.optimization_trials_total = Counter(
+            'athena_optimization_trials_total',
+            'Optimization trials by outcome',
+            ['strategy', 'outcome'],  # evaluated, memo or invalid
+            registry=self.registry
+        )
+
+        self.trial_duration = Histogram(
+            'athena_optimization_trial_seconds',
+            'Optimization trial time',
+            ['strategy'],
+            registry=self.registry
+        )
+
+        self.optimization_trials_per_second = Gauge(
+            'athena_optimization_trials_per_second',
+            'Trial throughput of the latest optimization',
+            ['strategy'],
+            registry=self.registry
+        )
+
+        self.optimization_worker_utilization = Gauge(
+            'athena_optimization_worker_utilization',
+            'Fraction of worker time spent in trials during the latest optimization',
+            ['strategy'],
+            registry=self.registry
+        )
+
+        self.walk_forward_window_seconds = Histogram(
+            'athena_walk_forward_window_seconds',
+            'Walk-forward window processing time',
+            ['strategy'],
+            registry=self.registry
+        )
+
+    def _child(self, metric: Any, *labels: str) -> Any:
+        """Get a metric's label child, resolving it only on first use."""
+        children = self._children.get(metric)
+        if children is None:
+            children = self._children[metric] = {}
+        child = children.get(labels)
+        if child is None:
+            child = children[labels] = metric.labels(*labels)
+        return child
+
+    def _sync_counter(self, metric: Any, total: float, *labels: str) -> None:
+        """Advance a counter to a cumulative total tracked elsewhere, e.g. on a broker."""
+        key = (metric, labels)
+        delta = total - self._synced_totals.get(key, 0)
+        if delta > 0:
+            self._child(metric, *labels).inc(delta)
+        self._synced_totals[key] = total
+
+    def apply(self, metric_type: str, kwargs: Dict[str, Any]) -> None:
+        """Apply one metric event by type.
+
+        Args:
+            metric_type: Key of a registered handler, e.g. order, trade or backtest
+            kwargs: Arguments for the matching record method
+        """
+        handler = self._handlers.get(metric_type)
+        if handler is None:
+            logger.warning(f"Unknown metric type: {metric_type}")
+            return
+
+        try:
+            handler(kwargs)
+        except Exception as e:
+            logger.error(f"Failed to record metric {metric_type}: {e}")
+
+    def start_deferred(self, flush_interval: float = 0.1) -> None:
+        """Queue events from record_metric and apply them from a background thread.
+
+        Args:
+            flush_interval: Seconds between flushes
+        """
+        if not self.enabled:
+            return
+        if self.deferred is None:
+            self.deferred = DeferredRecorder(self.apply, flush_interval)
+        self.deferred.start()
+
+    def stop_deferred(self) -> None:
+        """Stop deferred recording after applying queued events."""
+        if self.deferred is not None:
+            self.deferred.stop()
+            self.deferred = None
+
     def start_server(self) -> bool:
         """Start Prometheus metrics server."""
         if not self.enabled:
@@ -269,7 +542,7 @@ class PrometheusExporter:
             logger.error(f"Failed to start Prometheus server: {e}")
             return False
 
-    def update_broker_metrics(self, broker: BaseBroker) -> None:
+    def update_broker_metrics(self, broker: "BaseBroker") -> None:
         """Update broker-specific metrics."""
         if not self.enabled:
             return
@@ -277,28 +550,29 @@ class PrometheusExporter:
         broker_name = broker.__class__.__name__.lower()
 
         # Connection status
-        self.broker_connection_status.labels(broker=broker_name).state(broker.state.value)
+        self._child(self.broker_connection_status, broker_name).state(broker.state.value)
 
         # Uptime
         uptime = broker.get_uptime()
-        self.broker_uptime_seconds.labels(broker=broker_name).set(uptime)
+        self._child(self.broker_uptime_seconds, broker_name).set(uptime)
 
         # Metrics from broker
         metrics = broker.metrics
-        self.broker_reconnects_total.labels(broker=broker_name)._value._value = metrics.reconnect_count
-        self.dropped_ticks_total.labels(broker=broker_name, symbol='*')._value._value = metrics.dropped_ticks
+        self._sync_counter(self.broker_reconnects_total, metrics.reconnect_count, broker_name)
+        self._sync_counter(self.dropped_ticks_total, metrics.dropped_ticks, broker_name, '*')
 
     def record_order(self, broker_name: str, order_data: Dict[str, Any]) -> None:
         """Record order metrics."""
         if not self.enabled:
             return
 
-        self.orders_total.labels(
-            broker=broker_name,
-            symbol=order_data.get('symbol', 'unknown'),
-            side=order_data.get('side', 'unknown'),
-            order_type=order_data.get('order_type', 'unknown'),
-            status=order_data.get('status', 'unknown')
+        self._child(
+            self.orders_total,
+            broker_name,
+            order_data.get('symbol', 'unknown'),
+            order_data.get('side', 'unknown'),
+            order_data.get('order_type', 'unknown'),
+            order_data.get('status', 'unknown'),
         ).inc()
 
     def record_trade(self, broker_name: str, trade_data: Dict[str, Any]) -> None:
@@ -311,34 +585,25 @@ class PrometheusExporter:
         pnl = trade_data.get('pnl', 0)
         slippage = trade_data.get('slippage_bps', 0)
 
-        self.trades_total.labels(
-            broker=broker_name,
-            symbol=symbol,
-            side=side
-        ).inc()
+        self._child(self.trades_total, broker_name, symbol, side).inc()
 
         if pnl != 0:
-            self.trade_pnl.labels(
-                broker=broker_name,
-                symbol=symbol
-            ).observe(pnl)
+            self._child(self.trade_pnl, broker_name, symbol).observe(pnl)
 
         if slippage > 0:
-            self.slippage_bps.labels(
-                broker=broker_name,
-                symbol=symbol
-            ).observe(slippage)
+            self._child(self.slippage_bps, broker_name, symbol).observe(slippage)
 
-    def record_guard_violation(self, violation: GuardViolation) -> None:
+    def record_guard_violation(self, violation: "GuardViolation") -> None:
         """Record guard violation metrics."""
         if not self.enabled:
             return
 
-        self.guard_violations_total.labels(
-            type=violation.type.value,
-            severity=violation.severity,
-            action=violation.action.value,
-            symbol=violation.symbol or 'global'
+        self._child(
+            self.guard_violations_total,
+            violation.type.value,
+            violation.severity,
+            violation.action.value,
+            violation.symbol or 'global',
         ).inc()
 
     def record_trading_halt(self, halt_type: str, symbol: Optional[str] = None, duration: Optional[float] = None) -> None:
@@ -347,16 +612,10 @@ class PrometheusExporter:
             return
 
         halt_symbol = symbol or 'global'
-        self.trading_halts_total.labels(
-            type=halt_type,
-            symbol=halt_symbol
-        ).inc()
+        self._child(self.trading_halts_total, halt_type, halt_symbol).inc()
 
         if duration is not None:
-            self.halt_duration_seconds.labels(
-                type=halt_type,
-                symbol=halt_symbol
-            ).observe(duration)
+            self._child(self.halt_duration_seconds, halt_type, halt_symbol).observe(duration)
 
     def update_portfolio_metrics(self, broker_name: str, portfolio_data: Dict[str, Any]) -> None:
         """Update portfolio metrics."""
@@ -364,19 +623,19 @@ class PrometheusExporter:
             return
 
         if 'portfolio_value' in portfolio_data:
-            self.portfolio_value.labels(broker=broker_name).set(portfolio_data['portfolio_value'])
+            self._child(self.portfolio_value, broker_name).set(portfolio_data['portfolio_value'])
 
         if 'daily_pnl' in portfolio_data:
-            self.daily_pnl.labels(broker=broker_name).set(portfolio_data['daily_pnl'])
+            self._child(self.daily_pnl, broker_name).set(portfolio_data['daily_pnl'])
 
         if 'positions_count' in portfolio_data:
-            self.positions_count.labels(broker=broker_name).set(portfolio_data['positions_count'])
+            self._child(self.positions_count, broker_name).set(portfolio_data['positions_count'])
 
         if 'max_drawdown' in portfolio_data:
-            self.max_drawdown.labels(broker=broker_name).set(portfolio_data['max_drawdown'] * 100)
+            self._child(self.max_drawdown, broker_name).set(portfolio_data['max_drawdown'] * 100)
 
         if 'leverage' in portfolio_data:
-            self.leverage_ratio.labels(broker=broker_name).set(portfolio_data['leverage'])
+            self._child(self.leverage_ratio, broker_name).set(portfolio_data['leverage'])
 
     def update_position_metrics(self, broker_name: str, positions: List[Dict[str, Any]]) -> None:
         """Update individual position metrics."""
@@ -387,40 +646,128 @@ class PrometheusExporter:
             symbol = position.get('symbol', 'unknown')
             value = position.get('market_value', 0)
 
-            self.position_value.labels(
-                broker=broker_name,
-                symbol=symbol
-            ).set(value)
+            self._child(self.position_value, broker_name, symbol).set(value)
 
     def record_latency(self, broker_name: str, endpoint: str, latency_seconds: float) -> None:
         """Record API latency."""
         if not self.enabled:
             return
 
-        self.api_latency.labels(
-            broker=broker_name,
-            endpoint=endpoint
-        ).observe(latency_seconds)
+        self._child(self.api_latency, broker_name, endpoint).observe(latency_seconds)
+
+        key = (broker_name, endpoint)
+        histogram = self.latency_histograms.get(key)
+        if histogram is None:
+            histogram = self.latency_histograms[key] = LogHistogram(lowest=1e-6, highest=3600.0)
+        histogram.record(latency_seconds)
+
+    def get_latency_summary(self, broker_name: str, endpoint: str) -> Dict[str, float]:
+        """Get latency count, mean, max and percentiles for an endpoint.
+
+        Args:
+            broker_name: Broker label
+            endpoint: Endpoint label
+
+        Returns:
+            Summary in seconds (empty if nothing was recorded)
+        """
+        if not self.enabled:
+            return {}
+
+        histogram = self.latency_histograms.get((broker_name, endpoint))
+        return histogram.summary() if histogram else {}
+
+    def record_backtest_performance(
+        self,
+        strategy: str,
+        symbol: str,
+        duration_seconds: float,
+        bars: int = 0,
+        stages: Optional[Dict[str, float]] = None,
+    ) -> None:
+        """Record backtest performance.
 
-    def record_backtest_performance(self, strategy: str, symbol: str, duration_seconds: float) -> None:
-        """Record backtest performance."""
+        Args:
+            strategy: Strategy name
+            symbol: Symbol backtested
+            duration_seconds: Total backtest time
+            bars: Number of bars simulated
+            stages: Seconds spent per stage (e.g. signals, simulation, metrics)
+        """
         if not self.enabled:
             return
 
-        self.backtest_duration.labels(
-            strategy=strategy,
-            symbol=symbol
-        ).observe(duration_seconds)
+        self._child(self.backtest_duration, strategy, symbol).observe(duration_seconds)
+
+        if bars:
+            self._child(self.backtest_bars_total, strategy).inc(bars)
+            if duration_seconds > 0:
+                self._child(self.backtest_bars_per_second, strategy).set(bars / duration_seconds)
+
+        for stage, seconds in (stages or {}).items():
+            self._child(self.backtest_stage_seconds, stage).observe(seconds)
+
+    def record_cache_access(self, cache: str, hit: bool) -> None:
+        """Record a cache lookup."""
+        if not self.enabled:
+            return
+
+        self._child(self.cache_requests_total, cache, 'hit' if hit else 'miss').inc()
+
+    def record_trial(self, strategy: str, outcome: str, duration_seconds: float) -> None:
+        """Record one optimization trial.
+
+        Args:
+            strategy: Strategy name
+            outcome: evaluated, memo (answered from earlier trials) or invalid
+            duration_seconds: Trial time
+        """
+        if not self.enabled:
+            return
+
+        self._child(self.optimization_trials_total, strategy, outcome).inc()
+        self._child(self.trial_duration, strategy).observe(duration_seconds)
+
+    def record_optimization_performance(
+        self,
+        strategy: str,
+        optimizer: str,
+        duration_seconds: float,
+        trials: int,
+        worker_utilization: Optional[float] = None,
+    ) -> None:
+        """Record a finished optimization.
+
+        Args:
+            strategy: Strategy name
+            optimizer: Optimizer name
+            duration_seconds: Wall time of the optimization
+            trials: Trials run
+            worker_utilization: Busy fraction of worker time, if known
+        """
+        if not self.enabled:
+            return
+
+        self._child(self.optimization_duration, strategy, optimizer).observe(duration_seconds)
+        if duration_seconds > 0:
+            trials_per_second = trials / duration_seconds
+            self._child(self.optimization_trials_per_second, strategy).set(trials_per_second)
+        if worker_utilization is not None:
+            self._child(self.optimization_worker_utilization, strategy).set(worker_utilization)
+
+    def record_walk_forward_window(self, strategy: str, duration_seconds: float) -> None:
+        """Record one processed walk-forward window."""
+        if not self.enabled:
+            return
+
+        self._child(self.walk_forward_window_seconds, strategy).observe(duration_seconds)
 
     def record_error(self, component: str, error_type: str) -> None:
         """Record system errors."""
         if not self.enabled:
             return
 
-        self.errors_total.labels(
-            component=component,
-            error_type=error_type
-        ).inc()
+        self._child(self.errors_total, component, error_type).inc()
 
     def set_system_info(self, info: Dict[str, str]) -> None:
         """Set system information."""
@@ -453,8 +800,21 @@ def get_exporter() -> Optional[PrometheusExporter]:
     return _exporter
 
 
-def init_prometheus(port: int = 8090, start_server: bool = True) -> Optional[PrometheusExporter]:
-    """Initialize global Prometheus exporter."""
+def init_prometheus(
+    port: int = 8090,
+    start_server: bool = True,
+    clock: Optional[Clock] = None,
+    flush_interval: Optional[float] = None,
+) -> Optional[PrometheusExporter]:
+    """Initialize global Prometheus exporter.
+
+    Args:
+        port: Port to serve metrics on
+        start_server: Whether to start the HTTP server
+        clock: Time source for the reported start time (wall time if None)
+        flush_interval: Defer record_metric updates to a background thread
+            flushing at this interval in seconds (apply inline if None)
+    """
     global _exporter
 
     if _exporter is not None:
@@ -471,39 +831,31 @@ def init_prometheus(port: int = 8090, start_server: bool = True) -> Optional[Pro
         _exporter.set_system_info({
             "version": "1.0.0",
             "component": "athena-trading-system",
-            "started_at": datetime.now().isoformat()
+            "started_at": (clock or WallClock()).now().isoformat()
         })
 
+        if flush_interval is not None:
+            _exporter.start_deferred(flush_interval)
+
         logger.info(f"Prometheus metrics initialized on port {port}")
 
     return _exporter
 
 
 def record_metric(metric_type: str, **kwargs) -> None:
-    """Convenience function to record metrics."""
-    exporter = get_exporter()
-    if not exporter or not exporter.enabled:
+    """Convenience function to record metrics.
+
+    Queues the event when deferred recording is on, otherwise applies it inline.
+    """
+    exporter = _exporter
+    if exporter is None or not exporter.enabled:
         return
 
-    try:
-        if metric_type == "order":
-            exporter.record_order(kwargs.get('broker'), kwargs.get('data', {}))
-        elif metric_type == "trade":
-            exporter.record_trade(kwargs.get('broker'), kwargs.get('data', {}))
-        elif metric_type == "violation":
-            exporter.record_guard_violation(kwargs.get('violation'))
-        elif metric_type == "halt":
-            exporter.record_trading_halt(
-                kwargs.get('halt_type'),
-                kwargs.get('symbol'),
-                kwargs.get('duration')
-            )
-        elif metric_type == "error":
-            exporter.record_error(kwargs.get('component'), kwargs.get('error_type'))
-        else:
-            logger.warning(f"Unknown metric type: {metric_type}")
-    except Exception as e:
-        logger.error(f"Failed to record metric {metric_type}: {e}")
+    deferred = exporter.deferred
+    if deferred is not None:
+        deferred.submit(metric_type, kwargs)
+    else:
+        exporter.apply(metric_type, kwargs)
 
 
 # Decorator for automatic latency measurement
@@ -511,12 +863,12 @@ def measure_latency(broker_name: str, endpoint: str):
     """Decorator to measure function latency."""
     def decorator(func):
         def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_time = time.perf_counter()
             try:
                 result = func(*args, **kwargs)
                 return result
             finally:
-                latency = time.time() - start_time
+                latency = time.perf_counter() - start_time
                 exporter = get_exporter()
                 if exporter and exporter.enabled:
                     exporter.record_latency(broker_name, endpoint, latency)
@@ -533,12 +885,12 @@ async def measure_async_latency(broker_name: str, endpoint: str):
             self.start_time = None
 
         async def __aenter__(self):
-            self.start_time = time.time()
+            self.start_time = time.perf_counter()
             return self
 
         async def __aexit__(self, exc_type, exc_val, exc_tb):
             if self.start_time:
-                latency = time.time() - self.start_time
+                latency = time.perf_counter() - self.start_time
                 exporter = get_exporter()
                 if exporter and exporter.enabled:
                     exporter.record_latency(self.broker, self.endpoint, latency)
@@ -0,0 +1,161 @@
+"""Vectorized exhaustive grid search for moving-average crossover parameters."""
+
+from typing import Dict, Sequence
+
+import numpy as np
+import pandas as pd
+
+from athena.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+GRID_METRICS = ("sharpe", "total_return")
+
+
+def rolling_mean_matrix(values: np.ndarray, periods: Sequence[int]) -> np.ndarray:
+    """Compute simple moving averages for several periods at once.
+
+    Uses a single cumulative sum, so every period costs one vectorized subtraction.
+    Values before a full window are NaN, matching ``rolling(period, min_periods=period)``.
+
+    Args:
+        values: 1-D price array
+        periods: Window lengths
+
+    Returns:
+        Array of shape (len(periods), len(values))
+    """
+    values = np.asarray(values, dtype=float)
+    n = len(values)
+    cumsum = np.concatenate(([0.0], np.cumsum(values)))
+
+    result = np.full((len(periods), n), np.nan)
+    for row, period in enumerate(periods):
+        if 0 < period <= n:
+            result[row, period - 1 :] = (cumsum[period:] - cumsum[:-period]) / period
+
+    return result
+
+
+def crossover_signals(fast: np.ndarray, slow: np.ndarray) -> np.ndarray:
+    """Derive crossover signals for every fast/slow pairing.
+
+    Same rule as ``SMACrossoverStrategy.generate_signals``: 1 when the fast average
+    crosses above the slow one, -1 when it crosses below, 0 otherwise.
+
+    Args:
+        fast: Fast SMA matrix of shape (F, T)
+        slow: Slow SMA matrix of shape (S, T)
+
+    Returns:
+        int8 signal array of shape (F, S, T)
+    """
+    diff = fast[:, None, :] - slow[None, :, :]
+    prev, curr = diff[..., :-1], diff[..., 1:]
+
+    signals = np.zeros(diff.shape, dtype=np.int8)
+    # NaN comparisons are False, so warm-up bars never signal
+    signals[..., 1:][(prev <= 0) & (curr > 0)] = 1
+    signals[..., 1:][(prev >= 0) & (curr < 0)] = -1
+    return signals
+
+
+def signals_to_positions(signals: np.ndarray) -> np.ndarray:
+    """Convert entry/exit signals into long-only positions along the last axis.
+
+    A buy opens a position that is held until the next sell, the same way
+    ``BacktestEngine`` feeds signals to ``vbt.Portfolio.from_signals``.
+
+    Args:
+        signals: Signal array (..., T) with values in {-1, 0, 1}
+
+    Returns:
+        Float array of positions in {0, 1}
+    """
+    # Forward-fill the last non-zero signal via a running max over its index
+    steps = np.arange(signals.shape[-1])
+    last_signal = np.maximum.accumulate(np.where(signals != 0, steps, 0), axis=-1)
+    filled = np.take_along_axis(signals, last_signal, axis=-1)
+    return (filled > 0).astype(float)
+
+
+def sma_grid_search(
+    close: pd.Series,
+    fast_periods: Sequence[int],
+    slow_periods: Sequence[int],
+    metric: str = "sharpe",
+    commission: float = 0.0,
+    periods_per_year: int = 252,
+) -> pd.DataFrame:
+    """Score every fast/slow SMA crossover combination in one NumPy pass.
+
+    Memory scales with len(fast_periods) * len(slow_periods) * len(close).
+
+    Args:
+        close: Close price series
+        fast_periods: Candidate fast periods
+        slow_periods: Candidate slow periods
+        metric: "sharpe" or "total_return"
+        commission: Cost per unit of position change
+        periods_per_year: Bars per year for Sharpe annualization
+
+    Returns:
+        Score grid indexed by fast period with slow periods as columns. Combinations
+        with fast >= slow, or with no return variance for Sharpe, are NaN.
+    """
+    if metric not in GRID_METRICS:
+        raise ValueError(f"Unknown metric: {metric}. Expected one of {GRID_METRICS}")
+
+    fast_periods = list(fast_periods)
+    slow_periods = list(slow_periods)
+    prices = close.to_numpy(dtype=float)
+
+    fast = rolling_mean_matrix(prices, fast_periods)
+    slow = rolling_mean_matrix(prices, slow_periods)
+    positions = signals_to_positions(crossover_signals(fast, slow))
+
+    # Enter at the signal bar's close, so earn the next bar's return
+    returns = np.zeros(len(prices))
+    returns[1:] = prices[1:] / prices[:-1] - 1
+    strategy_returns = np.zeros(positions.shape)
+    strategy_returns[..., 1:] = positions[..., :-1] * returns[1:]
+
+    if commission:
+        turnover = np.abs(np.diff(positions, axis=-1, prepend=0.0))
+        strategy_returns -= turnover * commission
+
+    if metric == "sharpe":
+        std = strategy_returns.std(axis=-1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores = strategy_returns.mean(axis=-1) / std * np.sqrt(periods_per_year)
+        scores[std == 0] = np.nan
+    else:
+        scores = np.prod(1 + strategy_returns, axis=-1) - 1
+
+    scores[~np.less.outer(fast_periods, slow_periods)] = np.nan
+
+    return pd.DataFrame(
+        scores,
+        index=pd.Index(fast_periods, name="fast_period"),
+        columns=pd.Index(slow_periods, name="slow_period"),
+    )
+
+
+def best_grid_params(scores: pd.DataFrame) -> Dict[str, int]:
+    """Pick the highest scoring combination from a score grid.
+
+    Args:
+        scores: Grid returned by ``sma_grid_search``
+
+    Returns:
+        Dictionary with fast_period and slow_period
+
+    Raises:
+        ValueError: If no combination produced a valid score
+    """
+    stacked = scores.stack().dropna()
+    if stacked.empty:
+        raise ValueError("No valid parameter combination in grid")
+
+    fast_period, slow_period = stacked.idxmax()
+    return {"fast_period": int(fast_period), "slow_period": int(slow_period)}
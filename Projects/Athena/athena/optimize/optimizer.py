@@ -1,21 +1,64 @@
 """Hyperparameter optimization using Optuna."""
 
+import hashlib
 import json
+import os
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import optuna
 import pandas as pd
 from optuna.pruners import MedianPruner
 from optuna.samplers import TPESampler
 
+from athena.backtest.cache import fingerprint_data
 from athena.backtest.engine import BacktestEngine
 from athena.core.config import settings
 from athena.core.logging import get_logger
+from athena.core.profiling import profiled
+from athena.ops.prometheus_exporter import record_metric
 
 logger = get_logger(__name__)
 
+# Objective value returned for invalid parameters or failed backtests
+INVALID_OBJECTIVE = -999.0
+
+_METRIC_ATTRS = ("sharpe_ratio", "total_return", "max_drawdown", "win_rate")
+
+
+def _params_key(params: Dict[str, Any]) -> Tuple:
+    """Build a hashable memo key from a parameter set."""
+    return tuple(sorted(params.items()))
+
+
+def _study_key(
+    data: pd.DataFrame,
+    engine: BacktestEngine,
+    param_space: Dict[str, Dict],
+    objective_weights: Dict[str, float],
+) -> str:
+    """Fingerprint everything besides the sampled parameters that determines a trial's value.
+
+    Trials of studies with the same key are interchangeable, so their results can
+    be reused; any change to the data, engine settings, objective or search space
+    gives a new key.
+    """
+    payload = {
+        "data": fingerprint_data(data),
+        "engine": {
+            "initial_capital": float(engine.initial_capital),
+            "commission": float(engine.commission),
+            "slippage": float(engine.slippage),
+        },
+        "objective_weights": objective_weights,
+        "param_space": param_space,
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
 
 class StrategyOptimizer:
     """Optuna-based strategy parameter optimizer."""
@@ -26,6 +69,7 @@ class StrategyOptimizer:
         commission: float = None,
         n_jobs: int = 1,
         random_state: int = 42,
+        storage: Optional[str] = None,
     ):
         """Initialize optimizer.
 
@@ -34,11 +78,15 @@ class StrategyOptimizer:
             commission: Commission rate
             n_jobs: Number of parallel jobs
             random_state: Random seed for reproducibility
+            storage: Optuna storage URL (e.g. "sqlite:///./athena.db") for persistent,
+                resumable studies. Uses settings.optuna_storage if None; in-memory if unset.
         """
         self.initial_capital = initial_capital or settings.default_initial_capital
         self.commission = commission or settings.default_commission
         self.n_jobs = n_jobs
         self.random_state = random_state
+        self.storage = storage or settings.optuna_storage
+        self.memo_hits = 0
 
         # Initialize backtest engine
         self.engine = BacktestEngine(
@@ -54,9 +102,14 @@ class StrategyOptimizer:
         n_trials: int = 100,
         timeout: Optional[int] = None,
         objective_weights: Dict[str, float] = None,
+        study_name: Optional[str] = None,
+        callbacks: Optional[List[Callable[[optuna.Study, optuna.trial.FrozenTrial], None]]] = None,
     ) -> Dict[str, Any]:
         """Optimize strategy parameters.
 
+        Trials that sample a parameter set already evaluated (in this run or in a
+        resumed study) are answered from a memo table instead of re-running the backtest.
+
         Args:
             strategy_class: Strategy class to optimize
             data: OHLCV data for optimization
@@ -65,9 +118,16 @@ class StrategyOptimizer:
             n_trials: Number of optimization trials
             timeout: Timeout in seconds
             objective_weights: Weights for multi-objective optimization
+            study_name: Study name in storage. Defaults to strategy, symbol and a
+                fingerprint of the data, engine settings, objective weights and search
+                space, so only reruns of the identical setup resume the same study.
+            callbacks: Optuna callbacks invoked after each trial, e.g. for progress
 
         Returns:
             Optimization results including best parameters
+
+        Raises:
+            ValueError: If a named study in storage was created for a different setup
         """
         if objective_weights is None:
             objective_weights = {"sharpe": 0.7, "drawdown_penalty": 0.3}
@@ -79,16 +139,52 @@ class StrategyOptimizer:
             param_space=list(param_space.keys()),
         )
 
-        # Create study
+        study_key = _study_key(data, self.engine, param_space, objective_weights)
+        if study_name is None:
+            study_name = f"{strategy_class.__name__}_{symbol}_{study_key[:12]}"
+
+        # Create (or resume) study
         study = optuna.create_study(
+            study_name=study_name,
+            storage=self.storage,
+            load_if_exists=True,
             direction="maximize",
             sampler=TPESampler(seed=self.random_state),
             pruner=MedianPruner(n_startup_trials=10),
         )
 
+        past_trials = study.get_trials(
+            deepcopy=False, states=(optuna.trial.TrialState.COMPLETE,)
+        )
+        stored_key = study.user_attrs.get("study_key")
+        if stored_key is None and not past_trials:
+            study.set_user_attr("study_key", study_key)
+        elif stored_key != study_key:
+            raise ValueError(
+                f"Study '{study_name}' does not match this run's data, engine settings, "
+                "objective weights or parameter space; use another study name"
+            )
+
+        # Warm the memo table from valid trials already recorded in the study
+        memo: Dict[Tuple, Tuple[float, Dict[str, Any]]] = {}
+        for past_trial in past_trials:
+            if past_trial.value != INVALID_OBJECTIVE:
+                memo[_params_key(past_trial.params)] = (
+                    past_trial.value, dict(past_trial.user_attrs)
+                )
+        memo_lock = threading.Lock()
+        memo_hits_before = self.memo_hits
+        # Trials run and seconds spent inside them, for throughput and utilization
+        trial_stats = {"trials": 0, "busy": 0.0}
+
+        if memo:
+            logger.info(f"Resuming study {study_name} with {len(memo)} evaluated parameter sets")
+
         # Define objective function
         def objective(trial: optuna.Trial) -> float:
             """Objective function for optimization."""
+            trial_start = time.perf_counter()
+
             # Sample parameters
             params = {}
             for param_name, param_config in param_space.items():
@@ -113,54 +209,77 @@ class StrategyOptimizer:
                         param_name, param_config["choices"]
                     )
 
-            # Create strategy with sampled parameters
-            try:
-                strategy = strategy_class(**params)
-            except Exception as e:
-                logger.warning(f"Invalid parameters: {params}, error: {e}")
-                return -999  # Penalize invalid parameters
-
-            # Run backtest
-            try:
-                result = self.engine.run(strategy, data, symbol)
-
-                # Calculate composite objective
-                sharpe_component = result.sharpe_ratio * objective_weights["sharpe"]
-
-                # Drawdown penalty (less negative drawdown is better)
-                dd_penalty = (1 - result.max_drawdown) * objective_weights["drawdown_penalty"]
-
-                objective_value = sharpe_component + dd_penalty
-
-                # Store additional metrics for analysis
-                trial.set_user_attr("total_return", result.total_return)
-                trial.set_user_attr("max_drawdown", result.max_drawdown)
-                trial.set_user_attr("win_rate", result.win_rate)
-                trial.set_user_attr("total_trades", result.total_trades)
-
-                return objective_value
-
-            except Exception as e:
-                logger.warning(f"Backtest failed for params {params}: {e}")
-                return -999
+            # Duplicate parameter sets are deterministic; reuse the earlier evaluation
+            key = _params_key(params)
+            with memo_lock:
+                cached = memo.get(key)
+                if cached is not None:
+                    self.memo_hits += 1
+
+            outcome = "memo"
+            if cached is None:
+                cached = self._evaluate(strategy_class, params, data, symbol, objective_weights)
+                if cached[0] == INVALID_OBJECTIVE:
+                    # Failures may be transient; let a later trial evaluate these again
+                    outcome = "invalid"
+                else:
+                    with memo_lock:
+                        memo[key] = cached
+                    outcome = "evaluated"
+
+            objective_value, user_attrs = cached
+            for name, value in user_attrs.items():
+                trial.set_user_attr(name, value)
+
+            trial_seconds = time.perf_counter() - trial_start
+            with memo_lock:
+                trial_stats["trials"] += 1
+                trial_stats["busy"] += trial_seconds
+            record_metric(
+                "trial", strategy=strategy_class.__name__, outcome=outcome, duration=trial_seconds
+            )
+
+            return objective_value
 
         # Run optimization
+        start = time.perf_counter()
         study.optimize(
             objective,
             n_trials=n_trials,
             timeout=timeout,
             n_jobs=self.n_jobs,
+            callbacks=callbacks,
             show_progress_bar=True,
         )
+        duration = time.perf_counter() - start
+
+        workers = self.n_jobs if self.n_jobs > 0 else os.cpu_count() or 1
+        trials_per_second = trial_stats["trials"] / duration if duration > 0 else 0.0
+        worker_utilization = (
+            min(1.0, trial_stats["busy"] / (duration * workers)) if duration > 0 else 0.0
+        )
+        record_metric(
+            "optimization",
+            strategy=strategy_class.__name__,
+            optimizer="optuna",
+            duration=duration,
+            trials=trial_stats["trials"],
+            worker_utilization=worker_utilization,
+        )
 
         # Get best trial
         best_trial = study.best_trial
         best_params = best_trial.params
 
+        memo_hits = self.memo_hits - memo_hits_before
+
         logger.info(
             "Optimization completed",
             best_objective=f"{best_trial.value:.4f}",
             best_params=best_params,
+            memo_hits=memo_hits,
+            trials_per_second=f"{trials_per_second:.1f}",
+            worker_utilization=f"{worker_utilization:.0%}",
         )
 
         # Compile results
@@ -173,7 +292,12 @@ class StrategyOptimizer:
             "best_win_rate": best_trial.user_attrs.get("win_rate", 0),
             "best_trades": best_trial.user_attrs.get("total_trades", 0),
             "n_trials": len(study.trials),
+            "memo_hits": memo_hits,
+            "duration_seconds": duration,
+            "trials_per_second": trials_per_second,
+            "worker_utilization": worker_utilization,
             "study": study,
+            "study_name": study_name,
             "optimization_time": datetime.now().isoformat(),
             "symbol": symbol,
             "strategy": strategy_class.__name__,
@@ -181,6 +305,53 @@ class StrategyOptimizer:
 
         return results
 
+    @profiled("optimize.evaluate")
+    def _evaluate(
+        self,
+        strategy_class: type,
+        params: Dict[str, Any],
+        data: pd.DataFrame,
+        symbol: str,
+        objective_weights: Dict[str, float],
+    ) -> Tuple[float, Dict[str, Any]]:
+        """Run one backtest and score it.
+
+        Args:
+            strategy_class: Strategy class to instantiate
+            params: Strategy parameters
+            data: OHLCV data
+            symbol: Symbol being optimized
+            objective_weights: Objective weights
+
+        Returns:
+            Tuple of (objective value, metrics to store as trial user attributes)
+        """
+        # Create strategy with sampled parameters
+        try:
+            strategy = strategy_class(**params)
+        except Exception as e:
+            logger.warning(f"Invalid parameters: {params}, error: {e}")
+            return INVALID_OBJECTIVE, {}  # Penalize invalid parameters
+
+        # Run backtest
+        try:
+            result = self.engine.run(strategy, data, symbol)
+        except Exception as e:
+            logger.warning(f"Backtest failed for params {params}: {e}")
+            return INVALID_OBJECTIVE, {}
+
+        # Calculate composite objective
+        sharpe_component = result.sharpe_ratio * objective_weights["sharpe"]
+
+        # Drawdown penalty (less negative drawdown is better)
+        dd_penalty = (1 - result.max_drawdown) * objective_weights["drawdown_penalty"]
+
+        # Store additional metrics for analysis (plain types so RDB storage can serialize them)
+        user_attrs = {name: float(getattr(result, name)) for name in _METRIC_ATTRS}
+        user_attrs["total_trades"] = int(result.total_trades)
+
+        return float(sharpe_component + dd_penalty), user_attrs
+
     def save_results(self, results: Dict[str, Any], output_dir: Path = None) -> Path:
         """Save optimization results to file.
 
@@ -1,12 +1,13 @@
 """Base strategy class for all trading strategies."""
 
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import pandas as pd
 
 from athena.core.logging import get_logger
 from athena.core.types import Order, OrderSide, OrderType
+from athena.data.bars import MultiTimeframeBars
 
 logger = get_logger(__name__)
 
@@ -23,6 +24,10 @@ class BaseStrategy(ABC):
         self.name = name or self.__class__.__name__
         self.params = {}
 
+        # Extra timeframes (e.g., ["1h", "1d"]) the strategy reads via get_bars()
+        self.timeframes: List[str] = []
+        self.bars = None
+
     @abstractmethod
     def generate_signals(self, data: pd.DataFrame) -> pd.Series:
         """Generate trading signals from data.
@@ -63,6 +68,37 @@ class BaseStrategy(ABC):
 
         return data
 
+    def attach_bars(self, bars) -> None:
+        """Attach a multi-timeframe bar source.
+
+        Args:
+            bars: BarAggregator (live) or MultiTimeframeBars (backtest)
+        """
+        self.bars = bars
+
+    def get_bars(self, timeframe: str, data: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """Get closed OHLCV bars for one of the strategy's timeframes.
+
+        Only bars that have closed are visible, in backtests and live alike, so
+        higher-timeframe signals cannot look ahead. Live, the aggregator's open
+        bar is left out. In backtests every row is evaluated at once, so each
+        row holds the previous bar (see ``MultiTimeframeBars.to_frame``); align it
+        onto the base rows with a forward fill.
+
+        Args:
+            timeframe: Timeframe to read (e.g., "1h")
+            data: Fallback source data when no bar source is attached
+
+        Returns:
+            OHLCV DataFrame at the requested timeframe
+        """
+        if self.bars is None:
+            if data is None:
+                raise RuntimeError(f"No bar source attached to {self.name}")
+            return MultiTimeframeBars(data).to_frame(timeframe, include_partial=False)
+
+        return self.bars.to_frame(timeframe, include_partial=False)
+
     def create_orders(
         self, signals: pd.Series, data: pd.DataFrame, position_size: float = 1000
     ) -> List[Order]:
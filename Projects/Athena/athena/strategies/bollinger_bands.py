@@ -158,8 +158,8 @@ class BollingerBandsStrategy(BaseStrategy):
                     signals.iloc[i] = 1
                     position = 1
                     logger.debug(
-                        f"Buy signal at {data.index[i]}: "
-                        f"Price={current_price:.2f}, %B={current_percent_b:.2f}, RSI={current_rsi:.1f}"
+                        "Buy signal at %s: Price=%.2f, %%B=%.2f, RSI=%.1f",
+                        data.index[i], current_price, current_percent_b, current_rsi,
                     )
 
                 # Sell signal: Price near upper band + RSI overbought
@@ -172,8 +172,8 @@ class BollingerBandsStrategy(BaseStrategy):
                     signals.iloc[i] = -1
                     position = -1
                     logger.debug(
-                        f"Sell signal at {data.index[i]}: "
-                        f"Price={current_price:.2f}, %B={current_percent_b:.2f}, RSI={current_rsi:.1f}"
+                        "Sell signal at %s: Price=%.2f, %%B=%.2f, RSI=%.1f",
+                        data.index[i], current_price, current_percent_b, current_rsi,
                     )
 
             # Exit signals (mean reversion)
@@ -184,7 +184,7 @@ class BollingerBandsStrategy(BaseStrategy):
                 ) or current_rsi >= self.rsi_overbought:
                     signals.iloc[i] = -1  # Close long
                     position = 0
-                    logger.debug(f"Exit long at {data.index[i]}: mean reversion")
+                    logger.debug("Exit long at %s: mean reversion", data.index[i])
 
             elif position == -1:  # Short position
                 # Exit short: Price crosses below middle band or RSI becomes oversold
@@ -193,7 +193,7 @@ class BollingerBandsStrategy(BaseStrategy):
                 ) or current_rsi <= self.rsi_oversold:
                     signals.iloc[i] = 1  # Close short
                     position = 0
-                    logger.debug(f"Exit short at {data.index[i]}: mean reversion")
+                    logger.debug("Exit short at %s: mean reversion", data.index[i])
 
         return signals
 
@@ -194,34 +194,32 @@ class MomentumStrategy(BaseStrategy):
                 if rsi_bullish and macd_bullish and current_trend > 0:
                     signals.iloc[i] = 1
                     logger.debug(
-                        f"Buy signal at {data.index[i]}: "
-                        f"RSI={current_rsi:.1f}, MACD={current_macd:.4f}, "
-                        f"Signal={current_signal:.4f}, Trend=UP"
+                        "Buy signal at %s: RSI=%.1f, MACD=%.4f, Signal=%.4f, Trend=UP",
+                        data.index[i], current_rsi, current_macd, current_signal,
                     )
 
                 # Sell: Bearish momentum + downtrend
                 elif rsi_bearish and macd_bearish and current_trend < 0:
                     signals.iloc[i] = -1
                     logger.debug(
-                        f"Sell signal at {data.index[i]}: "
-                        f"RSI={current_rsi:.1f}, MACD={current_macd:.4f}, "
-                        f"Signal={current_signal:.4f}, Trend=DOWN"
+                        "Sell signal at %s: RSI=%.1f, MACD=%.4f, Signal=%.4f, Trend=DOWN",
+                        data.index[i], current_rsi, current_macd, current_signal,
                     )
             else:
                 # Buy: Bullish momentum (no trend filter)
                 if rsi_bullish and macd_bullish:
                     signals.iloc[i] = 1
                     logger.debug(
-                        f"Buy signal at {data.index[i]}: "
-                        f"RSI={current_rsi:.1f}, MACD bullish crossover"
+                        "Buy signal at %s: RSI=%.1f, MACD bullish crossover",
+                        data.index[i], current_rsi,
                     )
 
                 # Sell: Bearish momentum (no trend filter)
                 elif rsi_bearish and macd_bearish:
                     signals.iloc[i] = -1
                     logger.debug(
-                        f"Sell signal at {data.index[i]}: "
-                        f"RSI={current_rsi:.1f}, MACD bearish crossover"
+                        "Sell signal at %s: RSI=%.1f, MACD bearish crossover",
+                        data.index[i], current_rsi,
                     )
 
             # Additional exit conditions based on extreme RSI levels
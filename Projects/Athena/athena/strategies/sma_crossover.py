@@ -2,9 +2,11 @@
 
 from typing import Dict, Tuple
 
+import numpy as np
 import pandas as pd
 
 from athena.core.logging import get_logger
+from athena.optimize.grid import best_grid_params, sma_grid_search
 from athena.strategies.base import BaseStrategy
 
 logger = get_logger(__name__)
@@ -83,16 +85,16 @@ class SMACrossoverStrategy(BaseStrategy):
                 if prev_fast <= prev_slow and curr_fast > curr_slow:
                     signals.iloc[i] = 1
                     logger.debug(
-                        f"Buy signal at {data.index[i]}: "
-                        f"Fast SMA ({curr_fast:.2f}) crossed above Slow SMA ({curr_slow:.2f})"
+                        "Buy signal at %s: Fast SMA (%.2f) crossed above Slow SMA (%.2f)",
+                        data.index[i], curr_fast, curr_slow,
                     )
 
                 # Bearish crossover (death cross)
                 elif prev_fast >= prev_slow and curr_fast < curr_slow:
                     signals.iloc[i] = -1
                     logger.debug(
-                        f"Sell signal at {data.index[i]}: "
-                        f"Fast SMA ({curr_fast:.2f}) crossed below Slow SMA ({curr_slow:.2f})"
+                        "Sell signal at %s: Fast SMA (%.2f) crossed below Slow SMA (%.2f)",
+                        data.index[i], curr_fast, curr_slow,
                     )
 
         return signals
@@ -148,91 +150,65 @@ class SMACrossoverStrategy(BaseStrategy):
         slow_range: Tuple[int, int] = (40, 100),
         metric: str = "sharpe",
     ) -> Dict:
-        """Optimize strategy parameters using grid search with Optuna integration.
+        """Optimize strategy parameters using Optuna, or a vectorized grid search fallback.
 
         Args:
             data: Historical data for optimization
             fast_range: Range for fast period
             slow_range: Range for slow period
-            metric: Optimization metric
+            metric: Optimization metric ("sharpe" or "total_return")
 
         Returns:
             Optimal parameters
         """
+        data = self.prepare_data(data)
+        close = data["close"]
+        grid_metric = "total_return" if metric == "total_return" else "sharpe"
+
         try:
             import optuna
 
             def objective(trial):
                 """Optuna objective function."""
-                fast = trial.suggest_int('fast_period', fast_range[0], fast_range[1])
-                slow = trial.suggest_int('slow_period', slow_range[0], slow_range[1])
-
-                if fast >= slow:
-                    return -999999  # Invalid parameter combination
-
-                # Create temporary strategy with trial parameters
-                temp_strategy = SMACrossoverStrategy(fast_period=fast, slow_period=slow)
-
-                # Generate signals for the trial
-                signals = temp_strategy.generate_signals(data)
-
-                # Calculate the metric for optimization
-                if metric == "sharpe_ratio":
-                    returns = data['Close'].pct_change().fillna(0)
-                    strategy_returns = (signals['position'].shift(1) * returns).fillna(0)
-                    if strategy_returns.std() == 0:
-                        return -999999
-                    result = strategy_returns.mean() / strategy_returns.std() * np.sqrt(252)
-                elif metric == "total_return":
-                    returns = data['Close'].pct_change().fillna(0)
-                    strategy_returns = (signals['position'].shift(1) * returns).fillna(0)
-                    result = (1 + strategy_returns).prod() - 1
-                else:
-                    # Default to Sharpe ratio
-                    returns = data['Close'].pct_change().fillna(0)
-                    strategy_returns = (signals['position'].shift(1) * returns).fillna(0)
-                    if strategy_returns.std() == 0:
-                        return -999999
-                    result = strategy_returns.mean() / strategy_returns.std() * np.sqrt(252)
-
-                return result if not np.isnan(result) else -999999
+                fast = trial.suggest_int("fast_period", fast_range[0], fast_range[1])
+                slow = trial.suggest_int("slow_period", slow_range[0], slow_range[1])
+
+                score = sma_grid_search(close, [fast], [slow], metric=grid_metric).iat[0, 0]
+
+                # Invalid combinations (fast >= slow) and flat returns score as NaN
+                return score if not np.isnan(score) else -999999
 
             # Run optimization
-            study = optuna.create_study(direction='maximize')
+            study = optuna.create_study(direction="maximize")
             study.optimize(objective, n_trials=50, show_progress_bar=False)
 
             best_params = study.best_params
             logger.info(f"Optimization complete. Best {metric}: {study.best_value:.4f}")
-            logger.info(f"Best parameters: fast={best_params['fast_period']}, slow={best_params['slow_period']}")
+            logger.info(
+                f"Best parameters: fast={best_params['fast_period']}, "
+                f"slow={best_params['slow_period']}"
+            )
 
             return best_params
 
         except ImportError:
             logger.warning("Optuna not available. Using grid search fallback.")
 
-            # Fallback to simple grid search
-            best_score = -999999
-            best_params = {"fast_period": self.fast_period, "slow_period": self.slow_period}
-
-            for fast in range(fast_range[0], fast_range[1] + 1, 2):
-                for slow in range(slow_range[0], slow_range[1] + 1, 5):
-                    if fast >= slow:
-                        continue
-
-                    temp_strategy = SMACrossoverStrategy(fast_period=fast, slow_period=slow)
-                    signals = temp_strategy.generate_signals(data)
-
-                    returns = data['Close'].pct_change().fillna(0)
-                    strategy_returns = (signals['position'].shift(1) * returns).fillna(0)
-
-                    if strategy_returns.std() == 0:
-                        continue
-
-                    score = strategy_returns.mean() / strategy_returns.std() * np.sqrt(252)
+            # Score the whole grid at once
+            scores = sma_grid_search(
+                close,
+                range(fast_range[0], fast_range[1] + 1, 2),
+                range(slow_range[0], slow_range[1] + 1, 5),
+                metric=grid_metric,
+            )
 
-                    if score > best_score:
-                        best_score = score
-                        best_params = {"fast_period": fast, "slow_period": slow}
+            try:
+                best_params = best_grid_params(scores)
+                best_score = scores.loc[best_params["fast_period"], best_params["slow_period"]]
+            except ValueError:
+                # No valid combination (e.g. too little data); keep the current periods
+                best_params = {"fast_period": self.fast_period, "slow_period": self.slow_period}
+                best_score = float("nan")
 
             logger.info(f"Grid search complete. Best {metric}: {best_score:.4f}")
             logger.info(f"Best parameters: {best_params}")
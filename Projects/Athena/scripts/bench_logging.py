@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Benchmark logging overhead per backtest at different levels and handler modes.
+
+Logging is configured once per process, so each mode runs in a child process
+with its own LOG_LEVEL and LOG_ASYNC; log output goes to /dev/null.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+MODES = {
+    "WARNING (filtered)": {"LOG_LEVEL": "WARNING", "LOG_ASYNC": "false"},
+    "INFO sync": {"LOG_LEVEL": "INFO", "LOG_ASYNC": "false"},
+    "INFO async": {"LOG_LEVEL": "INFO", "LOG_ASYNC": "true"},
+    "DEBUG sync": {"LOG_LEVEL": "DEBUG", "LOG_ASYNC": "false"},
+    "DEBUG async": {"LOG_LEVEL": "DEBUG", "LOG_ASYNC": "true"},
+}
+
+
+def measure(runs: int, calls: int) -> dict:
+    """Time backtests and single log calls under the current configuration."""
+    import numpy as np
+    import pandas as pd
+
+    from athena.backtest.engine import BacktestEngine
+    from athena.core.logging import get_logger, shutdown_logging
+    from athena.strategies.momentum import MomentumStrategy
+
+    dates = pd.date_range(start="2015-01-01", periods=2000, freq="D")
+    prices = 100 * np.exp(np.cumsum(np.random.default_rng(7).normal(0, 0.02, len(dates))))
+    data = pd.DataFrame(
+        {"open": prices, "high": prices * 1.01, "low": prices * 0.99,
+         "close": prices, "volume": 1_000_000},
+        index=dates,
+    )
+    engine = BacktestEngine(initial_capital=100000, commission=0.001)
+    strategy = MomentumStrategy()
+    engine.run(strategy, data, "BENCH")
+
+    start = time.perf_counter()
+    for _ in range(runs):
+        engine.run(strategy, data, "BENCH")
+    backtest_ms = (time.perf_counter() - start) / runs * 1000
+
+    logger = get_logger("bench")
+    timings = {}
+    for level in ("debug", "info"):
+        log = getattr(logger, level)
+        start = time.perf_counter_ns()
+        for i in range(calls):
+            log("Signal at %s: RSI=%.1f", i, 55.5)
+        timings[f"{level}_ns"] = (time.perf_counter_ns() - start) / calls
+
+    start = time.perf_counter()
+    shutdown_logging()
+    drain_ms = (time.perf_counter() - start) * 1000
+
+    return {"backtest_ms": backtest_ms, "drain_ms": drain_ms, **timings}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=20, help="Backtests per mode")
+    parser.add_argument("--calls", type=int, default=2000, help="Log calls per level")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure(args.runs, args.calls)))
+        return
+
+    print(f"{'mode':<20} {'ms/backtest':>12} {'debug ns':>10} {'info ns':>10} {'drain ms':>10}")
+    for mode, env in MODES.items():
+        output = subprocess.run(
+            [sys.executable, __file__, "--child", "--runs", str(args.runs),
+             "--calls", str(args.calls)],
+            env={**os.environ, **env},
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            check=True,
+            text=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        print(
+            f"{mode:<20} {result['backtest_ms']:12.2f} {result['debug_ns']:10.0f} "
+            f"{result['info_ns']:10.0f} {result['drain_ms']:10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Benchmark SimulatedBroker order matching throughput."""
+
+import argparse
+import random
+import time
+
+from athena.core.types import Order, OrderSide, OrderStatus, OrderType
+from athena.live.broker import SimulatedBroker
+
+
+def make_orders(count: int, mid: float, rng: random.Random) -> list:
+    """Generate a mix of limit, stop and stop-limit orders around a mid price."""
+    orders = []
+    for _ in range(count):
+        side = rng.choice((OrderSide.BUY, OrderSide.SELL))
+        order_type = rng.choices(
+            (OrderType.LIMIT, OrderType.STOP, OrderType.STOP_LIMIT), weights=(6, 2, 2)
+        )[0]
+        offset = rng.uniform(0.001, 0.05) * mid
+        # Limits rest on the passive side; stops trigger on breakouts
+        passive = mid - offset if side == OrderSide.BUY else mid + offset
+        breakout = mid + offset if side == OrderSide.BUY else mid - offset
+
+        orders.append(
+            Order(
+                symbol="BENCH",
+                side=side,
+                quantity=rng.randint(1, 100),
+                order_type=order_type,
+                price=passive if order_type == OrderType.LIMIT else breakout,
+                stop_price=breakout if order_type != OrderType.LIMIT else None,
+            )
+        )
+    return orders
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, default=100_000, help="Orders to submit")
+    parser.add_argument("--ticks", type=int, default=50_000, help="Price ticks to replay")
+    parser.add_argument("--volume", type=float, default=500, help="Volume per tick")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    broker = SimulatedBroker(initial_capital=1e12)
+    broker.connect()
+    broker.set_mock_price("BENCH", 100.0)
+
+    orders = make_orders(args.orders, 100.0, rng)
+    start = time.perf_counter()
+    for order in orders:
+        broker.place_order(order)
+    place_seconds = time.perf_counter() - start
+
+    price = 100.0
+    start = time.perf_counter()
+    for _ in range(args.ticks):
+        price = max(1.0, price * (1 + rng.gauss(0, 0.002)))
+        broker.set_mock_price("BENCH", price, volume=args.volume)
+    tick_seconds = time.perf_counter() - start
+
+    filled = sum(order.status == OrderStatus.FILLED for order in orders)
+    partial = sum(order.status == OrderStatus.PARTIALLY_FILLED for order in orders)
+
+    print(f"Placed {args.orders:,} orders in {place_seconds:.2f}s "
+          f"({args.orders / place_seconds:,.0f} orders/sec)")
+    print(f"Replayed {args.ticks:,} ticks in {tick_seconds:.2f}s "
+          f"({args.ticks / tick_seconds:,.0f} ticks/sec)")
+    print(f"Fills: {len(broker.trades):,} trades, {filled:,} orders filled, {partial:,} partial, "
+          f"{len(broker.books['BENCH']):,} still resting")
+
+
+if __name__ == "__main__":
+    main()
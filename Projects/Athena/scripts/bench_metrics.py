@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Benchmark per-event overhead of metric recording on the trading hot path."""
+
+import argparse
+import time
+from typing import Callable, Optional
+
+from athena.ops import prometheus_exporter
+from athena.ops.prometheus_exporter import (
+    PROMETHEUS_AVAILABLE,
+    DeferredRecorder,
+    PrometheusExporter,
+    record_metric,
+)
+
+
+def per_event_ns(func: Callable[[], None], events: int,
+                 drain: Optional[Callable[[], int]] = None, batch: int = 1000) -> float:
+    """Average nanoseconds per call, draining queued events between untimed batches.
+
+    Draining keeps the queue as short as the background flusher would, so the
+    measurement is not dominated by garbage collection over a huge backlog.
+    """
+    elapsed = 0
+    for _ in range(max(1, events // batch)):
+        start = time.perf_counter_ns()
+        for _ in range(batch):
+            func()
+        elapsed += time.perf_counter_ns() - start
+        if drain is not None:
+            drain()
+    return elapsed / (max(1, events // batch) * batch)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=200_000, help="Events per measurement")
+    args = parser.parse_args()
+
+    order = {"symbol": "AAPL", "side": "buy", "order_type": "market", "status": "filled"}
+
+    def record_order():
+        record_metric("order", broker="bench", data=order)
+
+    recorder = DeferredRecorder(lambda metric_type, kwargs: None)
+    kwargs = {"broker": "bench", "data": order}
+    submit_ns = per_event_ns(lambda: recorder.submit("order", kwargs), args.events, recorder.flush)
+    print(f"DeferredRecorder.submit:   {submit_ns:8.0f} ns/event")
+
+    if not PROMETHEUS_AVAILABLE:
+        print("prometheus_client not installed; record_metric is a no-op:")
+        print(f"record_metric (disabled):  {per_event_ns(record_order, args.events):8.0f} ns/event")
+        return
+
+    from prometheus_client import CollectorRegistry
+
+    exporter = PrometheusExporter(registry=CollectorRegistry())
+    prometheus_exporter._exporter = exporter
+
+    print(f"record_metric (inline):    {per_event_ns(record_order, args.events):8.0f} ns/event")
+
+    exporter.deferred = DeferredRecorder(exporter.apply)
+    flush_ns = []
+
+    def timed_flush() -> int:
+        start = time.perf_counter_ns()
+        flushed = exporter.deferred.flush()
+        flush_ns.append((time.perf_counter_ns() - start) / flushed)
+        return flushed
+
+    deferred_ns = per_event_ns(record_order, args.events, timed_flush)
+    print(f"record_metric (deferred):  {deferred_ns:8.0f} ns/event")
+    print(f"Background flush:          {sum(flush_ns) / len(flush_ns):8.0f} ns/event")
+
+
+if __name__ == "__main__":
+    main()
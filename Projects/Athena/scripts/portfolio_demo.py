@@ -17,6 +17,7 @@ import plotly.express as px
 from plotly.subplots import make_subplots
 import plotly.offline as pyo
 
+from athena.backtest.cache import BacktestCache
 from athena.backtest.engine import BacktestEngine
 from athena.backtest import metrics as backtest_metrics
 from athena.strategies.sma_crossover import SMACrossoverStrategy
@@ -45,6 +46,7 @@ class PortfolioDemo:
 
         # Results storage
         self.data_cache = {}
+        self.backtest_cache = BacktestCache()
         self.backtest_results = {}
         self.optimization_results = {}
         self.wfv_results = {}
@@ -120,12 +122,12 @@ class PortfolioDemo:
 
     def _calculate_strategy_metrics(self, result: Any) -> Dict[str, float]:
         """Calculate comprehensive strategy metrics."""
-        if result is None or not hasattr(result, 'portfolio_value'):
+        if result is None or not hasattr(result, 'equity_curve'):
             return {}
 
         try:
             # Extract data from result
-            portfolio_value = result.portfolio_value
+            portfolio_value = result.equity_curve
             if len(portfolio_value) < 2:
                 return {}
 
@@ -188,13 +190,13 @@ class PortfolioDemo:
 
                     # Run backtest
                     engine = BacktestEngine(
-                        strategy=strategy,
                         initial_capital=self.initial_capital,
-                        commission=0.001  # 10 bps
+                        commission=0.001,  # 10 bps
+                        cache=self.backtest_cache
                     )
 
                     data = self.data_cache[symbol]
-                    result = engine.run(data)
+                    result = engine.run(strategy, data, symbol)
 
                     # Calculate metrics manually
                     strategy_metrics = self._calculate_strategy_metrics(result)
@@ -352,7 +354,7 @@ class PortfolioDemo:
 
             for j, (strategy_name, result) in enumerate(self.backtest_results[symbol].items()):
                 if "result" in result and result["result"] is not None:
-                    equity_curve = result["result"]["portfolio_value"]
+                    equity_curve = result["result"].equity_curve
 
                     fig.add_trace(
                         go.Scatter(
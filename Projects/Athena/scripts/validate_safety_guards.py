@@ -597,7 +597,8 @@ class SafetyGuardValidator:
 
         try:
             # Reset rate limiter
-            self.guard._order_timestamps = []
+            self.guard._orders_last_minute.clear()
+            self.guard._orders_last_hour.clear()
 
             results = {"orders": [], "rate_limit_triggered": False}
 
@@ -618,7 +619,7 @@ class SafetyGuardValidator:
                     "order_allowed": allowed,
                     "violation_triggered": violation is not None,
                     "violation_type": violation.type.value if violation else None,
-                    "orders_this_minute": len([t for t in self.guard._order_timestamps if t > datetime.now() - timedelta(minutes=1)])
+                    "orders_this_minute": self.guard.get_status()["recent_orders"]
                 }
 
                 results["orders"].append(order_result)
@@ -0,0 +1,173 @@
+"""Tests for multi-timeframe bar aggregation."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from athena.data.bars import (
+    BarAggregator,
+    MultiTimeframeBars,
+    resample_many,
+    resample_ohlcv,
+    timeframe_to_ns,
+)
+
+
+@pytest.fixture
+def ticks():
+    """Create irregular price ticks spanning a few hours."""
+    np.random.seed(7)
+    offsets = np.sort(np.random.randint(0, 3 * 3600, 2000))
+    index = pd.Timestamp("2024-01-02 09:30") + pd.to_timedelta(offsets, unit="s")
+    prices = 100 + np.cumsum(np.random.randn(2000) * 0.05)
+    return pd.DataFrame({"price": prices}, index=index)
+
+
+def pandas_resample(ticks: pd.DataFrame, rule: str) -> pd.DataFrame:
+    """Reference implementation using pandas resample."""
+    ohlcv = ticks.resample(rule).agg({"price": ["first", "max", "min", "last", "count"]})
+    ohlcv.columns = ["open", "high", "low", "close", "volume"]
+    ohlcv = ohlcv.dropna()
+    ohlcv["volume"] = ohlcv["volume"].astype(float)
+    return ohlcv
+
+
+class TestTimeframes:
+    """Test timeframe parsing."""
+
+    def test_timeframe_widths(self):
+        """Common timeframe strings resolve to fixed widths."""
+        assert timeframe_to_ns("1min") == 60 * 10**9
+        assert timeframe_to_ns("1m") == 60 * 10**9
+        assert timeframe_to_ns("1h") == 3600 * 10**9
+        assert timeframe_to_ns("1d") == 86400 * 10**9
+
+    def test_invalid_timeframe(self):
+        """Unparseable timeframes raise ValueError."""
+        with pytest.raises(ValueError):
+            timeframe_to_ns("not-a-timeframe")
+
+
+class TestBatchResample:
+    """Test vectorized resampling."""
+
+    @pytest.mark.parametrize("rule", ["1min", "5min", "1h"])
+    def test_matches_pandas_for_ticks(self, ticks, rule):
+        """Tick aggregation matches DataFrame.resample."""
+        result = resample_ohlcv(ticks, rule)
+        expected = pandas_resample(ticks, rule)
+        pd.testing.assert_frame_equal(result, expected, check_freq=False, check_names=False)
+
+    def test_bars_to_higher_timeframe(self, ticks):
+        """Resampling 1m bars to 1h equals resampling ticks to 1h directly."""
+        minute_bars = resample_ohlcv(ticks, "1min")
+        hourly_from_bars = resample_ohlcv(minute_bars, "1h")
+        hourly_from_ticks = resample_ohlcv(ticks, "1h")
+        pd.testing.assert_frame_equal(hourly_from_bars, hourly_from_ticks)
+
+    def test_resample_many(self, ticks):
+        """Several timeframes can be built from one source."""
+        views = resample_many(ticks, ["1min", "15min", "1h"])
+        assert set(views) == {"1min", "15min", "1h"}
+        assert views["1h"]["volume"].sum() == len(ticks)
+
+    def test_views_are_memoized(self, ticks):
+        """Views are computed once and handed out as independent copies."""
+        views = MultiTimeframeBars(ticks)
+        first = views.to_frame("1h")
+        first["close"] = 0.0
+
+        assert len(views._views) == 1
+        assert (views.to_frame("1h")["close"] > 0).all()
+
+    def test_closed_view_has_no_lookahead(self, ticks):
+        """Aligned onto the source rows, the closed view only shows finished bars."""
+        views = MultiTimeframeBars(ticks)
+        hourly = views.to_frame("1h")
+        closed = views.to_frame("1h", include_partial=False)
+
+        pd.testing.assert_frame_equal(closed, hourly.shift(1).iloc[1:])
+        # Every row sees the bar that ended when its own hour started (none in the first)
+        aligned = closed["close"].reindex(ticks.index, method="ffill")
+        previous_hour = ticks.index.floor("1h") - pd.Timedelta("1h")
+        np.testing.assert_array_equal(
+            aligned.to_numpy(), hourly["close"].reindex(previous_hour).to_numpy()
+        )
+
+    def test_empty_frame(self):
+        """Empty input yields an empty OHLCV frame."""
+        result = resample_ohlcv(pd.DataFrame({"price": []}, index=pd.DatetimeIndex([])), "1min")
+        assert result.empty
+        assert list(result.columns) == ["open", "high", "low", "close", "volume"]
+
+
+class TestBarAggregator:
+    """Test streaming aggregation."""
+
+    def test_streaming_matches_batch(self, ticks):
+        """Streaming all ticks produces the same bars as batch resampling."""
+        aggregator = BarAggregator(["1min", "1h"], max_bars=1000)
+        for timestamp, price in ticks["price"].items():
+            aggregator.update_tick(timestamp, price)
+
+        for rule in ["1min", "1h"]:
+            pd.testing.assert_frame_equal(
+                aggregator.to_frame(rule), resample_ohlcv(ticks, rule), check_freq=False
+            )
+
+    def test_closed_bars_reported(self):
+        """Crossing a bucket boundary reports the closed bar."""
+        aggregator = BarAggregator(["1min"])
+        start = pd.Timestamp("2024-01-01 10:00:00")
+
+        assert aggregator.update_tick(start, 100.0) == []
+        assert aggregator.update_tick(start + pd.Timedelta(seconds=30), 101.0) == []
+        closed = aggregator.update_tick(start + pd.Timedelta(seconds=61), 99.0)
+
+        assert len(closed) == 1
+        assert closed[0].open == 100.0
+        assert closed[0].high == 101.0
+        assert closed[0].close == 101.0
+        assert closed[0].volume == 2
+
+    def test_frame_cached_until_update(self):
+        """Frames are reused until a new tick arrives."""
+        aggregator = BarAggregator(["1min"])
+        aggregator.update_tick(pd.Timestamp("2024-01-01 10:00"), 100.0)
+
+        first = aggregator.to_frame("1min")
+        cached = aggregator._frames[pd.Timedelta("1min").value][1]
+        first["close"] = 0.0  # Callers get copies and cannot corrupt the cache
+        aggregator.to_frame("1min")
+        assert aggregator._frames[pd.Timedelta("1min").value][1] is cached
+        assert cached["close"].iloc[-1] == 100.0
+
+        aggregator.update_tick(pd.Timestamp("2024-01-01 10:00:30"), 100.5)
+        aggregator.to_frame("1min")
+        assert aggregator._frames[pd.Timedelta("1min").value][1] is not cached
+
+    def test_max_bars_bounds_memory(self):
+        """Only the most recent closed bars are retained."""
+        aggregator = BarAggregator(["1min"], max_bars=5)
+        start = pd.Timestamp("2024-01-01")
+        for i in range(20):
+            aggregator.update_tick(start + pd.Timedelta(minutes=i), float(i))
+
+        frame = aggregator.to_frame("1min", include_partial=False)
+        assert len(frame) == 5
+        assert frame["close"].iloc[-1] == 18.0
+
+    def test_late_ticks_ignored(self):
+        """Ticks older than the open bar do not mutate emitted bars."""
+        aggregator = BarAggregator(["1min"])
+        aggregator.update_tick(pd.Timestamp("2024-01-01 10:05"), 100.0)
+        aggregator.update_tick(pd.Timestamp("2024-01-01 10:01"), 50.0)
+
+        assert aggregator.late_updates == 1
+        assert aggregator.to_frame("1min")["low"].min() == 100.0
+
+    def test_unknown_timeframe(self):
+        """Requesting an unmaintained timeframe raises KeyError."""
+        aggregator = BarAggregator(["1min"])
+        with pytest.raises(KeyError):
+            aggregator.to_frame("1h")
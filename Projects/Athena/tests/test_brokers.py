@@ -0,0 +1,720 @@
+"""Tests for broker transports, rate limiting, batch orders, matching and accounting."""
+
+import asyncio
+import json
+import math
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import aiohttp
+import pytest
+
+from athena.core.histogram import LogHistogram
+from athena.core.types import Order, OrderSide, OrderStatus, OrderType
+from athena.live.binance_testnet import BinanceTestnetBroker
+from athena.live.broker import SimulatedBroker
+from athena.live.brokers import BinanceBroker, BrokerConfig, InteractiveBroker
+from athena.live.http import AsyncHTTPTransport
+from athena.live.order_book import OrderBook
+from athena.live.rate_limit import TokenBucket, get_shared_bucket, reset_shared_buckets
+
+
+class MockExchangeHandler(BaseHTTPRequestHandler):
+    """Minimal Binance-like REST API speaking keep-alive HTTP/1.1."""
+
+    protocol_version = "HTTP/1.1"
+    order_counter = 0
+
+    def _send_json(self, status: int, payload: dict) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        if url.path == "/api/v3/time":
+            self._send_json(200, {"serverTime": 1700000000000})
+        elif url.path == "/api/v3/ticker/price":
+            self._send_json(200, {"symbol": query["symbol"][0], "price": "42000.50"})
+        else:
+            self._send_json(404, {"msg": "not found"})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        if url.path == "/api/v3/order" and "timestamp" in query:
+            MockExchangeHandler.order_counter += 1
+            self._send_json(200, {"orderId": MockExchangeHandler.order_counter})
+        else:
+            self._send_json(400, {"msg": "bad request"})
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def mock_exchange():
+    """Run the mock exchange on an ephemeral port."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockExchangeHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestLogHistogram:
+    """Test log-bucketed latency percentiles."""
+
+    def test_percentiles_within_precision(self):
+        """Tail percentiles stay within the configured relative error."""
+        rng = random.Random(7)
+        samples = sorted(rng.lognormvariate(1, 1.5) for _ in range(20000))
+        histogram = LogHistogram(precision=0.01)
+        for sample in samples:
+            histogram.record(sample)
+
+        for percentile, value in histogram.percentiles().items():
+            exact = samples[math.ceil(percentile / 100 * len(samples)) - 1]
+            assert value == pytest.approx(exact, rel=0.011)
+        assert histogram.mean == pytest.approx(sum(samples) / len(samples))
+        assert histogram.max == samples[-1]
+
+    def test_out_of_range_values_clamp(self):
+        """Values beyond the range land in edge buckets but keep exact extremes."""
+        histogram = LogHistogram(lowest=1, highest=100)
+        for value in (0.0, 0.5, 1e6):
+            histogram.record(value)
+
+        assert histogram.percentile(0) == 0.0
+        assert histogram.percentile(100) == 1e6
+        assert histogram.summary()["min"] == 0.0
+
+    def test_merge_and_reset(self):
+        """Merged histograms combine counts; layouts must match."""
+        first, second = LogHistogram(), LogHistogram()
+        first.record(1.0)
+        second.record(100.0)
+        first.merge(second)
+
+        assert len(first) == 2
+        assert first.percentile(100) == 100.0
+        with pytest.raises(ValueError):
+            first.merge(LogHistogram(precision=0.1))
+
+        first.reset()
+        assert first.summary() == {"count": 0, "mean": 0.0, "min": 0.0, "max": 0.0,
+                                   "p50": 0.0, "p90": 0.0, "p99": 0.0, "p999": 0.0}
+
+    def test_no_percentiles_requested(self):
+        """Asking for no percentiles gives an empty result, recorded or not."""
+        histogram = LogHistogram()
+        assert histogram.percentiles([]) == {}
+
+        histogram.record(5.0)
+        assert histogram.percentiles([]) == {}
+
+    def test_memory_is_fixed(self):
+        """Recording more samples never grows the bucket array."""
+        histogram = LogHistogram()
+        size = len(histogram._counts)
+        for i in range(10000):
+            histogram.record(i * 0.37)
+
+        assert len(histogram._counts) == size
+
+    def test_broker_latency_telemetry(self):
+        """Brokers expose mean, max and tail latency in their health check."""
+        broker = InteractiveBroker(BrokerConfig())
+        for latency in [1.0] * 990 + [250.0] * 10:
+            broker.record_latency(latency)
+
+        metrics = asyncio.run(broker.health_check())["metrics"]
+
+        assert metrics["avg_latency_ms"] == pytest.approx(3.49)
+        assert metrics["max_latency_ms"] == 250.0
+        assert metrics["p50_latency_ms"] == pytest.approx(1.0, abs=0.02)
+        assert metrics["p99_latency_ms"] == pytest.approx(1.0, abs=0.02)
+        assert metrics["p999_latency_ms"] == pytest.approx(250.0, rel=0.01)
+
+
+class TestAsyncHTTPTransport:
+    """Test the pooled async transport."""
+
+    def test_connection_reused_across_requests(self, mock_exchange):
+        """Sequential requests share one keep-alive connection."""
+
+        async def run():
+            async with AsyncHTTPTransport(mock_exchange) as transport:
+                for _ in range(10):
+                    await transport.request("GET", "/api/v3/time")
+                return transport.connections_opened, transport.get_latency_stats()
+
+        connections, stats = asyncio.run(run())
+
+        assert connections == 1
+        assert stats["GET /api/v3/time"]["count"] == 10
+        assert 0 < stats["GET /api/v3/time"]["p50"] <= stats["GET /api/v3/time"]["max"]
+
+    def test_concurrent_requests_bounded_by_pool(self, mock_exchange):
+        """Concurrent requests never open more sockets than the pool allows."""
+
+        async def run():
+            async with AsyncHTTPTransport(mock_exchange, max_connections=3) as transport:
+                await asyncio.gather(
+                    *(transport.request("GET", "/api/v3/time") for _ in range(20))
+                )
+                return transport.connections_opened
+
+        assert asyncio.run(run()) <= 3
+
+    def test_http_error_raises(self, mock_exchange):
+        """Non-2xx responses raise and are still timed."""
+
+        async def run():
+            async with AsyncHTTPTransport(mock_exchange) as transport:
+                with pytest.raises(aiohttp.ClientResponseError):
+                    await transport.request("GET", "/missing")
+                return transport.get_latency_stats()
+
+        assert asyncio.run(run())["GET /missing"]["count"] == 1
+
+
+class TestBinanceTestnetAsync:
+    """Test BinanceTestnetBroker async calls against the mock exchange."""
+
+    @pytest.fixture
+    def broker(self, mock_exchange):
+        broker = BinanceTestnetBroker(api_key="key", secret_key="secret", testnet_url=mock_exchange)
+        broker.connected = True
+        return broker
+
+    def test_price_and_order_share_pool(self, broker):
+        """Price lookups and orders reuse the broker's pooled connection."""
+
+        async def run():
+            price = await broker.get_current_price_async("BTC/USDT")
+            order = Order(
+                symbol="BTC/USDT",
+                side=OrderSide.BUY,
+                quantity=0.01,
+                order_type=OrderType.MARKET,
+            )
+            order_id = await broker.place_order_async(order)
+            await broker.aclose()
+            return price, order, order_id
+
+        price, order, order_id = asyncio.run(run())
+
+        assert price == 42000.50
+        assert order.order_id == order_id
+        assert order.status == OrderStatus.PENDING
+        assert broker.orders[order_id] is order
+        assert broker.transport.connections_opened == 1
+        assert set(broker.get_latency_stats()) == {
+            "GET /api/v3/ticker/price",
+            "POST /api/v3/order",
+        }
+
+    def test_disconnect_closes_pool(self, broker):
+        """The blocking disconnect also closes the async connection pool."""
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(broker.get_current_price_async("BTC/USDT"))
+            session = broker.transport.session
+
+            broker.disconnect()
+
+            assert session.closed
+            assert broker.transport.session is None
+        finally:
+            loop.close()
+
+    def test_disconnect_inside_loop_closes_pool(self, broker):
+        """Disconnecting from a coroutine schedules the pool close on the running loop."""
+
+        async def run():
+            await broker.get_current_price_async("BTC/USDT")
+            session = broker.transport.session
+            broker.disconnect()
+            await asyncio.sleep(0)
+            return session
+
+        assert asyncio.run(run()).closed
+
+    def test_sync_requests_use_session(self, broker):
+        """Blocking calls go through the broker's persistent requests.Session."""
+        assert broker.get_current_price("ETH/USDT") == 42000.50
+        assert broker.session.headers["X-MBX-APIKEY"] == "key"
+
+    def test_failed_orders_are_not_resent(self, broker, monkeypatch):
+        """A failed order request is sent once, since it may have reached the exchange."""
+        calls = []
+
+        def fail(*args, **kwargs):
+            calls.append(args)
+            raise ConnectionError("timed out")
+
+        async def fail_async(*args, **kwargs):
+            fail(*args, **kwargs)
+
+        monkeypatch.setattr(broker.session, "request", fail)
+        monkeypatch.setattr(broker.transport, "request", fail_async)
+        order = Order(
+            symbol="BTC/USDT", side=OrderSide.BUY, quantity=0.01, order_type=OrderType.MARKET
+        )
+
+        with pytest.raises(Exception):
+            broker.place_order(order)
+        with pytest.raises(Exception):
+            asyncio.run(broker.place_order_async(order))
+
+        assert [call[0] for call in calls] == ["POST", "POST"]
+        assert broker.orders == {}
+
+
+class TestTokenBucket:
+    """Test the async token-bucket rate limiter."""
+
+    @pytest.fixture(autouse=True)
+    def clean_registry(self):
+        reset_shared_buckets()
+        yield
+        reset_shared_buckets()
+
+    def test_burst_is_immediate(self):
+        """Requests up to the burst capacity do not wait."""
+
+        async def run():
+            bucket = TokenBucket(rate=10, capacity=5)
+            start = time.monotonic()
+            await asyncio.gather(*(bucket.acquire() for _ in range(5)))
+            return time.monotonic() - start
+
+        assert asyncio.run(run()) < 0.05
+
+    def test_rate_enforced_beyond_burst(self):
+        """Once the burst is spent, tokens arrive at the configured rate."""
+
+        async def run():
+            bucket = TokenBucket(rate=50, capacity=5)
+            start = time.monotonic()
+            await asyncio.gather(*(bucket.acquire() for _ in range(10)))
+            return time.monotonic() - start
+
+        # 5 extra tokens at 50/s take ~0.1s
+        assert 0.08 < asyncio.run(run()) < 0.5
+
+    def test_weights_consume_budget(self):
+        """A heavy request consumes several tokens at once."""
+        bucket = TokenBucket(rate=1, capacity=20)
+
+        assert bucket.try_acquire(20)
+        assert not bucket.try_acquire(1)
+
+    def test_weight_above_capacity_rejected(self):
+        """Requests that can never fit raise ValueError."""
+        with pytest.raises(ValueError):
+            asyncio.run(TokenBucket(rate=1, capacity=5).acquire(10))
+
+    def test_waiters_served_in_order(self):
+        """A heavy waiter is not starved by later light requests."""
+
+        async def run():
+            bucket = TokenBucket(rate=100, capacity=10)
+            bucket.try_acquire(10)
+            order = []
+
+            async def request(name, weight):
+                await bucket.acquire(weight)
+                order.append(name)
+
+            heavy = asyncio.create_task(request("heavy", 10))
+            await asyncio.sleep(0)
+            light = [asyncio.create_task(request(f"light{i}", 1)) for i in range(3)]
+            await asyncio.gather(heavy, *light)
+            return order
+
+        assert asyncio.run(run())[0] == "heavy"
+
+    def test_shared_bucket_registry(self):
+        """The same key returns the same bucket."""
+        assert get_shared_bucket("x", 10) is get_shared_bucket("x", 10)
+        assert get_shared_bucket("x", 10) is not get_shared_bucket("y", 10)
+
+    def test_brokers_with_same_key_share_budget(self):
+        """Broker instances for one API key draw from one bucket with endpoint weights."""
+        config = BrokerConfig(api_key="k", rate_limit=600, rate_limit_burst=30)
+        first, second = BinanceBroker(config), BinanceBroker(config)
+
+        assert first._rate_limiter is second._rate_limiter
+
+        asyncio.run(first._check_rate_limit("/api/v3/ticker/bookTicker"))
+        assert second._rate_limiter.available < 29
+
+    def test_default_burst_fits_heaviest_endpoint(self):
+        """Low per-minute limits still leave room for the heaviest endpoint weight."""
+        config = BrokerConfig(
+            api_key="low", rate_limit=300, endpoint_weights={"/api/v3/ticker/bookTicker": 20}
+        )
+        broker = BinanceBroker(config)
+
+        assert broker._rate_limiter.capacity == 20
+        asyncio.run(broker._check_rate_limit("/api/v3/ticker/bookTicker"))
+
+    def test_default_burst_sized_from_charged_endpoints(self):
+        """The default burst only accounts for endpoints the broker actually charges."""
+        broker = BinanceBroker(BrokerConfig(api_key="charged", rate_limit=60))
+
+        assert broker._rate_limiter.capacity == 2  # bookTicker
+
+    def test_broker_orders_rate_limited(self):
+        """Simulated broker order calls go through the limiter."""
+        config = BrokerConfig(rate_limit=60, rate_limit_burst=2, rate_limit_key="ib-test")
+        broker = InteractiveBroker(config)
+
+        async def run():
+            order = Order(symbol="AAPL", side=OrderSide.BUY, quantity=1,
+                          order_type=OrderType.MARKET)
+            await broker.place_order(order)
+            await broker.place_order(order)
+            return await broker.health_check()
+
+        health = asyncio.run(run())
+        assert health["rate_limit"]["total_acquired"] == 2
+        assert health["rate_limit"]["available"] < 1
+
+    def test_no_limit_configured(self):
+        """Without a configured rate limit, checks are free."""
+        broker = InteractiveBroker(BrokerConfig())
+        assert broker._rate_limiter is None
+        asyncio.run(broker._check_rate_limit("placeOrder"))
+
+
+def make_orders(n, symbol="AAPL"):
+    """Create n market buy orders."""
+    return [
+        Order(symbol=symbol, side=OrderSide.BUY, quantity=1, order_type=OrderType.MARKET)
+        for _ in range(n)
+    ]
+
+
+class TestBatchOrders:
+    """Test place_orders on both broker hierarchies."""
+
+    def test_async_batch_runs_concurrently(self):
+        """Orders overlap up to the concurrency limit instead of running back to back."""
+        broker = InteractiveBroker(BrokerConfig(max_concurrent_orders=5))
+
+        async def run():
+            start = time.monotonic()
+            results = await broker.place_orders(make_orders(10))
+            return results, time.monotonic() - start
+
+        results, elapsed = asyncio.run(run())
+
+        # Each simulated IB order takes 0.1s; sequential submission would take 1s
+        assert elapsed < 0.6
+        assert all(result.success for result in results)
+        assert len({result.order.order_id for result in results}) == 10
+        assert all(result.latency_ms >= 100 for result in results)
+
+    def test_async_batch_reports_failures(self):
+        """A failing order does not abort the rest of the batch."""
+        broker = InteractiveBroker(BrokerConfig())
+        original = broker.place_order
+
+        async def flaky(order):
+            if order.symbol == "BAD":
+                raise RuntimeError("rejected by venue")
+            return await original(order)
+
+        broker.place_order = flaky
+        orders = make_orders(2) + make_orders(1, symbol="BAD")
+
+        results = asyncio.run(broker.place_orders(orders))
+
+        assert [result.success for result in results] == [True, True, False]
+        assert results[2].error == "rejected by venue"
+        assert results[2].order is orders[2]
+
+    def test_sync_batch(self):
+        """The sync broker API returns one result per order."""
+        broker = SimulatedBroker()
+        broker.connect()
+
+        results = broker.place_orders(make_orders(3))
+
+        assert all(result.success for result in results)
+        assert all(result.order.status == OrderStatus.FILLED for result in results)
+        assert len(broker.trades) == 3
+
+    def test_sync_batch_not_connected(self):
+        """Errors are captured per order."""
+        results = SimulatedBroker().place_orders(make_orders(2))
+
+        assert not any(result.success for result in results)
+        assert results[0].error == "Broker not connected"
+
+    def test_testnet_batch_uses_pool(self, mock_exchange):
+        """Testnet batches share pooled connections."""
+        broker = BinanceTestnetBroker(api_key="key", secret_key="secret", testnet_url=mock_exchange)
+        broker.connected = True
+
+        async def run():
+            results = await broker.place_orders_async(make_orders(8, "BTC/USDT"), 4)
+            await broker.aclose()
+            return results
+
+        results = asyncio.run(run())
+
+        assert all(result.success for result in results)
+        assert len(broker.orders) == 8
+        assert broker.transport.connections_opened <= 4
+
+
+def make_order(side, order_type, quantity=10, price=None, stop_price=None, symbol="AAPL"):
+    """Create an order of any type."""
+    return Order(symbol=symbol, side=side, quantity=quantity, order_type=order_type,
+                 price=price, stop_price=stop_price)
+
+
+class TestMatchingEngine:
+    """Test limit/stop matching in SimulatedBroker."""
+
+    @pytest.fixture
+    def broker(self):
+        broker = SimulatedBroker(commission=0.0, slippage=0.0)
+        broker.connect()
+        broker.set_mock_price("AAPL", 100.0)
+        return broker
+
+    def test_limit_rests_until_price_reached(self, broker):
+        """A passive buy limit fills at its limit once the price trades through it."""
+        order = make_order(OrderSide.BUY, OrderType.LIMIT, price=99.0)
+        broker.place_order(order)
+        assert order.status == OrderStatus.PENDING
+
+        broker.set_mock_price("AAPL", 99.5)
+        assert order.status == OrderStatus.PENDING
+
+        broker.set_mock_price("AAPL", 98.0)
+        assert order.status == OrderStatus.FILLED
+        assert order.filled_price == 98.0  # Gap-through fills at the better price
+        assert broker.positions["AAPL"].quantity == 10
+
+    def test_marketable_limit_fills_on_placement(self, broker):
+        """A sell limit below the last price executes immediately at that price."""
+        order = make_order(OrderSide.SELL, OrderType.LIMIT, price=95.0)
+        broker.place_order(order)
+
+        assert order.status == OrderStatus.FILLED
+        assert order.filled_price == 100.0
+
+    def test_price_time_priority_and_partial_fills(self, broker):
+        """Better prices fill first, then earlier orders, limited by tick volume."""
+        early = make_order(OrderSide.BUY, OrderType.LIMIT, quantity=10, price=99.0)
+        late = make_order(OrderSide.BUY, OrderType.LIMIT, quantity=10, price=99.0)
+        best = make_order(OrderSide.BUY, OrderType.LIMIT, quantity=10, price=99.5)
+        for order in (early, late, best):
+            broker.place_order(order)
+
+        broker.set_mock_price("AAPL", 99.0, volume=15)
+
+        assert best.status == OrderStatus.FILLED
+        assert early.status == OrderStatus.PARTIALLY_FILLED
+        assert early.filled_quantity == 5
+        assert late.filled_quantity == 0
+
+        broker.set_mock_price("AAPL", 99.0, volume=8)
+
+        assert early.status == OrderStatus.FILLED
+        assert late.filled_quantity == 3
+        assert sum(trade.quantity for trade in broker.trades) == 23
+
+    def test_stop_triggers_market_fill(self, broker):
+        """A sell stop becomes a market order when the price falls to its trigger."""
+        broker.place_order(make_order(OrderSide.BUY, OrderType.MARKET))
+        stop = make_order(OrderSide.SELL, OrderType.STOP, stop_price=95.0)
+        broker.place_order(stop)
+
+        broker.set_mock_price("AAPL", 96.0)
+        assert stop.status == OrderStatus.PENDING
+
+        broker.set_mock_price("AAPL", 94.0)
+        assert stop.status == OrderStatus.FILLED
+        assert stop.filled_price == 94.0
+        assert "AAPL" not in broker.positions
+
+    def test_triggered_stop_uses_tick_volume(self, broker):
+        """A triggered stop takes its quantity from the tick before resting limits match."""
+        limit = make_order(OrderSide.SELL, OrderType.LIMIT, symbol="X", price=95.0)
+        stop = make_order(OrderSide.SELL, OrderType.STOP, symbol="X", stop_price=96.0)
+        broker.place_order(limit)  # No price yet, so both wait for the first tick
+        broker.place_order(stop)
+
+        broker.set_mock_price("X", 95.0, volume=12)
+
+        assert stop.status == OrderStatus.FILLED
+        assert limit.filled_quantity == 2
+
+        late = make_order(OrderSide.SELL, OrderType.LIMIT, symbol="X", quantity=5, price=94.0)
+        broker.place_order(late)
+        assert late.status == OrderStatus.PENDING  # The tick's sell volume is used up
+
+    def test_market_order_uses_tick_volume(self, broker):
+        """Market fills between ticks leave less volume for newly placed limits."""
+        broker.set_mock_price("AAPL", 100.0, volume=10)
+        broker.place_order(make_order(OrderSide.BUY, OrderType.MARKET, quantity=6))
+
+        limit = make_order(OrderSide.BUY, OrderType.LIMIT, quantity=10, price=101.0)
+        broker.place_order(limit)
+
+        assert limit.filled_quantity == 4
+
+    def test_stop_limit_rests_after_trigger(self, broker):
+        """A triggered stop-limit only fills within its limit."""
+        order = make_order(OrderSide.BUY, OrderType.STOP_LIMIT, price=105.0, stop_price=104.0)
+        broker.place_order(order)
+
+        broker.set_mock_price("AAPL", 106.0)  # Triggers, but above the limit
+        assert order.status == OrderStatus.PENDING
+        assert broker.books["AAPL"].depth() == {"bids": 1, "asks": 0, "stops": 0}
+
+        broker.set_mock_price("AAPL", 104.5)
+        assert order.status == OrderStatus.FILLED
+        assert order.filled_price == 104.5
+
+    def test_cancel_removes_from_book(self, broker):
+        """Cancelled and partially filled orders stop matching."""
+        order = make_order(OrderSide.BUY, OrderType.LIMIT, quantity=10, price=99.0)
+        broker.place_order(order)
+        broker.set_mock_price("AAPL", 99.0, volume=4)
+
+        assert broker.cancel_order(order.order_id)
+        broker.set_mock_price("AAPL", 90.0)
+
+        assert order.status == OrderStatus.CANCELLED
+        assert order.filled_quantity == 4
+        assert len(broker.books["AAPL"]) == 0
+
+    def test_placement_respects_last_tick_volume(self, broker):
+        """New orders only take the last tick's leftover volume and never refill the book."""
+        resting = make_order(OrderSide.BUY, OrderType.LIMIT, symbol="X", quantity=100, price=100.0)
+        broker.place_order(resting)
+        broker.set_mock_price("X", 100.0, volume=10)
+        assert resting.filled_quantity == 10
+
+        unrelated = make_order(OrderSide.SELL, OrderType.LIMIT, symbol="X", quantity=5, price=200.0)
+        broker.place_order(unrelated)
+        assert resting.filled_quantity == 10
+
+        late = make_order(OrderSide.BUY, OrderType.LIMIT, symbol="X", quantity=5, price=101.0)
+        broker.place_order(late)
+        assert late.status == OrderStatus.PENDING  # The tick's buy volume is used up
+
+        seller = make_order(OrderSide.SELL, OrderType.LIMIT, symbol="X", quantity=20, price=99.0)
+        broker.place_order(seller)
+        assert seller.filled_quantity == 10  # Sell side still had the tick's 10 units
+
+        broker.set_mock_price("X", 100.0, volume=50)
+        assert late.status == OrderStatus.FILLED  # Better price goes first
+        assert resting.filled_quantity == 55
+
+    def test_missing_price_rejected(self, broker):
+        """Limit orders without a limit price are rejected."""
+        order = make_order(OrderSide.BUY, OrderType.LIMIT)
+        broker.place_order(order)
+
+        assert order.status == OrderStatus.REJECTED
+
+    def test_book_best_prices(self):
+        """The book exposes best bid/ask and skips cancelled orders."""
+        book = OrderBook("AAPL")
+        orders = [
+            make_order(OrderSide.BUY, OrderType.LIMIT, price=price) for price in (98, 99)
+        ] + [make_order(OrderSide.SELL, OrderType.LIMIT, price=101)]
+        for i, order in enumerate(orders):
+            order.order_id = str(i)
+            book.add_limit(order)
+
+        assert (book.best_bid(), book.best_ask()) == (99, 101)
+        book.cancel("1")
+        assert book.best_bid() == 98
+
+
+class TestPortfolioAccounting:
+    """Test SimulatedBroker running P&L totals."""
+
+    @pytest.fixture
+    def broker(self):
+        broker = SimulatedBroker(initial_capital=10000, commission=0.0, slippage=0.0)
+        broker.connect()
+        broker.set_mock_price("AAPL", 100.0)
+        return broker
+
+    def test_realized_pnl_on_close(self, broker):
+        """Closing trades carry their realized P&L."""
+        broker.place_order(make_order(OrderSide.BUY, OrderType.MARKET, quantity=10))
+        broker.set_mock_price("AAPL", 110.0)
+        broker.place_order(make_order(OrderSide.SELL, OrderType.MARKET, quantity=4))
+
+        portfolio = broker.get_portfolio()
+        assert broker.trades[0].pnl is None
+        assert broker.trades[1].pnl == pytest.approx(40.0)
+        assert portfolio.realized_pnl == pytest.approx(40.0)
+        assert portfolio.unrealized_pnl == pytest.approx(60.0)
+        assert portfolio.total_value == pytest.approx(10100.0)
+
+    def test_flip_resets_entry_price(self, broker):
+        """Selling through a long opens a short at the trade price."""
+        broker.place_order(make_order(OrderSide.BUY, OrderType.MARKET, quantity=10))
+        broker.set_mock_price("AAPL", 90.0)
+        broker.place_order(make_order(OrderSide.SELL, OrderType.MARKET, quantity=15))
+
+        position = broker.positions["AAPL"]
+        assert position.quantity == -5
+        assert position.avg_entry_price == 90.0
+        assert broker.realized_pnl == pytest.approx(-100.0)
+
+        broker.set_mock_price("AAPL", 80.0)
+        assert broker.get_portfolio().unrealized_pnl == pytest.approx(50.0)
+
+    def test_totals_match_full_recompute(self, broker):
+        """Incremental totals agree with recomputing from positions and trades."""
+        rng = random.Random(7)
+        symbols = ["AAPL", "MSFT", "NVDA"]
+        prices = dict.fromkeys(symbols, 100.0)
+
+        for _ in range(300):
+            symbol = rng.choice(symbols)
+            prices[symbol] *= 1 + rng.uniform(-0.02, 0.02)
+            broker.set_mock_price(symbol, prices[symbol])
+            side = rng.choice((OrderSide.BUY, OrderSide.SELL))
+            broker.place_order(
+                make_order(side, OrderType.MARKET, quantity=rng.randint(1, 20), symbol=symbol)
+            )
+
+        portfolio = broker.get_portfolio()
+        positions = portfolio.positions.values()
+
+        assert portfolio.unrealized_pnl == pytest.approx(
+            sum((prices[p.symbol] - p.avg_entry_price) * p.quantity for p in positions)
+        )
+        assert portfolio.total_value == pytest.approx(
+            broker.cash + sum(prices[p.symbol] * p.quantity for p in positions)
+        )
+        assert portfolio.realized_pnl == pytest.approx(
+            sum(trade.pnl or 0 for trade in broker.trades)
+        )
+        # Commission-free trading: equity changes only through P&L
+        assert portfolio.total_value == pytest.approx(
+            10000 + portfolio.realized_pnl + portfolio.unrealized_pnl
+        )
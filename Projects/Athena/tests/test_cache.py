@@ -0,0 +1,148 @@
+"""Tests for the backtest result cache."""
+
+import os
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from athena.backtest.cache import BacktestCache, fingerprint_data
+from athena.backtest.engine import BacktestEngine
+from athena.strategies.sma_crossover import SMACrossoverStrategy
+
+
+@pytest.fixture
+def sample_data():
+    """Create sample OHLCV data for testing."""
+    dates = pd.date_range(start="2023-01-01", periods=200, freq="D")
+    np.random.seed(42)
+    prices = 100 * np.exp(np.cumsum(np.random.randn(200) * 0.02))
+
+    return pd.DataFrame(
+        {
+            "open": prices,
+            "high": prices * 1.01,
+            "low": prices * 0.99,
+            "close": prices,
+            "volume": np.random.randint(1000000, 10000000, 200),
+        },
+        index=dates,
+    )
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create an enabled cache in a temporary directory."""
+    return BacktestCache(cache_dir=tmp_path, max_size_mb=10, enabled=True)
+
+
+class TestFingerprint:
+    """Test data fingerprinting."""
+
+    def test_identical_data_same_fingerprint(self, sample_data):
+        """Equal frames fingerprint identically regardless of object identity."""
+        assert fingerprint_data(sample_data) == fingerprint_data(sample_data.copy())
+
+    def test_changed_value_changes_fingerprint(self, sample_data):
+        """A single changed price produces a different fingerprint."""
+        modified = sample_data.copy()
+        modified.iloc[100, modified.columns.get_loc("close")] += 0.01
+        assert fingerprint_data(sample_data) != fingerprint_data(modified)
+
+    def test_changed_index_changes_fingerprint(self, sample_data):
+        """Shifting the index produces a different fingerprint."""
+        shifted = sample_data.copy()
+        shifted.index = shifted.index + pd.Timedelta(days=1)
+        assert fingerprint_data(sample_data) != fingerprint_data(shifted)
+
+
+class TestBacktestCache:
+    """Test cache keys, storage and eviction."""
+
+    def test_key_depends_on_params(self, cache, sample_data):
+        """Different strategy parameters or engine settings give different keys."""
+        base = cache.make_key(SMACrossoverStrategy(10, 20), sample_data, "TEST", 100000, 0.001, 0)
+        same = cache.make_key(SMACrossoverStrategy(10, 20), sample_data, "TEST", 100000, 0.001, 0)
+        other_params = cache.make_key(
+            SMACrossoverStrategy(10, 30), sample_data, "TEST", 100000, 0.001, 0
+        )
+        other_commission = cache.make_key(
+            SMACrossoverStrategy(10, 20), sample_data, "TEST", 100000, 0.002, 0
+        )
+
+        assert base == same
+        assert base != other_params
+        assert base != other_commission
+
+    def test_miss_then_hit(self, cache):
+        """Stored results are returned on subsequent lookups."""
+        assert cache.get("abc") is None
+        cache.put("abc", {"value": 1})
+
+        assert cache.get("abc") == {"value": 1}
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_corrupt_entry_discarded(self, cache, tmp_path):
+        """Unreadable entries count as misses and are removed."""
+        (tmp_path / "bad.pkl").write_bytes(b"not a pickle")
+
+        assert cache.get("bad") is None
+        assert not (tmp_path / "bad.pkl").exists()
+
+    def test_eviction_removes_least_recently_used(self, tmp_path):
+        """Entries beyond the size budget are evicted oldest first."""
+        cache = BacktestCache(cache_dir=tmp_path, max_size_mb=0.25, enabled=True)
+        payload = b"x" * 100_000
+
+        cache.put("old", payload)
+        cache.put("recent", payload)
+        os.utime(tmp_path / "old.pkl", (0, 0))
+        cache.put("new", payload)
+
+        assert not (tmp_path / "old.pkl").exists()
+        assert (tmp_path / "recent.pkl").exists()
+        assert (tmp_path / "new.pkl").exists()
+
+    def test_disabled_cache(self, tmp_path):
+        """A disabled cache never stores results."""
+        cache = BacktestCache(cache_dir=tmp_path / "off", enabled=False)
+        cache.put("abc", 1)
+
+        assert cache.get("abc") is None
+        assert not (tmp_path / "off").exists()
+
+    def test_clear(self, cache):
+        """Clearing removes every entry."""
+        cache.put("a", 1)
+        cache.put("b", 2)
+
+        assert cache.clear() == 2
+        assert cache.get_info()["num_entries"] == 0
+
+
+class TestEngineCaching:
+    """Test backtest engine integration."""
+
+    def test_repeat_backtest_served_from_cache(self, cache, sample_data):
+        """Running the same backtest twice skips signal generation the second time."""
+        engine = BacktestEngine(initial_capital=100000, commission=0.001, cache=cache)
+        first = engine.run(SMACrossoverStrategy(10, 20), sample_data, "TEST")
+
+        with patch.object(SMACrossoverStrategy, "generate_signals") as generate:
+            second = engine.run(SMACrossoverStrategy(10, 20), sample_data, "TEST")
+            generate.assert_not_called()
+
+        assert cache.hits == 1
+        assert second.total_return == first.total_return
+        pd.testing.assert_series_equal(second.equity_curve, first.equity_curve)
+
+    def test_changed_params_rerun(self, cache, sample_data):
+        """Changing a parameter invalidates the cached result."""
+        engine = BacktestEngine(initial_capital=100000, commission=0.001, cache=cache)
+        engine.run(SMACrossoverStrategy(10, 20), sample_data, "TEST")
+        engine.run(SMACrossoverStrategy(5, 20), sample_data, "TEST")
+
+        assert cache.hits == 0
+        assert cache.get_info()["num_entries"] == 2
@@ -4,6 +4,9 @@ import pytest
 from unittest.mock import Mock, patch, MagicMock
 from typer.testing import CliRunner
 from datetime import datetime, date
+from pathlib import Path
+import subprocess
+import sys
 import tempfile
 import os
 
@@ -22,9 +25,9 @@ class TestCLIApp:
         assert result.exit_code == 0
         assert "Athena Trading Platform" in result.output
 
-    @patch('athena.cli.main.YahooDataAdapter')
-    @patch('athena.cli.main.BacktestEngine')
-    @patch('athena.cli.main.SMACrossoverStrategy')
+    @patch('athena.data.yahoo.YahooDataAdapter')
+    @patch('athena.backtest.engine.BacktestEngine')
+    @patch('athena.strategies.sma_crossover.SMACrossoverStrategy')
     def test_backtest_command_success(self, mock_strategy, mock_engine, mock_adapter):
         runner = CliRunner()
 
@@ -80,9 +83,9 @@ class TestCLIApp:
 
         assert result.exit_code != 0
 
-    @patch('athena.cli.main.YahooDataAdapter')
-    @patch('athena.cli.main.TradingOptimizer')
-    @patch('athena.cli.main.SMACrossoverStrategy')
+    @patch('athena.data.yahoo.YahooDataAdapter')
+    @patch('athena.optimize.optimizer.TradingOptimizer')
+    @patch('athena.strategies.sma_crossover.SMACrossoverStrategy')
     def test_optimize_command_success(self, mock_strategy, mock_optimizer, mock_adapter):
         runner = CliRunner()
 
@@ -109,7 +112,7 @@ class TestCLIApp:
 
         assert result.exit_code == 0
 
-    @patch('athena.cli.main.YahooDataAdapter')
+    @patch('athena.data.yahoo.YahooDataAdapter')
     def test_ingest_command_single_symbol(self, mock_adapter):
         runner = CliRunner()
 
@@ -125,7 +128,7 @@ class TestCLIApp:
         assert result.exit_code == 0
         mock_data_instance.fetch.assert_called_once()
 
-    @patch('athena.cli.main.YahooDataAdapter')
+    @patch('athena.data.yahoo.YahooDataAdapter')
     def test_ingest_command_multiple_symbols(self, mock_adapter):
         runner = CliRunner()
 
@@ -146,7 +149,7 @@ class TestCLIApp:
 class TestCacheCommand:
     """Test cache management commands."""
 
-    @patch('athena.cli.main.YahooDataAdapter')
+    @patch('athena.data.yahoo.YahooDataAdapter')
     def test_cache_info_command(self, mock_adapter):
         runner = CliRunner()
 
@@ -164,7 +167,7 @@ class TestCacheCommand:
         assert "5" in result.output  # total files
         assert "25.6" in result.output  # size
 
-    @patch('athena.cli.main.YahooDataAdapter')
+    @patch('athena.data.yahoo.YahooDataAdapter')
     def test_cache_clear_command(self, mock_adapter):
         runner = CliRunner()
 
@@ -176,7 +179,7 @@ class TestCacheCommand:
         assert result.exit_code == 0
         mock_data_instance.clear_cache.assert_called_once()
 
-    @patch('athena.cli.main.YahooDataAdapter')
+    @patch('athena.data.yahoo.YahooDataAdapter')
     def test_cache_clear_symbol_command(self, mock_adapter):
         runner = CliRunner()
 
@@ -227,9 +230,9 @@ class TestCommandValidation:
 class TestStrategyParameterParsing:
     """Test strategy parameter parsing."""
 
-    @patch('athena.cli.main.YahooDataAdapter')
-    @patch('athena.cli.main.BacktestEngine')
-    @patch('athena.cli.main.SMACrossoverStrategy')
+    @patch('athena.data.yahoo.YahooDataAdapter')
+    @patch('athena.backtest.engine.BacktestEngine')
+    @patch('athena.strategies.sma_crossover.SMACrossoverStrategy')
     def test_sma_strategy_parameters(self, mock_strategy, mock_engine, mock_adapter):
         runner = CliRunner()
 
@@ -256,9 +259,9 @@ class TestStrategyParameterParsing:
         # Verify strategy was initialized with correct parameters
         mock_strategy.assert_called_once_with(fast_period=5, slow_period=20)
 
-    @patch('athena.cli.main.YahooDataAdapter')
-    @patch('athena.cli.main.BacktestEngine')
-    @patch('athena.cli.main.BollingerBandsStrategy')
+    @patch('athena.data.yahoo.YahooDataAdapter')
+    @patch('athena.backtest.engine.BacktestEngine')
+    @patch('athena.strategies.bollinger_bands.BollingerBandsStrategy')
     def test_bollinger_strategy_parameters(self, mock_strategy, mock_engine, mock_adapter):
         runner = CliRunner()
 
@@ -288,9 +291,9 @@ class TestStrategyParameterParsing:
 class TestOutputFormatting:
     """Test CLI output formatting."""
 
-    @patch('athena.cli.main.YahooDataAdapter')
-    @patch('athena.cli.main.BacktestEngine')
-    @patch('athena.cli.main.SMACrossoverStrategy')
+    @patch('athena.data.yahoo.YahooDataAdapter')
+    @patch('athena.backtest.engine.BacktestEngine')
+    @patch('athena.strategies.sma_crossover.SMACrossoverStrategy')
     def test_backtest_output_format(self, mock_strategy, mock_engine, mock_adapter):
         runner = CliRunner()
 
@@ -323,9 +326,9 @@ class TestOutputFormatting:
         # Should contain formatted metrics
         assert "Total Return" in result.output or "25.00%" in result.output
 
-    @patch('athena.cli.main.YahooDataAdapter')
-    @patch('athena.cli.main.BacktestEngine')
-    @patch('athena.cli.main.SMACrossoverStrategy')
+    @patch('athena.data.yahoo.YahooDataAdapter')
+    @patch('athena.backtest.engine.BacktestEngine')
+    @patch('athena.strategies.sma_crossover.SMACrossoverStrategy')
     def test_backtest_json_output(self, mock_strategy, mock_engine, mock_adapter):
         runner = CliRunner()
 
@@ -357,7 +360,7 @@ class TestOutputFormatting:
 class TestErrorHandling:
     """Test error handling in CLI commands."""
 
-    @patch('athena.cli.main.YahooDataAdapter')
+    @patch('athena.data.yahoo.YahooDataAdapter')
     def test_data_fetch_error(self, mock_adapter):
         runner = CliRunner()
 
@@ -371,8 +374,8 @@ class TestErrorHandling:
 
         assert result.exit_code != 0
 
-    @patch('athena.cli.main.YahooDataAdapter')
-    @patch('athena.cli.main.BacktestEngine')
+    @patch('athena.data.yahoo.YahooDataAdapter')
+    @patch('athena.backtest.engine.BacktestEngine')
     def test_backtest_engine_error(self, mock_engine, mock_adapter):
         runner = CliRunner()
 
@@ -424,9 +427,9 @@ class TestConfigurationOptions:
 class TestIntegrationScenarios:
     """Test realistic CLI usage scenarios."""
 
-    @patch('athena.cli.main.YahooDataAdapter')
-    @patch('athena.cli.main.BacktestEngine')
-    @patch('athena.cli.main.SMACrossoverStrategy')
+    @patch('athena.data.yahoo.YahooDataAdapter')
+    @patch('athena.backtest.engine.BacktestEngine')
+    @patch('athena.strategies.sma_crossover.SMACrossoverStrategy')
     def test_full_backtest_workflow(self, mock_strategy, mock_engine, mock_adapter):
         runner = CliRunner()
 
@@ -466,4 +469,38 @@ class TestIntegrationScenarios:
         mock_adapter.assert_called_once()
         mock_strategy.assert_called_once()
         mock_engine.assert_called_once()
-        mock_engine_instance.run.assert_called_once()
\ No newline at end of file
+        mock_engine_instance.run.assert_called_once()
+
+
+class TestStartupTime:
+    """Test that importing the CLI stays cheap."""
+
+    HEAVY_MODULES = (
+        "vectorbt", "optuna", "yfinance", "pandas", "pydantic_settings",
+        "athena.live.paper_trader",
+    )
+
+    def run_python(self, code, **env):
+        return subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True, text=True, check=True,
+            cwd=Path(__file__).resolve().parents[1],
+            env={**os.environ, **env},
+        )
+
+    def test_heavy_dependencies_not_imported(self):
+        """Command dependencies load only when a command needs them."""
+        result = self.run_python(
+            "import sys, athena.cli.main; "
+            f"print(','.join(m for m in {self.HEAVY_MODULES!r} if m in sys.modules))"
+        )
+        assert result.stdout.strip() == ""
+
+    def test_import_starts_no_log_thread(self):
+        """Logging is configured on first use, so importing starts no listener thread."""
+        result = self.run_python(
+            "import threading, athena.cli.main; print(threading.active_count())",
+            LOG_ASYNC="true",
+        )
+        assert result.stdout.strip() == "1"
+
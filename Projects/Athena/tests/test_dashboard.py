@@ -2,13 +2,30 @@
 
 import pytest
 import json
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import patch, MagicMock
 import pandas as pd
 import numpy as np
 
 from athena.dashboard.app import app
 
 
+def store_result(equity_curve=None, daily_returns=None, trades=None):
+    """Put a result in the dashboard's store and return its handle."""
+    from athena.dashboard.app import RESULTS
+    from athena.dashboard.result_store import StoredResult
+
+    result = StoredResult(
+        symbol="AAPL",
+        strategy="SMA Crossover",
+        params={},
+        metrics={"total_return": 0.15},
+        equity_curve=pd.Series(equity_curve or {}, dtype=float),
+        daily_returns=pd.Series(daily_returns or {}, dtype=float),
+        trades=trades or [],
+    )
+    return RESULTS.put(f"test-{id(result)}", result)
+
+
 class TestDashboardApp:
     """Test dashboard application."""
 
@@ -62,51 +79,14 @@ class TestDashboardCallbacks:
 
         assert result == []
 
-    @patch('athena.dashboard.app.YahooDataAdapter')
-    @patch('athena.dashboard.app.BacktestEngine')
-    @patch('athena.dashboard.app.SMACrossoverStrategy')
-    def test_run_backtest_success(self, mock_strategy, mock_engine, mock_adapter):
-        """Test successful backtest execution."""
+    @patch('athena.dashboard.app.JOBS')
+    def test_run_backtest_success(self, mock_jobs):
+        """Test backtest submission as a background job."""
         from athena.dashboard.app import run_backtest
+        from athena.dashboard.jobs import backtest_job
+
+        mock_jobs.submit.return_value = "job-1"
 
-        # Mock data adapter
-        mock_data_instance = Mock()
-        mock_data = pd.DataFrame({
-            'Open': [100, 101, 102],
-            'High': [101, 102, 103],
-            'Low': [99, 100, 101],
-            'Close': [100.5, 101.5, 102.5],
-            'Volume': [1000000, 1100000, 1200000]
-        })
-        mock_data_instance.fetch.return_value = mock_data
-        mock_adapter.return_value = mock_data_instance
-
-        # Mock strategy
-        mock_strategy_instance = Mock()
-        mock_strategy.return_value = mock_strategy_instance
-
-        # Mock backtest result
-        mock_result = Mock()
-        mock_result.initial_capital = 100000
-        mock_result.final_capital = 115000
-        mock_result.total_return = 0.15
-        mock_result.annualized_return = 0.12
-        mock_result.sharpe_ratio = 1.2
-        mock_result.max_drawdown = 0.05
-        mock_result.win_rate = 0.6
-        mock_result.total_trades = 25
-        mock_result.avg_trade_return = 0.006
-        mock_result.volatility = 0.18
-        mock_result.equity_curve = pd.Series([100000, 105000, 110000, 115000])
-        mock_result.trades = []
-        mock_result.daily_returns = pd.Series([0.01, 0.02, -0.01, 0.015])
-
-        # Mock backtest engine
-        mock_engine_instance = Mock()
-        mock_engine_instance.run.return_value = mock_result
-        mock_engine.return_value = mock_engine_instance
-
-        # Run backtest callback
         result = run_backtest(
             1,  # n_clicks
             "AAPL",  # symbol
@@ -117,23 +97,44 @@ class TestDashboardCallbacks:
             10,  # commission (bps)
             "fixed_fraction",  # risk_model
             10,  # position_size
-            10,  # fast_period (param value)
-            30   # slow_period (param value)
+            [10, 30],  # strategy params
+            {"optimization": "job-0"}  # active jobs
         )
 
-        # Check result structure
-        assert len(result) == 6
-        results_data, alert_msg, alert_color, alert_open, section_style, export_disabled = result
+        assert len(result) == 5
+        active_jobs, alert_msg, alert_color, alert_open, poller_disabled = result
 
-        assert results_data is not None
-        assert alert_color == "success"
+        assert active_jobs == {"optimization": "job-0", "backtest": "job-1"}
+        assert alert_color == "info"
         assert alert_open is True
-        assert section_style == {"display": "block"}
-        assert export_disabled is False
+        assert poller_disabled is False
+
+        args, kwargs = mock_jobs.submit.call_args
+        assert args[:2] == ("backtest", backtest_job)
+        assert "AAPL" in kwargs["key"]
+        assert args[-2] == pytest.approx(0.001)  # bps converted to decimal
+        mock_jobs.cancel.assert_not_called()
+
+    @patch('athena.dashboard.app.JOBS')
+    def test_run_backtest_releases_previous_job(self, mock_jobs):
+        """Resubmitting drops this session's interest in its previous backtest."""
+        from athena.dashboard.app import run_backtest
+
+        mock_jobs.submit.return_value = "job-2"
+
+        result = run_backtest(
+            1, "AAPL", "SMA Crossover", "2023-01-01", "2023-12-31", 100000, 10,
+            "fixed_fraction", 10, [10, 30], {"backtest": "job-1"}
+        )
+
+        mock_jobs.cancel.assert_called_once_with("job-1")
+        assert result[0] == {"backtest": "job-2"}
 
-    def test_run_backtest_no_clicks(self):
+    @patch('athena.dashboard.app.JOBS')
+    def test_run_backtest_no_clicks(self, mock_jobs):
         """Test backtest callback with no clicks."""
         from athena.dashboard.app import run_backtest
+        from dash import no_update
 
         result = run_backtest(
             None,  # n_clicks
@@ -141,12 +142,11 @@ class TestDashboardCallbacks:
             100000, 10, "fixed_fraction", 10, 10, 30
         )
 
-        # Should return initial state
-        assert result[0] is None  # No results data
-        assert result[4] == {"display": "none"}  # Results hidden
-        assert result[5] is True  # Export disabled
+        assert all(value is no_update for value in result)
+        mock_jobs.submit.assert_not_called()
 
-    def test_run_backtest_missing_fields(self):
+    @patch('athena.dashboard.app.JOBS')
+    def test_run_backtest_missing_fields(self, mock_jobs):
         """Test backtest callback with missing required fields."""
         from athena.dashboard.app import run_backtest
 
@@ -154,32 +154,93 @@ class TestDashboardCallbacks:
             1,  # n_clicks
             "",  # empty symbol
             "SMA Crossover", "2023-01-01", "2023-12-31",
-            100000, 10, "fixed_fraction", 10, 10, 30
+            100000, 10, "fixed_fraction", 10, [10, 30]
         )
 
-        # Should return error
-        assert result[0] is None  # No results data
         assert result[2] == "warning"  # Warning color
         assert result[3] is True  # Alert open
+        mock_jobs.submit.assert_not_called()
+
+    @patch('athena.dashboard.app.JOBS')
+    def test_poll_backtest_done(self, mock_jobs):
+        """Test finished backtest results are published by the poller."""
+        from dash import no_update
+
+        from athena.dashboard.app import RESULTS, poll_jobs
+        from athena.dashboard.jobs import Job, JobStatus
+        from athena.dashboard.result_store import StoredResult
+
+        stored = StoredResult(
+            symbol="AAPL", strategy="SMA Crossover", params={},
+            metrics={"total_return": 0.15},
+            equity_curve=pd.Series(np.linspace(100000, 115000, 5000)),
+            daily_returns=pd.Series(np.zeros(5000)),
+        )
+        mock_jobs.get.return_value = Job(id="job-1", kind="backtest", status=JobStatus.DONE)
+        mock_jobs.take_result.return_value = stored
+
+        result = poll_jobs(1, {"backtest": "job-1"})
+
+        (backtest_data, _, section_style, export_disabled, alert_msg, alert_color,
+         alert_open, progress, active_jobs, poller_disabled) = result
+        # Only a small handle goes to the browser; the series stay server-side
+        assert backtest_data["id"] == "job-1"
+        assert backtest_data["metrics"] == {"total_return": 0.15}
+        assert len(json.dumps(backtest_data)) < 500
+        assert RESULTS.get(backtest_data) is stored
+        assert section_style == {"display": "block"}
+        assert export_disabled is False
+        assert alert_color == "success"
+        assert alert_open is True
+        assert "Total Return: 15.00%" in alert_msg
+        assert progress == 100
+        assert active_jobs == {}
+        assert poller_disabled is True
+        mock_jobs.take_result.assert_called_once_with("job-1")
+
+        # Another session sharing the job finds the result in the store
+        mock_jobs.take_result.return_value = None
+        assert poll_jobs(2, {"backtest": "job-1"})[0]["id"] == "job-1"
+
+        RESULTS.clear()
+        expired = poll_jobs(3, {"backtest": "job-1"})
+        assert expired[0] is no_update
+        assert "expired" in expired[4]
+
+    @patch('athena.dashboard.app.JOBS')
+    def test_poll_backtest_no_data(self, mock_jobs):
+        """Test backtest failures are reported by the poller."""
+        from athena.dashboard.app import poll_jobs
+        from athena.dashboard.jobs import Job, JobStatus
+
+        mock_jobs.get.return_value = Job(
+            id="job-1", kind="backtest", status=JobStatus.FAILED,
+            error="No data available for INVALID in the specified date range."
+        )
 
-    @patch('athena.dashboard.app.YahooDataAdapter')
-    def test_run_backtest_no_data(self, mock_adapter):
-        """Test backtest callback when no data is available."""
-        from athena.dashboard.app import run_backtest
+        result = poll_jobs(1, {"backtest": "job-1"})
 
-        # Mock empty data
-        mock_data_instance = Mock()
-        mock_data_instance.fetch.return_value = pd.DataFrame()  # Empty DataFrame
-        mock_adapter.return_value = mock_data_instance
+        assert result[5] == "danger"
+        assert "No data available" in result[4]
+        assert result[8] == {}
 
-        result = run_backtest(
-            1, "INVALID", "SMA Crossover", "2023-01-01", "2023-12-31",
-            100000, 10, "fixed_fraction", 10, 10, 30
+    @patch('athena.dashboard.app.JOBS')
+    def test_poll_running_job(self, mock_jobs):
+        """Test running jobs report progress and keep the poller on."""
+        from athena.dashboard.app import poll_jobs
+        from athena.dashboard.jobs import Job, JobStatus
+
+        mock_jobs.get.return_value = Job(
+            id="job-2", kind="optimization", status=JobStatus.RUNNING,
+            progress=0.4, message="Trial 20/50"
         )
 
-        assert result[0] is None
-        assert result[2] == "danger"
-        assert "No data available" in result[1]
+        result = poll_jobs(1, {"optimization": "job-2"})
+
+        assert "Trial 20/50" in result[4]
+        assert result[7] == pytest.approx(40)
+        assert result[8] == {"optimization": "job-2"}
+        assert result[9] is False
 
     def test_update_metrics_table_no_data(self):
         """Test metrics table update with no data."""
@@ -233,38 +294,59 @@ class TestDashboardCallbacks:
         """Test equity curve update with valid data."""
         from athena.dashboard.app import update_equity_curve
 
-        results_data = {
-            "equity_curve": {
-                "2023-01-01": 100000,
-                "2023-06-01": 105000,
-                "2023-12-31": 115000
-            }
-        }
+        results_data = store_result(equity_curve={
+            "2023-01-01": 100000,
+            "2023-06-01": 105000,
+            "2023-12-31": 115000
+        })
 
         result = update_equity_curve(results_data)
 
         assert "data" in result
         assert "layout" in result
-        assert result["layout"]["title"] == "Portfolio Equity Curve"
+        assert result["layout"]["title"]["text"] == "Portfolio Equity Curve"
+
+    def test_update_equity_curve_zoom(self):
+        """Test long curves are downsampled and zooming re-fetches detail."""
+        from athena.dashboard.app import update_equity_curve
+
+        dates = pd.date_range('2023-01-01', periods=50000, freq='min')
+        results_data = store_result(
+            equity_curve=dict(zip(dates, np.linspace(100000, 150000, len(dates))))
+        )
+
+        full = update_equity_curve(results_data)
+        zoomed = update_equity_curve(results_data, {
+            "xaxis.range[0]": "2023-01-02 00:00", "xaxis.range[1]": "2023-01-02 06:00"
+        })
+
+        assert len(full["data"][0]["x"]) <= 2000
+        assert len(zoomed["data"][0]["x"]) == 6 * 60 + 3  # Range plus one point each side
+        assert full["layout"]["uirevision"] == results_data["id"]
+
+    def test_update_equity_curve_evicted(self):
+        """Test chart callbacks render the empty state for unknown handles."""
+        from athena.dashboard.app import update_equity_curve
+
+        assert update_equity_curve({"id": "evicted", "metrics": {}}) == {}
 
     def test_update_drawdown_chart_with_data(self):
         """Test drawdown chart update with valid data."""
         from athena.dashboard.app import update_drawdown_chart
 
-        results_data = {
-            "equity_curve": {
-                "2023-01-01": 100000,
-                "2023-06-01": 105000,
-                "2023-09-01": 98000,  # Drawdown
-                "2023-12-31": 115000
-            }
-        }
+        results_data = store_result(equity_curve={
+            "2023-01-01": 100000,
+            "2023-06-01": 105000,
+            "2023-09-01": 98000,  # Drawdown
+            "2023-12-31": 115000
+        })
 
         result = update_drawdown_chart(results_data)
 
         assert "data" in result
         assert "layout" in result
-        assert result["layout"]["title"] == "Portfolio Drawdown"
+        assert result["layout"]["title"]["text"] == "Portfolio Drawdown"
+        assert min(result["data"][0]["y"]) == pytest.approx((98000 / 105000 - 1) * 100)
 
     def test_update_rolling_sharpe_no_data(self):
         """Test rolling Sharpe update with no data."""
@@ -283,9 +365,7 @@ class TestDashboardCallbacks:
         returns_data = {date.strftime('%Y-%m-%d'): np.random.normal(0.001, 0.02)
                        for date in dates}
 
-        results_data = {
-            "daily_returns": returns_data
-        }
+        results_data = store_result(daily_returns=returns_data)
 
         result = update_rolling_sharpe(results_data)
 
@@ -301,7 +381,7 @@ class TestDashboardCallbacks:
         assert result == {}
 
         # Test with empty daily_returns
-        result = update_returns_distribution({"daily_returns": {}})
+        result = update_returns_distribution(store_result(daily_returns={}))
 
         assert result == {}
 
@@ -309,7 +389,7 @@ class TestDashboardCallbacks:
         """Test trade table update with no trades."""
         from athena.dashboard.app import update_trade_table
 
-        results_data = {"trades": []}
+        results_data = store_result(trades=[])
 
         result = update_trade_table(results_data)
 
@@ -319,21 +399,19 @@ class TestDashboardCallbacks:
         """Test trade table update with valid trades."""
         from athena.dashboard.app import update_trade_table
 
-        results_data = {
-            "trades": [
-                {
-                    "entry_date": "2023-01-15T10:30:00",
-                    "exit_date": "2023-01-20T15:45:00",
-                    "symbol": "AAPL",
-                    "side": "long",
-                    "quantity": 100,
-                    "entry_price": 150.00,
-                    "exit_price": 155.00,
-                    "pnl": 500.00,
-                    "return_pct": 0.033
-                }
-            ]
-        }
+        results_data = store_result(trades=[
+            {
+                "entry_date": "2023-01-15T10:30:00",
+                "exit_date": "2023-01-20T15:45:00",
+                "symbol": "AAPL",
+                "side": "long",
+                "quantity": 100,
+                "entry_price": 150.00,
+                "exit_price": 155.00,
+                "pnl": 500.00,
+                "return_pct": 0.033
+            }
+        ])
 
         result = update_trade_table(results_data)
 
@@ -369,33 +447,13 @@ class TestDashboardComponentsNavigation:
 
         assert result == "No walk-forward validation results available."
 
-    @patch('athena.dashboard.app.StrategyOptimizer')
-    @patch('athena.dashboard.app.YahooDataAdapter')
-    def test_run_optimization_success(self, mock_adapter, mock_optimizer):
-        """Test successful optimization execution."""
-        from athena.dashboard.app import run_optimization
+    @patch('athena.dashboard.app.JOBS')
+    def test_run_optimization_success(self, mock_jobs):
+        """Test optimization submission and completion."""
+        from athena.dashboard.app import poll_jobs, run_optimization
+        from athena.dashboard.jobs import Job, JobStatus, optimization_job
 
-        # Mock data adapter
-        mock_data_instance = Mock()
-        mock_data = pd.DataFrame({
-            'Close': [100, 101, 102, 103, 104],
-            'Volume': [1000, 1100, 1200, 1300, 1400]
-        })
-        mock_data_instance.fetch.return_value = mock_data
-        mock_adapter.return_value = mock_data_instance
-
-        # Mock optimizer
-        mock_optimizer_instance = Mock()
-        mock_study = Mock()
-        mock_study.best_value = 1.5
-        mock_study.best_params = {"fast_period": 10, "slow_period": 30}
-        mock_study.trials = [
-            Mock(number=1, value=1.2, params={"fast_period": 8, "slow_period": 25}, user_attrs={}),
-            Mock(number=2, value=1.5, params={"fast_period": 10, "slow_period": 30}, user_attrs={})
-        ]
-
-        mock_optimizer_instance.optimize.return_value = (mock_study.best_params, mock_study)
-        mock_optimizer.return_value = mock_optimizer_instance
+        mock_jobs.submit.return_value = "job-2"
 
         result = run_optimization(
             1,  # n_clicks
@@ -405,50 +463,73 @@ class TestDashboardComponentsNavigation:
             100000, 10  # capital, commission
         )
 
-        assert len(result) == 4
-        opt_results, alert_msg, alert_color, alert_open = result
+        assert len(result) == 5
+        active_jobs, alert_msg, alert_color, alert_open, poller_disabled = result
+        assert active_jobs == {"optimization": "job-2"}
+        assert poller_disabled is False
+        assert mock_jobs.submit.call_args[0][:2] == ("optimization", optimization_job)
 
-        assert opt_results is not None
-        assert alert_color == "success"
-        assert "Best Sharpe: 1.500" in alert_msg
+        mock_jobs.get.return_value = Job(
+            id="job-2", kind="optimization", status=JobStatus.DONE,
+            result={"best_params": {"fast_period": 10}, "best_value": 1.5, "trials": []}
+        )
+        result = poll_jobs(1, active_jobs)
+
+        assert result[1]["best_value"] == 1.5
+        assert result[5] == "success"
+        assert "Best Sharpe: 1.500" in result[4]
 
 
 class TestDashboardErrorHandling:
     """Test dashboard error handling."""
 
-    @patch('athena.dashboard.app.YahooDataAdapter')
-    def test_backtest_exception_handling(self, mock_adapter):
+    @patch('athena.dashboard.app.JOBS')
+    def test_backtest_exception_handling(self, mock_jobs):
         """Test backtest error handling."""
         from athena.dashboard.app import run_backtest
 
-        # Mock adapter that raises exception
-        mock_adapter.side_effect = Exception("Network error")
+        # Job queue that refuses the submission
+        mock_jobs.submit.side_effect = RuntimeError("Too many pending jobs")
 
         result = run_backtest(
             1, "AAPL", "SMA Crossover", "2023-01-01", "2023-12-31",
-            100000, 10, "fixed_fraction", 10, 10, 30
+            100000, 10, "fixed_fraction", 10, [10, 30]
         )
 
-        assert result[0] is None  # No results
         assert result[2] == "danger"  # Error color
         assert "Error running backtest" in result[1]
 
-    @patch('athena.dashboard.app.StrategyOptimizer')
-    def test_optimization_exception_handling(self, mock_optimizer):
+    @patch('athena.dashboard.app.JOBS')
+    def test_optimization_exception_handling(self, mock_jobs):
         """Test optimization error handling."""
         from athena.dashboard.app import run_optimization
 
-        # Mock optimizer that raises exception
-        mock_optimizer.side_effect = Exception("Optimization failed")
+        mock_jobs.submit.side_effect = RuntimeError("Too many pending jobs")
 
         result = run_optimization(
             1, "AAPL", "SMA Crossover", "2023-01-01", "2023-12-31", 100000, 10
         )
 
-        assert result[0] is None  # No results
         assert result[2] == "danger"  # Error color
         assert "Optimization failed" in result[1]
 
+    @patch('athena.dashboard.app.JOBS')
+    def test_cancel_jobs(self, mock_jobs):
+        """Test cancelling this session's jobs."""
+        from athena.dashboard.app import cancel_jobs
+
+        mock_jobs.cancel.return_value = True
+
+        message, color, is_open, active_jobs, poller_disabled = cancel_jobs(
+            1, {"backtest": "job-1"}
+        )
+
+        mock_jobs.cancel.assert_called_once_with("job-1")
+        assert color == "warning"
+        assert "backtest" in message
+        assert active_jobs == {}
+        assert poller_disabled
+
 
 class TestDashboardUtilities:
     """Test dashboard utility functions."""
@@ -468,12 +549,12 @@ class TestDashboardUtilities:
         assert "Kelly Criterion" in RISK_MODELS
         assert "Capped Kelly" in RISK_MODELS
 
-    def test_executor_configuration(self):
-        """Test that thread executor is configured."""
-        from athena.dashboard.app import executor
+    def test_job_manager_configuration(self):
+        """Test that the background job manager is configured."""
+        from athena.dashboard.app import JOBS
 
-        assert executor is not None
-        assert executor._max_workers > 0
+        assert JOBS is not None
+        assert JOBS.max_workers > 0
 
 
 class TestDashboardLayout:
@@ -1,11 +1,15 @@
 """Tests for data adapters."""
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import patch
 
 import pandas as pd
 import pytest
 
+from athena.data.service import MarketDataService, period_to_dates
 from athena.data.yahoo import YahooDataAdapter
 
 
@@ -110,3 +114,83 @@ class TestYahooDataAdapter:
         assert "AAPL" in info["symbols"]
         assert "MSFT" in info["symbols"]
         assert info["total_size_mb"] > 0
+
+
+class SlowAdapter:
+    """Adapter stand-in that blocks until released and counts fetches."""
+
+    def __init__(self):
+        self.calls = []
+        self.release = threading.Event()
+
+    def fetch(self, symbol, start, end, interval="1d"):
+        self.calls.append(symbol)
+        self.release.wait(5)
+        if symbol == "BAD":
+            raise ValueError(f"No data available for {symbol}")
+        return pd.DataFrame({"close": [100.0, 101.0]})
+
+
+class TestMarketDataService:
+    """Test the shared market data service."""
+
+    @pytest.fixture
+    def adapter(self):
+        """Create a blocking adapter."""
+        return SlowAdapter()
+
+    @pytest.fixture
+    def service(self, adapter):
+        """Create a service over the blocking adapter."""
+        service = MarketDataService(adapter=adapter, max_workers=4, ttl=60)
+        yield service
+        adapter.release.set()
+        service.shutdown()
+
+    def test_concurrent_requests_share_fetch(self, adapter, service):
+        """Ten users loading SPY trigger one fetch."""
+        with ThreadPoolExecutor(max_workers=10) as users:
+            loads = [users.submit(service.history, "spy", period="1y") for _ in range(10)]
+            while service.stats["joined"] + service.stats["fetches"] < 10:
+                time.sleep(0.001)
+            adapter.release.set()
+            results = [load.result(5) for load in loads]
+
+        assert adapter.calls == ["SPY"]
+        assert service.stats == {"hits": 0, "fetches": 1, "joined": 9}
+        assert all(result.equals(results[0]) for result in results)
+
+    def test_cached_copies(self, adapter, service):
+        """Repeat requests hit memory and get copies they can modify."""
+        adapter.release.set()
+        first = service.history("SPY", "2023-01-01", "2023-12-31")
+        first["close"] = 0.0
+        second = service.history("SPY", "2023-01-01", "2023-12-31")
+
+        assert adapter.calls == ["SPY"]
+        assert service.stats["hits"] == 1
+        assert second["close"].tolist() == [100.0, 101.0]
+
+    def test_history_many_skips_failures(self, adapter, service):
+        """Multi-symbol loads fetch concurrently and leave out failed symbols."""
+        adapter.release.set()
+        data = service.history_many(["AAPL", "BAD", "MSFT", "AAPL"], period="6mo")
+
+        assert sorted(data) == ["AAPL", "MSFT"]
+        assert sorted(adapter.calls) == ["AAPL", "BAD", "MSFT"]
+
+        # Failures are not cached
+        with pytest.raises(ValueError):
+            service.history("BAD", period="6mo")
+        assert adapter.calls.count("BAD") == 2
+
+    def test_period_to_dates(self):
+        """Yahoo periods convert to date ranges ending tomorrow."""
+        today = pd.Timestamp("2024-03-15")
+
+        assert period_to_dates("1y", today) == ("2023-03-15", "2024-03-16")
+        assert period_to_dates("6mo", today) == ("2023-09-15", "2024-03-16")
+        assert period_to_dates("5d", today) == ("2024-03-10", "2024-03-16")
+        assert period_to_dates("ytd", today) == ("2024-01-01", "2024-03-16")
+        with pytest.raises(ValueError):
+            period_to_dates("forever", today)
@@ -0,0 +1,117 @@
+"""Tests for chart downsampling."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from athena.dashboard.downsample import (
+    downsample,
+    downsample_ohlc,
+    lttb,
+    minmax,
+    visible_range,
+)
+
+
+@pytest.fixture
+def equity():
+    """A year of minute bars."""
+    index = pd.date_range("2023-01-01", periods=500_000, freq="min")
+    returns = np.random.default_rng(0).normal(0, 0.001, len(index))
+    return pd.Series(100000 * np.cumprod(1 + returns), index=index)
+
+
+class TestDownsample:
+    """Test line series reduction."""
+
+    def test_keeps_extremes_and_endpoints(self, equity):
+        """Peaks, troughs and both ends survive downsampling."""
+        reduced = downsample(equity, max_points=1000)
+
+        assert 990 < len(reduced) <= 1000
+        assert reduced.index.is_monotonic_increasing
+        assert reduced.max() == equity.max()
+        assert reduced.min() == equity.min()
+        assert reduced.index[0] == equity.index[0]
+        assert reduced.index[-1] == equity.index[-1]
+
+    def test_short_series_unchanged(self):
+        """Series within the budget are returned as-is, minus NaNs."""
+        series = pd.Series([np.nan, 1.0, 2.0, 3.0])
+
+        assert downsample(series, max_points=10).tolist() == [1.0, 2.0, 3.0]
+
+    def test_visible_range(self, equity):
+        """Zoomed ranges get the full point budget."""
+        start, end = "2023-03-01", "2023-03-03"
+        reduced = downsample(equity, max_points=1000, x_range=(start, end))
+        full = downsample(equity, max_points=1000)
+
+        assert 990 < len(reduced) <= 1000
+        assert reduced.index[0] < pd.Timestamp(start) <= reduced.index[1]
+        assert reduced.index[-2] <= pd.Timestamp(end) < reduced.index[-1]
+        assert ((full.index >= start) & (full.index <= end)).sum() < 20
+
+    def test_lttb_picks_spike(self):
+        """LTTB keeps an isolated spike over flat neighbours."""
+        x = np.arange(100, dtype=float)
+        y = np.zeros(100)
+        y[37] = 10.0
+
+        assert 37 in lttb(x, y, 10)
+
+    def test_minmax_buckets(self):
+        """Min-max keeps each bucket's extremes."""
+        y = np.array([0, 5, -5, 0, 0, 9, 0, -9, 0, 0], dtype=float)
+
+        kept = minmax(y, 4)
+
+        assert {1, 2, 5, 7} <= set(kept)
+        assert kept[0] == 0 and kept[-1] == len(y) - 1
+
+
+class TestDownsampleOHLC:
+    """Test candle aggregation."""
+
+    def test_candles_keep_extremes(self, equity):
+        """Aggregated candles keep highs, lows, volume and boundary prices."""
+        bars = pd.DataFrame(
+            {
+                "Open": equity,
+                "High": equity * 1.001,
+                "Low": equity * 0.999,
+                "Close": equity,
+                "Volume": 1.0,
+                "MA20": equity.rolling(20).mean(),
+            }
+        )
+
+        candles = downsample_ohlc(bars, max_points=1000)
+
+        assert len(candles) <= 1000
+        assert candles["High"].max() == bars["High"].max()
+        assert candles["Low"].min() == bars["Low"].min()
+        assert candles["Volume"].sum() == len(bars)
+        assert candles["Open"].iloc[0] == bars["Open"].iloc[0]
+        assert candles["Close"].iloc[-1] == bars["Close"].iloc[-1]
+        assert candles["MA20"].iloc[-1] == bars["MA20"].iloc[-1]
+        assert candles.index[0] == bars.index[0]
+
+
+class TestVisibleRange:
+    """Test parsing Plotly relayout events."""
+
+    @pytest.mark.parametrize(
+        "relayout_data, expected",
+        [
+            (None, None),
+            ({"xaxis.autorange": True}, None),
+            ({"autosize": True}, None),
+            ({"xaxis.range[0]": "2023-01-01", "xaxis.range[1]": "2023-02-01"},
+             ("2023-01-01", "2023-02-01")),
+            ({"xaxis.range": ["2023-01-01", "2023-02-01"]}, ("2023-01-01", "2023-02-01")),
+        ],
+    )
+    def test_relayout(self, relayout_data, expected):
+        """Zoom events yield a range; resets and other events yield None."""
+        assert visible_range(relayout_data) == expected
@@ -0,0 +1,154 @@
+"""Tests for dashboard background jobs."""
+
+import time
+
+import pytest
+
+from athena.dashboard.jobs import JobManager, JobStatus, report_progress
+
+
+def add(a, b):
+    """Return a sum after reporting progress."""
+    report_progress(0.5, "Adding")
+    return a + b
+
+
+def fail():
+    """Raise an error inside a job."""
+    raise ValueError("bad input")
+
+
+def slow(steps, delay):
+    """Report progress for a while, stopping early when cancelled."""
+    for step in range(steps):
+        report_progress(step / steps, f"Step {step + 1}/{steps}")
+        time.sleep(delay)
+    return steps
+
+
+@pytest.fixture(scope="module")
+def manager():
+    """Share one pool across tests; spawning processes is slow."""
+    manager = JobManager(max_workers=2, cache_size=8)
+    yield manager
+    manager.shutdown()
+
+
+def wait_for(predicate, timeout=10.0):
+    """Poll until a condition holds."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached in time"
+        time.sleep(0.05)
+
+
+class TestJobManager:
+    """Test job submission, polling and cancellation."""
+
+    def test_result(self, manager):
+        """Finished jobs keep their result and full progress."""
+        job_id = manager.submit("sum", add, 2, b=3)
+
+        job = manager.wait(job_id, timeout=30)
+
+        assert job.status is JobStatus.DONE
+        assert job.result == 5
+        assert job.progress == 1.0
+        assert job.started_at is not None
+        assert "result" not in job.to_dict()
+
+    def test_take_result(self, manager):
+        """Taken results leave the job cache and the job is no longer shared."""
+        job_id = manager.submit("sum", add, 4, 4, key="sum-4-4")
+        job = manager.wait(job_id, timeout=30)
+
+        assert manager.take_result(job_id) == 8
+        assert job.result is None
+        assert manager.take_result(job_id) is None
+        assert manager.submit("sum", add, 4, 4, key="sum-4-4") != job_id
+
+    def test_failure(self, manager):
+        """Exceptions are recorded on the job."""
+        job = manager.wait(manager.submit("fail", fail), timeout=30)
+
+        assert job.status is JobStatus.FAILED
+        assert "ValueError: bad input" in job.error
+
+    def test_same_key_shares_job(self, manager):
+        """Identical requests reuse the running or finished job."""
+        first = manager.submit("sum", add, 1, 1, key="sum-1-1")
+        second = manager.submit("sum", add, 1, 1, key="sum-1-1")
+        manager.wait(first, timeout=30)
+
+        assert first == second
+        assert manager.submit("sum", add, 1, 1, key="sum-1-1") == first
+
+    def test_failed_key_is_retried(self, manager):
+        """Failed jobs are not cached under their key."""
+        first = manager.submit("fail", fail, key="fail")
+        manager.wait(first, timeout=30)
+
+        assert manager.submit("fail", fail, key="fail") != first
+
+    def test_progress_and_cancel(self, manager):
+        """Running jobs report progress and stop when cancelled."""
+        job_id = manager.submit("slow", slow, 200, 0.05, key="slow")
+        job = manager.get(job_id)
+        wait_for(lambda: job.progress > 0)
+
+        assert job.status is JobStatus.RUNNING
+        assert job.message.startswith("Step")
+        assert manager.jobs(active_only=True) == [job]
+
+        assert manager.cancel(job_id)
+        manager.wait(job_id, timeout=30)
+
+        assert job.status is JobStatus.CANCELLED
+        assert not manager.cancel(job_id)
+        assert manager.submit("slow", slow, 1, 0, key="slow") != job_id
+
+    def test_shared_job_cancelled_by_last_subscriber(self, manager):
+        """One user's cancel only detaches them from a job others still want."""
+        job_id = manager.submit("slow", slow, 200, 0.05, key="shared")
+        assert manager.submit("slow", slow, 200, 0.05, key="shared") == job_id
+        job = manager.get(job_id)
+        wait_for(lambda: job.progress > 0)
+
+        assert manager.cancel(job_id)
+        time.sleep(0.2)
+        assert job.status is JobStatus.RUNNING
+        assert job.subscribers == 1
+
+        assert manager.cancel(job_id)
+        manager.wait(job_id, timeout=30)
+        assert job.status is JobStatus.CANCELLED
+
+    def test_cache_eviction(self):
+        """Only the most recent finished jobs are kept."""
+        manager = JobManager(max_workers=1, cache_size=1)
+        try:
+            first = manager.submit("sum", add, 1, 1, key="first")
+            manager.wait(first, timeout=30)
+            second = manager.submit("sum", add, 2, 2)
+            manager.wait(second, timeout=30)
+
+            assert manager.get(first) is None
+            assert manager.get(second).result == 4
+            assert manager.submit("sum", add, 1, 1, key="first") != first
+        finally:
+            manager.shutdown()
+
+    def test_queue_limit(self):
+        """Submissions beyond max_pending are refused."""
+        manager = JobManager(max_workers=1, max_pending=1)
+        try:
+            job_id = manager.submit("slow", slow, 100, 0.05)
+            with pytest.raises(RuntimeError):
+                manager.submit("sum", add, 1, 1)
+            manager.cancel(job_id)
+        finally:
+            manager.shutdown()
+
+    def test_report_progress_outside_job(self):
+        """Job functions can run directly without a manager."""
+        assert add(1, 2) == 3
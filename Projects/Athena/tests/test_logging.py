@@ -0,0 +1,87 @@
+"""Tests for logging configuration."""
+
+import logging
+import threading
+
+import pytest
+
+from athena.core import logging as athena_logging
+from athena.core.config import settings
+from athena.core.logging import get_logger, setup_logging, shutdown_logging
+
+
+class RecordingHandler(logging.Handler):
+    """Handler that keeps rendered messages and the thread that rendered them."""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append((threading.current_thread(), self.format(record)))
+
+
+@pytest.fixture
+def owned_root(monkeypatch):
+    """Configure logging on an empty root logger, restoring it afterwards.
+
+    pytest attaches its capture handlers just before each test runs, so the
+    root logger is cleared from inside the test by calling the fixture.
+    """
+    root = logging.getLogger()
+    handler = RecordingHandler()
+    saved = []
+
+    def configure(log_async: bool) -> RecordingHandler:
+        monkeypatch.setattr(settings, "log_async", log_async)
+        saved[:] = root.handlers
+        root.handlers.clear()
+        setup_logging(handler)
+        return handler
+
+    yield configure
+    shutdown_logging()
+    root.handlers[:] = saved
+    setup_logging()
+
+
+class TestLogging:
+    """Test lazy and off-thread logging."""
+
+    def test_filtered_calls_skip_formatting(self):
+        """Arguments of filtered calls are never formatted."""
+        formatted = []
+
+        class Expensive:
+            def __str__(self):
+                formatted.append(True)
+                return "expensive"
+
+        logger = get_logger("tests.lazy")
+        logger.debug("Value %s", Expensive())
+
+        assert not logger.is_enabled_for(logging.DEBUG)
+        assert formatted == []
+
+    def test_async_renders_off_thread(self, owned_root):
+        """Queued records are rendered by the listener thread."""
+        handler = owned_root(log_async=True)
+        assert isinstance(athena_logging._handler, athena_logging.RecordQueueHandler)
+
+        get_logger("tests.async").info("hello %s", "world", key="value")
+        shutdown_logging()
+
+        [(thread, message)] = handler.records
+        assert thread is not threading.current_thread()
+        assert "hello world" in message
+        assert "value" in message
+
+    def test_sync_renders_in_caller(self, owned_root):
+        """Without the queue, records render on the logging thread."""
+        handler = owned_root(log_async=False)
+
+        get_logger("tests.sync").warning("plain")
+
+        [(thread, message)] = handler.records
+        assert thread is threading.current_thread()
+        assert "plain" in message
@@ -0,0 +1,110 @@
+"""Tests for Monte Carlo path simulation."""
+
+import time
+
+import numpy as np
+import pytest
+
+from athena.backtest.monte_carlo import MonteCarloSimulator
+
+
+@pytest.fixture
+def history():
+    """Two years of daily returns."""
+    return np.random.default_rng(0).normal(0.0005, 0.01, 504)
+
+
+class TestMonteCarloSimulator:
+    """Test path generation and summaries."""
+
+    def test_seeded_runs_repeat(self):
+        """The same seed gives the same paths."""
+        first = MonteCarloSimulator(seed=7).paths(100.0, 20, 50)
+        second = MonteCarloSimulator(seed=7).paths(100.0, 20, 50)
+
+        assert first.shape == (50, 21)
+        assert (first[:, 0] == 100.0).all()
+        np.testing.assert_array_equal(first, second)
+
+    def test_gbm_moments(self):
+        """GBM terminal log returns match the drift and volatility."""
+        paths = MonteCarloSimulator(drift=0.08, volatility=0.25, seed=1).paths(1.0, 252, 20_000)
+        log_returns = np.log(paths[:, -1])
+
+        assert log_returns.mean() == pytest.approx(0.08 - 0.5 * 0.25**2, abs=0.01)
+        assert log_returns.std() == pytest.approx(0.25, abs=0.01)
+
+    def test_bootstrap_draws_from_history(self, history):
+        """Bootstrapped daily returns are all historical returns."""
+        paths = MonteCarloSimulator("bootstrap", returns=history, seed=2).paths(1.0, 30, 100)
+        daily = paths[:, 1:] / paths[:, :-1] - 1
+
+        nearest = np.abs(daily[..., None] - history).min(axis=-1)
+        assert nearest.max() < 1e-5
+
+    def test_block_bootstrap_keeps_blocks(self, history):
+        """Block bootstrap replays consecutive runs of history."""
+        simulator = MonteCarloSimulator(
+            "block_bootstrap", returns=history, block_size=10, seed=3
+        )
+        paths = simulator.paths(1.0, 10, 5)
+        daily = paths[:, 1:] / paths[:, :-1] - 1
+
+        for row in daily:
+            start = int(np.abs(history - row[0]).argmin())
+            expected = history[(start + np.arange(10)) % len(history)]
+            np.testing.assert_allclose(row, expected, atol=1e-5)
+
+    def test_invalid_inputs(self, history):
+        """Unknown methods and bootstraps without history are rejected."""
+        with pytest.raises(ValueError):
+            MonteCarloSimulator("garch")
+        with pytest.raises(ValueError):
+            MonteCarloSimulator("bootstrap")
+        with pytest.raises(ValueError):
+            MonteCarloSimulator("block_bootstrap", returns=history[:5], block_size=20)
+
+
+class TestSimulate:
+    """Test streamed percentile bands."""
+
+    def test_chunked_bands_match_exact(self):
+        """Histogram bands from chunks agree with exact percentiles."""
+        exact = MonteCarloSimulator(seed=4, chunk_size=50_000).simulate(100.0, 60, 50_000)
+        chunked = MonteCarloSimulator(seed=4, chunk_size=5_000).simulate(100.0, 60, 50_000)
+
+        np.testing.assert_allclose(chunked.final_values, exact.final_values, rtol=1e-5)
+        np.testing.assert_allclose(chunked.percentiles, exact.percentiles, rtol=2e-3)
+        assert list(exact.percentiles.columns) == [5, 25, 50, 75, 95]
+        assert len(exact.percentiles) == 61
+        assert (exact.percentiles.iloc[0] == 100.0).all()
+
+    def test_max_drawdowns(self):
+        """Drawdowns are measured from the running peak, starting value included."""
+        simulator = MonteCarloSimulator(seed=5)
+        paths = simulator.paths(1.0, 50, 200)
+        result = simulator.simulate(1.0, 50, 200)
+
+        peaks = np.maximum.accumulate(paths, axis=1)
+        expected = (1 - paths / peaks).max(axis=1)
+        np.testing.assert_allclose(result.max_drawdowns, expected, rtol=1e-4, atol=1e-6)
+
+    def test_summary(self, history):
+        """Summary statistics describe the terminal distribution."""
+        result = MonteCarloSimulator("bootstrap", returns=history, seed=6).simulate(
+            100.0, 252, 10_000
+        )
+        summary = result.summary()
+
+        assert 0 < summary["prob_loss"] < 1
+        assert summary["cvar_95"] <= summary["var_95"] < 0
+        assert 0 < summary["median_max_drawdown"] <= summary["p95_max_drawdown"] < 1
+
+    def test_large_run_is_fast(self):
+        """100k one-year paths stream in a few seconds even on slow machines."""
+        simulator = MonteCarloSimulator(seed=8)
+        start = time.perf_counter()
+        result = simulator.simulate(100.0, 252, 100_000)
+
+        assert time.perf_counter() - start < 5.0
+        assert len(result.final_values) == 100_000
@@ -0,0 +1,288 @@
+"""Tests for metric recording and the Prometheus exporter."""
+
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from athena.backtest.cache import BacktestCache
+from athena.backtest.engine import BacktestEngine
+from athena.backtest.walk_forward import WalkForwardValidator
+from athena.live.brokers.base import BrokerMetrics, ConnectionState
+from athena.ops import prometheus_exporter
+from athena.ops.prometheus_exporter import (
+    PROMETHEUS_AVAILABLE,
+    DeferredRecorder,
+    PrometheusExporter,
+    record_metric,
+)
+from athena.optimize.optimizer import StrategyOptimizer
+from athena.strategies.sma_crossover import SMACrossoverStrategy
+
+
+class CapturingExporter:
+    """Stand-in exporter that keeps every applied event."""
+
+    enabled = True
+    deferred = None
+
+    def __init__(self):
+        self.events = []
+
+    def apply(self, metric_type, kwargs):
+        self.events.append((metric_type, kwargs))
+
+    def of_type(self, metric_type):
+        return [kwargs for kind, kwargs in self.events if kind == metric_type]
+
+
+@pytest.fixture
+def captured(monkeypatch):
+    """Route record_metric into a capturing exporter."""
+    exporter = CapturingExporter()
+    monkeypatch.setattr(prometheus_exporter, "_exporter", exporter)
+    return exporter
+
+
+@pytest.fixture
+def sample_data():
+    """250 days of random-walk OHLCV data."""
+    dates = pd.date_range(start="2023-01-01", periods=250, freq="D")
+    rng = np.random.default_rng(42)
+    prices = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, 250)))
+    return pd.DataFrame(
+        {
+            "open": prices,
+            "high": prices * 1.01,
+            "low": prices * 0.99,
+            "close": prices,
+            "volume": 1_000_000,
+        },
+        index=dates,
+    )
+
+
+class TestDeferredRecorder:
+    """Test the hot-path metric queue."""
+
+    def test_flush_applies_in_order(self):
+        """Queued events are applied once, in submission order."""
+        applied = []
+        recorder = DeferredRecorder(lambda metric_type, kwargs: applied.append(kwargs["n"]))
+        for n in range(5):
+            recorder.submit("order", {"n": n})
+
+        assert recorder.pending == 5
+        assert recorder.flush() == 5
+        assert recorder.flush() == 0
+        assert applied == [0, 1, 2, 3, 4]
+
+    def test_drops_when_full(self):
+        """A full queue drops and counts new events instead of growing."""
+        recorder = DeferredRecorder(lambda metric_type, kwargs: None, max_pending=3)
+        for n in range(5):
+            recorder.submit("order", {"n": n})
+
+        assert recorder.pending == 3
+        assert recorder.dropped == 2
+
+    def test_background_thread_flushes(self):
+        """The flush thread applies events off the submitting thread."""
+        threads = set()
+        recorder = DeferredRecorder(
+            lambda metric_type, kwargs: threads.add(threading.current_thread().name),
+            flush_interval=0.01,
+        )
+        recorder.start()
+        recorder.submit("order", {})
+        for _ in range(100):
+            if threads:
+                break
+            time.sleep(0.01)
+        recorder.stop()
+
+        assert threads == {"metrics-flush"}
+        assert not recorder.running
+
+    def test_stop_flushes_remaining(self):
+        """Stopping applies anything still queued."""
+        applied = []
+        recorder = DeferredRecorder(lambda metric_type, kwargs: applied.append(metric_type),
+                                    flush_interval=60)
+        recorder.start()
+        recorder.submit("trade", {})
+        recorder.stop()
+
+        assert applied == ["trade"]
+
+    def test_submit_overhead(self):
+        """Queueing an event costs well under the cost of applying it."""
+        recorder = DeferredRecorder(lambda metric_type, kwargs: None)
+        kwargs = {"broker": "test"}
+        start = time.perf_counter()
+        for _ in range(10000):
+            recorder.submit("order", kwargs)
+        per_event = (time.perf_counter() - start) / 10000
+
+        assert per_event < 5e-6
+
+
+class TestRecordMetric:
+    """Test the module-level recording entry point."""
+
+    def test_noop_without_exporter(self, monkeypatch):
+        """Recording before initialization is a no-op."""
+        monkeypatch.setattr(prometheus_exporter, "_exporter", None)
+        record_metric("order", broker="test", data={})
+
+    def test_disabled_without_client(self):
+        """The exporter disables itself when prometheus_client is missing."""
+        if PROMETHEUS_AVAILABLE:
+            pytest.skip("prometheus_client is installed")
+        assert not PrometheusExporter().enabled
+
+
+class TestResearchInstrumentation:
+    """Test throughput metrics emitted by backtests, optimizations and walk-forward."""
+
+    def test_backtest_stage_timings(self, captured, sample_data):
+        """Backtests report bars and per-stage timings."""
+        engine = BacktestEngine(initial_capital=100000, commission=0.001)
+        engine.run(SMACrossoverStrategy(fast_period=5, slow_period=20), sample_data, "TEST")
+
+        [event] = captured.of_type("backtest")
+        assert event["bars"] == len(sample_data)
+        assert set(event["stages"]) == {"signals", "simulation", "metrics"}
+        assert event["duration"] >= sum(event["stages"].values())
+        assert engine.timings == event["stages"]
+
+    def test_cache_hits_and_misses(self, captured, sample_data, tmp_path):
+        """Cache lookups are reported, and hits skip the simulation stages."""
+        engine = BacktestEngine(
+            initial_capital=100000, commission=0.001,
+            cache=BacktestCache(cache_dir=tmp_path, enabled=True),
+        )
+        strategy = SMACrossoverStrategy(fast_period=5, slow_period=20)
+        engine.run(strategy, sample_data, "TEST")
+        engine.run(strategy, sample_data, "TEST")
+
+        assert [event["hit"] for event in captured.of_type("cache")] == [False, True]
+        assert len(captured.of_type("backtest")) == 1
+        assert set(engine.timings) == {"cache"}
+
+    def test_optimizer_throughput(self, captured, sample_data):
+        """Every trial is reported with its outcome, plus overall throughput."""
+        optimizer = StrategyOptimizer(initial_capital=100000, commission=0.001)
+        space = {
+            "fast_period": {"type": "int", "low": 5, "high": 10, "step": 5},
+            "slow_period": {"type": "int", "low": 20, "high": 30, "step": 10},
+        }
+        results = optimizer.optimize(SMACrossoverStrategy, sample_data, "TEST", space, n_trials=10)
+
+        trials = captured.of_type("trial")
+        assert len(trials) == 10
+        assert sum(t["outcome"] == "memo" for t in trials) == results["memo_hits"]
+
+        [summary] = captured.of_type("optimization")
+        assert summary["trials"] == 10
+        assert 0 < summary["worker_utilization"] <= 1
+        assert results["trials_per_second"] > 0
+
+    def test_walk_forward_windows(self, captured, sample_data):
+        """Each walk-forward window is timed."""
+        validator = WalkForwardValidator(train_period_days=60, test_period_days=30)
+        result = validator.run(
+            SMACrossoverStrategy(fast_period=5, slow_period=20), sample_data, "TEST"
+        )
+
+        windows = captured.of_type("walk_forward")
+        assert len(windows) == result.metadata["num_windows"]
+        assert result.metadata["duration_seconds"] >= sum(w["duration"] for w in windows)
+
+
+@pytest.mark.skipif(not PROMETHEUS_AVAILABLE, reason="prometheus_client not installed")
+class TestPrometheusExporter:
+    """Test exporter updates against a private registry."""
+
+    @pytest.fixture
+    def exporter(self, monkeypatch):
+        from prometheus_client import CollectorRegistry
+
+        exporter = PrometheusExporter(registry=CollectorRegistry())
+        monkeypatch.setattr(prometheus_exporter, "_exporter", exporter)
+        return exporter
+
+    def order_count(self, exporter):
+        return exporter.registry.get_sample_value(
+            "athena_orders_total",
+            {"broker": "test", "symbol": "AAPL", "side": "buy",
+             "order_type": "market", "status": "filled"},
+        ) or 0
+
+    def test_label_children_cached(self, exporter):
+        """Repeated updates reuse the resolved label child."""
+        data = {"symbol": "AAPL", "side": "buy", "order_type": "market", "status": "filled"}
+        record_metric("order", broker="test", data=data)
+        labels = ("test", "AAPL", "buy", "market", "filled")
+        child = exporter._children[exporter.orders_total][labels]
+        record_metric("order", broker="test", data=data)
+
+        assert exporter._child(exporter.orders_total, *labels) is child
+        assert self.order_count(exporter) == 2
+
+    def test_broker_counters_follow_totals(self, exporter):
+        """Broker totals advance the counters by the change since the last update."""
+
+        class StubBroker:
+            state = ConnectionState.CONNECTED
+            metrics = BrokerMetrics(reconnect_count=2, dropped_ticks=5)
+
+            def get_uptime(self):
+                return 10.0
+
+        broker = StubBroker()
+        exporter.update_broker_metrics(broker)
+        broker.metrics.reconnect_count = 3
+        exporter.update_broker_metrics(broker)
+
+        sample = exporter.registry.get_sample_value
+        assert sample("athena_broker_reconnects_total", {"broker": "stubbroker"}) == 3
+        assert sample("athena_dropped_ticks_total", {"broker": "stubbroker", "symbol": "*"}) == 5
+
+    def test_deferred_updates_apply_on_flush(self, exporter):
+        """Deferred events reach the registry only when flushed."""
+        exporter.start_deferred(flush_interval=60)
+        data = {"symbol": "AAPL", "side": "buy", "order_type": "market", "status": "filled"}
+        record_metric("order", broker="test", data=data)
+
+        assert self.order_count(exporter) == 0
+        exporter.stop_deferred()
+        assert self.order_count(exporter) == 1
+
+    def test_latency_quantiles_exported(self, exporter):
+        """Latency percentiles are exported at scrape time."""
+        for latency in [0.001] * 99 + [0.5]:
+            record_metric("latency", broker="test", endpoint="order", latency=latency)
+
+        p999 = exporter.registry.get_sample_value(
+            "athena_api_latency_quantile_seconds",
+            {"broker": "test", "endpoint": "order", "quantile": "0.999"},
+        )
+        assert p999 == pytest.approx(0.5)
+
+    def test_research_metrics(self, exporter):
+        """Backtest, cache and trial events land in their counters."""
+        record_metric("backtest", strategy="sma", symbol="SPY", duration=0.5, bars=1000,
+                      stages={"signals": 0.1, "simulation": 0.3, "metrics": 0.1})
+        record_metric("cache", cache="backtest", hit=True)
+        record_metric("trial", strategy="sma", outcome="memo", duration=0.001)
+
+        sample = exporter.registry.get_sample_value
+        assert sample("athena_backtest_bars_total", {"strategy": "sma"}) == 1000
+        assert sample("athena_backtest_bars_per_second", {"strategy": "sma"}) == 2000
+        assert sample("athena_backtest_stage_seconds_count", {"stage": "simulation"}) == 1
+        assert sample("athena_cache_requests_total", {"cache": "backtest", "result": "hit"}) == 1
+        assert sample("athena_optimization_trials_total",
+                      {"strategy": "sma", "outcome": "memo"}) == 1
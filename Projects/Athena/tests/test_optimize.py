@@ -0,0 +1,250 @@
+"""Tests for strategy parameter optimization."""
+
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from athena.backtest.engine import BacktestEngine
+from athena.optimize.grid import (
+    best_grid_params,
+    crossover_signals,
+    rolling_mean_matrix,
+    signals_to_positions,
+    sma_grid_search,
+)
+from athena.optimize.optimizer import StrategyOptimizer
+from athena.strategies.sma_crossover import SMACrossoverStrategy
+
+
+@pytest.fixture
+def sample_data():
+    """Create sample OHLCV data for testing."""
+    dates = pd.date_range(start="2023-01-01", periods=250, freq="D")
+    np.random.seed(42)
+    prices = 100 * np.exp(np.cumsum(np.random.randn(250) * 0.02))
+
+    return pd.DataFrame(
+        {
+            "open": prices,
+            "high": prices * 1.01,
+            "low": prices * 0.99,
+            "close": prices,
+            "volume": np.random.randint(1000000, 10000000, 250),
+        },
+        index=dates,
+    )
+
+
+# Small stepped space so TPE resamples identical combinations
+SMALL_SPACE = {
+    "fast_period": {"type": "int", "low": 5, "high": 10, "step": 5},
+    "slow_period": {"type": "int", "low": 20, "high": 30, "step": 10},
+}
+
+
+class TestTrialMemoization:
+    """Test duplicate-parameter trial handling."""
+
+    def test_duplicate_params_not_rebacktested(self, sample_data):
+        """Each distinct parameter set is backtested once."""
+        optimizer = StrategyOptimizer(initial_capital=100000, commission=0.001)
+
+        with patch.object(
+            BacktestEngine, "run", autospec=True, side_effect=BacktestEngine.run
+        ) as run:
+            results = optimizer.optimize(
+                SMACrossoverStrategy, sample_data, "TEST", SMALL_SPACE, n_trials=20
+            )
+
+        assert results["n_trials"] == 20
+        assert run.call_count <= 4
+        assert results["memo_hits"] == 20 - run.call_count
+
+    def test_memoized_trials_keep_metrics(self, sample_data):
+        """Memoized trials report the same value and metrics as the original."""
+        optimizer = StrategyOptimizer(initial_capital=100000, commission=0.001)
+        results = optimizer.optimize(
+            SMACrossoverStrategy, sample_data, "TEST", SMALL_SPACE, n_trials=12
+        )
+
+        by_params = {}
+        for trial in results["study"].trials:
+            key = tuple(sorted(trial.params.items()))
+            by_params.setdefault(key, []).append(trial)
+
+        for trials in by_params.values():
+            assert len({t.value for t in trials}) == 1
+            assert len({t.user_attrs["total_return"] for t in trials}) == 1
+
+        assert "sharpe_ratio" in results["study"].best_trial.user_attrs
+
+
+class TestPersistentStudies:
+    """Test RDB-backed study storage."""
+
+    def test_resume_study_from_storage(self, sample_data, tmp_path):
+        """A second run resumes the stored study and answers known params from memo."""
+        storage = f"sqlite:///{tmp_path / 'optuna.db'}"
+
+        first = StrategyOptimizer(initial_capital=100000, commission=0.001, storage=storage)
+        first_results = first.optimize(
+            SMACrossoverStrategy, sample_data, "TEST", SMALL_SPACE, n_trials=8
+        )
+
+        second = StrategyOptimizer(initial_capital=100000, commission=0.001, storage=storage)
+        with patch.object(BacktestEngine, "run") as run:
+            second_results = second.optimize(
+                SMACrossoverStrategy, sample_data, "TEST", SMALL_SPACE, n_trials=4
+            )
+
+        assert second_results["study_name"] == first_results["study_name"]
+        assert second_results["n_trials"] == 12
+        run.assert_not_called()
+        assert second_results["memo_hits"] == 4
+
+    def test_different_data_uses_new_study(self, sample_data, tmp_path):
+        """Default study names include a data fingerprint."""
+        storage = f"sqlite:///{tmp_path / 'optuna.db'}"
+        optimizer = StrategyOptimizer(initial_capital=100000, commission=0.001, storage=storage)
+
+        first = optimizer.optimize(
+            SMACrossoverStrategy, sample_data, "TEST", SMALL_SPACE, n_trials=2
+        )
+        second = optimizer.optimize(
+            SMACrossoverStrategy, sample_data.iloc[10:], "TEST", SMALL_SPACE, n_trials=2
+        )
+
+        assert first["study_name"] != second["study_name"]
+        assert second["n_trials"] == 2
+
+    def test_engine_settings_use_new_study(self, sample_data, tmp_path):
+        """Trials run with other engine settings are never reused."""
+        storage = f"sqlite:///{tmp_path / 'optuna.db'}"
+        cheap = StrategyOptimizer(initial_capital=100000, commission=0.0001, storage=storage)
+        costly = StrategyOptimizer(initial_capital=100000, commission=0.05, storage=storage)
+
+        first = cheap.optimize(SMACrossoverStrategy, sample_data, "TEST", SMALL_SPACE, n_trials=4)
+        with patch.object(
+            BacktestEngine, "run", autospec=True, side_effect=BacktestEngine.run
+        ) as run:
+            second = costly.optimize(
+                SMACrossoverStrategy, sample_data, "TEST", SMALL_SPACE, n_trials=4
+            )
+
+        assert first["study_name"] != second["study_name"]
+        assert second["n_trials"] == 4
+        assert run.call_count >= 1
+        assert second["best_objective"] != first["best_objective"]
+
+    def test_named_study_rejects_other_setup(self, sample_data, tmp_path):
+        """Resuming a named study with different weights fails instead of mixing results."""
+        storage = f"sqlite:///{tmp_path / 'optuna.db'}"
+        optimizer = StrategyOptimizer(initial_capital=100000, commission=0.001, storage=storage)
+        optimizer.optimize(
+            SMACrossoverStrategy, sample_data, "TEST", SMALL_SPACE, n_trials=2, study_name="sma"
+        )
+
+        with pytest.raises(ValueError, match="does not match"):
+            optimizer.optimize(
+                SMACrossoverStrategy,
+                sample_data,
+                "TEST",
+                SMALL_SPACE,
+                n_trials=2,
+                study_name="sma",
+                objective_weights={"sharpe": 1.0, "drawdown_penalty": 0.0},
+            )
+
+    def test_failed_backtests_not_memoized(self, sample_data):
+        """A failed backtest is retried when the same parameters come up again."""
+        optimizer = StrategyOptimizer(initial_capital=100000, commission=0.001)
+
+        with patch.object(BacktestEngine, "run", side_effect=RuntimeError("data feed")) as run:
+            results = optimizer.optimize(
+                SMACrossoverStrategy, sample_data, "TEST", SMALL_SPACE, n_trials=8
+            )
+
+        assert run.call_count == 8
+        assert results["memo_hits"] == 0
+
+
+class TestVectorizedGrid:
+    """Test the vectorized SMA grid evaluator."""
+
+    def test_rolling_mean_matches_pandas(self, sample_data):
+        """Cumulative-sum SMAs match pandas rolling means."""
+        close = sample_data["close"]
+        matrix = rolling_mean_matrix(close.to_numpy(), [5, 20])
+
+        for row, period in enumerate([5, 20]):
+            expected = close.rolling(period, min_periods=period).mean().to_numpy()
+            np.testing.assert_allclose(matrix[row], expected, equal_nan=True)
+
+    def test_signals_match_strategy(self, sample_data):
+        """Grid crossover signals equal SMACrossoverStrategy.generate_signals."""
+        fast_periods, slow_periods = [5, 10], [20, 40]
+        close = sample_data["close"].to_numpy()
+        signals = crossover_signals(
+            rolling_mean_matrix(close, fast_periods), rolling_mean_matrix(close, slow_periods)
+        )
+
+        for i, fast in enumerate(fast_periods):
+            for j, slow in enumerate(slow_periods):
+                expected = SMACrossoverStrategy(fast, slow).generate_signals(sample_data)
+                np.testing.assert_array_equal(signals[i, j], expected.to_numpy())
+
+    def test_positions_forward_fill(self):
+        """Buys are held until the next sell."""
+        signals = np.array([[0, 1, 0, 0, -1, 0, 1, 0]])
+        np.testing.assert_array_equal(signals_to_positions(signals), [[0, 1, 1, 1, 0, 0, 1, 1]])
+
+    def test_scores_match_per_combo_loop(self, sample_data):
+        """Grid scores equal a straightforward pandas evaluation of each combination."""
+        close = sample_data["close"]
+        scores = sma_grid_search(close, [5, 10, 30], [20, 40], metric="sharpe")
+
+        returns = close.pct_change().fillna(0)
+        for fast in [5, 10]:
+            for slow in [20, 40]:
+                signals = SMACrossoverStrategy(fast, slow).generate_signals(sample_data)
+                position = signals.replace(0, np.nan).ffill().fillna(0).clip(lower=0)
+                strategy_returns = (position.shift(1) * returns).fillna(0)
+                expected = strategy_returns.mean() / strategy_returns.std(ddof=0) * np.sqrt(252)
+                assert scores.loc[fast, slow] == pytest.approx(expected)
+
+        # fast >= slow is invalid
+        assert np.isnan(scores.loc[30, 20])
+
+    def test_best_params(self, sample_data):
+        """The best combination is the grid argmax."""
+        scores = sma_grid_search(sample_data["close"], range(5, 20, 5), range(20, 60, 10))
+        best = best_grid_params(scores)
+
+        assert scores.loc[best["fast_period"], best["slow_period"]] == np.nanmax(scores.values)
+
+    def test_unknown_metric(self, sample_data):
+        """Unsupported metrics raise ValueError."""
+        with pytest.raises(ValueError):
+            sma_grid_search(sample_data["close"], [5], [20], metric="sortino")
+
+    def test_strategy_grid_fallback(self, sample_data):
+        """optimize_parameters uses the grid when Optuna is unavailable."""
+        strategy = SMACrossoverStrategy()
+        with patch.dict("sys.modules", {"optuna": None}):
+            params = strategy.optimize_parameters(
+                sample_data, fast_range=(5, 15), slow_range=(20, 50)
+            )
+
+        assert params["fast_period"] < params["slow_period"]
+
+    def test_strategy_grid_fallback_short_data(self, sample_data):
+        """Too little data for any grid combination keeps the current periods."""
+        strategy = SMACrossoverStrategy(fast_period=5, slow_period=20)
+        with patch.dict("sys.modules", {"optuna": None}):
+            params = strategy.optimize_parameters(
+                sample_data.iloc[:30], fast_range=(10, 20), slow_range=(40, 60)
+            )
+
+        assert params == {"fast_period": 5, "slow_period": 20}
@@ -0,0 +1,162 @@
+"""Tests for profiling spans and profile output."""
+
+import asyncio
+import json
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from athena.backtest.engine import BacktestEngine
+from athena.core import profiling
+from athena.core.profiling import Profiler, profiled, span, start_profiling, stop_profiling
+from athena.strategies.sma_crossover import SMACrossoverStrategy
+
+
+@pytest.fixture
+def profiler():
+    """Profile for the duration of a test."""
+    profiler = start_profiling()
+    yield profiler
+    stop_profiling()
+
+
+def busy(seconds: float) -> None:
+    """Spin for a short, measurable interval."""
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+class TestSpans:
+    """Test span recording."""
+
+    def test_noop_when_off(self):
+        """Without a profiler, spans are a shared no-op and decorators pass through."""
+        @profiled()
+        def add(a, b):
+            return a + b
+
+        assert profiling.get_profiler() is None
+        assert span("a") is span("b")
+        assert add(1, 2) == 3
+
+    def test_timings_kept_when_off(self):
+        """Spans given a timings dict time their block even without a profiler."""
+        timings = {}
+        with span("stage.work", timings, "work"):
+            busy(0.002)
+
+        assert profiling.get_profiler() is None
+        assert timings["work"] >= 0.002
+
+    def test_timings_and_profiler_agree(self, profiler):
+        """One span feeds both the profiler and the timings dict."""
+        timings = {}
+        with span("stage.work", timings):
+            busy(0.002)
+
+        [row] = profiler.summary()
+        assert row["total_ms"] == pytest.approx(timings["stage.work"] * 1000)
+
+    def test_nested_self_time(self, profiler):
+        """A parent's self time excludes its children."""
+        with span("outer"):
+            busy(0.002)
+            for _ in range(3):
+                with span("inner"):
+                    busy(0.002)
+
+        rows = {row["name"]: row for row in profiler.summary()}
+        assert rows["inner"]["count"] == 3
+        assert rows["outer"]["count"] == 1
+        assert rows["outer"]["total_ms"] >= rows["inner"]["total_ms"]
+        assert rows["outer"]["self_ms"] == pytest.approx(
+            rows["outer"]["total_ms"] - rows["inner"]["total_ms"]
+        )
+
+    def test_decorator_sync_and_async(self, profiler):
+        """Decorated functions and coroutines record under their span names."""
+        @profiled("compute")
+        def compute():
+            return 1
+
+        @profiled()
+        async def fetch():
+            await asyncio.sleep(0)
+            return compute()
+
+        assert asyncio.run(fetch()) == 1
+        _, stacks = profiler._merged()
+        assert any(path[-1] == "compute" and len(path) == 2 for path in stacks)
+
+    def test_only_one_active(self, profiler):
+        """Starting a second profiler is refused."""
+        with pytest.raises(RuntimeError):
+            start_profiling()
+
+    def test_unknown_capture(self):
+        """Unknown capture backends are rejected."""
+        with pytest.raises(ValueError):
+            Profiler(capture="perf")
+
+
+class TestOutput:
+    """Test profile serialization."""
+
+    def test_speedscope_and_folded(self, profiler, tmp_path):
+        """Saved profiles are valid speedscope JSON and folded stacks."""
+        with span("run"):
+            busy(0.002)
+            with span("step"):
+                busy(0.002)
+
+        paths = profiler.save(tmp_path, "test")
+        document = json.loads(paths["speedscope"].read_text())
+        frames = [frame["name"] for frame in document["shared"]["frames"]]
+        [profile] = document["profiles"]
+
+        assert profile["type"] == "sampled"
+        assert len(profile["samples"]) == len(profile["weights"])
+        assert profile["endValue"] == sum(profile["weights"])
+        assert [[frames[i] for i in sample] for sample in profile["samples"]] == [
+            ["run"], ["run", "step"]
+        ]
+
+        lines = paths["folded"].read_text().splitlines()
+        assert [line.rsplit(" ", 1)[0] for line in lines] == ["run", "run;step"]
+        assert all(int(line.rsplit(" ", 1)[1]) > 0 for line in lines)
+
+    def test_cprofile_capture(self, tmp_path):
+        """The cProfile backend writes a pstats file alongside the spans."""
+        with profiling.profiling(tmp_path, "capture", capture="cprofile") as profiler:
+            with span("run"):
+                busy(0.001)
+
+        assert (tmp_path / "capture.prof").exists()
+        assert (tmp_path / "capture.speedscope.json").exists()
+        assert profiler.duration > 0
+        assert profiling.get_profiler() is None
+
+
+class TestInstrumentation:
+    """Test spans emitted by the engines."""
+
+    def test_backtest_stages(self, profiler):
+        """Backtests record each stage under the run span."""
+        dates = pd.date_range(start="2023-01-01", periods=120, freq="D")
+        prices = 100 + np.cumsum(np.random.default_rng(0).normal(0, 1, 120))
+        data = pd.DataFrame(
+            {"open": prices, "high": prices, "low": prices, "close": prices, "volume": 1000},
+            index=dates,
+        )
+        BacktestEngine(initial_capital=100000).run(
+            SMACrossoverStrategy(fast_period=5, slow_period=20), data, "TEST"
+        )
+
+        _, stacks = profiler._merged()
+        assert ("backtest.run", "backtest.signals",
+                "SMACrossoverStrategy.generate_signals") in stacks
+        assert ("backtest.run", "backtest.simulation") in stacks
+        assert ("backtest.run", "backtest.metrics") in stacks
@@ -0,0 +1,249 @@
+"""Tests for clocks, simulated time in live components and historical replay."""
+
+import asyncio
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from athena.core.clock import MonotonicClock, VirtualClock, WallClock
+from athena.core.types import Order, OrderSide, OrderStatus, OrderType
+from athena.live.broker import SimulatedBroker
+from athena.live.brokers import BrokerConfig, InteractiveBroker
+from athena.live.execution_guard import (
+    ExecutionGuard,
+    ExecutionGuardConfig,
+    GuardViolationType,
+)
+from athena.live.paper_trader import PaperTradingEngine
+from athena.live.replay import ReplayFeed
+from athena.strategies.sma_crossover import SMACrossoverStrategy
+
+
+@pytest.fixture
+def minute_bars():
+    """Two days of oscillating one-minute bars."""
+    index = pd.date_range("2024-01-02 09:30", periods=2000, freq="1min")
+    close = 100 + 5 * np.sin(np.arange(2000) / 60)
+    return pd.DataFrame(
+        {
+            "open": close - 0.1,
+            "high": close + 0.5,
+            "low": close - 0.5,
+            "close": close,
+            "volume": 1000.0,
+        },
+        index=index,
+    )
+
+
+class TestClock:
+    """Test wall and virtual clocks."""
+
+    def test_wall_clock(self):
+        """Wall clock follows real time."""
+        clock = WallClock()
+        assert abs((clock.now() - datetime.now()).total_seconds()) < 1
+        assert clock.monotonic() <= time.monotonic()
+
+    def test_monotonic_clock_tracks_wall_time(self):
+        """The monotonic clock starts at wall time and never goes backwards."""
+        clock = MonotonicClock()
+        first, second = clock.now(), clock.now()
+
+        assert abs((first - datetime.now()).total_seconds()) < 1
+        assert second >= first
+
+    def test_virtual_clock_moves_only_forward(self):
+        """Advancing to an earlier time is a no-op."""
+        clock = VirtualClock(start="2024-01-01")
+        clock.advance_to("2024-01-02")
+        clock.advance_to("2024-01-01 12:00")
+
+        assert clock.now() == datetime(2024, 1, 2)
+        assert clock.monotonic() == 86400
+        with pytest.raises(ValueError):
+            clock.advance(-1)
+
+    def test_virtual_sleep_is_instant(self):
+        """Sleeping an hour of virtual time takes no real time."""
+        clock = VirtualClock(start="2024-01-01")
+        start = time.monotonic()
+        asyncio.run(clock.sleep(3600))
+
+        assert time.monotonic() - start < 0.1
+        assert clock.now() == datetime(2024, 1, 1, 1)
+
+
+def small_order(symbol="AAPL"):
+    """A market order well inside the guard's size limits."""
+    return Order(symbol=symbol, side=OrderSide.BUY, quantity=1, order_type=OrderType.MARKET)
+
+
+class TestSimulatedTime:
+    """Test live components running on a virtual clock."""
+
+    def test_guard_halt_expires_in_virtual_time(self):
+        """Auto-resume halts lift after the halt duration of simulated time."""
+        clock = VirtualClock(start="2024-01-02 09:30")
+        guard = ExecutionGuard(
+            ExecutionGuardConfig(auto_resume_enabled=True, default_halt_duration_minutes=15),
+            clock=clock,
+        )
+
+        async def run():
+            await guard.force_halt("test")
+            blocked, _ = await guard.check_order_allowed(small_order())
+            clock.advance(16 * 60)
+            allowed, _ = await guard.check_order_allowed(small_order())
+            return blocked, allowed
+
+        assert asyncio.run(run()) == (False, True)
+
+    def test_guard_violations_stamped_with_clock(self):
+        """Every violation, returned or recorded, carries simulated time."""
+        clock = VirtualClock(start="2024-01-02 09:30")
+        guard = ExecutionGuard(ExecutionGuardConfig(max_latency_ms=100), clock=clock)
+
+        async def run():
+            latency = await guard.check_connectivity(500, is_connected=True)
+            await guard.force_halt("test")
+            _, halted = await guard.check_order_allowed(small_order())
+            return latency, halted
+
+        latency, halted = asyncio.run(run())
+
+        assert latency.timestamp == halted.timestamp == datetime(2024, 1, 2, 9, 30)
+        assert [v.timestamp for v in guard.violations] == [datetime(2024, 1, 2, 9, 30)]
+
+    def test_guard_rate_window_rolls_in_virtual_time(self):
+        """The per-minute order window empties as simulated time passes."""
+        clock = VirtualClock(start="2024-01-02 09:30")
+        guard = ExecutionGuard(ExecutionGuardConfig(max_orders_per_minute=3), clock=clock)
+
+        async def run():
+            results = [await guard.check_order_allowed(small_order()) for _ in range(4)]
+            clock.advance(61)
+            results.append(await guard.check_order_allowed(small_order()))
+            return results
+
+        results = asyncio.run(run())
+
+        assert [allowed for allowed, _ in results] == [True, True, True, False, True]
+        assert results[3][1].type == GuardViolationType.ORDER_RATE_LIMIT
+        assert results[3][1].timestamp == datetime(2024, 1, 2, 9, 30)
+        assert guard.get_status()["recent_orders"] == 1
+
+    def test_broker_telemetry_uses_clock(self):
+        """Heartbeats, uptime and simulated order delays follow the broker clock."""
+        clock = VirtualClock(start="2024-01-02 09:30")
+        broker = InteractiveBroker(BrokerConfig(), clock=clock)
+
+        async def run():
+            await broker.connect()
+            start = time.monotonic()
+            await broker.place_order(small_order())
+            return time.monotonic() - start
+
+        elapsed = asyncio.run(run())
+
+        assert elapsed < 0.1  # The simulated 100ms IB delay is virtual
+        assert broker.get_uptime() == pytest.approx(0.1)
+        broker.update_heartbeat()
+        assert broker.metrics.last_heartbeat == clock.now()
+
+
+class TestReplayFeed:
+    """Test replaying bars through the simulated broker."""
+
+    def test_ticks_use_close_and_volume(self, minute_bars):
+        """Each bar becomes one tick at its close."""
+        ticks = list(ReplayFeed(minute_bars.head(3), "AAPL"))
+
+        assert [tick.price for tick in ticks] == list(minute_bars["close"].head(3))
+        assert ticks[0].volume == 1000.0
+        assert ticks[0].timestamp == minute_bars.index[0]
+
+    def test_expand_bars_visits_extremes(self, minute_bars):
+        """Expanded bars emit open, both extremes and close within the bar."""
+        ticks = list(ReplayFeed(minute_bars.head(2), "AAPL", expand_bars=True))
+        bar = minute_bars.iloc[0]
+
+        assert len(ticks) == 8
+        assert {tick.price for tick in ticks[:4]} == {bar.open, bar.high, bar.low, bar.close}
+        assert ticks[3].timestamp < minute_bars.index[1]
+
+    def test_replay_into_broker_uses_virtual_time(self, minute_bars):
+        """Resting orders fill during replay with historical timestamps."""
+        feed = ReplayFeed(minute_bars, "AAPL", expand_bars=True)
+        broker = SimulatedBroker(commission=0.0, slippage=0.0, clock=feed.clock)
+        broker.connect()
+        broker.set_mock_price("AAPL", 100.0)
+        order = Order(symbol="AAPL", side=OrderSide.BUY, quantity=10,
+                      order_type=OrderType.LIMIT, price=96.0)
+        broker.place_order(order)
+
+        assert feed.replay_into(broker) == len(feed)
+        assert order.status == OrderStatus.FILLED
+        assert broker.trades[0].timestamp.year == 2024
+        assert feed.clock.now() >= minute_bars.index[-1].to_pydatetime()
+
+    def test_speed_paces_replay(self, minute_bars):
+        """A speed multiple spreads events over real time."""
+        # 10 minutes of bars at 6000x real time take ~0.1s
+        feed = ReplayFeed(minute_bars.head(11), "AAPL", speed=6000)
+
+        async def run():
+            start = time.monotonic()
+            async for _ in feed.stream():
+                pass
+            return time.monotonic() - start
+
+        assert 0.08 < asyncio.run(run()) < 1.0
+
+    def test_missing_price_column(self):
+        """Data without prices is rejected."""
+        with pytest.raises(ValueError):
+            ReplayFeed(pd.DataFrame({"volume": [1]}), "AAPL")
+
+    def test_from_parquet(self, minute_bars, tmp_path):
+        """Cached Parquet bars load with normalized column names."""
+        path = tmp_path / "bars.parquet"
+        minute_bars.rename(columns=str.title).to_parquet(path)
+
+        feed = ReplayFeed.from_parquet(path, "AAPL")
+
+        assert len(feed) == len(minute_bars)
+
+
+class TestPaperTradingReplay:
+    """Test running the paper trading engine over a replay."""
+
+    def test_strategy_trades_on_historical_time(self, minute_bars):
+        """Hours of minute bars replay in seconds and produce trades."""
+        feed = ReplayFeed(minute_bars.head(500), "AAPL")
+        engine = PaperTradingEngine(
+            SimulatedBroker(initial_capital=10000),
+            SMACrossoverStrategy(fast_period=5, slow_period=20),
+            "AAPL",
+        )
+        signals = []
+        engine.add_signal_callback(lambda signal, price, ts: signals.append(ts))
+
+        start = time.monotonic()
+        summary = engine.run_replay(feed)
+
+        assert time.monotonic() - start < 60
+        assert summary["total_trades"] > 0
+        assert all(ts.year == 2024 for ts in signals)
+        assert engine.broker.clock is feed.clock
+
+    def test_requires_simulated_broker(self, minute_bars):
+        """Replay is only supported on the simulated broker."""
+        engine = PaperTradingEngine(
+            object(), SMACrossoverStrategy(fast_period=5, slow_period=20), "AAPL"
+        )
+        with pytest.raises(TypeError):
+            engine.run_replay(ReplayFeed(minute_bars, "AAPL"))
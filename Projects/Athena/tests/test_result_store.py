@@ -0,0 +1,88 @@
+"""Tests for the dashboard's server-side result store."""
+
+import json
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from athena.backtest.engine import BacktestEngine
+from athena.dashboard.result_store import ResultStore, StoredResult
+from athena.strategies.sma_crossover import SMACrossoverStrategy
+
+
+@pytest.fixture
+def stored():
+    """A minute-bar sized result."""
+    index = pd.date_range("2020-01-01", periods=200_000, freq="min")
+    returns = pd.Series(np.random.default_rng(0).normal(0, 0.001, len(index)), index=index)
+    return StoredResult(
+        symbol="AAPL",
+        strategy="SMA Crossover",
+        params={"fast_period": 10},
+        metrics={"total_return": 0.1},
+        equity_curve=100000 * (1 + returns).cumprod(),
+        daily_returns=returns,
+    )
+
+
+class TestResultStore:
+    """Test storing and looking up results."""
+
+    def test_handle_is_small(self, stored):
+        """Only the handle is serialized for the browser."""
+        handle = ResultStore().put("abc", stored)
+
+        assert handle["id"] == "abc"
+        assert handle["params"] == {"fast_period": 10}
+        assert len(json.dumps(handle)) < 500
+
+    def test_lookup_by_handle_or_id(self, stored):
+        """Results are found by handle or bare ID; unknown ones are None."""
+        store = ResultStore()
+        handle = store.put("abc", stored)
+
+        assert store.get(handle) is stored
+        assert store.get("abc") is stored
+        assert store.get({"id": "missing"}) is None
+        assert store.get(None) is None
+
+    def test_lru_eviction(self, stored):
+        """The least recently used result is dropped first."""
+        store = ResultStore(max_results=2)
+        store.put("a", stored)
+        store.put("b", stored)
+        store.get("a")
+        store.put("c", stored)
+
+        assert "a" in store
+        assert "b" not in store
+        assert len(store) == 2
+
+    def test_derived_series_cached(self, stored):
+        """Drawdown and rolling Sharpe are computed once per result."""
+        assert stored.drawdown is stored.drawdown
+        assert stored.rolling_sharpe(30) is stored.rolling_sharpe(30)
+        assert stored.drawdown.max() == 0
+        assert (stored.drawdown <= 0).all()
+
+    def test_from_backtest(self):
+        """Engine results convert to picklable, JSON-safe metrics and trades."""
+        dates = pd.date_range("2023-01-01", periods=250, freq="D")
+        prices = 100 + np.cumsum(np.random.default_rng(1).normal(0, 1, len(dates)))
+        data = pd.DataFrame(
+            {"open": prices, "high": prices, "low": prices, "close": prices, "volume": 1000},
+            index=dates,
+        )
+        backtest = BacktestEngine(initial_capital=100000).run(
+            SMACrossoverStrategy(fast_period=5, slow_period=20), data, "TEST"
+        )
+
+        result = StoredResult.from_backtest(backtest, "TEST", "SMA Crossover", {"fast_period": 5})
+
+        assert result.metrics["final_capital"] == pytest.approx(backtest.final_capital)
+        assert len(result.trades) == len(backtest.trades)
+        json.dumps(result.handle("x"))
+        json.dumps(result.trades)
+        assert pickle.loads(pickle.dumps(result)).equity_curve.equals(result.equity_curve)
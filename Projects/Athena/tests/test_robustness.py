@@ -0,0 +1,142 @@
+"""Tests for Monte Carlo robustness analysis."""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from athena.backtest import robustness
+from athena.backtest.robustness import RobustnessAnalyzer
+from athena.core.types import BacktestResult, OrderSide, Trade
+
+
+def make_result(pnl, daily_returns, initial_capital=1000.0):
+    """Backtest result with the given trade P&Ls and daily returns."""
+    trades = [
+        Trade("TEST", OrderSide.BUY, 1.0, 100.0, datetime(2023, 1, 1), 0.0, pnl=p) for p in pnl
+    ]
+    daily_returns = pd.Series(daily_returns, dtype=float)
+    equity = initial_capital * (1 + daily_returns).cumprod()
+    return BacktestResult(
+        initial_capital=initial_capital,
+        final_capital=initial_capital + sum(p for p in pnl if p is not None),
+        total_return=0.0,
+        annual_return=0.0,
+        sharpe_ratio=1.0,
+        sortino_ratio=0.0,
+        max_drawdown=-0.1,
+        win_rate=0.0,
+        profit_factor=0.0,
+        total_trades=len(trades),
+        winning_trades=0,
+        losing_trades=0,
+        avg_win=0.0,
+        avg_loss=0.0,
+        best_trade=0.0,
+        worst_trade=0.0,
+        equity_curve=equity,
+        trades=trades,
+        daily_returns=daily_returns,
+    )
+
+
+@pytest.fixture
+def result():
+    """Nine winning trades, one large loss and a year of daily returns."""
+    returns = np.random.default_rng(0).normal(0.0005, 0.01, 252)
+    return make_result([100.0] * 9 + [-500.0], returns)
+
+
+class TestTradeTests:
+    """Test trade-level resampling."""
+
+    def test_trade_shuffle_drawdowns(self, result):
+        """The loss costs 500 from a peak set by the wins before it."""
+        outcome = RobustnessAnalyzer(result, n_resamples=5000, seed=1).run("trade_shuffle")
+
+        expected = 500 / (1000 + 100 * np.arange(10))
+        nearest = np.abs(outcome.max_drawdowns[:, None] - expected).min(axis=1)
+        assert nearest.max() < 1e-5
+        # Every position of the loss is about equally likely
+        assert len(np.unique(outcome.max_drawdowns.round(4))) == 10
+        np.testing.assert_allclose(outcome.terminal_wealth, 1400.0)
+        assert np.ptp(outcome.sharpe_ratios) == pytest.approx(0)
+
+    def test_skip_trades(self, result):
+        """Skipped trades remove their P&L from terminal wealth."""
+        none_skipped = RobustnessAnalyzer(result, skip_probability=0.0, seed=2).run(
+            "skip_trades", n_resamples=100
+        )
+        half_skipped = RobustnessAnalyzer(result, skip_probability=0.5, seed=2).run(
+            "skip_trades", n_resamples=20_000
+        )
+
+        np.testing.assert_allclose(none_skipped.terminal_wealth, 1400.0)
+        assert half_skipped.terminal_wealth.mean() == pytest.approx(1200.0, abs=5)
+        assert set(np.round(half_skipped.terminal_wealth) % 100) <= {0.0}
+
+    def test_missing_pnl_ignored(self):
+        """Trades without P&L are left out."""
+        analyzer = RobustnessAnalyzer(make_result([50.0, None, -20.0], [0.01, -0.01]))
+
+        np.testing.assert_allclose(analyzer.run("trade_shuffle", 10).terminal_wealth, 1030.0)
+
+
+class TestDailyBootstrap:
+    """Test daily return resampling."""
+
+    def test_constant_returns(self):
+        """Constant returns give one outcome and no drawdown."""
+        analyzer = RobustnessAnalyzer(make_result([], [0.001] * 100), seed=3)
+        outcome = analyzer.run("daily_bootstrap", 200)
+
+        np.testing.assert_allclose(outcome.terminal_wealth, 1000 * 1.001**100, rtol=1e-5)
+        np.testing.assert_allclose(outcome.max_drawdowns, 0.0, atol=1e-6)
+
+    def test_sharpe_matches_history(self, result):
+        """Bootstrapped Sharpe ratios center on the historical one."""
+        returns = result.daily_returns
+        historical = np.sqrt(252) * returns.mean() / returns.std()
+
+        outcome = RobustnessAnalyzer(result, block_size=5, seed=4).run("daily_bootstrap", 5000)
+
+        assert np.median(outcome.sharpe_ratios) == pytest.approx(historical, abs=0.15)
+        assert 0 < np.median(outcome.max_drawdowns) < 1
+
+
+class TestRobustnessAnalyzer:
+    """Test chunking, parallelism and validation."""
+
+    def test_reproducible_across_workers(self, result, monkeypatch):
+        """Seeded results do not depend on the number of worker processes."""
+        monkeypatch.setattr(robustness, "CHUNK_ELEMENTS", 1000)
+
+        serial = RobustnessAnalyzer(result, seed=5).run("skip_trades", 1000)
+        parallel = RobustnessAnalyzer(result, seed=5, n_jobs=2).run("skip_trades", 1000)
+
+        assert parallel.metadata["workers"] == 2
+        np.testing.assert_array_equal(serial.terminal_wealth, parallel.terminal_wealth)
+        np.testing.assert_array_equal(serial.max_drawdowns, parallel.max_drawdowns)
+
+    def test_run_all_and_summary(self):
+        """Tests without data are skipped; summaries cover every distribution."""
+        analyzer = RobustnessAnalyzer(make_result([], [0.01, -0.02, 0.015]), seed=6)
+
+        outcomes = analyzer.run_all(n_resamples=100)
+        summary = outcomes["daily_bootstrap"].summary()
+
+        assert list(outcomes) == ["daily_bootstrap"]
+        assert {"terminal_wealth_p50", "max_drawdown_p95", "sharpe_ratio_p5"} <= set(summary)
+        assert 0 <= summary["prob_loss"] <= 1
+
+    def test_invalid_inputs(self, result):
+        """Unknown tests, missing data and bad options are rejected."""
+        with pytest.raises(ValueError):
+            RobustnessAnalyzer(result).run("reverse")
+        with pytest.raises(ValueError):
+            RobustnessAnalyzer(make_result([], [0.01, 0.02])).run("trade_shuffle")
+        with pytest.raises(ValueError):
+            RobustnessAnalyzer(result, skip_probability=1.0)
+        with pytest.raises(ValueError):
+            RobustnessAnalyzer(result, block_size=0)
@@ -0,0 +1,286 @@
+"""Tests for websocket market-data streaming and backpressure."""
+
+import asyncio
+import json
+
+import pytest
+from websockets.asyncio.server import serve
+
+from athena.live.brokers import AlpacaBroker, BinanceBroker, BrokerConfig
+from athena.live.streaming import MarketDataStream, OverflowPolicy
+
+
+def price_parser(message):
+    """Parse {"s": symbol, "p": price} test messages."""
+    if "s" in message:
+        yield message["s"], message["p"]
+
+
+class MockFeed:
+    """Local websocket server that records control messages and pushes ticks."""
+
+    def __init__(self):
+        self.received = []
+        self.connections = []
+        self.url = None
+        self._server = None
+
+    async def _handler(self, websocket):
+        self.connections.append(websocket)
+        async for message in websocket:
+            self.received.append(json.loads(message))
+
+    async def __aenter__(self):
+        self._server = await serve(self._handler, "127.0.0.1", 0)
+        port = self._server.sockets[0].getsockname()[1]
+        self.url = f"ws://127.0.0.1:{port}"
+        return self
+
+    async def __aexit__(self, *exc):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def push(self, *messages):
+        """Send messages to the latest client."""
+        for message in messages:
+            await self.connections[-1].send(
+                message if isinstance(message, str) else json.dumps(message)
+            )
+
+
+async def wait_for(predicate, timeout=2.0):
+    """Poll until predicate() is true."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("Condition not met in time")
+        await asyncio.sleep(0.01)
+
+
+class TestMarketDataStream:
+    """Test the reader/dispatcher stream against a local websocket server."""
+
+    def test_delivers_ticks_in_order(self):
+        """Ticks reach the handler, with handshake sent before anything else."""
+        received = []
+
+        async def run():
+            async with MockFeed() as feed:
+                stream = MarketDataStream(
+                    feed.url,
+                    parser=price_parser,
+                    on_tick=lambda symbol, price: received.append((symbol, price)),
+                    policy=OverflowPolicy.DROP_OLDEST,
+                    handshake=[{"action": "auth"}],
+                )
+                await stream.start()
+                assert await stream.wait_connected(2)
+                await stream.send_json({"action": "subscribe"})
+                await feed.push({"s": "AAPL", "p": 1}, {"s": "MSFT", "p": 2}, {"s": "AAPL", "p": 3})
+                await wait_for(lambda: len(received) == 3)
+                await stream.close()
+                return feed.received, stream.stats
+
+        control, stats = asyncio.run(run())
+
+        assert received == [("AAPL", 1), ("MSFT", 2), ("AAPL", 3)]
+        assert control[0] == {"action": "auth"}
+        assert control[1] == {"action": "subscribe"}
+        assert stats["delivered"] == 3
+        assert stats["dropped"] == 0
+
+    def test_slow_handler_coalesces_to_latest(self):
+        """A slow async handler sees the latest price per symbol, not a backlog."""
+        received = []
+        drops = []
+
+        async def slow_handler(symbol, price):
+            received.append((symbol, price))
+            await asyncio.sleep(0.05)
+
+        async def run():
+            async with MockFeed() as feed:
+                stream = MarketDataStream(
+                    feed.url, price_parser, slow_handler, on_drop=lambda: drops.append(1)
+                )
+                await stream.start()
+                await stream.wait_connected(2)
+                await feed.push({"s": "AAPL", "p": 0})
+                await wait_for(lambda: received)
+                # Arrives while the handler is busy with the first tick
+                await feed.push(*({"s": "AAPL", "p": i} for i in range(1, 101)))
+                stats = stream.stats
+                await wait_for(lambda: stats["delivered"] + stats["dropped"] == 101)
+                await stream.close()
+                return stats
+
+        stats = asyncio.run(run())
+
+        assert received[-1] == ("AAPL", 100)
+        assert len(received) < 10
+        assert stats["coalesced"] == stats["dropped"] == len(drops)
+        assert stats["delivered"] + stats["dropped"] == 101
+
+    def test_drop_oldest_bounds_buffer(self):
+        """FIFO buffering keeps only the newest max_pending ticks."""
+        stream = MarketDataStream(
+            "ws://unused", price_parser, lambda s, p: None,
+            max_pending=3, policy=OverflowPolicy.DROP_OLDEST,
+        )
+        for i in range(5):
+            stream._ingest(json.dumps({"s": "AAPL", "p": i}))
+
+        assert stream.pending == 3
+        assert list(stream._take_batch()) == [("AAPL", 2), ("AAPL", 3), ("AAPL", 4)]
+        assert stream.stats["dropped"] == 2
+
+    def test_drop_newest_keeps_oldest(self):
+        """DROP_NEWEST rejects ticks once the buffer is full."""
+        stream = MarketDataStream(
+            "ws://unused", price_parser, lambda s, p: None,
+            max_pending=2, policy=OverflowPolicy.DROP_NEWEST,
+        )
+        for i in range(4):
+            stream._ingest(json.dumps({"s": "AAPL", "p": i}))
+
+        assert list(stream._take_batch()) == [("AAPL", 0), ("AAPL", 1)]
+        assert stream.stats["dropped"] == 2
+
+    def test_parse_errors_counted(self):
+        """Malformed messages are counted and skipped."""
+        stream = MarketDataStream("ws://unused", price_parser, lambda s, p: None)
+        stream._ingest("not json")
+        stream._ingest(json.dumps({"s": "AAPL", "p": 1}))
+
+        assert stream.stats["parse_errors"] == 1
+        assert stream.pending == 1
+
+    def test_subscriptions_replayed_after_reconnect(self):
+        """Dropped connections are re-established with handshake and live subscriptions."""
+        aapl = {"action": "subscribe", "symbols": ["AAPL"]}
+
+        async def run():
+            async with MockFeed() as feed:
+                stream = MarketDataStream(
+                    feed.url, price_parser, lambda s, p: None,
+                    handshake=[{"action": "auth"}], reconnect_delay=0.01,
+                )
+                await stream.start()
+                await stream.wait_connected(2)
+                await stream.subscribe("AAPL", aapl)
+                await stream.subscribe("MSFT", {"action": "subscribe", "symbols": ["MSFT"]})
+                await stream.unsubscribe("MSFT", {"action": "unsubscribe", "symbols": ["MSFT"]})
+                await stream.send_json({"action": "ping"})
+                await wait_for(lambda: len(feed.received) == 5)
+
+                await feed.connections[-1].close()
+                await wait_for(lambda: len(feed.connections) == 2 and len(feed.received) == 7)
+                await stream.close()
+                return feed.received, stream.stats
+
+        control, stats = asyncio.run(run())
+
+        assert control[5:] == [{"action": "auth"}, aapl]
+        assert stats["reconnects"] == 1
+
+
+class TestBrokerStreams:
+    """Test broker stream parsers feeding market data callbacks."""
+
+    def test_binance_book_ticker(self):
+        """Binance bookTicker events reach subscribers, wrapped or not."""
+        broker = BinanceBroker(BrokerConfig())
+        updates = []
+
+        async def run():
+            await broker.subscribe_market_data(["btcusdt"], updates.append)
+
+        asyncio.run(run())
+        event = {"u": 1, "s": "BTCUSDT", "b": "100.5", "B": "2", "a": "101.0", "A": "3"}
+        for message in (event, {"stream": "btcusdt@bookTicker", "data": event}, {"result": None}):
+            for symbol, data in broker._parse_stream_message(message):
+                broker._dispatch_market_data(symbol, data)
+
+        assert len(updates) == 2
+        assert updates[0].bid == 100.5
+        assert updates[0].ask_size == 3.0
+
+    def test_binance_subscription_reaches_server(self):
+        """Subscriptions made before the socket opens are sent, and resent after reconnects."""
+        broker = BinanceBroker(BrokerConfig())
+        updates = []
+        subscribe = {"method": "SUBSCRIBE", "params": ["btcusdt@bookTicker"], "id": 1}
+
+        async def run():
+            async with MockFeed() as feed:
+                broker.ws_url = feed.url
+                await broker.subscribe_market_data(["btcusdt"], updates.append)
+                broker.ws_connection.reconnect_delay = 0.01
+                await wait_for(lambda: feed.received == [subscribe])
+
+                await feed.push({"s": "BTCUSDT", "b": "100.5", "B": "2", "a": "101", "A": "3"})
+                await wait_for(lambda: updates)
+
+                await feed.connections[-1].close()
+                await wait_for(lambda: len(feed.connections) == 2 and len(feed.received) == 2)
+                await broker.unsubscribe_market_data(["btcusdt"])
+                await wait_for(lambda: len(feed.received) == 3)
+                subscriptions = dict(broker.ws_connection._subscriptions)
+                await broker.ws_connection.close()
+                return feed.received, subscriptions
+
+        received, subscriptions = asyncio.run(run())
+
+        assert received[:2] == [subscribe, subscribe]
+        assert received[2]["method"] == "UNSUBSCRIBE"
+        assert subscriptions == {}
+        assert updates[0].bid == 100.5
+
+    def test_alpaca_subscription_follows_auth(self):
+        """Alpaca sends auth, then each quote subscription, on every connection."""
+        broker = AlpacaBroker(BrokerConfig(api_key="k", api_secret="s"))
+
+        async def run():
+            async with MockFeed() as feed:
+                broker.data_ws_url = feed.url
+                await broker.subscribe_market_data(["AAPL"], lambda data: None)
+                broker.ws_connection.reconnect_delay = 0.01
+                await wait_for(lambda: len(feed.received) == 2)
+
+                await feed.connections[-1].close()
+                await wait_for(lambda: len(feed.connections) == 2 and len(feed.received) == 4)
+                await broker.ws_connection.close()
+                return feed.received
+
+        received = asyncio.run(run())
+
+        assert [message["action"] for message in received] == ["auth", "subscribe"] * 2
+        assert received[1]["quotes"] == ["AAPL"]
+
+    def test_alpaca_quotes(self):
+        """Alpaca quote messages are parsed; control messages are ignored."""
+        broker = AlpacaBroker(BrokerConfig())
+        messages = [
+            {"T": "success", "msg": "authenticated"},
+            {"T": "q", "S": "AAPL", "bp": 189.5, "bs": 1, "ap": 189.7, "as": 2,
+             "t": "2024-01-02T15:30:00.123456+00:00"},
+        ]
+
+        ticks = list(broker._parse_stream_message(messages))
+
+        assert [symbol for symbol, _ in ticks] == ["AAPL"]
+        assert ticks[0][1].last == pytest.approx(189.6)
+        assert ticks[0][1].timestamp.year == 2024
+
+    def test_callback_errors_isolated(self):
+        """A failing subscriber does not prevent delivery to the others."""
+        broker = BinanceBroker(BrokerConfig())
+        updates = []
+
+        def failing(data):
+            raise RuntimeError("boom")
+
+        broker._market_data_callbacks["BTCUSDT"] = [failing, updates.append]
+        broker._dispatch_market_data("BTCUSDT", object())
+
+        assert len(updates) == 1
@@ -0,0 +1,180 @@
+"""Tests for the broker connection supervisor."""
+
+import asyncio
+import time
+
+import pytest
+
+from athena.core.clock import VirtualClock
+from athena.live.brokers import BrokerConfig, InteractiveBroker
+from athena.live.brokers.base import ConnectionState
+from athena.live.execution_guard import ExecutionGuard, ExecutionGuardConfig
+from athena.live.supervisor import ConnectionSupervisor
+
+
+class FlakyBroker(InteractiveBroker):
+    """Paper IB broker whose heartbeat and reconnects can be made to fail."""
+
+    def __init__(self, clock=None, ping_delay=0.0):
+        super().__init__(BrokerConfig(), clock=clock)
+        self.ping_delay = ping_delay
+        self.refuse_connections = False
+        self.pings = 0
+
+    async def connect(self) -> bool:
+        if self.refuse_connections:
+            self.state = ConnectionState.ERROR
+            return False
+        return await super().connect()
+
+    async def ping(self) -> bool:
+        self.pings += 1
+        await asyncio.sleep(self.ping_delay)
+        return await super().ping()
+
+
+def make_supervisor(*brokers, **kwargs):
+    """Supervise brokers named primary, standby, ... on a shared virtual clock."""
+    names = ["primary", "standby", "backup"]
+    return ConnectionSupervisor(dict(zip(names, brokers)), **kwargs)
+
+
+class TestConnectionSupervisor:
+    """Test heartbeats, reconnects and failover."""
+
+    def test_start_connects_all_brokers(self):
+        """Every broker is connected so standbys are warm."""
+        clock = VirtualClock(start="2024-01-02 09:30")
+        primary, standby = FlakyBroker(clock), FlakyBroker(clock)
+        supervisor = make_supervisor(primary, standby, clock=clock)
+
+        asyncio.run(supervisor.check_all(reconnect=True))
+
+        assert primary.state == standby.state == ConnectionState.CONNECTED
+        assert supervisor.get_broker() is primary
+        assert supervisor.health["standby"].last_success == clock.now()
+
+    def test_heartbeats_run_concurrently(self):
+        """A slow venue does not delay heartbeats to the others."""
+        brokers = [FlakyBroker(VirtualClock(), ping_delay=0.1) for _ in range(3)]
+        for broker in brokers:
+            broker.state = ConnectionState.CONNECTED
+        supervisor = make_supervisor(*brokers)
+
+        start = time.perf_counter()
+        health = asyncio.run(supervisor.check_all())
+
+        assert time.perf_counter() - start < 0.25
+        assert all(h.connected and h.latency_ms >= 100 for h in health.values())
+        assert all(broker.metrics.average_latency_ms >= 100 for broker in brokers)
+
+    def test_reconnects_dropped_broker(self):
+        """A failed heartbeat triggers a reconnect inside the supervisor."""
+        clock = VirtualClock()
+        broker = FlakyBroker(clock)
+        supervisor = make_supervisor(broker, clock=clock)
+
+        async def run():
+            await supervisor.check_all(reconnect=True)
+            await broker.disconnect()
+            await supervisor.check_all(reconnect=True)
+
+        asyncio.run(run())
+
+        assert broker.state == ConnectionState.CONNECTED
+        assert supervisor.health["primary"].reconnects == 2  # Initial connect + recovery
+        assert broker.metrics.reconnect_count == 2
+
+    def test_heartbeat_timeout_counts_as_failure(self):
+        """A hung heartbeat fails after the timeout instead of blocking."""
+        broker = FlakyBroker(ping_delay=1.0)
+        broker.state = ConnectionState.CONNECTED
+        supervisor = make_supervisor(broker, heartbeat_timeout=0.05)
+
+        health = asyncio.run(supervisor.check_all())["primary"]
+
+        assert not health.connected
+        assert "timed out" in health.last_error
+        with pytest.raises(RuntimeError):
+            supervisor.get_broker()
+
+    def test_fails_over_to_standby_and_back(self):
+        """Orders route to the standby while the primary is down."""
+        clock = VirtualClock()
+        primary, standby = FlakyBroker(clock), FlakyBroker(clock)
+        supervisor = make_supervisor(primary, standby, clock=clock)
+        switches = []
+        supervisor.on_failover(lambda old, new: switches.append((old, new)))
+
+        async def run():
+            await supervisor.check_all(reconnect=True)
+            primary.refuse_connections = True
+            await primary.disconnect()
+            await supervisor.check_all(reconnect=True)
+            routed = supervisor.get_broker()
+            primary.refuse_connections = False
+            await supervisor.check_all(reconnect=True)
+            return routed
+
+        assert asyncio.run(run()) is standby
+        assert supervisor.get_broker() is primary
+        assert switches == [(None, "primary"), ("primary", "standby"), ("standby", "primary")]
+        assert supervisor.failovers == 2
+
+    def test_reconnect_backoff(self):
+        """Failing brokers are retried with exponential backoff."""
+        supervisor = make_supervisor(FlakyBroker(), reconnect_delay=1.0, max_reconnect_delay=5.0)
+        health = supervisor.health["primary"]
+
+        delays = []
+        for failures in range(5):
+            health.consecutive_failures = failures
+            delays.append(supervisor._next_delay("primary"))
+
+        assert delays == [supervisor.heartbeat_interval, 1.0, 2.0, 4.0, 5.0]
+
+    def test_feeds_execution_guard(self):
+        """Guard connectivity tracks the supervisor; outages halt once."""
+        clock = VirtualClock()
+        broker = FlakyBroker(clock)
+        guard = ExecutionGuard(ExecutionGuardConfig(), clock=clock)
+        supervisor = make_supervisor(broker, guard=guard, clock=clock)
+
+        async def run():
+            await supervisor.check_all(reconnect=True)
+            healthy = guard.is_global_halt
+            broker.refuse_connections = True
+            await broker.disconnect()
+            for _ in range(3):
+                await supervisor.check_all(reconnect=True)
+            return healthy
+
+        assert asyncio.run(run()) is False
+        assert guard.is_global_halt
+        assert len(guard.violations) == 1
+
+    def test_background_loop_recovers(self):
+        """The heartbeat task notices a drop and reconnects on its own."""
+        broker = FlakyBroker(VirtualClock())
+        supervisor = make_supervisor(broker, heartbeat_interval=0.01, reconnect_delay=0.01)
+
+        async def run():
+            await supervisor.start()
+            assert supervisor.running
+            await broker.disconnect()
+            for _ in range(100):
+                await asyncio.sleep(0.01)
+                if supervisor.health["primary"].reconnects > 1 and await broker.is_connected():
+                    break
+            await supervisor.stop()
+
+        asyncio.run(run())
+
+        assert broker.state == ConnectionState.CONNECTED
+        assert not supervisor.running
+        assert supervisor.get_status()["brokers"]["primary"]["reconnects"] >= 2
+
+    def test_requires_brokers(self):
+        """An empty broker set is rejected."""
+        with pytest.raises(ValueError):
+            ConnectionSupervisor({})